@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark: JsonlFileAuditSink append throughput per durability policy.
+
+Emits --events audit events into a temporary directory for each mode and reports events/s
+plus writer counters (fsync count and mean fsync latency):
+
+    open_close      the previous sink behaviour: mkdir check + open/write/close per event
+    fsync_off       shared long-lived handle, no fsync (default policy)
+    fsync_batch     shared handle, group fsync every --batch events / --interval-ms
+    fsync_always    shared handle, fsync per event (strict mode)
+
+Usage:
+    python scripts/bench_audit_jsonl_sink.py [--events 20000] [--batch 100] [--interval-ms 50]
+
+Output is JSON on stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.audit.jsonl_writer import (  # noqa: E402
+    FSYNC_ALWAYS,
+    FSYNC_BATCH,
+    FSYNC_OFF,
+    JsonlWriterConfig,
+)
+from idis.audit.sink import JsonlFileAuditSink  # noqa: E402
+
+
+def _event(i: int) -> dict[str, Any]:
+    return {
+        "event_id": str(uuid.uuid4()),
+        "tenant_id": "00000000-0000-0000-0000-000000000001",
+        "event_type": "deal.updated",
+        "occurred_at": f"2026-02-01T00:00:{i % 60:02d}Z",
+        "request": {"request_id": f"bench-{i}", "deal_id": f"deal-{i % 50}"},
+        "payload": {"safe": {"index": i}, "hashes": [], "refs": []},
+    }
+
+
+def _open_close(path: Path, events: list[dict[str, Any]]) -> None:
+    for event in events:
+        line = json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, mode="a", encoding="utf-8") as f:
+            f.write(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--interval-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    events = [_event(i) for i in range(args.events)]
+    modes: dict[str, JsonlWriterConfig | None] = {
+        "open_close": None,
+        "fsync_off": JsonlWriterConfig(fsync=FSYNC_OFF),
+        "fsync_batch": JsonlWriterConfig(
+            fsync=FSYNC_BATCH,
+            fsync_every_events=args.batch,
+            fsync_interval_ms=args.interval_ms,
+        ),
+        "fsync_always": JsonlWriterConfig(fsync=FSYNC_ALWAYS),
+    }
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="idis-bench-audit-") as tmp:
+        for mode, config in modes.items():
+            path = Path(tmp) / mode / "audit_events.jsonl"
+            result: dict[str, Any] = {"mode": mode}
+            started = time.perf_counter()
+            if config is None:
+                _open_close(path, events)
+            else:
+                sink = JsonlFileAuditSink(
+                    str(path), index_segment_events=None, writer_config=config
+                )
+                for event in events:
+                    sink.emit(event)
+                sink.flush()
+                stats = sink.stats()
+                if stats is not None:
+                    result["fsyncs"] = stats.fsyncs
+                    result["mean_fsync_ms"] = round(stats.mean_fsync_ms, 4)
+            elapsed = time.perf_counter() - started
+            result["seconds"] = round(elapsed, 4)
+            result["events_per_second"] = round(args.events / elapsed, 1)
+            results.append(result)
+
+    print(
+        json.dumps(
+            {"benchmark": "audit_jsonl_sink", "events": args.events, "results": results}, indent=2
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
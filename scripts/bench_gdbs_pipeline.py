@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark: per-stage pipeline latency and memory over a GDBS suite, gated on a baseline.
+
+Replays the suite's deals in-process (ingest, chunk, extract with the deterministic LLM client,
+Sanad grading, calc, deliverables) against the in-memory repositories and prints per-stage
+p50/p95/max milliseconds and traced memory high-water marks as JSON. See
+``idis.evaluation.benchmarks.pipeline`` for what each stage covers.
+
+With --baseline the report is compared against the pinned document and the script exits 1 when a
+stage exceeds its tolerance or a deterministic count drifts. --write-baseline pins the current
+report instead. Latency is the noisy part of the gate: on a loaded or shared CI runner, widen it
+with --latency-ratio instead of re-pinning the baseline.
+
+Usage:
+    python scripts/bench_gdbs_pipeline.py [--dataset datasets/gdbs_full] [--suite gdbs-s] \\
+        [--iterations 3] [--cases N] [--out PATH] \\
+        [--baseline PATH [--latency-ratio R] | --write-baseline PATH]
+
+Exit codes:
+    0 - Benchmark completed (and within tolerance when gated)
+    1 - Tolerance gate failed, or the baseline is missing or malformed
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.evaluation.benchmarks.pipeline import (  # noqa: E402
+    build_pipeline_baseline_document,
+    compare_pipeline_to_baseline,
+    load_pipeline_baseline,
+    run_pipeline_benchmark,
+)
+from idis.evaluation.types import VALID_SUITE_IDS  # noqa: E402
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--dataset", type=Path, default=_PROJECT_ROOT / "datasets" / "gdbs_full")
+    parser.add_argument("--suite", default="gdbs-s", choices=sorted(VALID_SUITE_IDS))
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--cases", type=int, default=None, help="Replay only the first N deals.")
+    gate = parser.add_mutually_exclusive_group()
+    gate.add_argument("--baseline", type=Path, default=None)
+    gate.add_argument("--write-baseline", type=Path, default=None)
+    parser.add_argument(
+        "--latency-ratio",
+        type=float,
+        default=None,
+        help="Override the baseline's latency_ratio tolerance (e.g. 4 on shared CI runners).",
+    )
+    parser.add_argument("--out", type=Path, default=None, help="Also write the JSON here.")
+    args = parser.parse_args()
+
+    # Pipeline stages log per deal; keep stdout to the JSON report.
+    logging.disable(logging.WARNING)
+    report = run_pipeline_benchmark(
+        args.dataset, args.suite, iterations=args.iterations, max_cases=args.cases
+    )
+    output: dict[str, object] = {"benchmark": report["benchmark"], "results": [report]}
+    exit_code = 0
+
+    if args.write_baseline is not None:
+        document = build_pipeline_baseline_document(report)
+        args.write_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.write_baseline.write_text(
+            json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+    elif args.baseline is not None:
+        baseline, error_code = load_pipeline_baseline(args.baseline)
+        if baseline is None:
+            output["gate"] = {"ok": False, "error_code": error_code}
+        else:
+            overrides = (
+                {"latency_ratio": args.latency_ratio} if args.latency_ratio is not None else None
+            )
+            output["gate"] = compare_pipeline_to_baseline(baseline, report, tolerances=overrides)
+        exit_code = 0 if output["gate"]["ok"] else 1  # type: ignore[index]
+
+    rendered = json.dumps(output, indent=2)
+    if args.out is not None:
+        args.out.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark: per-observation overhead of the in-process metrics registry.
+
+Reports nanoseconds per call (best of --repeat runs of --iterations calls) for:
+
+    histogram           observe_histogram with a (method, route) label set
+    histogram_nolabels  observe_histogram without labels
+    counter             increment_counter with a (method, status_class) label set
+
+plus a contended run where --threads threads observe the same series concurrently, checking
+that no observation is lost.
+
+No services are required.
+
+Usage:
+    python scripts/bench_metrics_histogram.py [--iterations 200000] [--budget-ns 5000]
+
+Exit codes:
+    0 - Benchmark completed within budget
+    1 - Histogram observation exceeded --budget-ns, or concurrent observations were lost
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.observability.metrics import (  # noqa: E402
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_TOTAL,
+    PARSER_DURATION_SECONDS,
+    get_histogram,
+    increment_counter,
+    observe_histogram,
+    reset_metrics,
+)
+
+_ROUTE_LABELS = {"method": "GET", "route": "/v1/deals/{deal_id}/claims"}
+_STATUS_LABELS = {"method": "GET", "status_class": "2xx"}
+
+
+def _ns_per_call(fn: Any, iterations: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for i in range(iterations):
+            fn(i)
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return round(best, 1)
+
+
+def _contended(threads: int, per_thread: int) -> dict[str, Any]:
+    labels = {"method": "POST", "route": "/v1/deals"}
+
+    def worker() -> None:
+        for i in range(per_thread):
+            observe_histogram(HTTP_REQUEST_DURATION_SECONDS, (i % 100) / 1000, labels=labels)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter_ns()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter_ns() - started
+    observed = get_histogram(HTTP_REQUEST_DURATION_SECONDS, labels=labels).count
+    return {
+        "mode": "histogram_contended",
+        "threads": threads,
+        "ns_per_call": round(elapsed / (threads * per_thread), 1),
+        "observed": observed,
+        "expected": threads * per_thread,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--budget-ns", type=float, default=5_000.0)
+    args = parser.parse_args()
+
+    reset_metrics()
+    results = [
+        {
+            "mode": "histogram",
+            "ns_per_call": _ns_per_call(
+                lambda i: observe_histogram(
+                    HTTP_REQUEST_DURATION_SECONDS, (i % 100) / 1000, labels=_ROUTE_LABELS
+                ),
+                args.iterations,
+                args.repeat,
+            ),
+        },
+        {
+            "mode": "histogram_nolabels",
+            "ns_per_call": _ns_per_call(
+                lambda i: observe_histogram(PARSER_DURATION_SECONDS, (i % 100) / 100),
+                args.iterations,
+                args.repeat,
+            ),
+        },
+        {
+            "mode": "counter",
+            "ns_per_call": _ns_per_call(
+                lambda i: increment_counter(HTTP_REQUESTS_TOTAL, labels=_STATUS_LABELS),
+                args.iterations,
+                args.repeat,
+            ),
+        },
+        _contended(args.threads, args.iterations // args.threads),
+    ]
+    reset_metrics()
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "metrics_observation_overhead",
+                "budget_ns": args.budget_ns,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    contended = results[-1]
+    within_budget = results[0]["ns_per_call"] <= args.budget_ns
+    return 0 if within_budget and contended["observed"] == contended["expected"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark: deal graph projection throughput against a local Neo4j.
+
+Projects one synthetic deal (--documents documents, --spans spans, --entities entities with
+one mention each) per mode and reports wall time and rows/s:
+
+    per_row         one auto-commit session per node/edge (the previous projection pattern)
+    batched_<N>     UNWIND statements in write transactions of N rows (--batch-sizes)
+
+Each mode writes under its own random tenant_id, which is deleted afterwards.
+
+Usage:
+    NEO4J_URI=bolt://localhost:7687 NEO4J_USERNAME=neo4j NEO4J_PASSWORD=... \\
+        python scripts/bench_neo4j_projection.py [--spans 30000] [--batch-sizes 500,1000,5000]
+
+Exit codes:
+    0 - Benchmark completed
+    2 - Neo4j not configured
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.persistence.graph_repo import GraphRepository  # noqa: E402
+from idis.persistence.neo4j_driver import (  # noqa: E402
+    close_neo4j_driver,
+    execute_write,
+    is_neo4j_configured,
+)
+
+
+class _PerRowGraphRepository(GraphRepository):
+    """Writes every row in its own session + auto-commit transaction."""
+
+    def _write_batches(
+        self,
+        statements: list[tuple[str, list[dict[str, Any]]]],
+        parameters: dict[str, Any],
+    ) -> int:
+        calls = 0
+        for query, rows in statements:
+            for row in rows:
+                execute_write(query, {**parameters, "rows": [row]})
+                calls += 1
+        return calls
+
+
+def _deal(documents: int, spans: int, entities: int) -> dict[str, Any]:
+    return {
+        "documents": [{"document_id": f"doc-{d}", "doc_type": "PDF"} for d in range(documents)],
+        "spans": [
+            {"span_id": f"span-{s}", "document_id": f"doc-{s % documents}", "span_type": "PAGE"}
+            for s in range(spans)
+        ],
+        "entities": [
+            {
+                "entity_id": f"ent-{e}",
+                "name": f"Entity {e}",
+                "type": "ORG",
+                "span_ids": [f"span-{e % spans}"],
+            }
+            for e in range(entities)
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--spans", type=int, default=30_000)
+    parser.add_argument("--entities", type=int, default=2_000)
+    parser.add_argument("--batch-sizes", default="500,1000,5000")
+    parser.add_argument("--skip-per-row", action="store_true")
+    args = parser.parse_args()
+
+    if not is_neo4j_configured():
+        print("NEO4J_URI is not set; this benchmark needs a local Neo4j.")
+        return 2
+
+    deal = _deal(args.documents, args.spans, args.entities)
+    rows = 1 + args.documents + args.spans + 2 * args.entities
+    modes: dict[str, GraphRepository] = {}
+    if not args.skip_per_row:
+        modes["per_row"] = _PerRowGraphRepository()
+    for size in (int(s) for s in args.batch_sizes.split(",") if s.strip()):
+        modes[f"batched_{size}"] = GraphRepository(batch_size=size)
+
+    results: list[dict[str, Any]] = []
+    try:
+        for mode, repo in modes.items():
+            tenant_id = str(uuid.uuid4())
+            started = time.perf_counter()
+            repo.upsert_deal_graph_projection(tenant_id=tenant_id, deal_id="deal-bench", **deal)
+            elapsed = time.perf_counter() - started
+            results.append(
+                {
+                    "mode": mode,
+                    "seconds": round(elapsed, 3),
+                    "rows_per_second": round(rows / elapsed, 1),
+                }
+            )
+            execute_write(
+                "MATCH (n {tenant_id: $tenant_id}) CALL { WITH n DETACH DELETE n } "
+                "IN TRANSACTIONS OF 10000 ROWS",
+                {"tenant_id": tenant_id},
+            )
+    finally:
+        close_neo4j_driver()
+
+    print(
+        json.dumps(
+            {"benchmark": "neo4j_projection", "rows": rows, "results": results},
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark: No-Free-Facts heuristic detection over IC memo sections.
+
+Builds --sections synthetic memo sections (a mix of narrative and metric sentences) and
+reports wall time for:
+
+    gated       NoFreeFactsValidator._looks_like_fact (literal-gated patterns)
+    ungated     the previous loop running every factual and semantic pattern
+    validate    validate_no_free_facts on a deliverable holding all sections
+
+and checks that gated and ungated produce the same findings.
+
+No services are required.
+
+Usage:
+    python scripts/bench_no_free_facts.py [--sections 2000] [--sentences 4]
+
+Exit codes:
+    0 - Benchmark completed
+    1 - Gated and ungated findings differ
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.validators.no_free_facts import (  # noqa: E402
+    FACTUAL_REGEXES,
+    SEMANTIC_RULES,
+    NoFreeFactsValidator,
+    validate_no_free_facts,
+)
+
+_NARRATIVE = (
+    "The team believes the go-to-market motion will mature over the next cycle.",
+    "Management discussed the roadmap and hiring plan with the board.",
+    "We view the competitive landscape as fragmented with room for consolidation.",
+    "Diligence calls with design partners were broadly positive about usability.",
+    "Key risks include execution on enterprise sales and regulatory timelines.",
+)
+_METRICS = (
+    "Revenue grew 45% year over year to $12.4M ARR.",
+    "The company raised a Series B at a $90M post-money valuation in 2024.",
+    "Gross margin is 72% and net revenue retention stands at 118%.",
+    "Headcount increased to 85 employees across three offices.",
+    "TAM of $4,500M according to the deck; 1,200 customers as of Q3 2025.",
+)
+
+
+def _sections(n: int, sentences: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(
+            rng.choice(_METRICS if rng.random() < 0.2 else _NARRATIVE) for _ in range(sentences)
+        )
+        for _ in range(n)
+    ]
+
+
+def _ungated(text: str) -> list[tuple[int, str]]:
+    """The previous pattern loops, reduced to (position, pattern) findings."""
+    findings: list[tuple[int, str]] = []
+    spans: set[tuple[int, int]] = set()
+    for regex in FACTUAL_REGEXES:
+        for match in regex.finditer(text):
+            if (match.start(), match.end()) not in spans:
+                spans.add((match.start(), match.end()))
+                findings.append((match.start(), regex.pattern))
+    positions = {position for position, _ in findings}
+    for subj_pattern, pred_pattern, rule_name in SEMANTIC_RULES:
+        for subj_match in subj_pattern.finditer(text):
+            window = text[subj_match.end() : subj_match.end() + 100]
+            if pred_pattern.search(window) and subj_match.start() not in positions:
+                positions.add(subj_match.start())
+                findings.append((subj_match.start(), f"semantic:{rule_name}"))
+    return sorted(findings, key=lambda finding: finding[0])
+
+
+def _timed(mode: str, fn: Any) -> tuple[dict[str, Any], Any]:
+    started = time.perf_counter()
+    value = fn()
+    return {"mode": mode, "seconds": round(time.perf_counter() - started, 4)}, value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--sections", type=int, default=2_000)
+    parser.add_argument("--sentences", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sections = _sections(args.sections, args.sentences, args.seed)
+    validator = NoFreeFactsValidator()
+    gated_row, gated = _timed(
+        "gated",
+        lambda: [
+            [(a.position, a.pattern_matched) for a in validator._looks_like_fact(text)]
+            for text in sections
+        ],
+    )
+    ungated_row, ungated = _timed("ungated", lambda: [_ungated(text) for text in sections])
+    deliverable = {"sections": [{"text": text} for text in sections]}
+    validate_row, result = _timed("validate", lambda: validate_no_free_facts(deliverable))
+    gated_row["findings"] = sum(map(len, gated))
+    ungated_row["findings"] = sum(map(len, ungated))
+    validate_row["errors"] = len(result.errors)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "no_free_facts_detection",
+                "sections": args.sections,
+                "results": [gated_row, ungated_row, validate_row],
+            },
+            indent=2,
+        )
+    )
+    return 0 if gated == ungated else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
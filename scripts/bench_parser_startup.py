@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark: cold-start import time and resident memory of the parser registry.
+
+Each mode runs in a fresh interpreter (--repeat times, median reported):
+
+    interpreter        bare interpreter (RSS floor)
+    registry_lazy      import idis.parsers.registry (parsers load on first use)
+    registry_warm_all  import the registry, then warm_parsers() for every family - the cost
+                       every process paid when the registry imported all parsers eagerly
+    ingestion_service  import idis.services.ingestion.service (API upload path)
+
+and records which heavy parser dependencies (pypdf, openpyxl, docx, pptx) ended up loaded.
+
+No services are required.
+
+Usage:
+    python scripts/bench_parser_startup.py [--repeat 5] [--out report.json]
+
+Exit codes:
+    0 - Benchmark completed; lazy modes loaded no heavy parser dependency
+    1 - registry_lazy or ingestion_service imported a heavy parser dependency
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+_SRC_DIR = Path(__file__).parent.parent / "src"
+
+HEAVY_MODULES = ("pypdf", "openpyxl", "docx", "pptx")
+
+MODES: dict[str, str] = {
+    "interpreter": "pass",
+    "registry_lazy": "import idis.parsers.registry",
+    "registry_warm_all": "from idis.parsers.registry import warm_parsers\nwarm_parsers()",
+    "ingestion_service": "import idis.services.ingestion.service",
+}
+
+LAZY_MODES = ("registry_lazy", "ingestion_service")
+
+_CHILD_TEMPLATE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{statement}
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({{
+    "import_ms": elapsed_ms,
+    "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _run_child(statement: str) -> dict[str, Any]:
+    env = {**os.environ, "PYTHONPATH": str(_SRC_DIR), "PYTHONDONTWRITEBYTECODE": "1"}
+    code = _CHILD_TEMPLATE.format(statement=statement, heavy=HEAVY_MODULES)
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _measure(mode: str, statement: str, repeat: int) -> dict[str, Any]:
+    samples = [_run_child(statement) for _ in range(repeat)]
+    return {
+        "mode": mode,
+        "samples": repeat,
+        "import_ms_p50": round(statistics.median(s["import_ms"] for s in samples), 1),
+        "max_rss_kib_p50": int(statistics.median(s["max_rss_kib"] for s in samples)),
+        "heavy_modules": samples[-1]["heavy_modules"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per mode")
+    parser.add_argument("--out", type=Path, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    results = [_measure(mode, statement, args.repeat) for mode, statement in MODES.items()]
+    by_mode = {result["mode"]: result for result in results}
+    lazy, eager = by_mode["registry_lazy"], by_mode["registry_warm_all"]
+    leaked = sorted(mode for mode in LAZY_MODES if by_mode[mode]["heavy_modules"])
+
+    report = {
+        "benchmark": "parser_startup",
+        "results": results,
+        "lazy_saves_ms": round(eager["import_ms_p50"] - lazy["import_ms_p50"], 1),
+        "lazy_saves_rss_kib": eager["max_rss_kib_p50"] - lazy["max_rss_kib_p50"],
+        "eager_imports_in_lazy_modes": leaked,
+    }
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.out:
+        args.out.write_text(rendered + "\n", encoding="utf-8")
+    return 1 if leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
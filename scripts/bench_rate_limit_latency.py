@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Load test: latency added per request by the rate limiter against a local Redis.
+
+Runs --requests limiter checks (tier + actor + write route class buckets) from --threads threads
+and reports p50/p99/max microseconds per check for each mode:
+
+    in_memory        per-process store (no network; the floor)
+    redis_per_tier   one Redis round-trip per bucket (the pre-multi-tier call pattern)
+    redis_multi      all buckets in one Lua script call
+    redis_leased     multi-bucket script fronted by the local token lease
+
+Limits are set high (--rpm) so every check is admitted and only overhead is measured.
+
+Usage:
+    IDIS_REDIS_URL=redis://localhost:6379/0 python scripts/bench_rate_limit_latency.py \\
+        [--requests 20000] [--threads 8] [--rpm 6000000]
+
+Exit codes:
+    0 - Benchmark completed
+    2 - IDIS_REDIS_URL not configured
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.rate_limit.lease import LeasedRateLimitStore  # noqa: E402
+from idis.rate_limit.limiter import (  # noqa: E402
+    ENV_REDIS_URL,
+    InMemoryRateLimitStore,
+    RateLimitConfig,
+    RateLimitStore,
+    RateLimitTier,
+    RedisTokenBucketStore,
+    RouteClass,
+    TenantRateLimiter,
+)
+
+
+class _PerTierStore:
+    """Hides consume_many so the limiter falls back to one consume (round-trip) per bucket."""
+
+    def __init__(self, store: RedisTokenBucketStore) -> None:
+        self._store = store
+
+    def consume(
+        self, *, key: str, capacity: int, refill_rate_per_sec: float, cost: int = 1
+    ) -> tuple[bool, int, int]:
+        return self._store.consume(
+            key=key, capacity=capacity, refill_rate_per_sec=refill_rate_per_sec, cost=cost
+        )
+
+    def reset(self) -> None:
+        self._store.reset()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _run(store: RateLimitStore, *, requests: int, threads: int, rpm: int) -> dict[str, Any]:
+    config = RateLimitConfig(
+        user_rpm=rpm, integration_rpm=rpm, burst_multiplier=2, actor_rpm=rpm, write_rpm=rpm
+    )
+    limiter = TenantRateLimiter(config, store=store)
+    tenant = f"bench-{uuid.uuid4()}"
+    per_thread = requests // threads
+    samples: list[list[float]] = [[] for _ in range(threads)]
+    denied = [0] * threads
+
+    def worker(n: int) -> None:
+        for i in range(per_thread):
+            started = time.perf_counter_ns()
+            decision = limiter.check_request(
+                tenant,
+                RateLimitTier.USER,
+                actor_id=f"actor-{(n + i) % 16}",
+                route_class=RouteClass.WRITE,
+            )
+            samples[n].append((time.perf_counter_ns() - started) / 1000)
+            denied[n] += not decision.allowed
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    wall = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    wall = time.perf_counter() - wall
+
+    flat = [s for chunk in samples for s in chunk]
+    result: dict[str, Any] = {
+        "checks": len(flat),
+        "denied": sum(denied),
+        "p50_us": round(_percentile(flat, 50), 1),
+        "p99_us": round(_percentile(flat, 99), 1),
+        "max_us": round(max(flat), 1),
+        "mean_us": round(statistics.fmean(flat), 1),
+        "checks_per_second": round(len(flat) / wall, 1),
+    }
+    if isinstance(store, LeasedRateLimitStore):
+        stats = store.stats()
+        result["lease_hit_ratio"] = round(stats.hit_ratio, 4)
+        result["remote_calls"] = stats.remote_calls
+        result["top_ups"] = stats.top_ups
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=6_000_000)
+    args = parser.parse_args()
+
+    url = os.environ.get(ENV_REDIS_URL, "").strip()
+    if not url:
+        print(f"{ENV_REDIS_URL} is not set; this benchmark needs a local Redis.")
+        return 2
+
+    modes: dict[str, RateLimitStore] = {
+        "in_memory": InMemoryRateLimitStore(),
+        "redis_per_tier": _PerTierStore(RedisTokenBucketStore.from_url(url)),
+        "redis_multi": RedisTokenBucketStore.from_url(url),
+        "redis_leased": LeasedRateLimitStore(RedisTokenBucketStore.from_url(url)),
+    }
+    results = []
+    for mode, store in modes.items():
+        _run(store, requests=min(1000, args.requests), threads=1, rpm=args.rpm)  # warm up
+        results.append(
+            {
+                "mode": mode,
+                **_run(store, requests=args.requests, threads=args.threads, rpm=args.rpm),
+            }
+        )
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "rate_limit_latency",
+                "requests": args.requests,
+                "threads": args.threads,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
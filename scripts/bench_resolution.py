@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark: claim resolution (near-match + conflict detection) at scale.
+
+Builds --per-class synthetic deduplicated claims for each of --classes claim classes (spread
+over a few predicates and time windows, values log-uniform so that near-matches and conflicts
+both occur) and reports wall time for:
+
+    sweep       Deduplicator._find_near_matches + ConflictDetector.detect (sort-and-sweep)
+    pairwise    the previous per-class O(n^2) scan, re-parsing values in the inner loop
+                (only run up to --pairwise-max claims per class; it grows quadratically)
+
+No services are required.
+
+Usage:
+    python scripts/bench_resolution.py [--per-class 10000] [--classes 3] [--pairwise-max 1000]
+
+Exit codes:
+    0 - Benchmark completed
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.services.extraction.resolution.conflict_detector import (  # noqa: E402
+    CONFLICT_THRESHOLD,
+    ConflictDetector,
+)
+from idis.services.extraction.resolution.deduplicator import (  # noqa: E402
+    DeduplicatedClaim,
+    Deduplicator,
+    _extract_numeric_value,
+)
+
+_CLASSES = ("FINANCIAL", "TRACTION", "MARKET", "TEAM", "PRODUCT")
+_PREDICATES = ("arr", "revenue", "gross_margin", "burn")
+_WINDOWS = ("FY2023", "FY2024", "Q4 2024")
+
+
+def _claims(per_class: int, classes: int, seed: int) -> list[DeduplicatedClaim]:
+    rng = random.Random(seed)
+    claims: list[DeduplicatedClaim] = []
+    for claim_class in _CLASSES[:classes]:
+        for i in range(per_class):
+            value = round(10 ** rng.uniform(3, 8), 2)
+            claims.append(
+                DeduplicatedClaim(
+                    claim_text=f"{claim_class} claim {i}",
+                    claim_class=claim_class,
+                    extraction_confidence=Decimal("0.9"),
+                    span_ids=[f"span-{claim_class}-{i}"],
+                    identity_hash=f"{claim_class}-{i:08d}",
+                    predicate=rng.choice(_PREDICATES),
+                    value={"value": value, "time_window": rng.choice(_WINDOWS)},
+                )
+            )
+    return claims
+
+
+def _pairwise(claims: list[DeduplicatedClaim]) -> tuple[int, int]:
+    """The previous per-class pairwise scan; returns (near_matches, conflicting_pairs)."""
+    by_class: dict[str, list[DeduplicatedClaim]] = {}
+    for claim in claims:
+        by_class.setdefault(claim.claim_class, []).append(claim)
+    near = conflicts = 0
+    for group in by_class.values():
+        for i, a in enumerate(group):
+            val_a = _extract_numeric_value({"value": a.value})
+            if val_a is None:
+                continue
+            for b in group[i + 1 :]:
+                val_b = _extract_numeric_value({"value": b.value})
+                if val_b is None:
+                    continue
+                denominator = max(abs(val_a), abs(val_b))
+                if denominator == 0:
+                    continue
+                pct = abs(val_a - val_b) / denominator
+                if pct > CONFLICT_THRESHOLD:
+                    conflicts += 1
+                else:
+                    near += 1
+    return near, conflicts
+
+
+def _timed(mode: str, per_class: int, fn: Any) -> dict[str, Any]:
+    started = time.perf_counter()
+    near, conflicts = fn()
+    return {
+        "mode": mode,
+        "per_class": per_class,
+        "seconds": round(time.perf_counter() - started, 3),
+        "near_matches": near,
+        "conflicts": conflicts,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--per-class", type=int, default=10_000)
+    parser.add_argument("--classes", type=int, default=3, choices=range(1, len(_CLASSES) + 1))
+    parser.add_argument("--pairwise-max", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    dedup = Deduplicator()
+    detector = ConflictDetector()
+    results: list[dict[str, Any]] = []
+    sizes = sorted({n for n in (1_000, args.pairwise_max, args.per_class) if n <= args.per_class})
+    for per_class in sizes:
+        claims = _claims(per_class, args.classes, args.seed)
+
+        def sweep(claims: list[DeduplicatedClaim] = claims) -> tuple[int, int]:
+            near = dedup._find_near_matches(claims)
+            return len(near), detector.detect(claims).conflict_count
+
+        results.append(_timed("sweep", per_class, sweep))
+        if per_class <= args.pairwise_max:
+            results.append(_timed("pairwise", per_class, lambda c=claims: _pairwise(c)))
+
+    print(
+        json.dumps(
+            {"benchmark": "claim_resolution", "classes": args.classes, "results": results},
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Benchmark: extraction task planning over a large data room with the span planning index.
+
+Plans the commercial_dd_v1 methodology against a synthetic data room (--documents classified
+documents, --spans-per-document spans each, evidence tags drawn from the template) twice:
+
+    per_pair  reference planner that re-sorts each document's spans and rebuilds its
+              evidence-tag Counter for every (question, document) pair
+    indexed   InMemoryExtractionTaskPlanner, which sorts spans and builds tag postings once
+              per run and intersects postings per question
+
+and checks both produce byte-identical plans (``model_dump_json``).
+
+No services are required.
+
+Usage:
+    python scripts/bench_task_planner.py [--documents 300] [--spans-per-document 200]
+
+Exit codes:
+    0 - Benchmark completed; plans are byte-identical
+    1 - The indexed plan differs from the per-pair reference plan
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.methodology.models import MethodologyQuestion, MethodologyRegistry  # noqa: E402
+from idis.methodology.registry import load_registry_from_json_file  # noqa: E402
+from idis.models.document_classification import (  # noqa: E402
+    CddDocumentCategory,
+    DocumentSupportStatus,
+    DocumentTriageStatus,
+    FddDocumentCategory,
+)
+from idis.models.extraction_task import (  # noqa: E402
+    ExtractionTask,
+    ExtractionTaskBlockerReason,
+    ExtractionTaskPlanningResult,
+    SourceSpanReference,
+)
+from idis.services.extraction import task_planner  # noqa: E402
+
+_TEMPLATE_PATH = (
+    Path(__file__).parent.parent
+    / "src"
+    / "idis"
+    / "methodology"
+    / "templates"
+    / "commercial_dd_v1.json"
+)
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+DEAL_ID = "22222222-2222-2222-2222-222222222222"
+RUN_ID = "33333333-3333-3333-3333-333333333333"
+_NOISE_TAGS = ("table", "narrative", "footnote", "chart")
+
+
+class PerPairPlanner(task_planner.InMemoryExtractionTaskPlanner):
+    """Reference planner: sorts and counts span tags for every (question, document) pair."""
+
+    def __init__(self, source_spans_by_document_id: dict[str, list[SourceSpanReference]]) -> None:
+        self._source_spans_by_document_id = source_spans_by_document_id
+
+    def _plan_for_question(
+        self,
+        *,
+        tenant_id: str,
+        deal_id: str,
+        run_id: str,
+        question: MethodologyQuestion,
+        coverage_record_id: str | None,
+        classifications: Sequence[task_planner.PlannerClassification],
+        span_index: Any,
+    ) -> list[ExtractionTask]:
+        tasks: list[ExtractionTask] = []
+        common: dict[str, Any] = {
+            "tenant_id": tenant_id,
+            "deal_id": deal_id,
+            "run_id": run_id,
+            "question": question,
+            "coverage_record_id": coverage_record_id,
+        }
+        if not classifications:
+            return [
+                task_planner._blocked_task(
+                    **common,
+                    classification=None,
+                    source_spans=[],
+                    blocker_reason=ExtractionTaskBlockerReason.NO_MATCHING_CLASSIFIED_DOCUMENT,
+                )
+            ]
+        matches = task_planner._classifications_matching_question(question, classifications)
+        if not matches:
+            return [
+                task_planner._blocked_task(
+                    **common,
+                    classification=None,
+                    source_spans=[],
+                    blocker_reason=ExtractionTaskBlockerReason.NO_MATCHING_DOCUMENT_CATEGORY,
+                )
+            ]
+
+        for classification in matches:
+            spans = sorted(
+                self._source_spans_by_document_id.get(classification.document_id, []),
+                key=lambda span: span.span_id,
+            )
+            counts = Counter(tag.lower().strip() for span in spans for tag in span.evidence_tags)
+            reason = task_planner._triage_blocker_for(classification)
+            if reason is None and not spans:
+                reason = ExtractionTaskBlockerReason.NO_SOURCE_SPANS
+            if reason is None and not all(
+                counts[evidence.evidence_type.lower().strip()] >= evidence.min_count
+                for evidence in question.required_evidence
+            ):
+                reason = ExtractionTaskBlockerReason.REQUIRED_EVIDENCE_MISSING
+            if reason is not None:
+                tasks.append(
+                    task_planner._blocked_task(
+                        **common,
+                        classification=classification,
+                        source_spans=spans,
+                        blocker_reason=reason,
+                    )
+                )
+                continue
+            tasks.append(
+                task_planner._ready_task(
+                    **common, classification=classification, source_spans=spans
+                )
+            )
+        return tasks
+
+
+def _data_room(
+    registry: MethodologyRegistry, documents: int, spans_per_document: int, seed: int
+) -> tuple[
+    list[task_planner.SafePreflightClassificationInput], dict[str, list[SourceSpanReference]]
+]:
+    rng = random.Random(seed)
+    evidence_tags = sorted(
+        {
+            evidence.evidence_type
+            for q in registry.current_version.questions
+            for evidence in q.required_evidence
+        }
+    )
+    tags = [*evidence_tags, *_NOISE_TAGS]
+    cdd_categories = list(CddDocumentCategory)
+    classifications = []
+    spans_by_document: dict[str, list[SourceSpanReference]] = {}
+    for index in range(documents):
+        document_id = f"doc-{index:04d}"
+        triage = DocumentTriageStatus.READY if index % 10 else DocumentTriageStatus.OCR_REQUIRED
+        classifications.append(
+            task_planner.SafePreflightClassificationInput(
+                tenant_id=TENANT_ID,
+                deal_id=DEAL_ID,
+                document_id=document_id,
+                classification_id=f"dc-{index:04d}",
+                fdd_category=FddDocumentCategory.UNKNOWN,
+                cdd_category=cdd_categories[index % len(cdd_categories)],
+                support_status=DocumentSupportStatus.SUPPORTED,
+                triage_status=triage,
+                usable_for_methodology_extraction=True,
+            )
+        )
+        spans = [
+            SourceSpanReference(
+                document_id=document_id,
+                span_id=f"span-{rng.randrange(10**9):09d}-{n:04d}",
+                evidence_tags=rng.sample(tags, k=1) if rng.random() < 0.05 else [],
+            )
+            for n in range(spans_per_document)
+        ]
+        rng.shuffle(spans)
+        spans_by_document[document_id] = spans
+    return classifications, spans_by_document
+
+
+def _plan(
+    planner: task_planner.InMemoryExtractionTaskPlanner,
+    registry: MethodologyRegistry,
+    classifications: list[task_planner.SafePreflightClassificationInput],
+    spans_by_document: dict[str, list[SourceSpanReference]],
+) -> tuple[float, ExtractionTaskPlanningResult]:
+    started = time.perf_counter()
+    result = planner.plan_tasks(
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        run_id=RUN_ID,
+        methodology_registry=registry,
+        classifications=classifications,
+        source_spans_by_document_id=spans_by_document,
+    )
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--documents", type=int, default=300)
+    parser.add_argument("--spans-per-document", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", type=Path, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    registry = load_registry_from_json_file(_TEMPLATE_PATH)
+    classifications, spans_by_document = _data_room(
+        registry, args.documents, args.spans_per_document, args.seed
+    )
+    planners: dict[str, task_planner.InMemoryExtractionTaskPlanner] = {
+        "per_pair": PerPairPlanner(spans_by_document),
+        "indexed": task_planner.InMemoryExtractionTaskPlanner(),
+    }
+
+    results: list[dict[str, Any]] = []
+    plans: dict[str, str] = {}
+    for mode, planner in planners.items():
+        samples = []
+        for _ in range(args.repeat):
+            elapsed_ms, plan = _plan(planner, registry, classifications, spans_by_document)
+            samples.append(elapsed_ms)
+        plans[mode] = plan.model_dump_json()
+        results.append(
+            {
+                "mode": mode,
+                "plan_ms_p50": round(statistics.median(samples), 1),
+                "tasks": plan.summary.total_tasks,
+                "by_status": plan.summary.by_status,
+            }
+        )
+
+    identical = plans["per_pair"] == plans["indexed"]
+    report = {
+        "benchmark": "task_planner",
+        "documents": args.documents,
+        "spans_per_document": args.spans_per_document,
+        "questions": len(registry.current_version.questions),
+        "results": results,
+        "speedup": round(results[0]["plan_ms_p50"] / max(results[1]["plan_ms_p50"], 0.001), 2),
+        "plans_identical": identical,
+    }
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.out:
+        args.out.write_text(rendered + "\n", encoding="utf-8")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
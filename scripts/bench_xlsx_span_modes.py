@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark: XLSX span count, parse time and extraction tokens per span mode.
+
+Parses every GDBS ``financials.xlsx`` in each span mode and reports:
+
+    cell   one span per non-empty cell (default)
+    row    one span per non-empty row (tab-separated values)
+    table  one span per contiguous block of rows
+
+For each mode: spans (rows to persist), parse time, extraction chunks and the estimated
+extraction tokens of those chunks. Compacted modes are also checked to expand back to exactly
+the cell-mode spans.
+
+No services are required.
+
+Usage:
+    python scripts/bench_xlsx_span_modes.py [--deals-dir DIR] [--out report.json]
+
+Exit codes:
+    0 - Benchmark completed; every compacted mode expanded back to the cell-mode spans
+    1 - No workbooks found, a parse failed, or an expansion did not match
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from idis.parsers.base import SpanDraft, XlsxSpanMode  # noqa: E402
+from idis.parsers.xlsx import expand_compacted_span, parse_xlsx  # noqa: E402
+from idis.services.extraction.chunking.service import ChunkingService  # noqa: E402
+
+_DEFAULT_DEALS_DIR = Path(__file__).parent.parent / "datasets" / "gdbs_full" / "deals"
+
+
+def _span_dicts(spans: list[SpanDraft]) -> list[dict[str, Any]]:
+    return [
+        {"span_id": f"span-{i}", "text_excerpt": span.text_excerpt, "locator": span.locator}
+        for i, span in enumerate(spans)
+    ]
+
+
+def _measure(
+    workbooks: list[tuple[str, bytes]],
+    mode: XlsxSpanMode,
+    cell_spans: dict[str, list[SpanDraft]],
+) -> dict[str, Any]:
+    chunking = ChunkingService()
+    spans = chunks = tokens = 0
+    parse_seconds = 0.0
+    failures: list[str] = []
+    mismatched: list[str] = []
+
+    for name, data in workbooks:
+        started = time.perf_counter()
+        result = parse_xlsx(data, span_mode=mode)
+        parse_seconds += time.perf_counter() - started
+        if not result.success:
+            failures.append(name)
+            continue
+        if mode is XlsxSpanMode.CELL:
+            cell_spans[name] = result.spans
+        else:
+            expanded = [cell for span in result.spans for cell in expand_compacted_span(span)]
+            if expanded != cell_spans.get(name):
+                mismatched.append(name)
+        doc_chunks = chunking.chunk_spans(
+            _span_dicts(result.spans), document_id=name, doc_type="XLSX"
+        )
+        spans += len(result.spans)
+        chunks += len(doc_chunks)
+        tokens += sum(chunk.token_estimate for chunk in doc_chunks)
+
+    return {
+        "mode": mode.value,
+        "workbooks": len(workbooks),
+        "spans": spans,
+        "parse_ms": round(parse_seconds * 1000, 1),
+        "chunks": chunks,
+        "extraction_tokens": tokens,
+        "failures": failures,
+        "expansion_mismatches": mismatched,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--deals-dir", type=Path, default=_DEFAULT_DEALS_DIR)
+    parser.add_argument("--out", type=Path, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    paths = sorted(args.deals_dir.glob("*/artifacts/financials.xlsx"))
+    if not paths:
+        print(f"No workbooks found under {args.deals_dir}", file=sys.stderr)
+        return 1
+    workbooks = [(path.parent.parent.name, path.read_bytes()) for path in paths]
+
+    cell_spans: dict[str, list[SpanDraft]] = {}
+    results = [_measure(workbooks, mode, cell_spans) for mode in XlsxSpanMode]
+    baseline = results[0]
+    for result in results[1:]:
+        result["span_reduction"] = round(1 - result["spans"] / max(baseline["spans"], 1), 3)
+
+    report = {"benchmark": "xlsx_span_modes", "results": results}
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.out:
+        args.out.write_text(rendered + "\n", encoding="utf-8")
+    failed = any(r["failures"] or r["expansion_mismatches"] for r in results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
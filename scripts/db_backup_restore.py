@@ -12,7 +12,8 @@ and safe aggregates only).
 
 Design (reuses existing repo tooling, no external pg_dump dependency):
 - backup: per-table CSV dumps via COPY (deterministic ordering) + a safe manifest
-  {schema_revision, tables: {name: {rows, sha256}}}.
+  {schema_revision, tables: {name: {rows, sha256}}}. Partitioned tables (``audit_events``)
+  are dumped and restored through their parent; individual partitions are skipped.
 - restore: verify every dump's sha256 against the manifest (fail-closed), replay the schema
   with alembic to the manifest's revision (migrations are the schema source of truth, so RLS
   ENABLE+FORCE and the audit immutability trigger are restored exactly), truncate, then COPY
@@ -64,6 +65,10 @@ def _public_tables(conn: Any) -> list[str]:
             WHERE table_schema = 'public'
               AND table_type = 'BASE TABLE'
               AND table_name <> 'alembic_version'
+              AND table_name NOT IN (
+                  SELECT relname FROM pg_class
+                  WHERE relispartition AND relnamespace = 'public'::regnamespace
+              )
             ORDER BY table_name
             """
         )
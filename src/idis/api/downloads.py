@@ -0,0 +1,154 @@
+"""Streamed object downloads with conditional and byte-range requests.
+
+Download routes serve stored artifacts through ``stored_object_response``: it reads the object's
+metadata first, answers ``If-None-Match`` with 304 and unsatisfiable ``Range`` requests with 416
+without opening the content, then streams the full object (200) or one byte range (206) in
+bounded chunks via ``ObjectStore.get_stream``.
+
+The strong ETag is the stored sha256 from object metadata; content is never rehashed on
+download. Only single ``bytes=`` ranges are honored. Multi-range or malformed ``Range`` headers,
+and ``If-Range`` validators that do not match the current ETag, fall back to the full body as
+RFC 9110 allows.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from starlette.responses import Response, StreamingResponse
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+
+    from idis.storage.object_store import ObjectStore
+
+_BYTES_UNIT_PREFIX = "bytes="
+
+
+class RangeNotSatisfiableError(ValueError):
+    """The requested byte range starts beyond the end of the object."""
+
+
+def object_etag(sha256: str) -> str:
+    """Return the strong ETag for an object with the given content sha256."""
+    return f'"{sha256}"'
+
+
+def if_none_match_hits(header: str | None, etag: str) -> bool:
+    """Return True when an ``If-None-Match`` header matches ``etag`` (weak comparison).
+
+    Args:
+        header: Raw ``If-None-Match`` header value, or None.
+        etag: Current strong ETag of the object.
+
+    Returns:
+        True if the client's cached representation is current.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def parse_byte_range(header: str | None, size_bytes: int) -> tuple[int, int] | None:
+    """Resolve a ``Range`` header to inclusive offsets within an object.
+
+    Args:
+        header: Raw ``Range`` header value, or None.
+        size_bytes: Size of the whole object.
+
+    Returns:
+        Inclusive ``(start, end)`` clamped to the object, or None to serve the whole object
+        (no header, another unit, several ranges or a malformed spec).
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts at or beyond the end of the object, or
+            is a zero-length suffix.
+    """
+    if not header or not header.startswith(_BYTES_UNIT_PREFIX):
+        return None
+    spec = header[len(_BYTES_UNIT_PREFIX) :].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    first, _, last = (part.strip() for part in spec.partition("-"))
+    if not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size_bytes == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(size_bytes - suffix, 0), size_bytes - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size_bytes:
+        raise RangeNotSatisfiableError(header)
+    return start, min(int(last), size_bytes - 1) if last else size_bytes - 1
+
+
+def stored_object_response(
+    request: Request,
+    object_store: ObjectStore,
+    *,
+    tenant_id: str,
+    key: str,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serve a stored object honoring ``If-None-Match``, ``Range`` and ``If-Range``.
+
+    Args:
+        request: Incoming request (conditional and range headers are read from it).
+        object_store: Store holding the object.
+        tenant_id: UUID of the tenant.
+        key: Object key.
+        media_type: Content type of the full representation.
+        headers: Extra response headers (e.g. ``Content-Disposition``).
+
+    Returns:
+        304 (not modified), 416 (range not satisfiable), 206 (one streamed byte range) or
+        200 (whole object streamed).
+
+    Raises:
+        ObjectNotFoundError: If the object does not exist.
+        ObjectStorageError: If the backend cannot complete the read.
+    """
+    metadata = object_store.head(tenant_id, key)
+    etag = object_etag(metadata.sha256)
+    response_headers = {**(headers or {}), "ETag": etag, "Accept-Ranges": "bytes"}
+
+    if if_none_match_hits(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=response_headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() != etag:
+        range_header = None
+    try:
+        byte_range = parse_byte_range(range_header, metadata.size_bytes)
+    except RangeNotSatisfiableError:
+        return Response(
+            status_code=416,
+            headers={**response_headers, "Content-Range": f"bytes */{metadata.size_bytes}"},
+        )
+
+    stream = object_store.get_stream(
+        tenant_id, key, version_id=metadata.version_id, byte_range=byte_range
+    )
+    response_headers["Content-Length"] = str(stream.content_length)
+    status_code = 200
+    if byte_range is not None:
+        status_code = 206
+        response_headers["Content-Range"] = (
+            f"bytes {stream.start}-{stream.end}/{metadata.size_bytes}"
+        )
+    return StreamingResponse(
+        stream.chunks,
+        status_code=status_code,
+        media_type=media_type,
+        headers=response_headers,
+    )
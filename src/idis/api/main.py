@@ -32,6 +32,7 @@ from idis.api.routes.break_glass import router as break_glass_router
 from idis.api.routes.claims import router as claims_router
 from idis.api.routes.compliance_admin import router as compliance_admin_router
 from idis.api.routes.data_room_packages import router as data_room_packages_router
+from idis.api.routes.deal_export import router as deal_export_router
 from idis.api.routes.deals import router as deals_router
 from idis.api.routes.debate import router as debate_router
 from idis.api.routes.defects import router as defects_router
@@ -202,6 +203,7 @@ def create_app(
     app.include_router(documents_router)
     app.include_router(data_room_packages_router)
     app.include_router(claims_router)
+    app.include_router(deal_export_router)
     app.include_router(sanad_router)
     app.include_router(defects_router)
     app.include_router(webhooks_router)
@@ -21,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import re
 from typing import Any
 
 from starlette.requests import Request
@@ -37,6 +38,15 @@ logger = logging.getLogger(__name__)
 # SET LOCAL / in-tx audit for that path, so only routes that touch no tenant data belong here.
 _DB_TX_EXEMPT_PATHS = frozenset({"/v1/strict-readiness"})
 
+# Read-only streaming GETs: bulk exports (rows from a server-side cursor) and deliverable
+# downloads (object-store chunks). Their messages are forwarded as they are produced instead of
+# buffered until commit, so a large body is never held in memory. The transaction still wraps
+# the whole response (the export cursor lives in it); since these routes never write, a failed
+# commit after the body was sent is logged rather than turned into a 500.
+_STREAMING_READ_PATH_RE = re.compile(
+    r"^/v1/(?:deals/[^/]+/export/[^/]+|deliverables/[^/]+/content)$"
+)
+
 
 def _open_connection() -> tuple[Any, Any]:
     """Open a DB connection and begin a transaction (sync, runs in thread).
@@ -80,6 +90,7 @@ class DBTransactionMiddleware:
     - Commits transaction if response status < 500
     - Rolls back transaction if response status >= 500
     - Always closes connection (never leaks)
+    - Buffers the response until commit, except read-only export and download streams
 
     Ordering:
     - Must run after RequestIdMiddleware (needs request_id for error responses)
@@ -145,17 +156,32 @@ class DBTransactionMiddleware:
 
         response_status: int | None = None
         response_messages: list[Any] = []
+        streaming = scope.get("method") == "GET" and bool(_STREAMING_READ_PATH_RE.match(path))
 
         async def send_wrapper(message: Any) -> None:
             nonlocal response_status
             if message["type"] == "http.response.start":
                 response_status = message.get("status", 500)
-            response_messages.append(message)
+            if streaming:
+                await send(message)
+            else:
+                response_messages.append(message)
 
         try:
             await self.app(scope, receive, send_wrapper)
 
-            if response_status is not None and response_status < 500:
+            if streaming and response_status is not None and response_status < 500:
+                try:
+                    await asyncio.to_thread(_commit, trans)
+                except Exception as e:
+                    logger.error(
+                        "Failed to commit read-only streaming transaction: %s",
+                        e,
+                        extra={"request_id": request_id},
+                    )
+                    with contextlib.suppress(Exception):
+                        await asyncio.to_thread(_rollback, trans)
+            elif response_status is not None and response_status < 500:
                 try:
                     await asyncio.to_thread(_commit, trans)
                     logger.debug("Committed DB transaction for request %s", request_id)
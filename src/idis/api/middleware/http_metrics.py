@@ -7,10 +7,14 @@ Records only genuinely measured, tenant-safe counters into the in-process regist
 - ``http_request_5xx_total{method}``
 - ``http_request_duration_ms_total{method}`` (sum of wall-clock ms; pair with
   ``http_requests_total`` for averages)
+- ``http_request_duration_seconds{method, route}`` (latency histogram)
 
-Labels are restricted to the HTTP method and a coarse status class - NEVER the request path
-(paths embed tenant/deal/run identifiers), headers, query strings, or payloads. An unhandled
-exception counts as a 5xx before re-raising.
+Labels are restricted to the HTTP method, a coarse status class and the route TEMPLATE
+(``/v1/deals/{deal_id}``: the OpenAPI path matched by OpenAPIValidationMiddleware, else the
+Starlette route path, else ``unmatched``) - NEVER the raw request path (paths embed
+tenant/deal/run identifiers), headers, query strings, or payloads. Requests rejected before
+route matching (e.g. failed authentication) are labeled ``unmatched``. An unhandled exception
+counts as a 5xx before re-raising.
 """
 
 from __future__ import annotations
@@ -24,17 +28,30 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from idis.observability.metrics import (
     HTTP_REQUEST_5XX_TOTAL,
     HTTP_REQUEST_DURATION_MS_TOTAL,
+    HTTP_REQUEST_DURATION_SECONDS,
     HTTP_REQUESTS_TOTAL,
     increment_counter,
+    observe_histogram,
 )
 
+UNMATCHED_ROUTE = "unmatched"
+
 
 def _status_class(status_code: int) -> str:
     return f"{status_code // 100}xx"
 
 
+def _route_template(request: Request) -> str:
+    template = getattr(request.state, "openapi_path_template", None)
+    if template:
+        return str(template)
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) and path else UNMATCHED_ROUTE
+
+
 class HttpMetricsMiddleware(BaseHTTPMiddleware):
-    """Count every request by method + status class and accumulate latency."""
+    """Count every request by method + status class and record latency by route template."""
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
@@ -44,14 +61,20 @@ class HttpMetricsMiddleware(BaseHTTPMiddleware):
         try:
             response = await call_next(request)
         except Exception:
-            self._record(method, 500, started)
+            self._record(request, method, 500, started)
             raise
-        self._record(method, response.status_code, started)
+        self._record(request, method, response.status_code, started)
         return response
 
     @staticmethod
-    def _record(method: str, status_code: int, started: float) -> None:
-        elapsed_ms = int((time.perf_counter() - started) * 1000)
+    def _record(request: Request, method: str, status_code: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        elapsed_ms = int(elapsed * 1000)
+        observe_histogram(
+            HTTP_REQUEST_DURATION_SECONDS,
+            elapsed,
+            labels={"method": method, "route": _route_template(request)},
+        )
         increment_counter(
             HTTP_REQUESTS_TOTAL,
             labels={"method": method, "status_class": _status_class(status_code)},
@@ -8,6 +8,9 @@ Rate limit tier is classified by actor role:
 - INTEGRATION_SERVICE role => integration tier
 - All other roles => user tier
 
+When configured, the per-actor and write route-class buckets are checked in the same limiter call
+(one Redis round-trip, or none when the local token lease covers the request).
+
 Middleware ordering (in main.py):
 1. RequestIdMiddleware (outermost)
 2. AuditMiddleware
@@ -31,7 +34,9 @@ from idis.api.error_model import make_error_response_no_request
 from idis.observability.runtime_signals import RATE_LIMIT_DENIED, emit_run_signal
 from idis.rate_limit.limiter import (
     RateLimitConfig,
+    RateLimitScope,
     TenantRateLimiter,
+    classify_route_class,
     classify_tier,
     load_rate_limit_config,
 )
@@ -46,7 +51,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     1. Skip non-/v1 paths
     2. If no tenant_context, skip (auth middleware handles 401)
     3. Classify tier from roles (INTEGRATION_SERVICE => integration, else user)
-    4. Consume token from limiter
+    4. Consume a token from every applicable bucket (tier, actor, route class)
     5. If allowed: proceed with optional rate limit headers
     6. If denied: return 429 RATE_LIMIT_EXCEEDED with normative error envelope
 
@@ -94,7 +99,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         try:
             tier = classify_tier(tenant_ctx.roles)
-            decision = self._limiter.check(tenant_ctx.tenant_id, tier)
+            check_request = getattr(self._limiter, "check_request", None)
+            if check_request is None:
+                # Injected limiters that only implement the tier-level check().
+                decision = self._limiter.check(tenant_ctx.tenant_id, tier)
+            else:
+                decision = check_request(
+                    tenant_ctx.tenant_id,
+                    tier,
+                    actor_id=tenant_ctx.actor_id,
+                    route_class=classify_route_class(request.method),
+                )
         except Exception:
             logger.exception(
                 "Rate limiter internal error for tenant=%s",
@@ -117,9 +132,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return response
 
         logger.info(
-            "Rate limit exceeded: tenant=%s tier=%s limit=%d retry_after=%d",
+            "Rate limit exceeded: tenant=%s tier=%s scope=%s limit=%d retry_after=%d",
             tenant_ctx.tenant_id,
             decision.tier.value,
+            getattr(decision, "scope", RateLimitScope.TIER).value,
             decision.limit_rpm,
             decision.retry_after_seconds,
             extra={"request_id": request_id},
@@ -153,6 +153,9 @@ POLICY_RULES: dict[str, PolicyRule] = {
     ),
     "listDealClaims": PolicyRule(allowed_roles=ALL_ROLES, is_mutation=False, is_deal_scoped=True),
     "createClaim": PolicyRule(allowed_roles=MUTATOR_ROLES, is_mutation=True, is_deal_scoped=True),
+    "exportDealRecords": PolicyRule(
+        allowed_roles=ALL_ROLES, is_mutation=False, is_deal_scoped=True
+    ),
     "getClaim": PolicyRule(allowed_roles=ALL_ROLES, is_mutation=False, is_deal_scoped=False),
     "updateClaim": PolicyRule(allowed_roles=MUTATOR_ROLES, is_mutation=True, is_deal_scoped=False),
     "getClaimSanad": PolicyRule(allowed_roles=ALL_ROLES, is_mutation=False, is_deal_scoped=False),
@@ -0,0 +1,84 @@
+"""Bulk export routes for IDIS API.
+
+Provides GET /v1/deals/{dealId}/export/{entity} per OpenAPI spec: a deal's claims, sanads or
+defects streamed as NDJSON from a server-side cursor, with optional column projection and
+``updated_since`` incremental sync.
+
+Supports both Postgres persistence (when configured) and in-memory fallback.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, HTTPException, Request
+from starlette.responses import StreamingResponse
+
+from idis.api.auth import RequireTenantContext
+from idis.persistence.repositories.deal_export import (
+    EXPORT_ENTITIES,
+    NDJSON_MEDIA_TYPE,
+    ExportProjectionError,
+    InMemoryDealExporter,
+    PostgresDealExporter,
+    ndjson_chunks,
+    resolve_columns,
+)
+
+router = APIRouter(prefix="/v1", tags=["Claims"])
+
+
+@router.get("/deals/{deal_id}/export/{entity}", operation_id="exportDealRecords")
+def export_deal_records(
+    deal_id: str,
+    entity: str,
+    request: Request,
+    tenant_ctx: RequireTenantContext,
+    fields: str | None = None,
+    updated_since: datetime | None = None,
+) -> StreamingResponse:
+    """Stream a deal's claims, sanads or defects as NDJSON.
+
+    Args:
+        deal_id: UUID of the deal.
+        entity: One of claims, sanads, defects.
+        request: FastAPI request for DB connection access.
+        tenant_ctx: Injected tenant context from auth dependency.
+        fields: Comma-separated column projection.
+        updated_since: Only records changed at or after this instant.
+
+    Returns:
+        NDJSON stream ordered by (changed_at, id).
+
+    Raises:
+        HTTPException: 404 if deal or entity not found, 400 if a field is unknown.
+    """
+    from idis.persistence.repositories.deals import (
+        DealsRepository,
+        InMemoryDealsRepository,
+    )
+
+    if entity not in EXPORT_ENTITIES:
+        raise HTTPException(status_code=404, detail="Unknown export entity")
+    try:
+        columns = resolve_columns(entity, fields)
+    except ExportProjectionError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    if updated_since is not None and updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=UTC)
+
+    db_conn = getattr(request.state, "db_conn", None)
+    deals_repo: DealsRepository | InMemoryDealsRepository
+    exporter: PostgresDealExporter | InMemoryDealExporter
+    if db_conn is not None:
+        deals_repo = DealsRepository(db_conn, tenant_ctx.tenant_id)
+        exporter = PostgresDealExporter(db_conn, tenant_ctx.tenant_id)
+    else:
+        deals_repo = InMemoryDealsRepository(tenant_ctx.tenant_id)
+        exporter = InMemoryDealExporter(tenant_ctx.tenant_id)
+
+    if deals_repo.get(deal_id) is None:
+        raise HTTPException(status_code=404, detail="Deal not found")
+
+    rows = exporter.iter_rows(entity, deal_id, columns=columns, updated_since=updated_since)
+    return StreamingResponse(ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE)
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 from starlette.responses import Response
 
 from idis.api.auth import RequireTenantContext
+from idis.api.downloads import stored_object_response
 from idis.api.errors import IdisHttpError
 from idis.deliverables.artifact_catalog import (
     MANIFEST_ARTIFACT_TYPE,
@@ -285,7 +286,11 @@ def download_deliverable_content(
     request: Request,
     tenant_ctx: RequireTenantContext,
 ) -> Response:
-    """Download one completed deliverable artifact via configured object storage."""
+    """Download one completed deliverable artifact via configured object storage.
+
+    Streams the artifact in bounded chunks with a sha256 ETag, answering ``If-None-Match``
+    (304) and single ``Range`` requests (206/416) without loading the whole object.
+    """
     db_conn = getattr(request.state, "db_conn", None)
     row = _downloadable_row(
         _get_deliverable_row(
@@ -313,7 +318,14 @@ def download_deliverable_content(
         )
 
     try:
-        stored = object_store.get(tenant_id=tenant_ctx.tenant_id, key=object_key)
+        response = stored_object_response(
+            request,
+            object_store,
+            tenant_id=tenant_ctx.tenant_id,
+            key=object_key,
+            media_type=content_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
     except ObjectNotFoundError as exc:
         raise IdisHttpError(
             status_code=404,
@@ -328,11 +340,7 @@ def download_deliverable_content(
         ) from exc
 
     request.state.audit_resource_id = deliverable_id
-    return Response(
-        content=stored.body,
-        media_type=content_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return response
 
 
 @router.get(
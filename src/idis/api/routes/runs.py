@@ -3222,6 +3222,8 @@ def _run_snapshot_auto_grade(
         "failed_count": grade_result.failed_count,
         "total_defects": grade_result.total_defects,
         "all_failed": grade_result.all_failed,
+        "reused_grades": grade_result.reused_count,
+        "recomputed_grades": grade_result.recomputed_count,
     }
 
 
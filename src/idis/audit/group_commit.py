@@ -0,0 +1,276 @@
+"""Group-commit audit writer for IDIS.
+
+Standalone ``PostgresAuditSink.emit`` opens one transaction per event, so a FULL run (one
+event per claim, agent and step) turns into thousands of single-row commits. The
+``GroupCommitAuditWriter`` coalesces concurrently emitted events into one multi-row INSERT
+per tenant and one commit per tenant group.
+
+Design (leader/follower group commit, as in a WAL flush):
+    - Every caller appends its event to a shared queue and blocks.
+    - If no flush is in flight, the caller becomes the leader: it optionally lingers for
+      ``linger_ms`` (only while other emitters are in flight, so a lone sequential caller
+      never pays the delay), drains up to ``max_batch_events`` and commits them.
+    - Events that arrive while a commit is in flight form the next batch.
+    - Each caller returns only after its own event is durably committed; if its tenant's
+      commit fails, the caller gets AuditSinkError (fail closed, never fire-and-forget).
+
+Throughput is recorded in the process-wide metrics registry (``audit_group_commit_*``
+counters, global aggregates with no tenant label) and in ``stats()``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Final
+
+from idis.audit.sink import AuditSinkError
+from idis.observability.metrics import (
+    AUDIT_GROUP_COMMIT_BATCHES_TOTAL,
+    AUDIT_GROUP_COMMIT_DURATION_MS_TOTAL,
+    AUDIT_GROUP_COMMIT_EVENTS_TOTAL,
+    AUDIT_GROUP_COMMIT_FAILURES_TOTAL,
+    increment_counter,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_EVENTS: Final[int] = 500
+DEFAULT_LINGER_MS: Final[float] = 2.0
+
+CommitBatchFn = Callable[[str, Sequence[dict[str, Any]]], None]
+
+
+@dataclass(frozen=True, slots=True)
+class GroupCommitStats:
+    """Snapshot of group-commit throughput counters.
+
+    Attributes:
+        batches: Tenant batches committed successfully.
+        events: Events committed successfully.
+        failed_batches: Tenant batches whose commit raised.
+        commit_seconds: Wall-clock seconds spent inside commits.
+        largest_batch: Largest tenant batch committed so far.
+    """
+
+    batches: int
+    events: int
+    failed_batches: int
+    commit_seconds: float
+    largest_batch: int
+
+    @property
+    def events_per_batch(self) -> float:
+        """Average committed events per tenant batch."""
+        return self.events / self.batches if self.batches else 0.0
+
+    @property
+    def events_per_commit_second(self) -> float:
+        """Committed events per second of commit time."""
+        return self.events / self.commit_seconds if self.commit_seconds > 0 else 0.0
+
+
+class _PendingEvent:
+    """One queued event and the outcome its emitter is waiting for."""
+
+    __slots__ = ("event", "tenant_id", "done", "error")
+
+    def __init__(self, event: dict[str, Any], tenant_id: str) -> None:
+        self.event = event
+        self.tenant_id = tenant_id
+        self.done = False
+        self.error: BaseException | None = None
+
+
+class GroupCommitAuditWriter:
+    """Coalesces concurrent audit emissions into per-tenant multi-row commits.
+
+    Thread-safe. The commit function is injected so the batching logic is independent of
+    the storage backend; the default commits through ``commit_tenant_batch`` (Postgres).
+    """
+
+    def __init__(
+        self,
+        commit_batch: CommitBatchFn | None = None,
+        *,
+        max_batch_events: int = DEFAULT_MAX_BATCH_EVENTS,
+        linger_ms: float = DEFAULT_LINGER_MS,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            commit_batch: Callable committing one tenant's events durably; raises on failure.
+                If None, uses the Postgres ``commit_tenant_batch``.
+            max_batch_events: Maximum events drained into one flush.
+            linger_ms: Maximum time a leader waits for siblings before flushing.
+
+        Raises:
+            ValueError: If max_batch_events < 1 or linger_ms < 0.
+        """
+        if max_batch_events < 1:
+            raise ValueError(f"max_batch_events must be >= 1, got {max_batch_events}")
+        if linger_ms < 0:
+            raise ValueError(f"linger_ms must be >= 0, got {linger_ms}")
+        if commit_batch is None:
+            from idis.audit.postgres_sink import commit_tenant_batch
+
+            commit_batch = commit_tenant_batch
+        self._commit_batch = commit_batch
+        self._max_batch_events = max_batch_events
+        self._linger_seconds = linger_ms / 1000.0
+
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: list[_PendingEvent] = []
+        self._flushing = False
+        self._active_emitters = 0
+
+        self._batches = 0
+        self._events = 0
+        self._failed_batches = 0
+        self._commit_seconds = 0.0
+        self._largest_batch = 0
+
+    def emit(self, event: dict[str, Any]) -> None:
+        """Emit one audit event, blocking until its batch is durably committed.
+
+        Args:
+            event: Validated audit event dict.
+
+        Raises:
+            AuditSinkError: If the event has no valid tenant or its batch fails to commit.
+        """
+        tenant_id = event.get("tenant_id")
+        if not tenant_id or tenant_id == "unknown":
+            raise AuditSinkError("Cannot emit audit event without valid tenant_id")
+
+        item = _PendingEvent(event, str(tenant_id))
+        with self._cond:
+            self._pending.append(item)
+            self._active_emitters += 1
+            try:
+                while not item.done:
+                    if self._flushing:
+                        self._cond.wait()
+                    else:
+                        self._lead_flush()
+            finally:
+                self._active_emitters -= 1
+
+        if item.error is not None:
+            if isinstance(item.error, AuditSinkError):
+                raise AuditSinkError(str(item.error)) from item.error
+            raise AuditSinkError(f"Failed to emit audit event: {item.error}") from item.error
+
+    def stats(self) -> GroupCommitStats:
+        """Return a snapshot of this writer's throughput counters."""
+        with self._cond:
+            return GroupCommitStats(
+                batches=self._batches,
+                events=self._events,
+                failed_batches=self._failed_batches,
+                commit_seconds=self._commit_seconds,
+                largest_batch=self._largest_batch,
+            )
+
+    def _lead_flush(self) -> None:
+        """Drain and commit one batch as leader. Caller holds the condition lock."""
+        self._flushing = True
+        batch: list[_PendingEvent] = []
+        committed = False
+        try:
+            if self._linger_seconds > 0 and self._active_emitters > 1:
+                deadline = time.monotonic() + self._linger_seconds
+                while len(self._pending) < self._max_batch_events:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+            batch = self._pending[: self._max_batch_events]
+            del self._pending[: self._max_batch_events]
+
+            self._cond.release()
+            try:
+                outcomes = self._commit_by_tenant(batch)
+            finally:
+                self._cond.acquire()
+            committed = True
+            self._record(outcomes)
+        finally:
+            # Every drained event must be released, even if the leader was interrupted:
+            # an event whose commit outcome is unknown is reported as failed (fail closed).
+            for item in batch:
+                if not committed and item.error is None:
+                    item.error = AuditSinkError("Audit group commit interrupted")
+                item.done = True
+            self._flushing = False
+            self._cond.notify_all()
+
+    def _commit_by_tenant(
+        self, batch: list[_PendingEvent]
+    ) -> list[tuple[int, float, BaseException | None]]:
+        """Commit a drained batch, one tenant group at a time (lock NOT held)."""
+        groups: dict[str, list[_PendingEvent]] = {}
+        for item in batch:
+            groups.setdefault(item.tenant_id, []).append(item)
+
+        outcomes: list[tuple[int, float, BaseException | None]] = []
+        for tenant_id, items in groups.items():
+            started = time.perf_counter()
+            error: BaseException | None = None
+            try:
+                self._commit_batch(tenant_id, [item.event for item in items])
+            except Exception as exc:
+                error = exc
+                logger.error(
+                    "Audit group commit failed for %d events of tenant %s: %s",
+                    len(items),
+                    tenant_id,
+                    exc,
+                )
+                for item in items:
+                    item.error = exc
+            outcomes.append((len(items), time.perf_counter() - started, error))
+        return outcomes
+
+    def _record(self, outcomes: list[tuple[int, float, BaseException | None]]) -> None:
+        """Fold commit outcomes into stats and metrics. Caller holds the condition lock."""
+        for size, seconds, error in outcomes:
+            self._commit_seconds += seconds
+            increment_counter(AUDIT_GROUP_COMMIT_DURATION_MS_TOTAL, value=round(seconds * 1000))
+            if error is not None:
+                self._failed_batches += 1
+                increment_counter(AUDIT_GROUP_COMMIT_FAILURES_TOTAL)
+                continue
+            self._batches += 1
+            self._events += size
+            self._largest_batch = max(self._largest_batch, size)
+            increment_counter(AUDIT_GROUP_COMMIT_BATCHES_TOTAL)
+            increment_counter(AUDIT_GROUP_COMMIT_EVENTS_TOTAL, value=size)
+
+
+_writer: GroupCommitAuditWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_group_commit_writer() -> GroupCommitAuditWriter:
+    """Get or create the process-wide Postgres group-commit writer.
+
+    Returns:
+        Shared GroupCommitAuditWriter committing through Postgres.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = GroupCommitAuditWriter()
+        return _writer
+
+
+def reset_group_commit_writer() -> None:
+    """Drop the process-wide writer (tests only)."""
+    global _writer
+    with _writer_lock:
+        _writer = None
@@ -0,0 +1,323 @@
+"""Sidecar segment index for the JSONL audit log.
+
+``JsonlAuditQueryRepository`` used to ``json.loads`` the whole audit file on every request.
+This module splits the append-only file into fixed-size *segments* (contiguous byte ranges of
+``segment_events`` complete lines) and records per-segment metadata in a sidecar file next to
+the log (``<log>.idx``), one JSON object per sealed segment:
+
+    start / end        byte offsets of the segment in the log (end exclusive)
+    events             number of lines in the segment
+    tenants            exact set of tenant_ids present
+    event_types        exact set of event_types present
+    min_at / max_at    lexicographic min/max of occurred_at (same ordering as pagination)
+    deal_bloom         bloom filter (hex) over deal ids (``audit_event_deal_id``)
+
+Queries prune segments on tenant, event_type and deal membership, visit the rest newest-first
+by ``max_at`` and stop once no remaining segment can beat the current page; each candidate
+segment is read with one seek and its lines are walked backwards.
+
+Maintenance is incremental and reader-driven: ``refresh()`` scans only the bytes after the
+last sealed segment, so every process that appends (API, worker) is covered no matter who
+wrote the bytes. The sink refreshes every ``segment_events`` appends; readers refresh before
+querying. The bytes after the last sealed segment (the *tail*) are always scanned directly.
+The index is derived data: if the log is truncated or replaced it is rebuilt from scratch,
+and duplicate segment records from concurrent refreshers are ignored on load.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from idis.audit.sink import DEFAULT_INDEX_SEGMENT_EVENTS, audit_event_deal_id
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION: Final[int] = 1
+INDEX_SUFFIX: Final[str] = ".idx"
+DEFAULT_SEGMENT_EVENTS: Final[int] = DEFAULT_INDEX_SEGMENT_EVENTS
+
+# Bloom filter sizing: 2048 bits / 3 hashes keeps false positives ~1% at ~200 distinct deals
+# per segment (a false positive only costs reading one extra segment).
+_BLOOM_BITS: Final[int] = 2048
+_BLOOM_HASHES: Final[int] = 3
+_HEAD_BYTES: Final[int] = 4096
+
+
+def _bloom_positions(value: str) -> Iterator[int]:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8 * _BLOOM_HASHES).digest()
+    for i in range(_BLOOM_HASHES):
+        yield int.from_bytes(digest[i * 8 : (i + 1) * 8], "big") % _BLOOM_BITS
+
+
+def _bloom_add(bits: int, value: str) -> int:
+    for position in _bloom_positions(value):
+        bits |= 1 << position
+    return bits
+
+
+def bloom_may_contain(bloom_hex: str, value: str) -> bool:
+    """Check bloom membership (False means definitely absent)."""
+    bits = int(bloom_hex, 16) if bloom_hex else 0
+    return all(bits >> position & 1 for position in _bloom_positions(value))
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentInfo:
+    """Metadata for one sealed (or tail) segment of the audit log."""
+
+    start: int
+    end: int
+    events: int
+    tenants: frozenset[str]
+    event_types: frozenset[str]
+    min_at: str
+    max_at: str
+    deal_bloom: str
+    sealed: bool = True
+
+    def may_match(
+        self, tenant_id: str, event_type: str | None = None, deal_id: str | None = None
+    ) -> bool:
+        """Whether the segment can contain events for these filters."""
+        if not self.sealed:
+            return True
+        if tenant_id not in self.tenants:
+            return False
+        if event_type and event_type not in self.event_types:
+            return False
+        return not (deal_id and not bloom_may_contain(self.deal_bloom, deal_id))
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "events": self.events,
+            "tenants": sorted(self.tenants),
+            "event_types": sorted(self.event_types),
+            "min_at": self.min_at,
+            "max_at": self.max_at,
+            "deal_bloom": self.deal_bloom,
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> SegmentInfo:
+        return cls(
+            start=int(record["start"]),
+            end=int(record["end"]),
+            events=int(record["events"]),
+            tenants=frozenset(record["tenants"]),
+            event_types=frozenset(record["event_types"]),
+            min_at=str(record["min_at"]),
+            max_at=str(record["max_at"]),
+            deal_bloom=str(record["deal_bloom"]),
+        )
+
+
+class _SegmentBuilder:
+    """Accumulates metadata for the segment being scanned."""
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.end = start
+        self.events = 0
+        self.tenants: set[str] = set()
+        self.event_types: set[str] = set()
+        self.min_at: str | None = None
+        self.max_at: str | None = None
+        self.bloom = 0
+
+    def add(self, line_end: int, event: dict[str, Any] | None) -> None:
+        self.end = line_end
+        self.events += 1
+        if event is None:
+            return
+        self.tenants.add(str(event.get("tenant_id", "")))
+        self.event_types.add(str(event.get("event_type", "")))
+        occurred_at = str(event.get("occurred_at", ""))
+        self.min_at = occurred_at if self.min_at is None else min(self.min_at, occurred_at)
+        self.max_at = occurred_at if self.max_at is None else max(self.max_at, occurred_at)
+        deal_id = audit_event_deal_id(event)
+        if deal_id:
+            self.bloom = _bloom_add(self.bloom, deal_id)
+
+    def seal(self) -> SegmentInfo:
+        return SegmentInfo(
+            start=self.start,
+            end=self.end,
+            events=self.events,
+            tenants=frozenset(self.tenants),
+            event_types=frozenset(self.event_types),
+            min_at=self.min_at or "",
+            max_at=self.max_at or "",
+            deal_bloom=format(self.bloom, "x"),
+        )
+
+
+def parse_event_line(line: bytes) -> dict[str, Any] | None:
+    """Decode one JSONL line; None for blank or malformed lines (skipped, as before)."""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    try:
+        event = json.loads(stripped)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return event if isinstance(event, dict) else None
+
+
+class JsonlAuditIndex:
+    """Incrementally maintained segment index for one JSONL audit log file."""
+
+    def __init__(self, log_path: Path, *, segment_events: int = DEFAULT_SEGMENT_EVENTS) -> None:
+        """Initialize the index for ``log_path`` (sidecar at ``<log_path>.idx``).
+
+        Args:
+            log_path: Path to the JSONL audit log.
+            segment_events: Lines per sealed segment.
+
+        Raises:
+            ValueError: If segment_events < 1.
+        """
+        if segment_events < 1:
+            raise ValueError(f"segment_events must be >= 1, got {segment_events}")
+        self._log_path = Path(log_path)
+        self._index_path = self._log_path.with_name(self._log_path.name + INDEX_SUFFIX)
+        self._segment_events = segment_events
+
+    @property
+    def index_path(self) -> Path:
+        """Return the sidecar index path."""
+        return self._index_path
+
+    def _head_digest(self, length: int = _HEAD_BYTES) -> str:
+        """Digest of the first ``length`` bytes, used to detect a replaced log file."""
+        with open(self._log_path, "rb") as f:
+            return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _load(self) -> tuple[dict[str, Any] | None, list[SegmentInfo]]:
+        """Load the header and the contiguous chain of sealed segments."""
+        if not self._index_path.exists():
+            return None, []
+        header: dict[str, Any] | None = None
+        segments: list[SegmentInfo] = []
+        with open(self._index_path, encoding="utf-8") as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    break  # torn trailing write: everything before it is still valid
+                if header is None:
+                    header = record
+                    continue
+                try:
+                    segment = SegmentInfo.from_record(record)
+                except (KeyError, TypeError, ValueError):
+                    break
+                expected_start = segments[-1].end if segments else 0
+                if segment.start != expected_start:
+                    continue  # duplicate record from a concurrent refresher
+                segments.append(segment)
+        return header, segments
+
+    def _reset(self, size: int) -> None:
+        head_bytes = min(size, _HEAD_BYTES)
+        header = {
+            "version": INDEX_VERSION,
+            "head_bytes": head_bytes,
+            "head_sha256": self._head_digest(head_bytes),
+        }
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, sort_keys=True, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self._index_path)
+
+    def refresh(self) -> list[SegmentInfo]:
+        """Seal any complete segments appended since the last refresh.
+
+        Returns:
+            All sealed segments, in file order. Empty if the log does not exist.
+
+        Raises:
+            OSError: If the log or sidecar cannot be read or written.
+        """
+        if not self._log_path.exists():
+            return []
+        size = self._log_path.stat().st_size
+        header, segments = self._load()
+        indexed_end = segments[-1].end if segments else 0
+        if (
+            header is None
+            or header.get("version") != INDEX_VERSION
+            or indexed_end > size
+            or int(header.get("head_bytes", -1)) > size
+            or header.get("head_sha256") != self._head_digest(int(header.get("head_bytes", 0)))
+        ):
+            self._reset(size)
+            segments = []
+            indexed_end = 0
+
+        if size - indexed_end <= 0:
+            return segments
+
+        new_segments: list[SegmentInfo] = []
+        builder = _SegmentBuilder(indexed_end)
+        with open(self._log_path, "rb") as f:
+            f.seek(indexed_end)
+            offset = indexed_end
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial trailing line: still being written
+                offset += len(line)
+                builder.add(offset, parse_event_line(line))
+                if builder.events >= self._segment_events:
+                    new_segments.append(builder.seal())
+                    builder = _SegmentBuilder(offset)
+
+        if new_segments:
+            payload = "".join(
+                json.dumps(s.to_record(), sort_keys=True, separators=(",", ":")) + "\n"
+                for s in new_segments
+            )
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.write(payload)
+        return segments + new_segments
+
+    def segments_with_tail(self) -> list[SegmentInfo]:
+        """Refresh, then return sealed segments plus the unsealed tail (if any)."""
+        segments = self.refresh()
+        start = segments[-1].end if segments else 0
+        size = self._log_path.stat().st_size if self._log_path.exists() else 0
+        if size > start:
+            segments.append(
+                SegmentInfo(
+                    start=start,
+                    end=size,
+                    events=0,
+                    tenants=frozenset(),
+                    event_types=frozenset(),
+                    min_at="",
+                    max_at="",
+                    deal_bloom="",
+                    sealed=False,
+                )
+            )
+        return segments
+
+    def read_segment_reversed(self, segment: SegmentInfo) -> Iterator[dict[str, Any]]:
+        """Yield a segment's decodable events newest-appended first (one seek + read)."""
+        with open(self._log_path, "rb") as f:
+            f.seek(segment.start)
+            data = f.read(segment.end - segment.start)
+        # An unterminated trailing line in the tail is either complete JSON (decoded) or a write
+        # still in flight (fails to decode and is skipped), exactly like a full-file scan.
+        for line in reversed(data.split(b"\n")):
+            event = parse_event_line(line)
+            if event is not None:
+                yield event
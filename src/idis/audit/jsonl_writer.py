@@ -0,0 +1,523 @@
+"""Long-lived, lock-protected append writer for the JSONL audit log.
+
+``JsonlFileAuditSink`` used to run a mkdir check and an open/write/close cycle for every
+audit event. ``JsonlAppendWriter`` keeps one append-mode handle per log path instead, shared
+by every sink instance in the process, and makes each event a single unbuffered ``write()``
+(O_APPEND, so lines from concurrent processes never interleave). The JSONL line format is
+produced by the sink and is unchanged.
+
+Durability policy (``IDIS_AUDIT_FSYNC``):
+    off     never fsync; lines reach the OS page cache on return (previous behaviour)
+    batch   group fsync every ``IDIS_AUDIT_FSYNC_EVERY_EVENTS`` events or
+            ``IDIS_AUDIT_FSYNC_INTERVAL_MS`` after the first unsynced event, whichever is first
+    always  fsync before every emit returns (strict mode)
+
+A failed background fsync is reported to the next emitter as an error (fail closed).
+
+Rotation (``IDIS_AUDIT_LOG_MAX_BYTES``, 0 disables): when an append would push the live file
+past the limit it is renamed to ``<log>.NNNNNN`` (with its sidecar index) and a new live file
+is started. Each rotated segment gets one line in ``<log>.manifest`` recording its byte size,
+event count, occurred_at range and sha256; JsonlAuditQueryRepository uses the manifest to
+prune whole segments. Writers in other processes notice the rename on their next append (the
+live path no longer matches their handle) and reopen.
+
+Throughput is recorded in ``stats()`` and the process-wide ``audit_jsonl_*`` counters.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from io import FileIO
+from pathlib import Path
+from typing import Any, Final
+
+from idis.observability.metrics import (
+    AUDIT_JSONL_BYTES_WRITTEN_TOTAL,
+    AUDIT_JSONL_FSYNC_DURATION_US_TOTAL,
+    AUDIT_JSONL_FSYNC_TOTAL,
+    AUDIT_JSONL_ROTATIONS_TOTAL,
+    increment_counter,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms rotate under the process lock only
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+AUDIT_FSYNC_ENV: Final[str] = "IDIS_AUDIT_FSYNC"
+AUDIT_FSYNC_EVERY_EVENTS_ENV: Final[str] = "IDIS_AUDIT_FSYNC_EVERY_EVENTS"
+AUDIT_FSYNC_INTERVAL_MS_ENV: Final[str] = "IDIS_AUDIT_FSYNC_INTERVAL_MS"
+AUDIT_LOG_MAX_BYTES_ENV: Final[str] = "IDIS_AUDIT_LOG_MAX_BYTES"
+
+FSYNC_OFF: Final[str] = "off"
+FSYNC_BATCH: Final[str] = "batch"
+FSYNC_ALWAYS: Final[str] = "always"
+FSYNC_POLICIES: Final[tuple[str, ...]] = (FSYNC_OFF, FSYNC_BATCH, FSYNC_ALWAYS)
+
+DEFAULT_FSYNC_EVERY_EVENTS: Final[int] = 100
+DEFAULT_FSYNC_INTERVAL_MS: Final[int] = 50
+
+MANIFEST_SUFFIX: Final[str] = ".manifest"
+_LOCK_SUFFIX: Final[str] = ".lock"
+_SEGMENT_DIGITS: Final[int] = 6
+
+
+@dataclass(frozen=True, slots=True)
+class JsonlWriterConfig:
+    """Durability and rotation policy for a JSONL audit writer.
+
+    Attributes:
+        fsync: One of ``off``, ``batch``, ``always``.
+        fsync_every_events: Batch mode: fsync after this many unsynced events.
+        fsync_interval_ms: Batch mode: fsync at most this long after the first unsynced event.
+        max_bytes: Rotate the live file before it grows past this size (0 disables).
+    """
+
+    fsync: str = FSYNC_OFF
+    fsync_every_events: int = DEFAULT_FSYNC_EVERY_EVENTS
+    fsync_interval_ms: int = DEFAULT_FSYNC_INTERVAL_MS
+    max_bytes: int = 0
+
+    def __post_init__(self) -> None:
+        if self.fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {self.fsync!r}")
+        if self.fsync_every_events < 1:
+            raise ValueError(f"fsync_every_events must be >= 1, got {self.fsync_every_events}")
+        if self.fsync_interval_ms < 1:
+            raise ValueError(f"fsync_interval_ms must be >= 1, got {self.fsync_interval_ms}")
+        if self.max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {self.max_bytes}")
+
+
+def _int_from_env(env_var: str, default: int) -> int:
+    raw = os.environ.get(env_var, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as e:
+        raise ValueError(f"{env_var} must be an integer, got '{raw}'") from e
+
+
+def load_jsonl_writer_config() -> JsonlWriterConfig:
+    """Load the JSONL writer policy from environment variables.
+
+    Environment variables:
+        IDIS_AUDIT_FSYNC: off | batch | always (default: off)
+        IDIS_AUDIT_FSYNC_EVERY_EVENTS: Batch size for group fsync (default: 100)
+        IDIS_AUDIT_FSYNC_INTERVAL_MS: Max delay before a group fsync (default: 50)
+        IDIS_AUDIT_LOG_MAX_BYTES: Rotation threshold in bytes (default: 0, disabled)
+
+    Returns:
+        JsonlWriterConfig.
+
+    Raises:
+        ValueError: If a variable is set to an invalid value.
+    """
+    return JsonlWriterConfig(
+        fsync=os.environ.get(AUDIT_FSYNC_ENV, "").strip().lower() or FSYNC_OFF,
+        fsync_every_events=_int_from_env(AUDIT_FSYNC_EVERY_EVENTS_ENV, DEFAULT_FSYNC_EVERY_EVENTS),
+        fsync_interval_ms=_int_from_env(AUDIT_FSYNC_INTERVAL_MS_ENV, DEFAULT_FSYNC_INTERVAL_MS),
+        max_bytes=_int_from_env(AUDIT_LOG_MAX_BYTES_ENV, 0),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class JsonlWriterStats:
+    """Snapshot of one writer's counters.
+
+    Attributes:
+        events: Lines appended.
+        bytes_written: Bytes appended.
+        fsyncs: fsync calls completed.
+        fsync_seconds: Wall-clock seconds spent in fsync.
+        rotations: Segments rotated out by this writer.
+    """
+
+    events: int
+    bytes_written: int
+    fsyncs: int
+    fsync_seconds: float
+    rotations: int
+
+    @property
+    def mean_fsync_ms(self) -> float:
+        """Average fsync latency in milliseconds."""
+        return self.fsync_seconds * 1000 / self.fsyncs if self.fsyncs else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class RotatedSegment:
+    """One manifest entry describing a rotated-out log segment."""
+
+    path: Path
+    seq: int
+    bytes: int
+    events: int
+    min_at: str
+    max_at: str
+    sha256: str
+
+
+def manifest_path(log_path: Path) -> Path:
+    """Return the rotation manifest path for ``log_path``."""
+    return log_path.with_name(log_path.name + MANIFEST_SUFFIX)
+
+
+def _segment_pattern(log_path: Path) -> re.Pattern[str]:
+    return re.compile(re.escape(log_path.name) + rf"\.(\d{{{_SEGMENT_DIGITS}}})$")
+
+
+def rotated_segment_paths(log_path: Path) -> list[tuple[int, Path]]:
+    """List rotated segments of ``log_path`` on disk as ``(seq, path)``, oldest first."""
+    pattern = _segment_pattern(log_path)
+    found: list[tuple[int, Path]] = []
+    if not log_path.parent.exists():
+        return found
+    for candidate in log_path.parent.iterdir():
+        match = pattern.match(candidate.name)
+        if match:
+            found.append((int(match.group(1)), candidate))
+    return sorted(found)
+
+
+def read_segment_manifest(log_path: Path) -> dict[int, RotatedSegment]:
+    """Read the rotation manifest for ``log_path`` keyed by segment sequence number.
+
+    Malformed lines are skipped; the manifest only adds pruning metadata, so a segment that is
+    missing from it is still queried in full.
+    """
+    entries: dict[int, RotatedSegment] = {}
+    path = manifest_path(log_path)
+    if not path.exists():
+        return entries
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            try:
+                record = json.loads(raw)
+                entry = RotatedSegment(
+                    path=log_path.with_name(str(record["segment"])),
+                    seq=int(record["seq"]),
+                    bytes=int(record["bytes"]),
+                    events=int(record["events"]),
+                    min_at=str(record["min_at"]),
+                    max_at=str(record["max_at"]),
+                    sha256=str(record["sha256"]),
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue
+            entries[entry.seq] = entry
+    return entries
+
+
+def _describe_segment(path: Path) -> dict[str, Any]:
+    """Hash and summarize a sealed segment for its manifest line."""
+    digest = hashlib.sha256()
+    events = 0
+    size = 0
+    min_at: str | None = None
+    max_at: str | None = None
+    with open(path, "rb") as f:
+        for line in f:
+            digest.update(line)
+            size += len(line)
+            if not line.strip():
+                continue
+            events += 1
+            try:
+                occurred_at = str(json.loads(line).get("occurred_at", ""))
+            except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                continue
+            min_at = occurred_at if min_at is None else min(min_at, occurred_at)
+            max_at = occurred_at if max_at is None else max(max_at, occurred_at)
+    return {
+        "bytes": size,
+        "events": events,
+        "min_at": min_at or "",
+        "max_at": max_at or "",
+        "sha256": digest.hexdigest(),
+    }
+
+
+class JsonlAppendWriter:
+    """Shared append handle for one JSONL log path (see module docstring)."""
+
+    def __init__(self, path: Path, config: JsonlWriterConfig | None = None) -> None:
+        """Initialize the writer. The file is opened lazily on the first append.
+
+        Args:
+            path: Live JSONL log path.
+            config: Durability/rotation policy (default: from environment).
+        """
+        self._path = Path(path)
+        self._config = config if config is not None else load_jsonl_writer_config()
+        self._lock = threading.Lock()
+        self._file: FileIO | None = None
+        self._identity: tuple[int, int] | None = None
+        self._unsynced = 0
+        self._timer: threading.Timer | None = None
+        self._deferred_error: OSError | None = None
+        self._events = 0
+        self._bytes = 0
+        self._fsyncs = 0
+        self._fsync_seconds = 0.0
+        self._rotations = 0
+
+    @property
+    def path(self) -> Path:
+        """Return the live log path."""
+        return self._path
+
+    @property
+    def config(self) -> JsonlWriterConfig:
+        """Return the writer policy."""
+        return self._config
+
+    def append(self, data: bytes, *, lines: int = 1) -> None:
+        """Append complete line(s) with a single write and apply the fsync policy.
+
+        Args:
+            data: Encoded line(s), including the trailing newline.
+            lines: Number of lines in ``data`` (counted as events by the fsync policy).
+
+        Raises:
+            OSError: If the directory, file, write or a (possibly earlier, batched) fsync fails.
+        """
+        rotated: Path | None = None
+        with self._lock:
+            if self._deferred_error is not None:
+                error, self._deferred_error = self._deferred_error, None
+                raise error
+            size = self._ensure_open_locked()
+            if self._config.max_bytes and size and size + len(data) > self._config.max_bytes:
+                rotated = self._rotate_locked()
+                self._ensure_open_locked()
+            assert self._file is not None
+            try:
+                written = self._file.write(data)
+                while written is not None and written < len(data):
+                    written += self._file.write(data[written:]) or 0
+            except OSError:
+                self._close_locked()
+                raise
+            self._events += lines
+            self._bytes += len(data)
+            self._unsynced += lines
+            if self._config.fsync == FSYNC_ALWAYS or (
+                self._config.fsync == FSYNC_BATCH
+                and self._unsynced >= self._config.fsync_every_events
+            ):
+                self._fsync_locked()
+            elif self._config.fsync == FSYNC_BATCH:
+                self._schedule_fsync_locked()
+        increment_counter(AUDIT_JSONL_BYTES_WRITTEN_TOTAL, value=len(data))
+        if rotated is not None:
+            self._record_rotation(rotated)
+
+    def flush(self) -> None:
+        """fsync any appended-but-unsynced lines now.
+
+        Raises:
+            OSError: If fsync fails.
+        """
+        with self._lock:
+            if self._unsynced and self._file is not None:
+                self._fsync_locked()
+
+    def close(self) -> None:
+        """fsync pending lines (unless fsync is off) and release the handle."""
+        with self._lock:
+            if self._file is not None and self._unsynced and self._config.fsync != FSYNC_OFF:
+                try:
+                    self._fsync_locked()
+                except OSError as e:
+                    logger.error("Failed to fsync audit log %s on close: %s", self._path, e)
+            self._close_locked()
+
+    def stats(self) -> JsonlWriterStats:
+        """Return a snapshot of this writer's counters."""
+        with self._lock:
+            return JsonlWriterStats(
+                events=self._events,
+                bytes_written=self._bytes,
+                fsyncs=self._fsyncs,
+                fsync_seconds=self._fsync_seconds,
+                rotations=self._rotations,
+            )
+
+    def _ensure_open_locked(self) -> int:
+        """Open (or reopen after an external rename/unlink) the live file; return its size."""
+        if self._file is not None:
+            try:
+                st = os.stat(self._path)
+            except FileNotFoundError:
+                st = None
+            if st is not None and (st.st_dev, st.st_ino) == self._identity:
+                return st.st_size
+            if self._unsynced and self._config.fsync != FSYNC_OFF:
+                self._fsync_locked()
+            self._close_locked()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = FileIO(self._path, mode="ab")
+        st = os.fstat(self._file.fileno())
+        self._identity = (st.st_dev, st.st_ino)
+        return st.st_size
+
+    def _close_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.warning("Failed to close audit log %s: %s", self._path, e)
+        self._file = None
+        self._identity = None
+        self._unsynced = 0
+
+    def _fsync_locked(self) -> None:
+        assert self._file is not None
+        started = time.perf_counter()
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            # The kernel may have dropped the dirty pages; never retry on the same handle.
+            self._close_locked()
+            raise
+        elapsed = time.perf_counter() - started
+        self._unsynced = 0
+        self._fsyncs += 1
+        self._fsync_seconds += elapsed
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        increment_counter(AUDIT_JSONL_FSYNC_TOTAL)
+        increment_counter(AUDIT_JSONL_FSYNC_DURATION_US_TOTAL, value=round(elapsed * 1_000_000))
+
+    def _schedule_fsync_locked(self) -> None:
+        if self._timer is not None:
+            return
+        timer = threading.Timer(self._config.fsync_interval_ms / 1000, self._timed_fsync)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _timed_fsync(self) -> None:
+        with self._lock:
+            self._timer = None
+            if not self._unsynced or self._file is None:
+                return
+            try:
+                self._fsync_locked()
+            except OSError as e:
+                logger.error("Batched fsync of audit log %s failed: %s", self._path, e)
+                self._deferred_error = e
+
+    @contextmanager
+    def _rotation_lock(self) -> Iterator[None]:
+        """Serialize rotation across processes sharing the log directory."""
+        if fcntl is None:
+            yield
+            return
+        lock_path = self._path.with_name(self._path.name + _LOCK_SUFFIX)
+        with open(lock_path, "a+b") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _rotate_locked(self) -> Path | None:
+        """Rename the live file to the next segment name. Caller holds the writer lock."""
+        if self._file is not None and self._unsynced and self._config.fsync != FSYNC_OFF:
+            self._fsync_locked()
+        identity = self._identity
+        self._close_locked()
+        with self._rotation_lock():
+            try:
+                st = os.stat(self._path)
+            except FileNotFoundError:
+                return None
+            if (st.st_dev, st.st_ino) != identity:
+                return None  # another process rotated first
+            existing = rotated_segment_paths(self._path)
+            seq = existing[-1][0] + 1 if existing else 1
+            target = self._path.with_name(f"{self._path.name}.{seq:0{_SEGMENT_DIGITS}d}")
+            index = self._path.with_name(self._path.name + ".idx")
+            if index.exists():
+                os.replace(index, target.with_name(target.name + ".idx"))
+            os.replace(self._path, target)
+        self._rotations += 1
+        return target
+
+    def _record_rotation(self, segment: Path) -> None:
+        """Append the manifest line for a freshly rotated segment (outside the writer lock)."""
+        increment_counter(AUDIT_JSONL_ROTATIONS_TOTAL)
+        match = _segment_pattern(self._path).match(segment.name)
+        try:
+            record = {
+                "segment": segment.name,
+                "seq": int(match.group(1)) if match else 0,
+                "rotated_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+                **_describe_segment(segment),
+            }
+            line = json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n"
+            with self._rotation_lock(), open(manifest_path(self._path), "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            # The segment is on disk and still queried; it only lacks pruning metadata.
+            logger.error("Failed to record audit segment %s in manifest: %s", segment, e)
+
+
+_writers: weakref.WeakValueDictionary[tuple[Path, JsonlWriterConfig], JsonlAppendWriter] = (
+    weakref.WeakValueDictionary()
+)
+_writers_lock = threading.Lock()
+
+
+def get_jsonl_writer(path: Path, config: JsonlWriterConfig | None = None) -> JsonlAppendWriter:
+    """Get the process-wide writer for ``path`` and ``config``.
+
+    Writers are shared by every sink using the same path and policy, and are released (handle
+    closed) once no sink references them.
+
+    Args:
+        path: Live JSONL log path.
+        config: Writer policy (default: from environment).
+
+    Returns:
+        Shared JsonlAppendWriter.
+    """
+    resolved = Path(os.path.abspath(path))
+    effective = config if config is not None else load_jsonl_writer_config()
+    key = (resolved, effective)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = JsonlAppendWriter(resolved, effective)
+            _writers[key] = writer
+        return writer
+
+
+@atexit.register
+def close_jsonl_writers() -> None:
+    """fsync and close every live writer (runs at interpreter exit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
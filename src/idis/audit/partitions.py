@@ -0,0 +1,78 @@
+"""Monthly partition upkeep for the PostgreSQL audit_events table.
+
+Migration 0031 range-partitions ``audit_events`` by month on ``occurred_at`` and provisions
+partitions a few months ahead. This module keeps that horizon moving: it calls the
+SECURITY DEFINER ``idis_ensure_audit_events_partition(date)`` function for the current month
+and the next ``months_ahead`` months. Rows that land outside every provisioned month go to
+the DEFAULT partition, so missing upkeep degrades pruning, never audit durability.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MONTHS_AHEAD: Final[int] = 3
+
+_ENSURE_PARTITION_SQL = text("SELECT idis_ensure_audit_events_partition(:month_start)")
+
+
+def months_to_provision(now: datetime, months_ahead: int = DEFAULT_MONTHS_AHEAD) -> list[date]:
+    """First day of the current UTC month and each of the next ``months_ahead`` months.
+
+    Args:
+        now: Reference time (converted to UTC).
+        months_ahead: Number of future months to include.
+
+    Returns:
+        Ascending list of month-start dates.
+    """
+    current = now.astimezone(UTC)
+    year, month = current.year, current.month
+    months: list[date] = []
+    for _ in range(months_ahead + 1):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def ensure_audit_event_partitions(
+    conn: Connection,
+    *,
+    now: datetime | None = None,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> list[str]:
+    """Create any missing monthly audit_events partitions (idempotent).
+
+    Each month is provisioned in its own savepoint so one failure (for example, a month
+    whose rows already sit in the DEFAULT partition) does not block the others.
+
+    Args:
+        conn: SQLAlchemy connection inside a transaction.
+        now: Reference time (default: current UTC time).
+        months_ahead: Number of future months to provision.
+
+    Returns:
+        Names of the partitions that exist for the provisioned months.
+    """
+    reference = now or datetime.now(UTC)
+    ensured: list[str] = []
+    for month_start in months_to_provision(reference, months_ahead):
+        try:
+            with conn.begin_nested():
+                name = conn.execute(_ENSURE_PARTITION_SQL, {"month_start": month_start}).scalar()
+        except SQLAlchemyError as e:
+            logger.warning("Could not provision audit_events partition for %s: %s", month_start, e)
+            continue
+        if name:
+            ensured.append(str(name))
+    return ensured
@@ -1,37 +1,180 @@
 """PostgreSQL audit event sink for IDIS.
 
 Provides append-only audit event storage in PostgreSQL with RLS tenant isolation.
-Supports both standalone emission and in-transaction emission for atomicity.
+Supports both standalone emission and in-transaction emission for atomicity, plus
+multi-row batch emission and optional group commit (see ``idis.audit.group_commit``).
 
 Design Requirements (v6.3):
     - Append-only: INSERT only, no UPDATE/DELETE (enforced by DB trigger)
     - RLS enforced: tenant_id must match current_setting('idis.tenant_id')
     - Fail closed: any DB error raises AuditSinkError
+    - deal_id / run_id promoted to indexed columns at insert time (migration 0031)
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+from collections.abc import Sequence
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from idis.audit.sink import AuditSinkError
+from idis.audit.sink import AuditSinkError, audit_event_deal_id, audit_event_run_id
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
 
+    from idis.audit.group_commit import GroupCommitAuditWriter
+
 logger = logging.getLogger(__name__)
 
+AUDIT_GROUP_COMMIT_ENV: Final[str] = "IDIS_AUDIT_GROUP_COMMIT"
+
+# Rows per multi-row INSERT statement. 9 bind params per row keeps a full chunk far below the
+# 65535 bind-parameter ceiling of the Postgres wire protocol.
+MAX_ROWS_PER_INSERT: Final[int] = 500
+
+_AUDIT_COLUMNS: Final[tuple[str, ...]] = (
+    "event_id",
+    "tenant_id",
+    "occurred_at",
+    "event_type",
+    "request_id",
+    "idempotency_key",
+    "event",
+    "deal_id",
+    "run_id",
+)
+
+
+def is_group_commit_enabled() -> bool:
+    """Check if standalone Postgres audit emission should use group commit.
+
+    Returns:
+        True if IDIS_AUDIT_GROUP_COMMIT is set to "1"/"true", False otherwise.
+    """
+    return os.environ.get(AUDIT_GROUP_COMMIT_ENV, "").strip().lower() in ("1", "true")
+
+
+@lru_cache(maxsize=8)
+def _multi_row_insert_sql(row_count: int) -> Any:
+    """Build (and cache) a multi-row INSERT for ``row_count`` audit events."""
+    values = ",\n".join(
+        "(" + ", ".join(f":{column}_{index}" for column in _AUDIT_COLUMNS) + ")"
+        for index in range(row_count)
+    )
+    return text(f"INSERT INTO audit_events\n({', '.join(_AUDIT_COLUMNS)})\nVALUES\n{values}")
+
+
+def _event_row(event: dict[str, Any]) -> dict[str, Any]:
+    """Map an audit event to its audit_events column values.
+
+    Args:
+        event: Audit event dict.
+
+    Returns:
+        Column name -> bind value mapping.
+
+    Raises:
+        AuditSinkError: If required fields are missing.
+    """
+    event_id = event.get("event_id")
+    tenant_id = event.get("tenant_id")
+    occurred_at = event.get("occurred_at")
+    event_type = event.get("event_type")
+
+    if not all([event_id, tenant_id, occurred_at, event_type]):
+        raise AuditSinkError(
+            "Audit event missing required fields: event_id, tenant_id, occurred_at, event_type"
+        )
+
+    request_info = event.get("request", {})
+    request_id = request_info.get("request_id")
+    idempotency_key = request_info.get("idempotency_key_sha256")
+
+    occurred_at_dt: datetime
+    if isinstance(occurred_at, str):
+        occurred_at_dt = datetime.fromisoformat(occurred_at.replace("Z", "+00:00"))
+    elif isinstance(occurred_at, datetime):
+        occurred_at_dt = occurred_at
+    else:
+        occurred_at_dt = datetime.now()
+
+    return {
+        "event_id": event_id,
+        "tenant_id": tenant_id,
+        "occurred_at": occurred_at_dt,
+        "event_type": event_type,
+        "request_id": request_id,
+        "idempotency_key": idempotency_key,
+        "event": json.dumps(event, sort_keys=True, separators=(",", ":")),
+        "deal_id": audit_event_deal_id(event),
+        "run_id": audit_event_run_id(event),
+    }
+
+
+def insert_events(conn: Connection, events: Sequence[dict[str, Any]]) -> None:
+    """Insert audit events with multi-row INSERT statements.
+
+    All rows are mapped (and validated) before the first statement executes, so a malformed
+    event never leaves a partially inserted batch behind in the caller's transaction.
+
+    Args:
+        conn: SQLAlchemy connection with tenant context already set.
+        events: Audit event dicts (all for the connection's tenant).
+
+    Raises:
+        SQLAlchemyError: If an INSERT fails.
+        AuditSinkError: If any event is missing required fields.
+    """
+    rows = [_event_row(event) for event in events]
+    for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+        chunk = rows[start : start + MAX_ROWS_PER_INSERT]
+        params: dict[str, Any] = {}
+        for index, row in enumerate(chunk):
+            for column, value in row.items():
+                params[f"{column}_{index}"] = value
+        conn.execute(_multi_row_insert_sql(len(chunk)), params)
+
+
+def commit_tenant_batch(tenant_id: str, events: Sequence[dict[str, Any]]) -> None:
+    """Durably commit a single tenant's audit events in one transaction.
+
+    Args:
+        tenant_id: Tenant UUID shared by every event in ``events``.
+        events: Audit event dicts.
+
+    Raises:
+        AuditSinkError: If the tenant is invalid, an event belongs to another tenant,
+            or the transaction fails.
+    """
+    from idis.persistence.db import begin_app_conn, set_tenant_local
+
+    if not tenant_id or tenant_id == "unknown":
+        raise AuditSinkError("Cannot emit audit event without valid tenant_id")
+    if any(event.get("tenant_id") != tenant_id for event in events):
+        raise AuditSinkError("Audit batch contains events for more than one tenant")
+
+    try:
+        with begin_app_conn() as conn:
+            set_tenant_local(conn, tenant_id)
+            insert_events(conn, events)
+    except SQLAlchemyError as e:
+        raise AuditSinkError(f"Failed to emit audit event batch: {e}") from e
+    logger.debug("Committed %d audit events for tenant %s", len(events), tenant_id)
+
 
 class PostgresAuditSink:
     """PostgreSQL audit sink with RLS tenant isolation.
 
     Stores audit events in the audit_events table. Supports two modes:
-    1. Standalone: Creates its own connection per emit() call
+    1. Standalone: Creates its own connection per emit() call, or - when a
+       GroupCommitAuditWriter is attached - joins a shared multi-row commit
     2. In-transaction: Uses provided connection for atomic operations
 
     The sink relies on RLS policies to enforce tenant isolation.
@@ -41,21 +184,39 @@ class PostgresAuditSink:
     _INSERT_SQL = text(
         """
         INSERT INTO audit_events
-        (event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key, event)
+        (event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key, event,
+         deal_id, run_id)
         VALUES
-        (:event_id, :tenant_id, :occurred_at, :event_type, :request_id, :idempotency_key, :event)
+        (:event_id, :tenant_id, :occurred_at, :event_type, :request_id, :idempotency_key, :event,
+         :deal_id, :run_id)
         """
     )
 
-    def __init__(self) -> None:
-        """Initialize the PostgreSQL audit sink."""
-        pass
+    def __init__(self, group_commit: GroupCommitAuditWriter | None = None) -> None:
+        """Initialize the PostgreSQL audit sink.
+
+        Args:
+            group_commit: Optional group-commit writer for standalone emit(). If None and
+                IDIS_AUDIT_GROUP_COMMIT is enabled, the process-wide writer is used.
+        """
+        if group_commit is None and is_group_commit_enabled():
+            from idis.audit.group_commit import get_group_commit_writer
+
+            group_commit = get_group_commit_writer()
+        self._group_commit = group_commit
+
+    @property
+    def group_commit(self) -> GroupCommitAuditWriter | None:
+        """Return the attached group-commit writer, if any."""
+        return self._group_commit
 
     def emit(self, event: dict[str, Any]) -> None:
         """Emit an audit event using a new connection.
 
         Creates a new connection, sets tenant context, and inserts the event.
         This method is for standalone emission outside of request transactions.
+        With a group-commit writer attached, the event is committed together with
+        concurrently emitted events; the call still returns only once it is durable.
 
         Args:
             event: Validated audit event dict with required fields.
@@ -69,6 +230,10 @@ class PostgresAuditSink:
         if not tenant_id or tenant_id == "unknown":
             raise AuditSinkError("Cannot emit audit event without valid tenant_id")
 
+        if self._group_commit is not None:
+            self._group_commit.emit(event)
+            return
+
         try:
             with begin_app_conn() as conn:
                 set_tenant_local(conn, tenant_id)
@@ -94,6 +259,36 @@ class PostgresAuditSink:
         except SQLAlchemyError as e:
             raise AuditSinkError(f"Failed to emit audit event in transaction: {e}") from e
 
+    def emit_batch(self, events: Sequence[dict[str, Any]]) -> None:
+        """Emit many audit events with multi-row INSERTs, one transaction per tenant.
+
+        Args:
+            events: Validated audit event dicts (may span tenants).
+
+        Raises:
+            AuditSinkError: If any tenant's batch fails to commit.
+        """
+        by_tenant: dict[str, list[dict[str, Any]]] = {}
+        for event in events:
+            by_tenant.setdefault(str(event.get("tenant_id") or ""), []).append(event)
+        for tenant_id, tenant_events in by_tenant.items():
+            commit_tenant_batch(tenant_id, tenant_events)
+
+    def emit_batch_in_tx(self, conn: Connection, events: Sequence[dict[str, Any]]) -> None:
+        """Emit many audit events within an existing transaction.
+
+        Args:
+            conn: SQLAlchemy connection with tenant context already set.
+            events: Validated audit event dicts for the connection's tenant.
+
+        Raises:
+            AuditSinkError: If emission fails for any reason.
+        """
+        try:
+            insert_events(conn, events)
+        except SQLAlchemyError as e:
+            raise AuditSinkError(f"Failed to emit audit events in transaction: {e}") from e
+
     def _insert_event(self, conn: Connection, event: dict[str, Any]) -> None:
         """Insert audit event into database.
 
@@ -105,44 +300,10 @@ class PostgresAuditSink:
             SQLAlchemyError: If INSERT fails.
             AuditSinkError: If required fields are missing.
         """
-        event_id = event.get("event_id")
-        tenant_id = event.get("tenant_id")
-        occurred_at = event.get("occurred_at")
-        event_type = event.get("event_type")
-
-        if not all([event_id, tenant_id, occurred_at, event_type]):
-            raise AuditSinkError(
-                "Audit event missing required fields: event_id, tenant_id, occurred_at, event_type"
-            )
-
-        request_info = event.get("request", {})
-        request_id = request_info.get("request_id")
-        idempotency_key = request_info.get("idempotency_key_sha256")
-
-        occurred_at_dt: datetime
-        if isinstance(occurred_at, str):
-            occurred_at_dt = datetime.fromisoformat(occurred_at.replace("Z", "+00:00"))
-        elif isinstance(occurred_at, datetime):
-            occurred_at_dt = occurred_at
-        else:
-            occurred_at_dt = datetime.now()
-
-        event_json = json.dumps(event, sort_keys=True, separators=(",", ":"))
-
-        conn.execute(
-            self._INSERT_SQL,
-            {
-                "event_id": event_id,
-                "tenant_id": tenant_id,
-                "occurred_at": occurred_at_dt,
-                "event_type": event_type,
-                "request_id": request_id,
-                "idempotency_key": idempotency_key,
-                "event": event_json,
-            },
-        )
+        row = _event_row(event)
+        conn.execute(self._INSERT_SQL, row)
 
-        logger.debug("Emitted audit event %s for tenant %s", event_id, tenant_id)
+        logger.debug("Emitted audit event %s for tenant %s", row["event_id"], row["tenant_id"])
 
 
 def get_postgres_audit_sink() -> PostgresAuditSink:
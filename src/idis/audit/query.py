@@ -13,8 +13,11 @@ Design Requirements (v6.3):
 from __future__ import annotations
 
 import base64
+import heapq
+import itertools
 import json
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +26,9 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy.exc import SQLAlchemyError
 
 from idis.api.errors import IdisHttpError
+from idis.audit.jsonl_index import DEFAULT_SEGMENT_EVENTS, JsonlAuditIndex
+from idis.audit.jsonl_writer import RotatedSegment, read_segment_manifest, rotated_segment_paths
+from idis.audit.sink import audit_event_deal_id
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
@@ -104,7 +110,12 @@ def _validate_limit(limit: int) -> int:
 
 
 class PostgresAuditQueryRepository:
-    """Query audit events from PostgreSQL with RLS tenant isolation."""
+    """Query audit events from PostgreSQL with RLS tenant isolation.
+
+    Filters hit real columns only (``deal_id`` is promoted at insert time, migration 0031),
+    so every page is a keyset range scan over a covering (tenant_id, [deal_id | event_type,]
+    occurred_at DESC, event_id DESC) index.
+    """
 
     def __init__(self, conn: Connection, tenant_id: str) -> None:
         """Initialize with connection and tenant ID.
@@ -156,7 +167,7 @@ class PostgresAuditQueryRepository:
             params["cursor_event_id"] = cursor_event_id
 
         if deal_id:
-            where_clauses.append("event::jsonb->'request'->>'deal_id' = :deal_id")
+            where_clauses.append("deal_id = :deal_id")
             params["deal_id"] = deal_id
 
         if event_type:
@@ -222,18 +233,75 @@ class PostgresAuditQueryRepository:
         return AuditEventsPage(items=items, next_cursor=next_cursor)
 
 
+def _jsonl_event_matches(
+    event: dict[str, Any],
+    *,
+    tenant_id: str,
+    deal_id: str | None,
+    event_type: str | None,
+    after: datetime | None,
+    before: datetime | None,
+    cursor: tuple[str, str] | None,
+) -> bool:
+    """Apply the JSONL backend's tenant, filter and cursor predicates to one event."""
+    if event.get("tenant_id") != tenant_id:
+        return False
+    if event_type and event.get("event_type") != event_type:
+        return False
+    if deal_id and audit_event_deal_id(event) != deal_id:
+        return False
+
+    occurred_at_str = event.get("occurred_at", "")
+    if after or before:
+        try:
+            event_dt = datetime.fromisoformat(occurred_at_str.replace("Z", "+00:00"))
+        except ValueError:
+            return False
+        if after and event_dt <= after:
+            return False
+        if before and event_dt >= before:
+            return False
+
+    return not (cursor and (occurred_at_str, event.get("event_id", "")) >= cursor)
+
+
 class JsonlAuditQueryRepository:
-    """Query audit events from JSONL file with tenant filtering."""
+    """Query audit events from a JSONL file with tenant filtering.
+
+    Reads go through the sidecar segment index (``idis.audit.jsonl_index``): segments that
+    cannot hold a matching event are skipped, the rest are visited newest-first and the scan
+    stops as soon as no remaining segment can contribute to the requested page. Segments
+    rotated out of the live file (``idis.audit.jsonl_writer``) are queried too; their
+    manifest time range lets whole files be skipped without opening them.
+    """
 
-    def __init__(self, file_path: Path, tenant_id: str) -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        tenant_id: str,
+        *,
+        segment_events: int = DEFAULT_SEGMENT_EVENTS,
+    ) -> None:
         """Initialize with file path and tenant ID.
 
         Args:
-            file_path: Path to JSONL audit log file.
+            file_path: Path to the live JSONL audit log file.
             tenant_id: Tenant UUID string for filtering.
+            segment_events: Lines per sealed index segment.
         """
         self._file_path = file_path
         self._tenant_id = tenant_id
+        self._segment_events = segment_events
+        self._index = JsonlAuditIndex(file_path, segment_events=segment_events)
+
+    def _log_files(self) -> list[tuple[JsonlAuditIndex, RotatedSegment | None]]:
+        """Live file plus rotated segments, each with its manifest entry when recorded."""
+        manifest = read_segment_manifest(self._file_path)
+        files: list[tuple[JsonlAuditIndex, RotatedSegment | None]] = [(self._index, None)]
+        for seq, path in reversed(rotated_segment_paths(self._file_path)):
+            index = JsonlAuditIndex(path, segment_events=self._segment_events)
+            files.append((index, manifest.get(seq)))
+        return files
 
     def list_events(
         self,
@@ -246,7 +314,6 @@ class JsonlAuditQueryRepository:
     ) -> AuditEventsPage:
         """List audit events with pagination and optional filters.
 
-        Reads JSONL file, filters by tenant, applies ordering and pagination.
         Returns empty list (not error) if file does not exist.
 
         Args:
@@ -262,79 +329,44 @@ class JsonlAuditQueryRepository:
         """
         limit = _validate_limit(limit)
 
-        cursor_occurred_at: str | None = None
-        cursor_event_id: str | None = None
+        cursor_key: tuple[str, str] | None = None
         if cursor:
-            cursor_occurred_at, cursor_event_id = _decode_cursor(cursor)
+            cursor_key = _decode_cursor(cursor)
 
-        if not self._file_path.exists():
+        try:
+            files = self._log_files()
+        except OSError as e:
+            logger.warning("Failed to read audit log file %s: %s", self._file_path, e)
             return AuditEventsPage(items=[], next_cursor=None)
+        # Unbounded files (live, or not yet in the manifest) first, then newest-first.
+        files.sort(key=lambda f: (f[1] is None, f[1].max_at if f[1] else ""), reverse=True)
 
-        events: list[dict[str, Any]] = []
+        wanted = limit + 1
+        heap: list[tuple[tuple[str, str], int, dict[str, Any]]] = []
+        sequence = itertools.count()
         try:
-            with open(self._file_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
+            for index, bounds in files:
+                if bounds is not None:
+                    if bounds.events == 0 or (cursor_key and bounds.min_at > cursor_key[0]):
                         continue
-
-                    if event.get("tenant_id") != self._tenant_id:
-                        continue
-
-                    if event_type and event.get("event_type") != event_type:
-                        continue
-
-                    if deal_id:
-                        req = event.get("request", {})
-                        if req.get("deal_id") != deal_id:
-                            continue
-
-                    occurred_at_str = event.get("occurred_at", "")
-                    if after:
-                        try:
-                            event_dt = datetime.fromisoformat(
-                                occurred_at_str.replace("Z", "+00:00")
-                            )
-                            if event_dt <= after:
-                                continue
-                        except ValueError:
-                            continue
-
-                    if before:
-                        try:
-                            event_dt = datetime.fromisoformat(
-                                occurred_at_str.replace("Z", "+00:00")
-                            )
-                            if event_dt >= before:
-                                continue
-                        except ValueError:
-                            continue
-
-                    events.append(event)
-
+                    if len(heap) >= wanted and bounds.max_at < heap[0][0][0]:
+                        break
+                self._scan_file(
+                    index,
+                    heap,
+                    wanted,
+                    sequence,
+                    deal_id=deal_id,
+                    event_type=event_type,
+                    after=after,
+                    before=before,
+                    cursor=cursor_key,
+                )
         except OSError as e:
             logger.warning("Failed to read audit log file %s: %s", self._file_path, e)
             return AuditEventsPage(items=[], next_cursor=None)
 
-        events.sort(
-            key=lambda ev: (ev.get("occurred_at", ""), ev.get("event_id", "")),
-            reverse=True,
-        )
-
-        if cursor_occurred_at and cursor_event_id:
-            filtered: list[dict[str, Any]] = []
-            for ev in events:
-                ev_occurred = ev.get("occurred_at", "")
-                ev_id = ev.get("event_id", "")
-                if (ev_occurred, ev_id) < (cursor_occurred_at, cursor_event_id):
-                    filtered.append(ev)
-            events = filtered
-
-        page_events = events[: limit + 1]
+        page_events = [event for _, _, event in sorted(heap, reverse=True)]
 
         items: list[AuditEventItem] = []
         for ev in page_events[:limit]:
@@ -352,3 +384,50 @@ class JsonlAuditQueryRepository:
             next_cursor = _encode_cursor(last_item.occurred_at, last_item.event_id)
 
         return AuditEventsPage(items=items, next_cursor=next_cursor)
+
+    def _scan_file(
+        self,
+        index: JsonlAuditIndex,
+        heap: list[tuple[tuple[str, str], int, dict[str, Any]]],
+        wanted: int,
+        sequence: Iterator[int],
+        *,
+        deal_id: str | None,
+        event_type: str | None,
+        after: datetime | None,
+        before: datetime | None,
+        cursor: tuple[str, str] | None,
+    ) -> None:
+        """Push one log file's matching events into the bounded top-``wanted`` heap."""
+        candidates = [
+            segment
+            for segment in index.segments_with_tail()
+            if segment.may_match(self._tenant_id, event_type=event_type, deal_id=deal_id)
+            and not (segment.sealed and cursor and segment.min_at > cursor[0])
+        ]
+        # Tail first (its bounds are unknown), then sealed segments newest-first.
+        candidates.sort(key=lambda segment: (not segment.sealed, segment.max_at), reverse=True)
+
+        for segment in candidates:
+            if segment.sealed and len(heap) >= wanted and segment.max_at < heap[0][0][0]:
+                break
+            for event in index.read_segment_reversed(segment):
+                if not _jsonl_event_matches(
+                    event,
+                    tenant_id=self._tenant_id,
+                    deal_id=deal_id,
+                    event_type=event_type,
+                    after=after,
+                    before=before,
+                    cursor=cursor,
+                ):
+                    continue
+                entry = (
+                    (event.get("occurred_at", ""), event.get("event_id", "")),
+                    next(sequence),
+                    event,
+                )
+                if len(heap) < wanted:
+                    heapq.heappush(heap, entry)
+                elif entry[0] > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
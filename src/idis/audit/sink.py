@@ -14,13 +14,22 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
+from idis.audit.jsonl_writer import (
+    JsonlAppendWriter,
+    JsonlWriterConfig,
+    JsonlWriterStats,
+    get_jsonl_writer,
+)
+
 logger = logging.getLogger(__name__)
 
 AUDIT_LOG_PATH_ENV = "IDIS_AUDIT_LOG_PATH"
 DEFAULT_AUDIT_LOG_PATH = "./var/audit/audit_events.jsonl"
+DEFAULT_INDEX_SEGMENT_EVENTS = 1024
 
 
 class AuditSinkError(Exception):
@@ -51,6 +60,43 @@ class AuditSink(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchAuditSink(Protocol):
+    """Audit sinks that can persist many events in one write/transaction."""
+
+    def emit_batch(self, events: Sequence[dict[str, Any]]) -> None:
+        """Emit many audit events at once.
+
+        Args:
+            events: Validated audit event dicts
+
+        Raises:
+            AuditSinkError: If emission fails for any reason
+        """
+        ...
+
+
+def emit_audit_batch(sink: AuditSink, events: Sequence[dict[str, Any]]) -> None:
+    """Emit ``events`` through the sink's batch path when it has one.
+
+    Sinks without ``emit_batch`` receive one ``emit`` call per event, in order.
+
+    Args:
+        sink: Audit sink.
+        events: Validated audit event dicts.
+
+    Raises:
+        AuditSinkError: If emission fails for any reason
+    """
+    if not events:
+        return
+    if isinstance(sink, BatchAuditSink):
+        sink.emit_batch(events)
+        return
+    for event in events:
+        sink.emit(event)
+
+
 class JsonlFileAuditSink:
     """Append-only JSONL file sink for audit events.
 
@@ -59,6 +105,10 @@ class JsonlFileAuditSink:
     - Creates parent directories if missing
     - Appends one line per event: json.dumps(event, sort_keys=True, separators=(",", ":")) + "\\n"
     - Never truncates/overwrites existing content
+    - Writes through a shared long-lived append handle (``idis.audit.jsonl_writer``) with the
+      fsync and size-based rotation policy from IDIS_AUDIT_FSYNC* / IDIS_AUDIT_LOG_MAX_BYTES
+    - Every ``index_segment_events`` appends, incrementally refreshes the sidecar segment
+      index used by JsonlAuditQueryRepository (best-effort: the index is derived data)
 
     Fail-closed behavior:
     - Any IO error raises AuditSinkError
@@ -66,13 +116,23 @@ class JsonlFileAuditSink:
     - Serialization failure raises AuditSinkError
     """
 
-    def __init__(self, file_path: str | None = None) -> None:
+    def __init__(
+        self,
+        file_path: str | None = None,
+        *,
+        index_segment_events: int | None = DEFAULT_INDEX_SEGMENT_EVENTS,
+        writer_config: JsonlWriterConfig | None = None,
+    ) -> None:
         """Initialize the JSONL file sink.
 
         Args:
             file_path: Override path for the audit log file.
                        If None, reads from IDIS_AUDIT_LOG_PATH env var,
                        falling back to DEFAULT_AUDIT_LOG_PATH.
+            index_segment_events: Appends between sidecar index refreshes (None disables;
+                       readers still refresh the index before querying).
+            writer_config: fsync/rotation policy. If None, loaded from the environment
+                       when the first event is emitted.
         """
         if file_path is not None:
             self._file_path = Path(file_path)
@@ -82,6 +142,10 @@ class JsonlFileAuditSink:
                 self._file_path = Path(env_path)
             else:
                 self._file_path = Path(DEFAULT_AUDIT_LOG_PATH)
+        self._index_segment_events = index_segment_events
+        self._appends_since_index = 0
+        self._writer_config = writer_config
+        self._writer: JsonlAppendWriter | None = None
 
     @property
     def file_path(self) -> Path:
@@ -113,19 +177,85 @@ class JsonlFileAuditSink:
         Raises:
             AuditSinkError: If serialization or file write fails
         """
+        self.emit_batch([event])
+
+    def emit_batch(self, events: Sequence[dict[str, Any]]) -> None:
+        """Append many audit events with a single write.
+
+        Every event is serialized before anything is written, so a bad event never
+        leaves part of the batch in the log.
+
+        Args:
+            events: Validated audit event dicts
+
+        Raises:
+            AuditSinkError: If serialization or file write fails
+        """
+        if not events:
+            return
         try:
-            line = json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+            lines = [
+                json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n" for event in events
+            ]
         except (TypeError, ValueError) as e:
             raise AuditSinkError(f"Failed to serialize audit event: {e}") from e
 
-        self._ensure_parent_directory()
+        writer = self._get_writer()
 
         try:
-            with open(self._file_path, mode="a", encoding="utf-8") as f:
-                f.write(line)
+            writer.append("".join(lines).encode("utf-8"), lines=len(lines))
         except OSError as e:
             raise AuditSinkError(f"Failed to write audit event to {self._file_path}: {e}") from e
 
+        self._maybe_refresh_index(len(lines))
+
+    def _get_writer(self) -> JsonlAppendWriter:
+        """Resolve the shared append writer on first use.
+
+        Raises:
+            AuditSinkError: If the directory cannot be created or the policy is invalid
+        """
+        if self._writer is None:
+            self._ensure_parent_directory()
+            try:
+                self._writer = get_jsonl_writer(self._file_path, self._writer_config)
+            except ValueError as e:
+                raise AuditSinkError(f"Invalid audit log writer configuration: {e}") from e
+        return self._writer
+
+    def flush(self) -> None:
+        """fsync events appended but not yet synced under a batched fsync policy.
+
+        Raises:
+            AuditSinkError: If fsync fails
+        """
+        if self._writer is None:
+            return
+        try:
+            self._writer.flush()
+        except OSError as e:
+            raise AuditSinkError(f"Failed to fsync audit log {self._file_path}: {e}") from e
+
+    def stats(self) -> JsonlWriterStats | None:
+        """Return the shared writer's counters (None before the first emit)."""
+        return self._writer.stats() if self._writer is not None else None
+
+    def _maybe_refresh_index(self, appended: int = 1) -> None:
+        """Seal newly completed index segments every ``index_segment_events`` appends."""
+        if self._index_segment_events is None:
+            return
+        self._appends_since_index += appended
+        if self._appends_since_index < self._index_segment_events:
+            return
+        self._appends_since_index = 0
+
+        from idis.audit.jsonl_index import JsonlAuditIndex
+
+        try:
+            JsonlAuditIndex(self._file_path, segment_events=self._index_segment_events).refresh()
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to refresh audit index for %s: %s", self._file_path, e)
+
 
 class InMemoryAuditSink:
     """In-memory audit sink for testing (no disk writes).
@@ -151,6 +281,18 @@ class InMemoryAuditSink:
         except (TypeError, ValueError) as e:
             raise AuditSinkError(f"Failed to serialize audit event: {e}") from e
 
+    def emit_batch(self, events: Sequence[dict[str, Any]]) -> None:
+        """Emit many audit events to memory (all or none).
+
+        Args:
+            events: Validated audit event dicts
+        """
+        try:
+            lines = [json.dumps(event, sort_keys=True, separators=(",", ":")) for event in events]
+        except (TypeError, ValueError) as e:
+            raise AuditSinkError(f"Failed to serialize audit event: {e}") from e
+        self._events.extend(json.loads(line) for line in lines)
+
     @property
     def events(self) -> list[dict[str, Any]]:
         """Return all emitted events."""
@@ -161,6 +303,39 @@ class InMemoryAuditSink:
         self._events.clear()
 
 
+def _str_or_none(value: Any) -> str | None:
+    return str(value) if value not in (None, "") else None
+
+
+def audit_event_deal_id(event: dict[str, Any]) -> str | None:
+    """Return the deal an audit event belongs to, if any.
+
+    API middleware records it under ``request.deal_id``; service and run-step events record
+    it under ``resource.deal_id``. This is the value promoted to the ``audit_events.deal_id``
+    column and matched by the ``deal_id`` audit query filter on every backend.
+    """
+    request_info = event.get("request") or {}
+    resource = event.get("resource") or {}
+    return _str_or_none(request_info.get("deal_id")) or _str_or_none(resource.get("deal_id"))
+
+
+def audit_event_run_id(event: dict[str, Any]) -> str | None:
+    """Return the pipeline run an audit event belongs to, if any.
+
+    Checked in order: ``request.run_id``, ``resource.run_id``, then the run-step payload
+    (``payload.safe.run_id``) emitted by the orchestrator.
+    """
+    request_info = event.get("request") or {}
+    resource = event.get("resource") or {}
+    payload = event.get("payload") or {}
+    safe = payload.get("safe") if isinstance(payload, dict) else None
+    return (
+        _str_or_none(request_info.get("run_id"))
+        or _str_or_none(resource.get("run_id"))
+        or (_str_or_none(safe.get("run_id")) if isinstance(safe, dict) else None)
+    )
+
+
 def get_audit_sink() -> AuditSink:
     """Factory function to get the configured audit sink.
 
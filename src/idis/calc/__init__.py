@@ -4,6 +4,7 @@ Phase 4.1: Calc engine framework with Calc-Sanad provenance.
 
 This package provides:
 - CalcEngine: Run deterministic calculations with full provenance
+- CalcGridResult: Batched sensitivity grids / scenarios with one shared grid hash
 - FormulaRegistry: Versioned formula specifications with stable hashes
 - Exceptions: Typed exceptions for fail-closed validation
 """
@@ -11,6 +12,8 @@ This package provides:
 from idis.calc.engine import (
     CalcEngine,
     CalcEngineResult,
+    CalcGridAxis,
+    CalcGridResult,
     CalcIntegrityError,
     CalcMissingInputError,
     CalcUnsupportedValueError,
@@ -20,6 +23,8 @@ from idis.calc.formulas.registry import FormulaRegistry, FormulaSpec
 __all__ = [
     "CalcEngine",
     "CalcEngineResult",
+    "CalcGridAxis",
+    "CalcGridResult",
     "CalcIntegrityError",
     "CalcMissingInputError",
     "CalcUnsupportedValueError",
@@ -2,16 +2,20 @@
 
 Phase 4.1: CalcEngine with run() and verify_reproducibility() methods.
 Phase 4.2: Extraction confidence gate enforcement.
+Batch grids/scenarios: run_grid() and run_scenarios() gate, validate and hash once per batch.
 All arithmetic uses Decimal exclusively; no float operations.
 """
 
 from __future__ import annotations
 
+import itertools
+import math
 import uuid
-from dataclasses import dataclass
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
 from idis.calc.formulas.registry import (
     FormulaRegistry,
@@ -38,6 +42,11 @@ if TYPE_CHECKING:
 
 __version__ = "0.1.0"
 
+# Upper bound on cells per batch; a grid is materialized as one result matrix in memory.
+MAX_GRID_CELLS: Final[int] = 250_000
+
+SCENARIO_AXIS: Final[str] = "scenario"
+
 
 class CalcMissingInputError(Exception):
     """Raised when a required input is missing.
@@ -114,6 +123,135 @@ class CalcEngineResult:
     calc_sanad: CalcSanad
 
 
+@dataclass(frozen=True)
+class CalcGridAxis:
+    """One dimension of a calc grid.
+
+    Each step overrides one or more formula inputs. A sensitivity axis has one input per step
+    (labelled with its value); a scenario axis carries named override sets.
+
+    Attributes:
+        name: Axis name (the swept input name, or ``"scenario"``).
+        labels: Human-readable label per step.
+        overrides: Input overrides applied at each step, aligned with ``labels``.
+    """
+
+    name: str
+    labels: tuple[str, ...]
+    overrides: tuple[dict[str, Decimal], ...]
+
+    def to_hash_dict(self) -> dict[str, Any]:
+        """Return the canonical form used in the grid hash."""
+        return {
+            "labels": list(self.labels),
+            "name": self.name,
+            "overrides": [{k: str(v) for k, v in sorted(step.items())} for step in self.overrides],
+        }
+
+
+@dataclass(frozen=True)
+class CalcGridResult:
+    """Result from CalcEngine.run_grid() / run_scenarios().
+
+    The grid definition (tenant, deal, formula, code version, base inputs, claims, metadata
+    and axes) is hashed once into ``grid_hash``. Outputs are kept as a compact row-major
+    matrix; any cell is reproducible from ``grid_hash`` plus its coordinates, and
+    ``inputs_at`` gives exactly the input set ``CalcEngine.run`` would need to recompute it.
+
+    Attributes:
+        grid_id: UUID for this batch (also the ``calc_id`` of ``calc_sanad``).
+        grid_hash: SHA256 of the canonical grid definition.
+        tenant_id: Tenant UUID.
+        deal_id: Deal UUID.
+        calc_type: Calculation performed in every cell.
+        formula_hash: Hash of the formula spec used.
+        code_version: Engine code version.
+        base_inputs: Inputs shared by every cell, merged with formula defaults.
+        axes: Grid dimensions, outermost first.
+        values: Quantized outputs in row-major order; None where the formula rejected a cell.
+        errors: Formula error message per rejected cell, keyed by coordinates.
+        input_claim_ids: Sorted input claim IDs shared by every cell.
+        metadata: Units/currency/time_window shared by every cell.
+        calc_sanad: Provenance grade shared by every cell.
+    """
+
+    grid_id: str
+    grid_hash: str
+    tenant_id: str
+    deal_id: str
+    calc_type: CalcType
+    formula_hash: str
+    code_version: str
+    base_inputs: dict[str, Decimal]
+    axes: tuple[CalcGridAxis, ...]
+    values: tuple[Decimal | None, ...]
+    errors: dict[tuple[int, ...], str]
+    input_claim_ids: list[str]
+    metadata: dict[str, str]
+    calc_sanad: CalcSanad
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Number of steps along each axis."""
+        return tuple(len(axis.labels) for axis in self.axes)
+
+    def value_at(self, coordinates: Sequence[int]) -> Decimal | None:
+        """Return the output at ``coordinates`` (None if the formula rejected the cell)."""
+        return self.values[self._flat_index(coordinates)]
+
+    def inputs_at(self, coordinates: Sequence[int]) -> dict[str, Decimal]:
+        """Return the full formula input set for the cell at ``coordinates``."""
+        self._flat_index(coordinates)
+        inputs = dict(self.base_inputs)
+        for axis, step in zip(self.axes, coordinates, strict=True):
+            inputs.update(axis.overrides[step])
+        return inputs
+
+    def cell_hash(self, coordinates: Sequence[int]) -> str:
+        """Return the reproducibility hash of one cell: grid hash + coordinates + output."""
+        value = self.value_at(coordinates)
+        return compute_sha256(
+            canonical_json_for_hash(
+                {
+                    "coordinates": list(coordinates),
+                    "grid_hash": self.grid_hash,
+                    "primary_value": None if value is None else str(value),
+                }
+            )
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a compact JSON-compatible dict (one flat value list, no per-cell rows)."""
+        return {
+            "grid_id": self.grid_id,
+            "grid_hash": self.grid_hash,
+            "calc_type": self.calc_type.value,
+            "formula_hash": self.formula_hash,
+            "code_version": self.code_version,
+            "base_inputs": {k: str(v) for k, v in sorted(self.base_inputs.items())},
+            "axes": [axis.to_hash_dict() for axis in self.axes],
+            "shape": list(self.shape),
+            "values": [None if v is None else str(v) for v in self.values],
+            "errors": [
+                {"coordinates": list(coords), "error": message}
+                for coords, message in sorted(self.errors.items())
+            ],
+            "calc_grade": self.calc_sanad.calc_grade.value,
+        }
+
+    def _flat_index(self, coordinates: Sequence[int]) -> int:
+        shape = self.shape
+        if len(coordinates) != len(shape):
+            raise IndexError(f"Expected {len(shape)} coordinates, got {len(coordinates)}")
+        index = 0
+        for step, size in zip(coordinates, shape, strict=True):
+            if not 0 <= step < size:
+                raise IndexError(f"Coordinates {tuple(coordinates)} outside grid shape {shape}")
+            index = index * size + step
+        return index
+
+
 class CalcEngine:
     """Deterministic calculation engine with full provenance.
 
@@ -242,6 +380,124 @@ class CalcEngine:
 
         return CalcEngineResult(calculation=calculation, calc_sanad=calc_sanad)
 
+    def run_grid(
+        self,
+        tenant_id: str,
+        deal_id: str,
+        calc_type: CalcType,
+        base_inputs: dict[str, Decimal],
+        axes: Mapping[str, Sequence[Decimal]],
+        input_grades: list[InputGradeInfo],
+        metadata: dict[str, str] | None = None,
+    ) -> CalcGridResult:
+        """Evaluate one formula across the Cartesian product of input sweeps.
+
+        The extraction gate, input validation, default merging, Calc-Sanad and grid hash are
+        computed once for the whole grid; each cell only evaluates the formula.
+
+        Args:
+            tenant_id: Tenant UUID for isolation.
+            deal_id: Deal UUID the grid belongs to.
+            calc_type: Type of calculation to perform in every cell.
+            base_inputs: Inputs held constant across the grid (all Decimal).
+            axes: Input name -> values to sweep, outermost axis first.
+            input_grades: Grade information for input claims.
+            metadata: Optional metadata (units, currency, time_window).
+
+        Returns:
+            CalcGridResult with the row-major output matrix.
+
+        Raises:
+            CalcMissingInputError: If a required input is neither a base input nor an axis.
+            CalcUnsupportedValueError: If an axis is not a formula input or a value is not Decimal.
+            ExtractionGateBlockedError: If any input fails extraction gate.
+            KeyError: If calc_type is not registered.
+            ValueError: If an axis is empty or the grid exceeds MAX_GRID_CELLS.
+        """
+        grid_axes = tuple(
+            CalcGridAxis(
+                name=name,
+                labels=tuple(str(value) for value in values),
+                overrides=tuple({name: value} for value in values),
+            )
+            for name, values in axes.items()
+        )
+        return self._run_batch(
+            tenant_id, deal_id, calc_type, base_inputs, grid_axes, input_grades, metadata
+        )
+
+    def run_scenarios(
+        self,
+        tenant_id: str,
+        deal_id: str,
+        calc_type: CalcType,
+        base_inputs: dict[str, Decimal],
+        scenarios: Mapping[str, Mapping[str, Decimal]],
+        input_grades: list[InputGradeInfo],
+        metadata: dict[str, str] | None = None,
+    ) -> CalcGridResult:
+        """Evaluate one formula for a set of named scenarios (e.g. base/bull/bear).
+
+        Scenarios form a single ``"scenario"`` axis whose steps override base inputs, so
+        cell coordinates are ``(index,)`` in scenario order. Validation, gating and hashing
+        are shared exactly as in ``run_grid``.
+
+        Args:
+            tenant_id: Tenant UUID for isolation.
+            deal_id: Deal UUID the scenarios belong to.
+            calc_type: Type of calculation to perform.
+            base_inputs: Inputs shared by every scenario (all Decimal).
+            scenarios: Scenario name -> input overrides.
+            input_grades: Grade information for input claims.
+            metadata: Optional metadata (units, currency, time_window).
+
+        Returns:
+            CalcGridResult with one axis named ``"scenario"``.
+
+        Raises:
+            CalcMissingInputError: If a required input is missing from base and any scenario.
+            CalcUnsupportedValueError: If an override is not a formula input or not Decimal.
+            ExtractionGateBlockedError: If any input fails extraction gate.
+            KeyError: If calc_type is not registered.
+            ValueError: If no scenarios are given.
+        """
+        axis = CalcGridAxis(
+            name=SCENARIO_AXIS,
+            labels=tuple(scenarios),
+            overrides=tuple(dict(overrides) for overrides in scenarios.values()),
+        )
+        return self._run_batch(
+            tenant_id, deal_id, calc_type, base_inputs, (axis,), input_grades, metadata
+        )
+
+    def verify_grid_reproducibility(self, grid: CalcGridResult) -> None:
+        """Verify a grid's hash against its definition.
+
+        Args:
+            grid: The grid result to verify.
+
+        Raises:
+            CalcIntegrityError: If the recomputed grid hash doesn't match (tamper detected).
+        """
+        spec = self._registry.get_or_raise(grid.calc_type)
+        computed_hash = self._compute_grid_hash(
+            tenant_id=grid.tenant_id,
+            deal_id=grid.deal_id,
+            calc_type=grid.calc_type,
+            formula_hash=spec.formula_hash,
+            code_version=grid.code_version,
+            base_inputs=grid.base_inputs,
+            input_claim_ids=grid.input_claim_ids,
+            metadata=grid.metadata,
+            axes=grid.axes,
+        )
+        if computed_hash != grid.grid_hash:
+            raise CalcIntegrityError(
+                calc_id=grid.grid_id,
+                expected_hash=grid.grid_hash,
+                computed_hash=computed_hash,
+            )
+
     def verify_reproducibility(self, calculation: DeterministicCalculation) -> None:
         """Verify the reproducibility hash of a calculation.
 
@@ -272,6 +528,125 @@ class CalcEngine:
                 computed_hash=computed_hash,
             )
 
+    def _run_batch(
+        self,
+        tenant_id: str,
+        deal_id: str,
+        calc_type: CalcType,
+        base_inputs: dict[str, Decimal],
+        axes: tuple[CalcGridAxis, ...],
+        input_grades: list[InputGradeInfo],
+        metadata: dict[str, str] | None,
+    ) -> CalcGridResult:
+        """Gate, validate and hash a batch once, then evaluate every cell."""
+        spec = self._registry.get_or_raise(calc_type)
+
+        if self._enforce_extraction_gate:
+            self._enforce_extraction_gate_on_inputs(input_grades, calc_type)
+
+        self._validate_batch_definition(spec, base_inputs, axes)
+        merged_base = self._merge_with_defaults(spec, base_inputs)
+        input_claim_ids = sorted(ig.claim_id for ig in input_grades)
+        batch_metadata = dict(metadata or {})
+
+        grid_hash = self._compute_grid_hash(
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            calc_type=calc_type,
+            formula_hash=spec.formula_hash,
+            code_version=self._code_version,
+            base_inputs=merged_base,
+            input_claim_ids=input_claim_ids,
+            metadata=batch_metadata,
+            axes=axes,
+        )
+
+        quantum = Decimal(f"0.{'0' * spec.output_precision}")
+        values: list[Decimal | None] = []
+        errors: dict[tuple[int, ...], str] = {}
+        steps = [range(len(axis.overrides)) for axis in axes]
+        for coordinates in itertools.product(*steps):
+            cell_inputs = dict(merged_base)
+            for axis, step in zip(axes, coordinates, strict=True):
+                cell_inputs.update(axis.overrides[step])
+            try:
+                output_value = spec.fn(cell_inputs)
+            except (ValueError, ArithmeticError) as exc:
+                values.append(None)
+                errors[coordinates] = str(exc) or type(exc).__name__
+                continue
+            values.append(output_value.quantize(quantum, rounding=ROUND_HALF_UP))
+
+        grid_id = str(uuid.uuid4())
+        now = datetime.now(UTC)
+        calc_sanad = self._compute_calc_sanad(
+            calc_sanad_id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            calc_id=grid_id,
+            input_grades=input_grades,
+            now=now,
+        )
+
+        return CalcGridResult(
+            grid_id=grid_id,
+            grid_hash=grid_hash,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            calc_type=calc_type,
+            formula_hash=spec.formula_hash,
+            code_version=self._code_version,
+            base_inputs=merged_base,
+            axes=axes,
+            values=tuple(values),
+            errors=errors,
+            input_claim_ids=input_claim_ids,
+            metadata=batch_metadata,
+            calc_sanad=calc_sanad,
+            created_at=now,
+        )
+
+    def _validate_batch_definition(
+        self,
+        spec: FormulaSpec,
+        base_inputs: dict[str, Decimal],
+        axes: tuple[CalcGridAxis, ...],
+    ) -> None:
+        """Validate a batch definition once, before any cell is evaluated.
+
+        Raises:
+            CalcMissingInputError: If a required input is not supplied for every cell.
+            CalcUnsupportedValueError: If an input is unknown to the formula or not Decimal.
+            ValueError: If an axis is empty or the batch exceeds MAX_GRID_CELLS.
+        """
+        known_inputs = sorted({*spec.required_inputs, *spec.optional_inputs})
+        supplied = [base_inputs.items()]
+        for axis in axes:
+            if not axis.overrides:
+                raise ValueError(f"Grid axis '{axis.name}' has no values")
+            supplied.extend(step.items() for step in axis.overrides)
+
+        for items in supplied:
+            for name, value in items:
+                if name not in known_inputs:
+                    raise CalcUnsupportedValueError("input", name, known_inputs)
+                if not isinstance(value, Decimal):
+                    raise CalcUnsupportedValueError(
+                        f"value type for {name}", type(value).__name__, ["Decimal"]
+                    )
+
+        cell_count = math.prod(len(axis.overrides) for axis in axes)
+        if cell_count > MAX_GRID_CELLS:
+            raise ValueError(f"Grid has {cell_count} cells; limit is {MAX_GRID_CELLS}")
+
+        missing = [
+            name
+            for name in spec.required_inputs
+            if name not in base_inputs
+            and not any(all(name in step for step in axis.overrides) for axis in axes)
+        ]
+        if missing:
+            raise CalcMissingInputError(missing, spec.calc_type)
+
     def _validate_required_inputs(
         self,
         spec: FormulaSpec,
@@ -375,6 +750,34 @@ class CalcEngine:
         canonical = canonical_json_for_hash(hash_input)
         return compute_sha256(canonical)
 
+    def _compute_grid_hash(
+        self,
+        tenant_id: str,
+        deal_id: str,
+        calc_type: CalcType,
+        formula_hash: str,
+        code_version: str,
+        base_inputs: dict[str, Decimal],
+        input_claim_ids: list[str],
+        metadata: dict[str, str],
+        axes: tuple[CalcGridAxis, ...],
+    ) -> str:
+        """Compute the hash of a grid definition (computed once per batch, not per cell)."""
+        hash_input = {
+            "axes": [axis.to_hash_dict() for axis in axes],
+            "calc_type": calc_type.value,
+            "code_version": code_version,
+            "deal_id": deal_id.lower(),
+            "formula_hash": formula_hash,
+            "inputs": {
+                "claim_ids": sorted(input_claim_ids),
+                "metadata": metadata,
+                "values": {k: str(v) for k, v in sorted(base_inputs.items())},
+            },
+            "tenant_id": tenant_id.lower(),
+        }
+        return compute_sha256(canonical_json_for_hash(hash_input))
+
     def _compute_calc_sanad(
         self,
         calc_sanad_id: str,
@@ -86,6 +86,17 @@ def _output_json(data: dict[str, Any]) -> None:
     print(json.dumps(data, sort_keys=True, indent=2))
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be an integer >= 1."""
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {parsed}")
+    return parsed
+
+
 def _make_error_result(code: str, message: str) -> dict[str, Any]:
     """Create a failed ValidationResult dict with a single error."""
     return {
@@ -235,6 +246,7 @@ def cmd_test_gdbs(args: argparse.Namespace) -> int:
             base_url=base_url,
             api_key=api_key,
             out_path=out_path,
+            concurrency=getattr(args, "concurrency", 1),
         )
 
         print(format_summary(result), file=sys.stderr)
@@ -415,6 +427,13 @@ def create_parser() -> argparse.ArgumentParser:
             metavar="KEY",
             help="API key for execute mode",
         )
+        suite_parser.add_argument(
+            "--concurrency",
+            type=_positive_int,
+            default=1,
+            metavar="N",
+            help="Execute mode: run up to N cases in parallel (default: 1)",
+        )
         suite_parser.add_argument(
             "--out",
             metavar="FILE",
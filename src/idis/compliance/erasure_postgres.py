@@ -10,8 +10,9 @@ deterministic_calculations), run_steps (via runs), human_gate_actions (via human
 Retained-with-reason:
 - ``erasure_requests``: the durable evidence OF the erasure itself; deliberately has no FK to
   deals and must outlive the erased row.
-(``audit_events`` and ``legal_holds`` carry no deal_id column - audit events reference deals
-only inside their JSON resource and are immutable by trigger; holds reference target_id text.)
+(``audit_events`` rows are immutable by trigger and retained - their promoted ``deal_id``
+column only indexes the JSON resource; ``legal_holds`` carry no deal_id column and reference
+target_id text.)
 
 The executor deletes in FK-safe order (children before parents, ``deals`` last), object
 artifacts through the hold-aware ``ComplianceEnforcedStore`` (uri convention ``idis://<key>``),
@@ -0,0 +1,539 @@
+"""GDBS pipeline benchmark - per-stage latency and memory, gated against a pinned baseline.
+
+Replays the deals of a GDBS suite through the production stage helpers, in-process and
+hermetic: no network, no Postgres, no live LLM. Each deal goes through:
+
+- ``ingest``: ``IngestionService.ingest_bytes`` over every file in the deal's ``artifacts/``
+  directory (object store in a temporary directory).
+- ``chunk``: ``ChunkingService.chunk_spans`` over the ingested spans.
+- ``extract``: the SNAPSHOT extraction pipeline with the deterministic LLM client (it chunks
+  again internally, so ``extract`` includes chunking).
+- ``grade``: Sanad auto-grading of the extracted claims.
+- ``calc``: the deterministic calc runner over the extracted claims plus the deal's GDBS calc
+  inputs (``calcs.json``), seeded as graded claims that clear the extraction gate. The
+  deterministic LLM client extracts no numeric values, so without them every calc would block.
+- ``deliverables``: deterministic analysis, scoring and deliverables bundle generation.
+
+Stage latencies are sampled once per deal and iteration and reported as p50/p95/max. Memory
+high-water marks come from a separate ``tracemalloc`` pass (tracing would distort the timed
+passes), run after one discarded warm-up replay: the peak traced allocation within each stage,
+over all deals.
+
+Deterministic counts (spans, chunks, claims, calcs, deliverables) are reported alongside, so the
+gate also catches behavioral drift. Latency and memory are compared against a pinned baseline
+with ratio + absolute-floor tolerances; a missing or malformed baseline fails closed.
+
+Counts and traced memory are exact or near-exact across machines; latency is not. The default
+latency tolerance (2x + 10 ms) absorbs ordinary jitter on the machine that pinned the baseline,
+but a loaded or shared CI runner can still be several times slower on every stage. There, pass
+a wider ``latency_ratio`` override (``--latency-ratio`` on the script) rather than re-pinning.
+
+Regenerating the pin after an INTENTIONAL change (on a quiet machine):
+    python scripts/bench_gdbs_pipeline.py --write-baseline \
+tests/fixtures/bench_baseline/gdbs_pipeline_gdbs_s_baseline.json
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from idis.evaluation.baseline import compute_manifest_sha256
+from idis.evaluation.benchmarks.gdbs import load_gdbs_suite
+
+if TYPE_CHECKING:
+    from idis.evaluation.types import GdbsCase, SuiteId
+
+BENCHMARK_NAME: Final[str] = "gdbs_pipeline"
+
+PIPELINE_BASELINE_VERSION: Final[int] = 1
+
+PIPELINE_STAGES: Final[tuple[str, ...]] = (
+    "ingest",
+    "chunk",
+    "extract",
+    "grade",
+    "calc",
+    "deliverables",
+)
+
+_REQUIRED_BASELINE_KEYS: Final[tuple[str, ...]] = (
+    "baseline_version",
+    "benchmark",
+    "suite_id",
+    "manifest_sha256",
+    "case_count",
+    "counts",
+    "stages",
+    "tolerances",
+)
+
+# A stage regresses when current > baseline * ratio + floor. The floors keep sub-millisecond
+# stages from tripping the gate on scheduler noise.
+DEFAULT_TOLERANCES: Final[dict[str, float]] = {
+    "latency_ratio": 2.0,
+    "latency_floor_ms": 10.0,
+    "memory_ratio": 1.25,
+    "memory_floor_kib": 256.0,
+}
+
+_BENCH_ACTOR_ID: Final[str] = "gdbs-pipeline-benchmark"
+
+
+class _StageRecorder:
+    """Collect per-stage latency samples and, while tracing, per-stage peak allocations."""
+
+    def __init__(self) -> None:
+        self.samples_ms: dict[str, list[float]] = {stage: [] for stage in PIPELINE_STAGES}
+        self.peak_bytes: dict[str, int] = dict.fromkeys(PIPELINE_STAGES, 0)
+        self.tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.tracing:
+            tracemalloc.reset_peak()
+            floor, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        yield
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if self.tracing:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_bytes[name] = max(self.peak_bytes[name], peak - floor)
+        else:
+            self.samples_ms[name].append(elapsed_ms)
+
+
+def _clear_in_memory_stores() -> None:
+    from idis.persistence.repositories.calculations import clear_in_memory_calculations_store
+    from idis.persistence.repositories.claims import clear_all_claims_stores
+
+    clear_all_claims_stores()
+    clear_in_memory_calculations_store()
+
+
+def _seed_calc_inputs(deal_dir: Path, tenant_id: str, deal_id: str) -> list[str]:
+    """Seed the deal's GDBS calc inputs as graded claims. Returns the seeded claim ids.
+
+    Each ``calcs.json`` input becomes a claim at the calc's ``input_min_sanad_grade`` whose text
+    names the input (the calc runner resolves it through its aliases), with a sanad at the
+    extraction gate thresholds.
+    """
+    from idis.persistence.repositories.claims import (
+        InMemoryClaimsRepository,
+        InMemorySanadsRepository,
+    )
+    from idis.validators.extraction_gate import CONFIDENCE_THRESHOLD, DHABT_THRESHOLD
+
+    calcs_path = deal_dir / "calcs.json"
+    if not calcs_path.is_file():
+        return []
+    claims_repo = InMemoryClaimsRepository(tenant_id)
+    sanads_repo = InMemorySanadsRepository(tenant_id)
+    claim_ids: list[str] = []
+    calc_sanads = json.loads(calcs_path.read_text(encoding="utf-8")).get("calc_sanads", [])
+    for calc_sanad in calc_sanads:
+        for input_key, value in sorted(dict(calc_sanad.get("inputs") or {}).items()):
+            claim_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{calc_sanad['calc_id']}/{input_key}"))
+            sanad_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{claim_id}/sanad"))
+            claims_repo.create(
+                claim_id=claim_id,
+                deal_id=deal_id,
+                claim_class="FINANCIAL",
+                claim_text=input_key.replace("_", " "),
+                value={"value": value},
+                sanad_id=sanad_id,
+                claim_grade=str(calc_sanad["input_min_sanad_grade"]),
+            )
+            sanads_repo.create(
+                sanad_id=sanad_id,
+                claim_id=claim_id,
+                deal_id=deal_id,
+                primary_evidence_id=f"gdbs-calc-input:{claim_id}",
+                computed={
+                    "extraction_confidence": str(CONFIDENCE_THRESHOLD),
+                    "dhabt_score": str(DHABT_THRESHOLD),
+                },
+            )
+            claim_ids.append(claim_id)
+    return claim_ids
+
+
+def _replay_case(
+    dataset_root: Path,
+    case: GdbsCase,
+    recorder: _StageRecorder,
+    storage_dir: Path,
+) -> dict[str, int]:
+    """Run one deal through every stage. Returns its deterministic output counts."""
+    from idis.api.routes.runs import (
+        _run_full_analysis,
+        _run_full_deliverables,
+        _run_full_scoring,
+        _run_snapshot_auto_grade,
+        _run_snapshot_calc,
+        _run_snapshot_extraction,
+    )
+    from idis.audit.sink import InMemoryAuditSink
+    from idis.services.extraction.chunking.service import ChunkingService
+    from idis.services.extraction.extractors.llm_client import (
+        DeterministicAnalysisLLMClient,
+        DeterministicLLMClient,
+        DeterministicScoringLLMClient,
+    )
+    from idis.services.ingestion import IngestionService
+    from idis.services.ingestion.service import IngestionContext
+    from idis.storage.compliant_store import ComplianceEnforcedStore
+    from idis.storage.filesystem_store import FilesystemObjectStore
+
+    _clear_in_memory_stores()
+    deal_dir = dataset_root / case.directory
+    deal = json.loads((deal_dir / "deal.json").read_text(encoding="utf-8"))
+    tenant_id = str(deal["tenant_id"])
+    deal_id = case.deal_id
+    run_id = str(uuid.uuid4())
+    artifacts = sorted(p for p in (deal_dir / "artifacts").iterdir() if p.is_file())
+    payloads = [(path.name, path.read_bytes()) for path in artifacts]
+
+    service = IngestionService(
+        compliant_store=ComplianceEnforcedStore(
+            inner_store=FilesystemObjectStore(base_dir=storage_dir / run_id)
+        ),
+        audit_sink=InMemoryAuditSink(),
+    )
+    ctx = IngestionContext(
+        tenant_id=uuid.UUID(tenant_id), actor_id=_BENCH_ACTOR_ID, request_id=run_id
+    )
+    documents: list[dict[str, Any]] = []
+    with recorder.stage("ingest"):
+        for filename, data in payloads:
+            result = service.ingest_bytes(
+                ctx, uuid.UUID(deal_id), filename=filename, media_type=None, data=data
+            )
+            if not result.success or result.document_id is None:
+                continue
+            documents.append(
+                {
+                    "document_id": str(result.document_id),
+                    "doc_type": result.doc_type,
+                    "document_name": filename,
+                    "spans": [
+                        {
+                            "span_id": str(span.span_id),
+                            "text_excerpt": span.text_excerpt,
+                            "locator": span.locator,
+                            "span_type": str(span.span_type),
+                        }
+                        for span in service.get_spans(uuid.UUID(tenant_id), result.document_id)
+                    ],
+                }
+            )
+
+    chunking = ChunkingService()
+    with recorder.stage("chunk"):
+        chunk_count = sum(
+            len(
+                chunking.chunk_spans(
+                    doc["spans"], document_id=doc["document_id"], doc_type=doc["doc_type"]
+                )
+            )
+            for doc in documents
+        )
+
+    with recorder.stage("extract"):
+        extraction = _run_snapshot_extraction(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            documents=documents,
+            extractor_client_factory=lambda _selection: DeterministicLLMClient(),
+        )
+    claim_ids = list(extraction["created_claim_ids"])
+
+    with recorder.stage("grade"):
+        grading = _run_snapshot_auto_grade(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            created_claim_ids=claim_ids,
+            audit_sink=InMemoryAuditSink(),
+        )
+
+    calc_input_ids = _seed_calc_inputs(deal_dir, tenant_id, deal_id)
+    with recorder.stage("calc"):
+        calc = _run_snapshot_calc(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            created_claim_ids=[*claim_ids, *calc_input_ids],
+        )
+
+    with recorder.stage("deliverables"):
+        analysis = _run_full_analysis(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            created_claim_ids=claim_ids,
+            calc_ids=list(calc["calc_ids"]),
+            enrichment_refs={},
+            analysis_client_factory=lambda _selection: DeterministicAnalysisLLMClient(),
+        )
+        scoring = _run_full_scoring(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            analysis_bundle=analysis["_analysis_bundle"],
+            analysis_context=analysis["_analysis_context"],
+            scoring_client_factory=lambda _selection: DeterministicScoringLLMClient(),
+        )
+        deliverables = _run_full_deliverables(
+            run_id=run_id,
+            tenant_id=tenant_id,
+            deal_id=deal_id,
+            analysis_bundle=analysis["_analysis_bundle"],
+            analysis_context=analysis["_analysis_context"],
+            scorecard=scoring["_scorecard"],
+        )
+
+    return {
+        "documents": len(documents),
+        "spans": sum(len(doc["spans"]) for doc in documents),
+        "chunks": chunk_count,
+        "claims": len(claim_ids),
+        "graded": int(grading["graded_count"]),
+        "calcs": len(calc["calc_ids"]),
+        "deliverables": int(deliverables["deliverable_count"]),
+    }
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def _max_rss_kib() -> int | None:
+    """Process RSS high-water mark in KiB, or None where ``resource`` is unavailable (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux and the BSDs.
+    return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+def run_pipeline_benchmark(
+    dataset_root: Path,
+    suite: SuiteId = "gdbs-s",
+    *,
+    iterations: int = 3,
+    max_cases: int | None = None,
+) -> dict[str, Any]:
+    """Replay a GDBS suite through every pipeline stage and report latency and memory.
+
+    Clears the in-memory claim, sanad and calculation stores before each deal.
+
+    Args:
+        dataset_root: GDBS dataset root (deal directories must contain ``artifacts/``).
+        suite: Suite whose deals are replayed.
+        iterations: Timed passes over the deals, after the warm-up and traced passes.
+        max_cases: Replay only the first N deals of the suite.
+
+    Returns:
+        Report with per-stage ``p50_ms``/``p95_ms``/``max_ms``/``peak_kib``, deterministic
+        output counts and the process RSS high-water mark (``max_rss_kib``, None on platforms
+        without ``resource``).
+
+    Raises:
+        ValueError: If the suite fails to load or has no deals, ``iterations`` < 1 or
+            ``max_cases`` < 1.
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be >= 1")
+    if max_cases is not None and max_cases < 1:
+        raise ValueError("max_cases must be >= 1")
+    loaded = load_gdbs_suite(Path(dataset_root), suite)
+    if not loaded.success:
+        raise ValueError(f"GDBS suite {suite} failed to load: {loaded.errors}")
+    cases = loaded.cases[:max_cases] if max_cases is not None else loaded.cases
+    if not cases:
+        raise ValueError(f"GDBS suite {suite} has no deals to replay")
+
+    recorder = _StageRecorder()
+    counts: dict[str, int] = {}
+    with tempfile.TemporaryDirectory(prefix="idis-bench-") as storage:
+        # Untraced, discarded replay first: lazy imports and caches must not count as stage peaks.
+        _replay_case(Path(dataset_root), cases[0], _StageRecorder(), Path(storage))
+        recorder.tracing = True
+        tracemalloc.start()
+        try:
+            for case in cases:
+                for key, value in _replay_case(
+                    Path(dataset_root), case, recorder, Path(storage)
+                ).items():
+                    counts[key] = counts.get(key, 0) + value
+        finally:
+            tracemalloc.stop()
+            recorder.tracing = False
+        for _ in range(iterations):
+            for case in cases:
+                _replay_case(Path(dataset_root), case, recorder, Path(storage))
+    _clear_in_memory_stores()
+
+    stages: dict[str, dict[str, Any]] = {}
+    for stage in PIPELINE_STAGES:
+        samples = recorder.samples_ms[stage]
+        stages[stage] = {
+            "samples": len(samples),
+            "p50_ms": round(_percentile(samples, 50), 3),
+            "p95_ms": round(_percentile(samples, 95), 3),
+            "max_ms": round(max(samples, default=0.0), 3),
+            "peak_kib": round(recorder.peak_bytes[stage] / 1024, 1),
+        }
+    return {
+        "benchmark": BENCHMARK_NAME,
+        "suite_id": suite,
+        "manifest_sha256": compute_manifest_sha256(Path(dataset_root)),
+        "case_count": len(cases),
+        "iterations": iterations,
+        "counts": dict(sorted(counts.items())),
+        "stages": stages,
+        "max_rss_kib": _max_rss_kib(),
+    }
+
+
+def build_pipeline_baseline_document(
+    report: dict[str, Any], *, tolerances: dict[str, float] | None = None
+) -> dict[str, Any]:
+    """Build a pinnable baseline document from a benchmark report."""
+    return {
+        "baseline_version": PIPELINE_BASELINE_VERSION,
+        "benchmark": BENCHMARK_NAME,
+        "suite_id": report["suite_id"],
+        "manifest_sha256": report["manifest_sha256"],
+        "case_count": report["case_count"],
+        "counts": dict(report["counts"]),
+        "stages": {
+            stage: {key: values[key] for key in ("p50_ms", "p95_ms", "peak_kib")}
+            for stage, values in report["stages"].items()
+        },
+        "tolerances": {**DEFAULT_TOLERANCES, **(tolerances or {})},
+    }
+
+
+def load_pipeline_baseline(path: Path) -> tuple[dict[str, Any] | None, str | None]:
+    """Load a pipeline baseline. Returns (document, None) or (None, error_code) fail-closed."""
+    baseline_path = Path(path)
+    if not baseline_path.is_file():
+        return None, "BASELINE_MISSING"
+    try:
+        document = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None, "BASELINE_INVALID"
+    if not isinstance(document, dict) or document.get("benchmark") != BENCHMARK_NAME:
+        return None, "BASELINE_INVALID"
+    if any(key not in document for key in _REQUIRED_BASELINE_KEYS):
+        return None, "BASELINE_INVALID"
+    return document, None
+
+
+def _bounded_drift(
+    metric: str, baseline_value: float, current_value: float, ratio: float, floor: float
+) -> dict[str, Any]:
+    limit = round(baseline_value * ratio + floor, 3)
+    return {
+        "metric": metric,
+        "baseline": baseline_value,
+        "current": current_value,
+        "limit": limit,
+        "exceeded": current_value > limit,
+    }
+
+
+def compare_pipeline_to_baseline(
+    baseline: dict[str, Any],
+    report: dict[str, Any],
+    *,
+    tolerances: dict[str, float] | None = None,
+) -> dict[str, Any]:
+    """Tolerance gate. ``ok`` is False when a stage regresses or an identity/count drifts.
+
+    ``tolerances`` override the pinned ones, e.g. a wider ``latency_ratio`` on a shared runner.
+    """
+    tolerances = {
+        **DEFAULT_TOLERANCES,
+        **dict(baseline.get("tolerances") or {}),
+        **(tolerances or {}),
+    }
+    drifts: list[dict[str, Any]] = []
+
+    for key in ("suite_id", "manifest_sha256", "case_count"):
+        drifts.append(
+            {
+                "metric": key,
+                "baseline": baseline[key],
+                "current": report[key],
+                "limit": "exact-match",
+                "exceeded": baseline[key] != report[key],
+            }
+        )
+    baseline_counts = dict(baseline["counts"])
+    current_counts = dict(report["counts"])
+    for key in sorted(set(baseline_counts) | set(current_counts)):
+        drifts.append(
+            {
+                "metric": f"counts.{key}",
+                "baseline": baseline_counts.get(key),
+                "current": current_counts.get(key),
+                "limit": "exact-match",
+                "exceeded": baseline_counts.get(key) != current_counts.get(key),
+            }
+        )
+
+    for stage, pinned in sorted(dict(baseline["stages"]).items()):
+        current = report["stages"].get(stage)
+        if current is None:
+            drifts.append(
+                {
+                    "metric": f"stages.{stage}",
+                    "baseline": "present",
+                    "current": "missing",
+                    "limit": "exact-match",
+                    "exceeded": True,
+                }
+            )
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            drifts.append(
+                _bounded_drift(
+                    f"stages.{stage}.{key}",
+                    float(pinned[key]),
+                    float(current[key]),
+                    float(tolerances["latency_ratio"]),
+                    float(tolerances["latency_floor_ms"]),
+                )
+            )
+        drifts.append(
+            _bounded_drift(
+                f"stages.{stage}.peak_kib",
+                float(pinned["peak_kib"]),
+                float(current["peak_kib"]),
+                float(tolerances["memory_ratio"]),
+                float(tolerances["memory_floor_kib"]),
+            )
+        )
+
+    exceeded = [d["metric"] for d in drifts if d["exceeded"]]
+    return {
+        "ok": not exceeded,
+        "baseline_version": baseline.get("baseline_version"),
+        "exceeded_metrics": exceeded,
+        "drifts": drifts,
+    }
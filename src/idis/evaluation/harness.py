@@ -4,16 +4,25 @@ Modes:
 - validate: Only validate dataset structure, produce report
 - execute: Attempt to run cases via API (returns BLOCKED if endpoint unavailable)
 
+Execute mode runs cases on a bounded worker pool (``concurrency``, default 1) sharing one pooled
+httpx client. Cases are isolated by deal: each creates its own deal, seeds its bytes under a
+case-scoped storage key and starts its run with a case-scoped Idempotency-Key. Results are
+reported in the suite's deterministic case order regardless of completion order, alongside
+wall-clock vs cumulative case time and per-case phase and run-step timings.
+
 Uses httpx as the project-standard HTTP client.
 """
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
@@ -292,6 +301,7 @@ def _execute_case(
     dataset_root: Path,
     shared_store_dir: Path | None = None,
     http_timeout: float | None = None,
+    http_client: httpx.Client | None = None,
 ) -> CaseResult:
     """Execute a single case via the IDIS API.
 
@@ -307,17 +317,24 @@ def _execute_case(
         api_key: Optional API key for authentication.
         dataset_root: Path to GDBS dataset root.
         shared_store_dir: Path to the shared filesystem store for seeding bytes.
+        http_timeout: Optional per-request HTTP timeout override in seconds.
+        http_client: Shared pooled client; a case-owned client is created when omitted.
 
     Returns:
-        CaseResult with status, errors, metrics, and timing.
+        CaseResult with status, errors, metrics, and timing. ``metrics["timings_ms"]``
+        holds the create_deal / seed_and_ingest / run phase durations and
+        ``metrics["step_timings_ms"]`` the run's per-step durations.
     """
     start_time = time.monotonic()
     metrics: dict[str, object] = {}
+    timings_ms: dict[str, int] = {}
+    metrics["timings_ms"] = timings_ms
     auth_headers = _build_headers(api_key)
 
     try:
         effective_timeout = http_timeout if http_timeout is not None else _HTTP_TIMEOUT
-        with httpx.Client(timeout=effective_timeout) as client:
+        with _case_client(http_client, effective_timeout) as client:
+            phase_start = time.monotonic()
             create_resp = client.post(
                 f"{base_url}/v1/deals",
                 json={"name": case.deal_key, "company_name": case.deal_key},
@@ -337,9 +354,11 @@ def _execute_case(
 
             deal_id = create_resp.json()["deal_id"]
             metrics["deal_id"] = deal_id
+            timings_ms["create_deal"] = _elapsed_ms(phase_start)
 
             deal_dir = dataset_root / case.directory
             if deal_dir.exists():
+                phase_start = time.monotonic()
                 ingested_count, seed_errors = _seed_and_ingest_documents(
                     client=client,
                     auth_headers=auth_headers,
@@ -350,6 +369,7 @@ def _execute_case(
                     case_id=case.case_id,
                 )
                 metrics["documents_ingested"] = ingested_count
+                timings_ms["seed_and_ingest"] = _elapsed_ms(phase_start)
                 if seed_errors:
                     metrics["seed_errors"] = seed_errors
 
@@ -364,11 +384,13 @@ def _execute_case(
                     )
 
             run_headers = {**auth_headers, "Idempotency-Key": case.case_id}
+            phase_start = time.monotonic()
             run_resp = client.post(
                 f"{base_url}/v1/deals/{deal_id}/runs",
                 json={"mode": "FULL"},
                 headers=run_headers,
             )
+            timings_ms["run"] = _elapsed_ms(phase_start)
 
             execution_time_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -413,6 +435,7 @@ def _execute_case(
             metrics["run_status"] = run_status
             metrics["steps_completed"] = len([s for s in steps if s.get("status") == "COMPLETED"])
             metrics["steps_failed"] = len([s for s in steps if s.get("status") == "FAILED"])
+            metrics["step_timings_ms"] = _step_timings_ms(steps)
 
             failed_steps = [s for s in steps if s.get("status") == "FAILED"]
             if failed_steps:
@@ -470,6 +493,35 @@ def _execute_case(
         )
 
 
+@contextlib.contextmanager
+def _case_client(shared: httpx.Client | None, timeout: float) -> Iterator[httpx.Client]:
+    """Yield the shared pooled client, or a case-owned client closed on exit."""
+    if shared is not None:
+        yield shared
+        return
+    with httpx.Client(timeout=timeout) as client:
+        yield client
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
+
+def _step_timings_ms(steps: list[dict[str, Any]]) -> dict[str, int]:
+    """Per-step durations from the run response's started_at / finished_at timestamps."""
+    timings: dict[str, int] = {}
+    for step in steps:
+        started, finished = step.get("started_at"), step.get("finished_at")
+        if not (step.get("step_name") and started and finished):
+            continue
+        try:
+            duration = datetime.fromisoformat(finished) - datetime.fromisoformat(started)
+        except (TypeError, ValueError):
+            continue
+        timings[str(step["step_name"])] = int(duration.total_seconds() * 1000)
+    return timings
+
+
 def run_suite(
     dataset_root: Path,
     suite: SuiteId,
@@ -482,6 +534,7 @@ def run_suite(
     case_limit: int | None = None,
     http_timeout: float | None = None,
     pre_case_fn: Callable[[], None] | None = None,
+    concurrency: int = 1,
 ) -> SuiteResult:
     """Run evaluation suite in validate or execute mode.
 
@@ -498,15 +551,25 @@ def run_suite(
         case_limit: Optional max number of cases to execute (for diagnostic runs).
         http_timeout: Optional per-request HTTP timeout override in seconds.
         pre_case_fn: Optional callback invoked before each case (e.g. server restart).
+            Requires sequential execution (concurrency=1).
+        concurrency: Number of cases executed in parallel in execute mode.
 
     Returns:
         SuiteResult with status, cases, and metrics
 
+    Raises:
+        ValueError: If concurrency < 1, or pre_case_fn is combined with concurrency > 1.
+
     Exit code semantics:
         PASS (0): All validations/executions succeeded
         FAIL (1): Validation or execution errors
         BLOCKED (2): Execution blocked due to missing dependencies
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+    if pre_case_fn is not None and concurrency > 1:
+        raise ValueError("pre_case_fn runs between cases and requires concurrency=1")
+
     started_at = SuiteResult.now_iso()
 
     if suite not in VALID_SUITE_IDS:
@@ -556,6 +619,7 @@ def run_suite(
             shared_store_dir=shared_store_dir,
             http_timeout=http_timeout,
             pre_case_fn=pre_case_fn,
+            concurrency=concurrency,
         )
 
 
@@ -613,8 +677,9 @@ def _run_execute_mode(
     shared_store_dir: Path | None = None,
     http_timeout: float | None = None,
     pre_case_fn: Callable[[], None] | None = None,
+    concurrency: int = 1,
 ) -> SuiteResult:
-    """Run execute mode (attempts API calls)."""
+    """Run execute mode (attempts API calls) on a pool of ``concurrency`` workers."""
     blockers: list[str] = []
 
     if not base_url:
@@ -636,10 +701,22 @@ def _run_execute_mode(
     if not api_available:
         blockers.append(reason)
 
+    wall_start = time.monotonic()
     case_results: list[CaseResult] = []
 
-    for idx, case in enumerate(load_result.cases):
-        if pre_case_fn is not None:
+    if not api_available:
+        case_results = [
+            CaseResult(
+                case_id=case.case_id,
+                deal_id=case.deal_id,
+                status=CaseStatus.BLOCKED,
+                blockers=[reason],
+            )
+            for case in load_result.cases
+        ]
+    elif pre_case_fn is not None:
+        # The server restarts between cases, so each case opens its own connections.
+        for idx, case in enumerate(load_result.cases):
             logger.info(
                 "pre_case_fn: resetting server before case %d/%d (%s)",
                 idx + 1,
@@ -647,24 +724,42 @@ def _run_execute_mode(
                 case.case_id,
             )
             pre_case_fn()
-        if api_available:
-            case_result = _execute_case(
-                case,
-                base_url,
-                api_key,
-                dataset_root,
-                shared_store_dir=shared_store_dir,
-                http_timeout=http_timeout,
-            )
-        else:
-            case_result = CaseResult(
-                case_id=case.case_id,
-                deal_id=case.deal_id,
-                status=CaseStatus.BLOCKED,
-                blockers=[reason],
+            case_results.append(
+                _execute_case(
+                    case,
+                    base_url,
+                    api_key,
+                    dataset_root,
+                    shared_store_dir=shared_store_dir,
+                    http_timeout=http_timeout,
+                )
             )
-        case_results.append(case_result)
+    else:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        timeout = http_timeout if http_timeout is not None else _HTTP_TIMEOUT
+        with httpx.Client(timeout=timeout, limits=limits) as client:
+
+            def execute(case: GdbsCase) -> CaseResult:
+                return _execute_case(
+                    case,
+                    base_url,
+                    api_key,
+                    dataset_root,
+                    shared_store_dir=shared_store_dir,
+                    http_timeout=http_timeout,
+                    http_client=client,
+                )
+
+            if concurrency == 1:
+                case_results = [execute(case) for case in load_result.cases]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=concurrency, thread_name_prefix="gdbs-case"
+                ) as pool:
+                    # map() yields in submission order: the report keeps the suite's case order.
+                    case_results = list(pool.map(execute, load_result.cases))
 
+    wall_clock_ms = _elapsed_ms(wall_start)
     finished_at = SuiteResult.now_iso()
 
     passed = len([c for c in case_results if c.status == CaseStatus.PASS])
@@ -692,6 +787,9 @@ def _run_execute_mode(
             "cases_failed": failed,
             "cases_passed": passed,
             "cases_total": len(case_results),
+            "concurrency": concurrency,
+            "cumulative_case_ms": sum(c.execution_time_ms or 0 for c in case_results),
+            "wall_clock_ms": wall_clock_ms,
         },
     )
 
@@ -1,18 +1,24 @@
-"""Minimal in-process Prometheus-style counters (Slice97 Task 6; hardened Slice99).
-
-A tiny, thread-safe, label-aware counter registry served at the unauthenticated ``GET /metrics``
-scrape surface. Because that surface is unauthenticated, counters must carry only safe labels:
-``webhook_delivery_success_total`` / ``webhook_delivery_attempts_total`` are GLOBAL aggregates
-(no tenant label - no tenant UUID or per-tenant volume is scrapeable), and the HTTP counters are
-labeled by method + status class only. ``render_prometheus_text`` emits the standard exposition
-format with label values escaped per the Prometheus text spec. Deliberately dependency-free
-(no ``prometheus_client``); counters are per-process.
+"""Minimal in-process Prometheus-style metrics (Slice97 Task 6; hardened Slice99).
+
+A tiny, thread-safe, label-aware registry of counters, gauges and histograms served at the
+unauthenticated ``GET /metrics`` scrape surface. Because that surface is unauthenticated,
+metrics must carry only safe labels: ``webhook_delivery_success_total`` /
+``webhook_delivery_attempts_total`` are GLOBAL aggregates (no tenant label - no tenant UUID or
+per-tenant volume is scrapeable), the HTTP metrics are labeled by method, status class and
+OpenAPI route template (never the raw path), the DB pool metrics by pool role, and the latency
+histograms by step name, provider or document format. ``render_prometheus_text`` emits the
+standard exposition format (histograms as cumulative ``_bucket`` series plus ``_sum`` and
+``_count``) with label values escaped per the Prometheus text spec. Deliberately
+dependency-free (no ``prometheus_client``); metrics are per-process.
 """
 
 from __future__ import annotations
 
+import math
 import threading
+from bisect import bisect_left
 from collections.abc import Mapping
+from dataclasses import dataclass
 
 WEBHOOK_DELIVERY_SUCCESS_TOTAL = "webhook_delivery_success_total"
 WEBHOOK_DELIVERY_ATTEMPTS_TOTAL = "webhook_delivery_attempts_total"
@@ -22,13 +28,109 @@ HTTP_REQUESTS_TOTAL = "http_requests_total"
 HTTP_REQUEST_5XX_TOTAL = "http_request_5xx_total"
 HTTP_REQUEST_DURATION_MS_TOTAL = "http_request_duration_ms_total"
 
+# Audit group-commit throughput recorded by idis.audit.group_commit (global aggregates).
+AUDIT_GROUP_COMMIT_BATCHES_TOTAL = "audit_group_commit_batches_total"
+AUDIT_GROUP_COMMIT_EVENTS_TOTAL = "audit_group_commit_events_total"
+AUDIT_GROUP_COMMIT_FAILURES_TOTAL = "audit_group_commit_failures_total"
+AUDIT_GROUP_COMMIT_DURATION_MS_TOTAL = "audit_group_commit_duration_ms_total"
+
+# JSONL audit writer throughput recorded by idis.audit.jsonl_writer (global aggregates).
+AUDIT_JSONL_BYTES_WRITTEN_TOTAL = "audit_jsonl_bytes_written_total"
+AUDIT_JSONL_FSYNC_TOTAL = "audit_jsonl_fsync_total"
+AUDIT_JSONL_FSYNC_DURATION_US_TOTAL = "audit_jsonl_fsync_duration_us_total"
+AUDIT_JSONL_ROTATIONS_TOTAL = "audit_jsonl_rotations_total"
+
+# Application DB connection-pool state recorded by idis.persistence.db (labeled by pool role).
+DB_POOL_CHECKOUTS_TOTAL = "db_pool_checkouts_total"
+DB_POOL_CHECKOUT_WAIT_US_TOTAL = "db_pool_checkout_wait_us_total"
+DB_POOL_CHECKOUT_TIMEOUTS_TOTAL = "db_pool_checkout_timeouts_total"
+DB_POOL_CONNECTIONS_IN_USE = "db_pool_connections_in_use"
+DB_POOL_CHECKOUTS_WAITING = "db_pool_checkouts_waiting"
+
+# Latency histograms (seconds).
+HTTP_REQUEST_DURATION_SECONDS = "http_request_duration_seconds"
+RUN_STEP_DURATION_SECONDS = "run_step_duration_seconds"
+LLM_CALL_DURATION_SECONDS = "llm_call_duration_seconds"
+PARSER_DURATION_SECONDS = "parser_duration_seconds"
+
+DEFAULT_LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+RUN_STEP_DURATION_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+    1800.0,
+)
+LLM_CALL_DURATION_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+PARSER_DURATION_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
 # The metrics IDIS genuinely measures and serves at /metrics. The Slice99 mapping doc
 # (docs/architecture/slice99_metrics_mapping.md) must mirror this exactly: SLO/dashboard
 # metrics not listed here are NOT emitted yet and must never be presented as live.
 LIVE_METRIC_NAMES: tuple[str, ...] = (
+    AUDIT_GROUP_COMMIT_BATCHES_TOTAL,
+    AUDIT_GROUP_COMMIT_DURATION_MS_TOTAL,
+    AUDIT_GROUP_COMMIT_EVENTS_TOTAL,
+    AUDIT_GROUP_COMMIT_FAILURES_TOTAL,
+    AUDIT_JSONL_BYTES_WRITTEN_TOTAL,
+    AUDIT_JSONL_FSYNC_DURATION_US_TOTAL,
+    AUDIT_JSONL_FSYNC_TOTAL,
+    AUDIT_JSONL_ROTATIONS_TOTAL,
+    DB_POOL_CHECKOUT_TIMEOUTS_TOTAL,
+    DB_POOL_CHECKOUT_WAIT_US_TOTAL,
+    DB_POOL_CHECKOUTS_TOTAL,
+    DB_POOL_CHECKOUTS_WAITING,
+    DB_POOL_CONNECTIONS_IN_USE,
     HTTP_REQUEST_5XX_TOTAL,
     HTTP_REQUEST_DURATION_MS_TOTAL,
+    HTTP_REQUEST_DURATION_SECONDS,
     HTTP_REQUESTS_TOTAL,
+    LLM_CALL_DURATION_SECONDS,
+    PARSER_DURATION_SECONDS,
+    RUN_STEP_DURATION_SECONDS,
     WEBHOOK_DELIVERY_ATTEMPTS_TOTAL,
     WEBHOOK_DELIVERY_SUCCESS_TOTAL,
 )
@@ -36,11 +138,50 @@ LIVE_METRIC_NAMES: tuple[str, ...] = (
 _LabelsKey = tuple[tuple[str, str], ...]
 
 _COUNTERS: dict[tuple[str, _LabelsKey], int] = {}
+_GAUGES: dict[tuple[str, _LabelsKey], int] = {}
+_LABEL_KEYS: dict[tuple[tuple[str, str], ...], _LabelsKey] = {}
+_HISTOGRAM_BUCKETS: dict[str, tuple[float, ...]] = {}
+_HISTOGRAMS: dict[tuple[str, _LabelsKey], _HistogramSeries] = {}
 _LOCK = threading.Lock()
 
 
+class _HistogramSeries:
+    """Per-bucket (non-cumulative) observation counts, the +Inf overflow last, and their sum."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * (buckets + 1)
+        self.total = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Point-in-time view of one histogram series.
+
+    Attributes:
+        buckets: ``(upper_bound, cumulative_count)`` pairs, ending with ``(inf, count)``.
+        sum: Sum of all observed values.
+        count: Number of observations.
+    """
+
+    buckets: tuple[tuple[float, int], ...]
+    sum: float
+    count: int
+
+
 def _labels_key(labels: Mapping[str, str] | None) -> _LabelsKey:
-    return tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items()))
+    if not labels:
+        return ()
+    raw = tuple(labels.items())
+    key = _LABEL_KEYS.get(raw)
+    if key is None:
+        key = tuple(sorted((str(k), str(v)) for k, v in raw))
+        # Memoize all-string label sets only: they are bounded by the safe-label policy, and
+        # equal-hashing non-string values (True vs 1) could not alias a cached entry.
+        if all(type(k) is str and type(v) is str for k, v in raw):
+            _LABEL_KEYS[raw] = key
+    return key
 
 
 def increment_counter(
@@ -58,10 +199,88 @@ def get_counter(name: str, *, labels: Mapping[str, str] | None = None) -> int:
         return _COUNTERS.get((name, _labels_key(labels)), 0)
 
 
+def set_gauge(name: str, value: int, *, labels: Mapping[str, str] | None = None) -> None:
+    """Set a named gauge to ``value`` (thread-safe)."""
+    with _LOCK:
+        _GAUGES[(name, _labels_key(labels))] = value
+
+
+def add_gauge(name: str, delta: int, *, labels: Mapping[str, str] | None = None) -> None:
+    """Add ``delta`` (may be negative) to a named gauge (thread-safe)."""
+    key = (name, _labels_key(labels))
+    with _LOCK:
+        _GAUGES[key] = _GAUGES.get(key, 0) + delta
+
+
+def get_gauge(name: str, *, labels: Mapping[str, str] | None = None) -> int:
+    """Current value of a gauge (0 if never set)."""
+    with _LOCK:
+        return _GAUGES.get((name, _labels_key(labels)), 0)
+
+
+def register_histogram(
+    name: str, *, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_SECONDS
+) -> None:
+    """Declare a histogram's bucket upper bounds (idempotent).
+
+    Args:
+        name: Metric name (exposed as ``<name>_bucket``, ``<name>_sum`` and ``<name>_count``).
+        buckets: Strictly increasing, finite upper bounds; +Inf is always appended.
+
+    Raises:
+        ValueError: If the bounds are invalid or the histogram was registered with others.
+    """
+    bounds = tuple(float(bound) for bound in buckets)
+    if not bounds or any(not math.isfinite(bound) for bound in bounds):
+        raise ValueError(f"histogram {name} needs one or more finite bucket bounds")
+    if any(low >= high for low, high in zip(bounds, bounds[1:], strict=False)):
+        raise ValueError(f"histogram {name} bucket bounds must be strictly increasing")
+    with _LOCK:
+        existing = _HISTOGRAM_BUCKETS.setdefault(name, bounds)
+    if existing != bounds:
+        raise ValueError(f"histogram {name} is already registered with buckets {existing}")
+
+
+def observe_histogram(name: str, value: float, *, labels: Mapping[str, str] | None = None) -> None:
+    """Record one observation in a histogram (thread-safe).
+
+    Histograms not registered via ``register_histogram`` use the default latency buckets.
+    """
+    bounds = _HISTOGRAM_BUCKETS.get(name)
+    if bounds is None:
+        register_histogram(name)
+        bounds = _HISTOGRAM_BUCKETS[name]
+    key = (name, _labels_key(labels))
+    index = bisect_left(bounds, value)
+    with _LOCK:
+        series = _HISTOGRAMS.get(key)
+        if series is None:
+            series = _HISTOGRAMS[key] = _HistogramSeries(len(bounds))
+        series.counts[index] += 1
+        series.total += value
+
+
+def get_histogram(name: str, *, labels: Mapping[str, str] | None = None) -> HistogramSnapshot:
+    """Current state of a histogram series (all zero if never observed)."""
+    bounds = (*_HISTOGRAM_BUCKETS.get(name, DEFAULT_LATENCY_BUCKETS_SECONDS), math.inf)
+    with _LOCK:
+        series = _HISTOGRAMS.get((name, _labels_key(labels)))
+        counts = list(series.counts) if series else [0] * len(bounds)
+        total = series.total if series else 0.0
+    cumulative: list[tuple[float, int]] = []
+    running = 0
+    for bound, count in zip(bounds, counts, strict=True):
+        running += count
+        cumulative.append((bound, running))
+    return HistogramSnapshot(buckets=tuple(cumulative), sum=total, count=running)
+
+
 def reset_metrics() -> None:
-    """Clear all counters (tests only)."""
+    """Clear all counters, gauges and histogram observations (tests only)."""
     with _LOCK:
         _COUNTERS.clear()
+        _GAUGES.clear()
+        _HISTOGRAMS.clear()
 
 
 def _escape_label_value(value: str) -> str:
@@ -69,15 +288,54 @@ def _escape_label_value(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
 
+def _format_float(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _sample_line(name: str, labels: _LabelsKey, value: str) -> str:
+    if not labels:
+        return f"{name} {value}"
+    label_text = ",".join(f'{key}="{_escape_label_value(val)}"' for key, val in labels)
+    return f"{name}{{{label_text}}} {value}"
+
+
 def render_prometheus_text() -> str:
-    """Render all counters in the Prometheus exposition format."""
+    """Render all counters, gauges and histograms in the Prometheus exposition format."""
     with _LOCK:
-        items = sorted(_COUNTERS.items())
-    lines: list[str] = []
-    for (name, labels), value in items:
-        if labels:
-            label_text = ",".join(f'{key}="{_escape_label_value(val)}"' for key, val in labels)
-            lines.append(f"{name}{{{label_text}}} {value}")
-        else:
-            lines.append(f"{name} {value}")
-    return "\n".join(lines) + ("\n" if lines else "")
+        scalars = [*_COUNTERS.items(), *_GAUGES.items()]
+        histograms = [
+            (key, _HISTOGRAM_BUCKETS[key[0]], list(series.counts), series.total)
+            for key, series in _HISTOGRAMS.items()
+        ]
+    families: list[tuple[str, _LabelsKey, list[str]]] = [
+        (name, labels, [_sample_line(name, labels, str(value))])
+        for (name, labels), value in scalars
+    ]
+    for (name, labels), bounds, counts, total in histograms:
+        lines: list[str] = []
+        running = 0
+        for bound, count in zip((*bounds, math.inf), counts, strict=True):
+            running += count
+            le = (*labels, ("le", _format_float(bound)))
+            lines.append(_sample_line(f"{name}_bucket", le, str(running)))
+        lines.append(_sample_line(f"{name}_sum", labels, _format_float(total)))
+        lines.append(_sample_line(f"{name}_count", labels, str(running)))
+        families.append((name, labels, lines))
+
+    rendered: list[str] = []
+    typed: set[str] = set()
+    histogram_names = {name for (name, _), *_ in histograms}
+    for name, _, lines in sorted(families, key=lambda family: family[:2]):
+        if name in histogram_names and name not in typed:
+            typed.add(name)
+            rendered.append(f"# TYPE {name} histogram")
+        rendered.extend(lines)
+    return "\n".join(rendered) + ("\n" if rendered else "")
+
+
+register_histogram(HTTP_REQUEST_DURATION_SECONDS)
+register_histogram(RUN_STEP_DURATION_SECONDS, buckets=RUN_STEP_DURATION_BUCKETS_SECONDS)
+register_histogram(LLM_CALL_DURATION_SECONDS, buckets=LLM_CALL_DURATION_BUCKETS_SECONDS)
+register_histogram(PARSER_DURATION_SECONDS, buckets=PARSER_DURATION_BUCKETS_SECONDS)
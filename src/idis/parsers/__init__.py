@@ -10,14 +10,31 @@ Modules:
     docx: DOCX text extraction with paragraph/table locators
     pptx: PPTX text extraction with slide/shape locators
     registry: Format detection and parser dispatch
+
+The format-specific parse functions are resolved on first attribute access so importing any
+``idis.parsers`` submodule does not pull in pypdf, openpyxl, python-docx or python-pptx.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from idis.parsers.base import ParseError, ParseResult, SpanDraft
-from idis.parsers.docx import parse_docx
-from idis.parsers.pdf import parse_pdf
-from idis.parsers.pptx import parse_pptx
 from idis.parsers.registry import parse_bytes
-from idis.parsers.xlsx import parse_xlsx
+
+if TYPE_CHECKING:
+    from idis.parsers.docx import parse_docx
+    from idis.parsers.pdf import parse_pdf
+    from idis.parsers.pptx import parse_pptx
+    from idis.parsers.xlsx import parse_xlsx
+
+_LAZY_EXPORTS = {
+    "parse_docx": "idis.parsers.docx",
+    "parse_pdf": "idis.parsers.pdf",
+    "parse_pptx": "idis.parsers.pptx",
+    "parse_xlsx": "idis.parsers.xlsx",
+}
 
 __all__ = [
     "ParseError",
@@ -29,3 +46,13 @@ __all__ = [
     "parse_pptx",
     "parse_xlsx",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a format parser on first access and cache it on the package."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -62,6 +62,21 @@ class ParseError:
         }
 
 
+class XlsxSpanMode(StrEnum):
+    """Span granularity for XLSX parsing.
+
+    CELL emits one span per non-empty cell (default). ROW emits one span per non-empty row and
+    TABLE one span per blank-row-separated block, as tab-separated lines. Both point at the
+    block's header row via ``locator["header_row"]`` and map every cell reference to its
+    character offsets in ``locator["cells"]``. Claims cite compacted spans as a whole: only CELL
+    mode yields cell-level citations today.
+    """
+
+    CELL = "cell"
+    ROW = "row"
+    TABLE = "table"
+
+
 @dataclass(frozen=True, slots=True)
 class SpanDraft:
     """Intermediate span representation before DB materialization.
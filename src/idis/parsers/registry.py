@@ -7,28 +7,36 @@ Requirements:
 - Deterministic format detection via magic bytes (not extension/mime)
 - Fail-closed: unknown formats return structured error
 - Never raises exceptions: all failures captured in ParseResult
+
+Parser modules pull in heavy third-party packages (pypdf, openpyxl, python-docx, python-pptx),
+so they are imported on first use rather than with the registry. Workers that want the cost
+paid up front call ``warm_parsers`` at startup.
 """
 
 from __future__ import annotations
 
+import importlib
+import threading
+import time
 import zipfile
+from collections.abc import Callable, Iterable, Mapping
 from io import BytesIO
 from pathlib import PurePath
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
+from idis.observability.metrics import PARSER_DURATION_SECONDS, observe_histogram
 from idis.parsers.base import (
     ParseError,
     ParseErrorCode,
     ParseLimits,
     ParseResult,
+    XlsxSpanMode,
 )
-from idis.parsers.docx import parse_docx
-from idis.parsers.html_text import parse_html_text
-from idis.parsers.image import parse_image
-from idis.parsers.media import MediaConfig, parse_media
-from idis.parsers.ocr import OcrConfig
-from idis.parsers.pdf import parse_pdf
-from idis.parsers.pptx import parse_pptx
-from idis.parsers.xlsx import parse_xlsx
+
+if TYPE_CHECKING:
+    from idis.parsers.media import MediaConfig
+    from idis.parsers.ocr import OcrConfig
 
 PDF_MAGIC = b"%PDF-"
 ZIP_MAGIC = b"PK\x03\x04"
@@ -41,6 +49,79 @@ HTML_EXTENSIONS = frozenset({".html", ".htm"})
 TEXT_MIME_TYPES = frozenset({"text/plain", "text/html"})
 HTML_MIME_TYPE = "text/html"
 
+# Parser family -> "module:function". Detected formats (PDF/XLSX/DOCX/PPTX) use their own name;
+# IMAGE, MEDIA and HTML_TEXT are routed by filename/MIME type.
+PARSER_IMPORT_PATHS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "PDF": "idis.parsers.pdf:parse_pdf",
+        "XLSX": "idis.parsers.xlsx:parse_xlsx",
+        "DOCX": "idis.parsers.docx:parse_docx",
+        "PPTX": "idis.parsers.pptx:parse_pptx",
+        "IMAGE": "idis.parsers.image:parse_image",
+        "MEDIA": "idis.parsers.media:parse_media",
+        "HTML_TEXT": "idis.parsers.html_text:parse_html_text",
+    }
+)
+
+_loaded_parsers: dict[str, Callable[..., ParseResult]] = {}
+_load_lock = threading.Lock()
+
+
+def load_parser(parser_format: str) -> Callable[..., ParseResult]:
+    """Return the parser for a format family, importing its module on first use.
+
+    Args:
+        parser_format: Key of ``PARSER_IMPORT_PATHS`` (e.g. "PDF", "HTML_TEXT").
+
+    Returns:
+        The parser function (cached after the first call).
+
+    Raises:
+        KeyError: If ``parser_format`` is not registered.
+        ImportError: If the parser module or one of its dependencies cannot be imported.
+    """
+    parser = _loaded_parsers.get(parser_format)
+    if parser is not None:
+        return parser
+
+    import_path = PARSER_IMPORT_PATHS[parser_format]
+    with _load_lock:
+        parser = _loaded_parsers.get(parser_format)
+        if parser is None:
+            module_name, _, attribute = import_path.partition(":")
+            parser = getattr(importlib.import_module(module_name), attribute)
+            _loaded_parsers[parser_format] = parser
+    return parser
+
+
+def loaded_parser_formats() -> tuple[str, ...]:
+    """Return the parser families imported so far, in registry order."""
+    return tuple(name for name in PARSER_IMPORT_PATHS if name in _loaded_parsers)
+
+
+def warm_parsers(parser_formats: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Import parsers ahead of first use (worker startup hook).
+
+    Args:
+        parser_formats: Families to import; None imports every registered parser.
+
+    Returns:
+        The families now loaded, in registry order.
+
+    Raises:
+        ValueError: If an unknown family is requested.
+        ImportError: If a parser cannot be imported (surfaced at startup, not mid-request).
+    """
+    requested = list(PARSER_IMPORT_PATHS) if parser_formats is None else list(parser_formats)
+    unknown = sorted(set(requested) - set(PARSER_IMPORT_PATHS))
+    if unknown:
+        raise ValueError(
+            f"Unknown parser formats: {unknown}. Supported: {list(PARSER_IMPORT_PATHS)}"
+        )
+    for parser_format in requested:
+        load_parser(parser_format)
+    return loaded_parser_formats()
+
 
 def _is_pdf(data: bytes) -> bool:
     """Check if data starts with PDF magic bytes."""
@@ -111,6 +192,7 @@ def parse_bytes(
     limits: ParseLimits | None = None,
     ocr_config: OcrConfig | None = None,
     media_config: MediaConfig | None = None,
+    xlsx_span_mode: XlsxSpanMode = XlsxSpanMode.CELL,
 ) -> ParseResult:
     """Parse document bytes by detecting format and dispatching to parser.
 
@@ -121,6 +203,7 @@ def parse_bytes(
         limits: Optional parsing limits (defaults to ParseLimits()).
         ocr_config: Optional explicit OCR execution config for PDF/image parsing.
         media_config: Optional explicit media transcription config for media parsing.
+        xlsx_span_mode: XLSX span granularity (per cell by default; ROW/TABLE compact).
 
     Returns:
         ParseResult from the appropriate parser, or error result for
@@ -131,7 +214,44 @@ def parse_bytes(
         - Empty bytes return UNSUPPORTED_FORMAT with doc_type UNKNOWN.
         - Unsupported formats return success=False with UNSUPPORTED_FORMAT error.
         - Never raises exceptions; all failures captured in result.
+        - Wall time is recorded in ``parser_duration_seconds`` by result doc type.
+        - A parser whose module cannot be imported yields INTERNAL_ERROR.
     """
+    started = time.perf_counter()
+    try:
+        result = _dispatch_parse(
+            data, filename, mime_type, limits, ocr_config, media_config, xlsx_span_mode
+        )
+    except ImportError as exc:
+        result = ParseResult(
+            doc_type="UNKNOWN",
+            success=False,
+            errors=[
+                ParseError(
+                    code=ParseErrorCode.INTERNAL_ERROR,
+                    message="Parser unavailable",
+                    details={"filename": filename, "module": exc.name},
+                )
+            ],
+        )
+    observe_histogram(
+        PARSER_DURATION_SECONDS,
+        time.perf_counter() - started,
+        labels={"format": result.doc_type, "outcome": "ok" if result.success else "error"},
+    )
+    return result
+
+
+def _dispatch_parse(
+    data: bytes,
+    filename: str | None,
+    mime_type: str | None,
+    limits: ParseLimits | None,
+    ocr_config: OcrConfig | None,
+    media_config: MediaConfig | None,
+    xlsx_span_mode: XlsxSpanMode = XlsxSpanMode.CELL,
+) -> ParseResult:
+    """Detect the format of ``data`` and run the matching parser (see ``parse_bytes``)."""
     if limits is None:
         limits = ParseLimits()
 
@@ -151,25 +271,25 @@ def parse_bytes(
     detected_format = detect_format(data)
 
     if detected_format == "PDF":
-        return parse_pdf(data, limits=limits, ocr_config=ocr_config)
+        return load_parser("PDF")(data, limits=limits, ocr_config=ocr_config)
 
     if detected_format == "XLSX":
-        return parse_xlsx(data, limits=limits)
+        return load_parser("XLSX")(data, limits=limits, span_mode=xlsx_span_mode)
 
     if detected_format == "DOCX":
-        return parse_docx(data, limits=limits)
+        return load_parser("DOCX")(data, limits=limits)
 
     if detected_format == "PPTX":
-        return parse_pptx(data, limits=limits)
+        return load_parser("PPTX")(data, limits=limits)
 
     if is_image_source(filename=filename, mime_type=mime_type):
-        return parse_image(data, limits=limits, ocr_config=ocr_config)
+        return load_parser("IMAGE")(data, limits=limits, ocr_config=ocr_config)
 
     if is_media_source(filename=filename, mime_type=mime_type):
-        return parse_media(data, limits=limits, media_config=media_config)
+        return load_parser("MEDIA")(data, limits=limits, media_config=media_config)
 
     if is_text_source(filename=filename, mime_type=mime_type):
-        return parse_html_text(
+        return load_parser("HTML_TEXT")(
             data,
             is_html=_is_html_text_source(filename=filename, mime_type=mime_type),
             limits=limits,
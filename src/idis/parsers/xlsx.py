@@ -8,18 +8,27 @@ Requirements:
 - Fail-closed: malformed XLSX files return structured errors
 - Numeric stability: floats formatted via Decimal to avoid binary surprises
 - Date handling: ISO-8601 format for datetime values
+
+Compacted modes (XlsxSpanMode.ROW / TABLE) emit far fewer, denser spans for large models.
+``locator["cells"]`` maps each A1 reference to the [start, end) character offsets of its value
+in the excerpt, and ``expand_compacted_span`` rebuilds the exact per-cell spans CELL mode would
+have produced. Nothing downstream resolves citations through that map yet: claims extracted
+from a compacted span cite the whole row/table span, not a cell. Use CELL mode (the default)
+where cell-level citations are required.
 """
 
 from __future__ import annotations
 
 import hashlib
 import io
+from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
 from typing import Any
 
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 from openpyxl.utils.exceptions import InvalidFileException
 
 from idis.parsers.base import (
@@ -28,8 +37,23 @@ from idis.parsers.base import (
     ParseLimits,
     ParseResult,
     SpanDraft,
+    XlsxSpanMode,
 )
 
+_ROW_CELL_SEPARATOR = "\t"
+
+
+@dataclass(frozen=True, slots=True)
+class _CellValue:
+    """A non-empty cell kept for compacted span assembly."""
+
+    col: int
+    text: str
+    is_label: bool
+
+
+_SheetRow = tuple[int, list[_CellValue]]
+
 
 def _compute_content_hash(text: str) -> str:
     """Compute SHA-256 hash of text content."""
@@ -85,15 +109,133 @@ def _format_cell_value(value: Any) -> str | None:
     return str(value)
 
 
+def _table_blocks(rows: list[_SheetRow]) -> list[list[_SheetRow]]:
+    """Split a sheet's non-empty rows into blocks separated by blank rows."""
+    blocks: list[list[_SheetRow]] = []
+    for row in rows:
+        if blocks and row[0] == blocks[-1][-1][0] + 1:
+            blocks[-1].append(row)
+        else:
+            blocks.append([row])
+    return blocks
+
+
+def _detect_header_row(block: list[_SheetRow]) -> int | None:
+    """Return the header row index of a block, if it has one.
+
+    The first row is a header when the block has data below it and the row holds at least two
+    cells, all text.
+    """
+    row_idx, cells = block[0]
+    if len(block) > 1 and len(cells) >= 2 and all(cell.is_label for cell in cells):
+        return row_idx
+    return None
+
+
+def _cell_range(first_row: int, last_row: int, cols: list[int]) -> str:
+    """Return the A1 range covering ``cols`` across ``first_row``..``last_row``."""
+    start = f"{get_column_letter(min(cols))}{first_row}"
+    end = f"{get_column_letter(max(cols))}{last_row}"
+    return start if start == end else f"{start}:{end}"
+
+
+def _render_rows(rows: list[_SheetRow]) -> tuple[str, dict[str, list[int]]]:
+    """Render rows as tab-separated lines with per-cell value offsets."""
+    parts: list[str] = []
+    offsets: dict[str, list[int]] = {}
+    length = 0
+    for line_idx, (row_idx, cells) in enumerate(rows):
+        if line_idx:
+            parts.append("\n")
+            length += 1
+        for cell_idx, cell in enumerate(cells):
+            if cell_idx:
+                parts.append(_ROW_CELL_SEPARATOR)
+                length += len(_ROW_CELL_SEPARATOR)
+            offsets[f"{get_column_letter(cell.col)}{row_idx}"] = [length, length + len(cell.text)]
+            parts.append(cell.text)
+            length += len(cell.text)
+    return "".join(parts), offsets
+
+
+def _compacted_sheet_spans(
+    sheet_name: str,
+    rows: list[_SheetRow],
+    span_mode: XlsxSpanMode,
+) -> list[SpanDraft]:
+    """Build ROW or TABLE spans for one sheet's non-empty rows."""
+    spans: list[SpanDraft] = []
+    for block in _table_blocks(rows):
+        header_row = _detect_header_row(block)
+        groups = [[row] for row in block] if span_mode == XlsxSpanMode.ROW else [block]
+        for group in groups:
+            text, offsets = _render_rows(group)
+            first_row, last_row = group[0][0], group[-1][0]
+            locator: dict[str, Any] = {
+                "sheet": sheet_name,
+                "row": first_row,
+                "range": _cell_range(
+                    first_row, last_row, [cell.col for _, cells in group for cell in cells]
+                ),
+                "cells": offsets,
+            }
+            if last_row != first_row:
+                locator["row_range"] = [first_row, last_row]
+            if header_row is not None:
+                locator["header_row"] = header_row
+            spans.append(
+                SpanDraft(
+                    span_type="CELL",
+                    locator=locator,
+                    text_excerpt=text,
+                    content_hash=_compute_content_hash(text),
+                )
+            )
+    return spans
+
+
+def expand_compacted_span(span: SpanDraft) -> list[SpanDraft]:
+    """Rebuild the per-cell spans covered by a ROW/TABLE span.
+
+    Returns exactly the spans CELL mode emits for those cells (same locator, excerpt and hash).
+    Spans without a ``cells`` map are returned unchanged. This is the building block for
+    cell-level citations from compacted spans; claim materialization does not call it yet, so
+    claims from ROW/TABLE spans still cite the whole span.
+    """
+    cells = span.locator.get("cells")
+    if not isinstance(cells, dict):
+        return [span]
+    expanded: list[SpanDraft] = []
+    for cell_ref, (start, end) in cells.items():
+        col_letter, row_idx = coordinate_from_string(cell_ref)
+        value = span.text_excerpt[start:end]
+        expanded.append(
+            SpanDraft(
+                span_type="CELL",
+                locator={
+                    "sheet": span.locator["sheet"],
+                    "cell": cell_ref,
+                    "row": row_idx,
+                    "col": column_index_from_string(col_letter),
+                },
+                text_excerpt=value,
+                content_hash=_compute_content_hash(value),
+            )
+        )
+    return expanded
+
+
 def parse_xlsx(
     data: bytes,
     limits: ParseLimits | None = None,
+    span_mode: XlsxSpanMode = XlsxSpanMode.CELL,
 ) -> ParseResult:
     """Parse XLSX bytes and extract cell spans with sheet/cell locators.
 
     Args:
         data: Raw XLSX file bytes.
         limits: Optional parsing limits (defaults to ParseLimits()).
+        span_mode: Span granularity (default one span per cell).
 
     Returns:
         ParseResult with success=True and spans if extraction succeeded,
@@ -102,7 +244,9 @@ def parse_xlsx(
     Behavior:
         - Sheets are processed in workbook order.
         - Only non-empty cells are extracted.
-        - Each cell becomes a SpanDraft with locator {sheet, cell, row, col}.
+        - CELL mode: each cell becomes a SpanDraft with locator {sheet, cell, row, col}.
+        - ROW/TABLE mode: one span per row / blank-row-separated block, with locator
+          {sheet, row, range, cells, row_range?, header_row?}; cell limits apply unchanged.
         - Numeric values use Decimal formatting for stability.
         - Dates use ISO-8601 format.
         - Malformed XLSX files fail with INVALID_XLSX error.
@@ -171,6 +315,7 @@ def parse_xlsx(
             ],
         )
 
+    span_mode = XlsxSpanMode(span_mode)
     spans: list[SpanDraft] = []
     warnings: list[str] = []
     total_cells = 0
@@ -179,8 +324,10 @@ def parse_xlsx(
         for sheet_name in sheet_names:
             sheet = workbook[sheet_name]
             sheet_cells = 0
+            sheet_rows: list[_SheetRow] = []
 
             for row_idx, row in enumerate(sheet.iter_rows(), start=1):
+                row_cells: list[_CellValue] = []
                 for col_idx, cell in enumerate(row, start=1):
                     cell_value = _format_cell_value(cell.value)
                     if cell_value is None:
@@ -216,6 +363,16 @@ def parse_xlsx(
                             ],
                         )
 
+                    if span_mode != XlsxSpanMode.CELL:
+                        row_cells.append(
+                            _CellValue(
+                                col=col_idx,
+                                text=cell_value,
+                                is_label=isinstance(cell.value, str),
+                            )
+                        )
+                        continue
+
                     col_letter = get_column_letter(col_idx)
                     cell_ref = f"{col_letter}{row_idx}"
 
@@ -233,8 +390,14 @@ def parse_xlsx(
                         )
                     )
 
+                if row_cells:
+                    sheet_rows.append((row_idx, row_cells))
+
                 if sheet_cells > limits.max_cells_per_sheet:
                     break
+
+            if sheet_rows:
+                spans.extend(_compacted_sheet_spans(sheet_name, sheet_rows, span_mode))
     finally:
         workbook.close()
 
@@ -246,6 +409,7 @@ def parse_xlsx(
             "sheet_count": len(sheet_names),
             "sheet_names": sheet_names,
             "span_count": len(spans),
+            "span_mode": span_mode.value,
             "total_cells": total_cells,
         },
         warnings=warnings,
@@ -2,16 +2,28 @@
 
 Each module provides a parameterized query builder for one of the six
 normative graph query patterns. All queries enforce tenant_id as a
-first-match constraint.
+first-match constraint. The per-claim/per-defect patterns (4.4.1, 4.4.3,
+4.4.4, 4.4.5) also have a batched builder that takes an id list and
+tags every record with ``batch_key``.
 """
 
-from idis.persistence.cypher.q_4_4_1_full_chain import build_full_chain_query
+from idis.persistence.cypher.q_4_4_1_full_chain import (
+    build_full_chain_batch_query,
+    build_full_chain_query,
+)
 from idis.persistence.cypher.q_4_4_2_deal_claims_grades import build_deal_claims_grades_query
 from idis.persistence.cypher.q_4_4_3_independence_clusters import (
+    build_independence_clusters_batch_query,
     build_independence_clusters_query,
 )
-from idis.persistence.cypher.q_4_4_4_weakest_link import build_weakest_link_query
-from idis.persistence.cypher.q_4_4_5_defect_impact import build_defect_impact_query
+from idis.persistence.cypher.q_4_4_4_weakest_link import (
+    build_weakest_link_batch_query,
+    build_weakest_link_query,
+)
+from idis.persistence.cypher.q_4_4_5_defect_impact import (
+    build_defect_impact_batch_query,
+    build_defect_impact_query,
+)
 from idis.persistence.cypher.q_4_4_6_entity_cooccurrence import build_entity_cooccurrence_query
 
 __all__ = [
@@ -21,4 +33,8 @@ __all__ = [
     "build_weakest_link_query",
     "build_defect_impact_query",
     "build_entity_cooccurrence_query",
+    "build_full_chain_batch_query",
+    "build_independence_clusters_batch_query",
+    "build_weakest_link_batch_query",
+    "build_defect_impact_batch_query",
 ]
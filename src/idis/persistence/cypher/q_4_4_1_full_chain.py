@@ -21,6 +21,20 @@ ORDER BY tn.timestamp ASC
 
 REQUIRED_PARAMS = frozenset({"claim_id", "tenant_id"})
 
+# Batched variant: same chain records for many claims in one read, keyed by batch_key.
+BATCH_QUERY = """\
+UNWIND $claim_ids AS batch_key
+MATCH path = (doc:Document)-[:HAS_SPAN]->(span:Span)
+              <-[:INPUT]-(tn:TransmissionNode)-[:OUTPUT]->(claim:Claim)
+WHERE claim.claim_id = batch_key AND claim.tenant_id = $tenant_id
+RETURN batch_key, doc, span, tn, claim,
+       [node IN nodes(path) | labels(node)] AS node_types,
+       length(path) AS chain_depth
+ORDER BY batch_key ASC, tn.timestamp ASC
+"""
+
+BATCH_REQUIRED_PARAMS = frozenset({"claim_ids", "tenant_id"})
+
 
 def build_full_chain_query(
     *,
@@ -37,3 +51,21 @@ def build_full_chain_query(
         Tuple of (cypher_query, parameters).
     """
     return QUERY, {"claim_id": claim_id, "tenant_id": tenant_id}
+
+
+def build_full_chain_batch_query(
+    *,
+    claim_ids: list[str],
+    tenant_id: str,
+) -> tuple[str, dict[str, Any]]:
+    """Build the batched §4.4.1 full Sanad chain query.
+
+    Args:
+        claim_ids: UUIDs of the claims to trace (one read for all of them).
+        tenant_id: UUID of the tenant (isolation constraint).
+
+    Returns:
+        Tuple of (cypher_query, parameters). Every record carries ``batch_key``,
+        the claim_id it belongs to.
+    """
+    return BATCH_QUERY, {"claim_ids": list(claim_ids), "tenant_id": tenant_id}
@@ -27,6 +27,30 @@ RETURN claim.claim_id,
 
 REQUIRED_PARAMS = frozenset({"claim_id", "tenant_id"})
 
+# Batched variant: one aggregate record per claim that has evidence, keyed by batch_key.
+BATCH_QUERY = """\
+UNWIND $claim_ids AS batch_key
+MATCH (claim:Claim {claim_id: batch_key, tenant_id: $tenant_id})
+      -[:SUPPORTED_BY]->(ev:EvidenceItem)
+WITH batch_key, claim, ev,
+     ev.source_system + '|' + coalesce(ev.upstream_origin_id, ev.evidence_id) AS independence_key
+WITH batch_key, claim, independence_key,
+     collect(ev) AS group_members, count(ev) AS group_size
+RETURN batch_key,
+       claim.claim_id,
+       count(independence_key) AS independent_source_count,
+       CASE
+         WHEN count(independence_key) >= 3 THEN 'MUTAWATIR'
+         WHEN count(independence_key) = 2 THEN 'AHAD_2'
+         WHEN count(independence_key) = 1 THEN 'AHAD_1'
+         ELSE 'NONE'
+       END AS corroboration_status,
+       collect({key: independence_key, count: group_size}) AS clusters
+ORDER BY batch_key ASC
+"""
+
+BATCH_REQUIRED_PARAMS = frozenset({"claim_ids", "tenant_id"})
+
 
 def build_independence_clusters_query(
     *,
@@ -43,3 +67,21 @@ def build_independence_clusters_query(
         Tuple of (cypher_query, parameters).
     """
     return QUERY, {"claim_id": claim_id, "tenant_id": tenant_id}
+
+
+def build_independence_clusters_batch_query(
+    *,
+    claim_ids: list[str],
+    tenant_id: str,
+) -> tuple[str, dict[str, Any]]:
+    """Build the batched §4.4.3 independence clusters query.
+
+    Args:
+        claim_ids: UUIDs of the claims (one read for all of them).
+        tenant_id: UUID of the tenant (isolation constraint).
+
+    Returns:
+        Tuple of (cypher_query, parameters). Every record carries ``batch_key``,
+        the claim_id it belongs to.
+    """
+    return BATCH_QUERY, {"claim_ids": list(claim_ids), "tenant_id": tenant_id}
@@ -28,6 +28,29 @@ RETURN tn.node_id AS weakest_node,
 
 REQUIRED_PARAMS = frozenset({"claim_id", "tenant_id"})
 
+# Batched variant: the per-claim LIMIT 1 becomes "first of the grade-ordered collect" per claim.
+BATCH_QUERY = """\
+UNWIND $claim_ids AS batch_key
+MATCH (claim:Claim {claim_id: batch_key, tenant_id: $tenant_id})
+      -[:HAS_SANAD_STEP]->(tn:TransmissionNode)
+      -[:INPUT]->(ev:EvidenceItem)
+WITH batch_key, tn, ev,
+     CASE ev.source_grade
+       WHEN 'A' THEN 0 WHEN 'B' THEN 1
+       WHEN 'C' THEN 2 WHEN 'D' THEN 3
+     END AS grade_rank
+ORDER BY grade_rank DESC
+WITH batch_key, collect({tn: tn, ev: ev})[0] AS weakest
+RETURN batch_key,
+       weakest.tn.node_id AS weakest_node,
+       weakest.ev.evidence_id AS weakest_evidence,
+       weakest.ev.source_grade AS min_grade,
+       weakest.ev.source_system AS source_system
+ORDER BY batch_key ASC
+"""
+
+BATCH_REQUIRED_PARAMS = frozenset({"claim_ids", "tenant_id"})
+
 
 def build_weakest_link_query(
     *,
@@ -44,3 +67,21 @@ def build_weakest_link_query(
         Tuple of (cypher_query, parameters).
     """
     return QUERY, {"claim_id": claim_id, "tenant_id": tenant_id}
+
+
+def build_weakest_link_batch_query(
+    *,
+    claim_ids: list[str],
+    tenant_id: str,
+) -> tuple[str, dict[str, Any]]:
+    """Build the batched §4.4.4 weakest link query.
+
+    Args:
+        claim_ids: UUIDs of the claims (one read for all of them).
+        tenant_id: UUID of the tenant (isolation constraint).
+
+    Returns:
+        Tuple of (cypher_query, parameters). Every record carries ``batch_key``,
+        the claim_id it belongs to.
+    """
+    return BATCH_QUERY, {"claim_ids": list(claim_ids), "tenant_id": tenant_id}
@@ -24,6 +24,25 @@ RETURN defect.defect_type AS defect_type, defect.severity AS severity,
 
 REQUIRED_PARAMS = frozenset({"defect_id", "tenant_id"})
 
+# Batched variant: one impact record per defect that affects a claim, keyed by batch_key.
+BATCH_QUERY = """\
+UNWIND $defect_ids AS batch_key
+MATCH (defect:Defect {defect_id: batch_key, tenant_id: $tenant_id})
+      <-[:HAS_DEFECT]-(claim:Claim)
+OPTIONAL MATCH (calc:Calculation)-[:DERIVED_FROM]->(claim)
+RETURN batch_key, defect.defect_type AS defect_type, defect.severity AS severity,
+       collect(DISTINCT {
+         claim_id: claim.claim_id,
+         claim_text: claim.claim_text,
+         materiality: claim.materiality,
+         grade: claim.claim_grade
+       }) AS affected_claims,
+       collect(DISTINCT calc.calc_id) AS affected_calculations
+ORDER BY batch_key ASC
+"""
+
+BATCH_REQUIRED_PARAMS = frozenset({"defect_ids", "tenant_id"})
+
 
 def build_defect_impact_query(
     *,
@@ -40,3 +59,21 @@ def build_defect_impact_query(
         Tuple of (cypher_query, parameters).
     """
     return QUERY, {"defect_id": defect_id, "tenant_id": tenant_id}
+
+
+def build_defect_impact_batch_query(
+    *,
+    defect_ids: list[str],
+    tenant_id: str,
+) -> tuple[str, dict[str, Any]]:
+    """Build the batched §4.4.5 defect impact analysis query.
+
+    Args:
+        defect_ids: UUIDs of the defects (one read for all of them).
+        tenant_id: UUID of the tenant (isolation constraint).
+
+    Returns:
+        Tuple of (cypher_query, parameters). Every record carries ``batch_key``,
+        the defect_id it belongs to.
+    """
+    return BATCH_QUERY, {"defect_ids": list(defect_ids), "tenant_id": tenant_id}
@@ -5,6 +5,17 @@ Provides engine creation, connection management, and tenant context setting via
 Environment Variables:
     IDIS_DATABASE_URL: Application/runtime role connection string (non-superuser)
     IDIS_DATABASE_ADMIN_URL: Admin/superuser connection string (migrations/tests only)
+    IDIS_DB_POOL_ROLE: Process role selecting pool overrides and metric labels (default: api)
+    IDIS_DB_POOL_SIZE: Persistent connections in the application pool (default: 5)
+    IDIS_DB_POOL_MAX_OVERFLOW: Extra connections allowed under load (default: 10)
+    IDIS_DB_POOL_TIMEOUT_SECONDS: Max wait for a pooled connection (default: 30)
+    IDIS_DB_POOL_RECYCLE_SECONDS: Connection max age before reconnect (default: 1800)
+    IDIS_DB_POOL_PRE_PING: "1" to ping on every checkout (default: off; recycle instead)
+    IDIS_DB_PREPARED_STATEMENTS: "0" to disable server-side prepared statements (default: on;
+        disable behind a transaction-pooling proxy such as PgBouncer)
+
+    Every IDIS_DB_POOL_* setting except the role can be overridden per role with a
+    ``_<ROLE>`` suffix, e.g. IDIS_DB_POOL_SIZE_WORKER=3 when IDIS_DB_POOL_ROLE=worker.
 
 Design Requirements (v6.3):
     - PostgreSQL is the canonical store (MUST)
@@ -17,21 +28,56 @@ from __future__ import annotations
 import logging
 import os
 import re
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Mapping
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from idis.observability.metrics import (
+    DB_POOL_CHECKOUT_TIMEOUTS_TOTAL,
+    DB_POOL_CHECKOUT_WAIT_US_TOTAL,
+    DB_POOL_CHECKOUTS_TOTAL,
+    DB_POOL_CHECKOUTS_WAITING,
+    DB_POOL_CONNECTIONS_IN_USE,
+    add_gauge,
+    increment_counter,
+    set_gauge,
+)
 
 if TYPE_CHECKING:
-    from sqlalchemy import Connection, Engine
+    from sqlalchemy import Connection, CursorResult, Engine
 
 logger = logging.getLogger(__name__)
 
 IDIS_DATABASE_URL_ENV = "IDIS_DATABASE_URL"
 IDIS_DATABASE_ADMIN_URL_ENV = "IDIS_DATABASE_ADMIN_URL"
 
+IDIS_DB_POOL_ROLE_ENV: Final[str] = "IDIS_DB_POOL_ROLE"
+IDIS_DB_POOL_SIZE_ENV: Final[str] = "IDIS_DB_POOL_SIZE"
+IDIS_DB_POOL_MAX_OVERFLOW_ENV: Final[str] = "IDIS_DB_POOL_MAX_OVERFLOW"
+IDIS_DB_POOL_TIMEOUT_ENV: Final[str] = "IDIS_DB_POOL_TIMEOUT_SECONDS"
+IDIS_DB_POOL_RECYCLE_ENV: Final[str] = "IDIS_DB_POOL_RECYCLE_SECONDS"
+IDIS_DB_POOL_PRE_PING_ENV: Final[str] = "IDIS_DB_POOL_PRE_PING"
+IDIS_DB_PREPARED_STATEMENTS_ENV: Final[str] = "IDIS_DB_PREPARED_STATEMENTS"
+
+# The processes sharing the application engine; a deployment running one of them alone sets
+# IDIS_DB_POOL_ROLE so its pool can be sized for that workload.
+DB_POOL_ROLES: Final[tuple[str, ...]] = ("api", "worker", "webhooks", "janitor")
+DEFAULT_DB_POOL_ROLE: Final[str] = "api"
+DEFAULT_DB_POOL_SIZE: Final[int] = 5
+DEFAULT_DB_POOL_MAX_OVERFLOW: Final[int] = 10
+DEFAULT_DB_POOL_TIMEOUT_SECONDS: Final[int] = 30
+DEFAULT_DB_POOL_RECYCLE_SECONDS: Final[int] = 1800
+
+_TRUE_VALUES: Final[frozenset[str]] = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES: Final[frozenset[str]] = frozenset({"0", "false", "no", "off"})
+
 _app_engine: Engine | None = None
 _admin_engine: Engine | None = None
 
@@ -95,30 +141,160 @@ def get_database_url(admin: bool = False) -> str:
     return _ensure_psycopg_driver(url)
 
 
+@dataclass(frozen=True, slots=True)
+class DbPoolConfig:
+    """Application engine pool settings for one process role."""
+
+    role: str
+    pool_size: int
+    max_overflow: int
+    timeout_seconds: int
+    recycle_seconds: int
+    pre_ping: bool
+
+
+def _role_env(name: str, role: str) -> tuple[str, str]:
+    """Return (env var, raw value) for a pool setting, preferring the role override."""
+    role_name = f"{name}_{role.upper()}"
+    raw = os.environ.get(role_name, "").strip()
+    if raw:
+        return role_name, raw
+    return name, os.environ.get(name, "").strip()
+
+
+def _pool_int(name: str, role: str, default: int, *, minimum: int) -> int:
+    env_name, raw = _role_env(name, role)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise DatabaseConfigError(f"{env_name} must be an integer, got '{raw}'") from exc
+    if value < minimum:
+        raise DatabaseConfigError(f"{env_name} must be >= {minimum}, got {value}")
+    return value
+
+
+def _env_flag(name: str, raw: str, default: bool) -> bool:
+    value = raw.strip().lower()
+    if not value:
+        return default
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise DatabaseConfigError(f"{name} must be a boolean flag (1/0, true/false), got '{raw}'")
+
+
+def get_pool_config() -> DbPoolConfig:
+    """Read the application engine pool settings for this process's role.
+
+    Returns:
+        DbPoolConfig for IDIS_DB_POOL_ROLE (default: api).
+
+    Raises:
+        DatabaseConfigError: If the role is unknown or a setting is not a valid value.
+    """
+    role = os.environ.get(IDIS_DB_POOL_ROLE_ENV, "").strip().lower() or DEFAULT_DB_POOL_ROLE
+    if role not in DB_POOL_ROLES:
+        raise DatabaseConfigError(
+            f"{IDIS_DB_POOL_ROLE_ENV} must be one of {', '.join(DB_POOL_ROLES)}, got '{role}'"
+        )
+    pre_ping_env, pre_ping_raw = _role_env(IDIS_DB_POOL_PRE_PING_ENV, role)
+    return DbPoolConfig(
+        role=role,
+        pool_size=_pool_int(IDIS_DB_POOL_SIZE_ENV, role, DEFAULT_DB_POOL_SIZE, minimum=1),
+        max_overflow=_pool_int(
+            IDIS_DB_POOL_MAX_OVERFLOW_ENV, role, DEFAULT_DB_POOL_MAX_OVERFLOW, minimum=0
+        ),
+        timeout_seconds=_pool_int(
+            IDIS_DB_POOL_TIMEOUT_ENV, role, DEFAULT_DB_POOL_TIMEOUT_SECONDS, minimum=1
+        ),
+        recycle_seconds=_pool_int(
+            IDIS_DB_POOL_RECYCLE_ENV, role, DEFAULT_DB_POOL_RECYCLE_SECONDS, minimum=1
+        ),
+        pre_ping=_env_flag(pre_ping_env, pre_ping_raw, False),
+    )
+
+
+def prepared_statements_enabled() -> bool:
+    """Return whether hot repository queries use server-side prepared statements.
+
+    Raises:
+        DatabaseConfigError: If IDIS_DB_PREPARED_STATEMENTS is not a boolean flag.
+    """
+    raw = os.environ.get(IDIS_DB_PREPARED_STATEMENTS_ENV, "")
+    return _env_flag(IDIS_DB_PREPARED_STATEMENTS_ENV, raw, True)
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records checkout waits and connections in use at ``/metrics``.
+
+    Subclassed per role by ``get_app_engine`` (``metrics_role``) so the label survives
+    ``Pool.recreate``, which rebuilds the pool from its class.
+    """
+
+    metrics_role: ClassVar[str] = DEFAULT_DB_POOL_ROLE
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        labels = {"role": self.metrics_role}
+        add_gauge(DB_POOL_CHECKOUTS_WAITING, 1, labels=labels)
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            increment_counter(DB_POOL_CHECKOUT_TIMEOUTS_TOTAL, labels=labels)
+            raise
+        finally:
+            add_gauge(DB_POOL_CHECKOUTS_WAITING, -1, labels=labels)
+            waited_us = int((time.perf_counter() - started) * 1_000_000)
+            increment_counter(DB_POOL_CHECKOUT_WAIT_US_TOTAL, labels=labels, value=waited_us)
+        increment_counter(DB_POOL_CHECKOUTS_TOTAL, labels=labels)
+        set_gauge(DB_POOL_CONNECTIONS_IN_USE, self.checkedout(), labels=labels)
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        set_gauge(DB_POOL_CONNECTIONS_IN_USE, self.checkedout(), labels={"role": self.metrics_role})
+
+
 def get_app_engine() -> Engine:
     """Get or create the application database engine.
 
-    Uses IDIS_DATABASE_URL for non-superuser application connections.
+    Uses IDIS_DATABASE_URL for non-superuser application connections. Pool sizing comes from
+    ``get_pool_config()``; connection liveness relies on ``pool_recycle`` rather than a ping
+    round-trip per checkout (opt back in with IDIS_DB_POOL_PRE_PING). Pool checkouts, waits
+    and connections in use are recorded at ``/metrics``.
     Automatically instruments with OpenTelemetry if tracing is enabled.
 
     Returns:
         SQLAlchemy Engine for application use.
 
     Raises:
-        DatabaseConfigError: If IDIS_DATABASE_URL is not set.
+        DatabaseConfigError: If IDIS_DATABASE_URL is not set or the pool settings are invalid.
     """
     global _app_engine
 
     if _app_engine is None:
         url = get_database_url(admin=False)
+        config = get_pool_config()
+        pool_class = type("AppQueuePool", (MeteredQueuePool,), {"metrics_role": config.role})
         _app_engine = create_engine(
             url,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
+            poolclass=pool_class,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.timeout_seconds,
+            pool_recycle=config.recycle_seconds,
+            pool_pre_ping=config.pre_ping,
             echo=False,
         )
-        logger.info("Created application database engine")
+        logger.info(
+            "Created application database engine: role=%s pool_size=%d max_overflow=%d",
+            config.role,
+            config.pool_size,
+            config.max_overflow,
+        )
 
         try:
             from idis.observability.tracing import instrument_sqlalchemy
@@ -237,6 +413,69 @@ def set_tenant_local(conn: Connection, tenant_id: str) -> None:
         raise
 
 
+_BIND_PARAM_RE = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+_STATEMENT_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+_PREPARED_INFO_KEY = "idis_prepared_statements"
+
+
+def _positional_sql(sql: str) -> tuple[str, tuple[str, ...]]:
+    """Rewrite ``:name`` bind parameters to positional ``$n`` parameters for PREPARE.
+
+    Returns:
+        (rewritten SQL, parameter names in ``$n`` order).
+    """
+    names: list[str] = []
+
+    def positional(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return _BIND_PARAM_RE.sub(positional, sql), tuple(names)
+
+
+def execute_prepared(
+    conn: Connection, name: str, sql: str, params: Mapping[str, Any]
+) -> CursorResult[Any]:
+    """Execute a hot query through a server-side prepared statement.
+
+    psycopg2 has no protocol-level statement cache, so the first execution on a pooled DBAPI
+    connection issues ``PREPARE <name> AS ...`` and every execution runs ``EXECUTE <name>(...)``;
+    Postgres then skips parse/analyze (and, after a few runs, planning) for that connection.
+    Prepared names are tracked in the pooled connection's ``info`` so they follow the DBAPI
+    connection across checkouts and vanish with it on recycle or invalidation. RLS still applies:
+    policies read ``idis.tenant_id`` at execution time.
+
+    Falls back to a plain execution on non-Postgres dialects or when
+    IDIS_DB_PREPARED_STATEMENTS is off. Parameters must be scalars (no array binds).
+
+    Args:
+        conn: SQLAlchemy Connection.
+        name: Statement name, unique per SQL text (lowercase identifier).
+        sql: SQL with ``:name`` bind parameters.
+        params: Bind parameter values.
+
+    Returns:
+        The query result.
+
+    Raises:
+        DatabaseConfigError: If the statement name is not a valid identifier.
+    """
+    if conn.dialect.name != "postgresql" or not prepared_statements_enabled():
+        return conn.execute(text(sql), params)
+    if not _STATEMENT_NAME_RE.match(name):
+        raise DatabaseConfigError(f"Invalid prepared statement name: {name!r}")
+
+    positional, names = _positional_sql(sql)
+    prepared: set[str] = conn.connection.info.setdefault(_PREPARED_INFO_KEY, set())
+    if name not in prepared:
+        conn.execute(text(f"PREPARE {name} AS {positional}"))
+        prepared.add(name)
+    args = f"({', '.join(f':{param}' for param in names)})" if names else ""
+    return conn.execute(text(f"EXECUTE {name}{args}"), {param: params[param] for param in names})
+
+
 def reset_engines() -> None:
     """Reset global engine instances.
 
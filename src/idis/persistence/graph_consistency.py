@@ -25,7 +25,7 @@ from typing import Any, Protocol
 
 from idis.persistence.graph_repo import GraphProjectionError, GraphRepository
 from idis.persistence.neo4j_driver import is_neo4j_configured
-from idis.persistence.saga import DualWriteSagaExecutor
+from idis.persistence.saga import BatchDualWriteSagaExecutor, DualWriteSagaExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,7 @@ class ProjectionStatus(StrEnum):
     SUCCESS = "success"
     SKIPPED = "skipped"
     FAILED = "failed"
+    COMPENSATED = "compensated"
     AUDIT_FAILURE = "audit_failure"
 
 
@@ -82,7 +83,9 @@ def _build_audit_event(
     event: dict[str, Any] = {
         "event_type": f"graph_projection.{entity_type}.{status.value}",
         "tenant_id": tenant_id,
-        "severity": "HIGH" if status == ProjectionStatus.FAILED else "LOW",
+        "severity": (
+            "HIGH" if status in (ProjectionStatus.FAILED, ProjectionStatus.COMPENSATED) else "LOW"
+        ),
         "resource": {
             "resource_type": entity_type,
             "resource_id": entity_id,
@@ -125,6 +128,36 @@ def _emit_audit_or_fail(
         ) from exc
 
 
+def _emit_claim_sanad_audits(
+    audit_sink: AuditSinkProtocol | None,
+    *,
+    tenant_id: str,
+    claim_ids: list[str],
+    status: ProjectionStatus,
+    error: str | None = None,
+) -> None:
+    """Emit one claim_sanad projection audit event per claim of a batch.
+
+    Raises:
+        RuntimeError: If audit emission fails.
+    """
+    for claim_id in claim_ids:
+        _emit_audit_or_fail(
+            audit_sink,
+            _build_audit_event(
+                tenant_id=tenant_id,
+                entity_type="claim_sanad",
+                entity_id=claim_id,
+                status=status,
+                error=error,
+            ),
+        )
+
+
+def _projection_claim_id(projection: dict[str, Any]) -> str:
+    return str(projection["claim"].get("claim_id", "unknown"))
+
+
 class GraphProjectionService:
     """Service for projecting Postgres-persisted entities into Neo4j.
 
@@ -334,6 +367,91 @@ class GraphProjectionService:
                 timestamp=datetime.now(UTC).isoformat(),
             )
 
+    def project_claim_sanad_batch(
+        self,
+        *,
+        tenant_id: str,
+        batch_id: str,
+        projections: list[dict[str, Any]],
+    ) -> list[ProjectionResult]:
+        """Project many claim Sanad chains into Neo4j in UNWIND batches.
+
+        Claims are written in chunks of the repository write batch size. A failed chunk does
+        not stop later chunks; its claims are reported FAILED. Audit events are the same
+        per-claim events ``project_claim_sanad`` emits.
+
+        Args:
+            tenant_id: Tenant UUID.
+            batch_id: Batch identifier stamped on the projected claim-owned nodes.
+            projections: Dicts with claim, evidence_items, transmission_nodes and optional
+                defects and calculations (the ``project_claim_sanad`` arguments).
+
+        Returns:
+            One ProjectionResult per projection, in input order.
+        """
+        claim_ids = [_projection_claim_id(p) for p in projections]
+
+        if not is_neo4j_configured():
+            timestamp = datetime.now(UTC).isoformat()
+            return [
+                ProjectionResult(
+                    status=ProjectionStatus.SKIPPED,
+                    entity_type="claim_sanad",
+                    entity_id=claim_id,
+                    tenant_id=tenant_id,
+                    timestamp=timestamp,
+                )
+                for claim_id in claim_ids
+            ]
+
+        results: list[ProjectionResult] = []
+        chunk_size = self._graph_repo.write_batch_size
+        for start in range(0, len(projections), chunk_size):
+            chunk_ids = claim_ids[start : start + chunk_size]
+            status = ProjectionStatus.SUCCESS
+            error_msg: str | None = None
+            try:
+                self._graph_repo.upsert_claim_sanad_projection_batch(
+                    tenant_id=tenant_id,
+                    batch_id=batch_id,
+                    projections=projections[start : start + chunk_size],
+                )
+            except GraphProjectionError as exc:
+                status = ProjectionStatus.FAILED
+                error_msg = str(exc)
+                logger.error("Graph projection failed for claim batch %s: %s", batch_id, error_msg)
+
+            if status == ProjectionStatus.SUCCESS:
+                _emit_claim_sanad_audits(
+                    self._audit_sink, tenant_id=tenant_id, claim_ids=chunk_ids, status=status
+                )
+            else:
+                try:
+                    _emit_claim_sanad_audits(
+                        self._audit_sink,
+                        tenant_id=tenant_id,
+                        claim_ids=chunk_ids,
+                        status=status,
+                        error=error_msg,
+                    )
+                except RuntimeError:
+                    status = ProjectionStatus.AUDIT_FAILURE
+                    error_msg = f"Projection failed AND audit emission failed: {error_msg}"
+
+            timestamp = datetime.now(UTC).isoformat()
+            results.extend(
+                ProjectionResult(
+                    status=status,
+                    entity_type="claim_sanad",
+                    entity_id=claim_id,
+                    tenant_id=tenant_id,
+                    error=error_msg,
+                    timestamp=timestamp,
+                )
+                for claim_id in chunk_ids
+            )
+        return results
+
 
 def create_claim_projection_saga(
     *,
@@ -386,3 +504,99 @@ def create_claim_projection_saga(
         .add_postgres_step("postgres_claim_insert", postgres_insert, postgres_delete)
         .add_graph_step("graph_claim_projection", graph_insert, graph_delete)
     )
+
+
+def create_claim_projection_batch_saga(
+    *,
+    graph_repo: GraphRepository,
+    tenant_id: str,
+    batch_id: str,
+    postgres_insert: Any,
+    postgres_delete: Any,
+    audit_sink: AuditSinkProtocol | None = None,
+) -> BatchDualWriteSagaExecutor[dict[str, Any]]:
+    """Create a batch dual-write saga for claim + Sanad graph projection.
+
+    Postgres rows for the whole batch are written by one ``postgres_insert(batch_id, items)``
+    call; claims are then projected in UNWIND chunks of the repository write batch size. A
+    failed chunk compensates the batch by id: the graph nodes stamped with ``batch_id`` are
+    deleted and ``postgres_delete(batch_id)`` reverses the Postgres write. Per-claim audit
+    events match ``GraphProjectionService.project_claim_sanad``; when a batch is compensated,
+    every claim already audited as ``success`` by an earlier chunk also gets a
+    ``graph_projection.claim_sanad.compensated`` event (or ``failed`` if the graph delete
+    fails), so the trail records the rollback.
+
+    Args:
+        graph_repo: Graph repository instance.
+        tenant_id: Tenant UUID.
+        batch_id: Batch identifier.
+        postgres_insert: Callable writing all items in one Postgres transaction.
+        postgres_delete: Callable deleting the rows of a batch id (compensation).
+        audit_sink: Audit sink for projection events.
+
+    Returns:
+        Configured batch saga executor; execute it with the projection dicts
+        (claim, evidence_items, transmission_nodes, optional defects and calculations).
+    """
+
+    # Claims audited as projected during the current execute(); reset by its Postgres write.
+    projected: list[str] = []
+
+    def postgres_write(saga_batch_id: str, items: list[dict[str, Any]]) -> None:
+        projected.clear()
+        postgres_insert(saga_batch_id, items)
+
+    def graph_insert(saga_batch_id: str, chunk: list[dict[str, Any]]) -> None:
+        claim_ids = [_projection_claim_id(p) for p in chunk]
+        try:
+            graph_repo.upsert_claim_sanad_projection_batch(
+                tenant_id=tenant_id, batch_id=saga_batch_id, projections=chunk
+            )
+        except GraphProjectionError as exc:
+            _emit_claim_sanad_audits(
+                audit_sink,
+                tenant_id=tenant_id,
+                claim_ids=claim_ids,
+                status=ProjectionStatus.FAILED,
+                error=str(exc),
+            )
+            raise
+        _emit_claim_sanad_audits(
+            audit_sink, tenant_id=tenant_id, claim_ids=claim_ids, status=ProjectionStatus.SUCCESS
+        )
+        projected.extend(claim_ids)
+
+    def graph_delete(saga_batch_id: str) -> None:
+        logger.info("Compensating graph projection for claim batch %s", saga_batch_id)
+        audited = list(projected)
+        projected.clear()
+        try:
+            graph_repo.delete_claim_sanad_projection_batch(
+                tenant_id=tenant_id, batch_id=saga_batch_id
+            )
+        except GraphProjectionError as exc:
+            _emit_claim_sanad_audits(
+                audit_sink,
+                tenant_id=tenant_id,
+                claim_ids=audited,
+                status=ProjectionStatus.FAILED,
+                error=f"Batch {saga_batch_id} failed and its compensation failed: {exc}",
+            )
+            raise
+        _emit_claim_sanad_audits(
+            audit_sink,
+            tenant_id=tenant_id,
+            claim_ids=audited,
+            status=ProjectionStatus.COMPENSATED,
+            error=f"Batch {saga_batch_id} failed; projection rolled back",
+        )
+
+    return BatchDualWriteSagaExecutor(
+        batch_id,
+        item_id=_projection_claim_id,
+        postgres_write=postgres_write,
+        postgres_compensate=postgres_delete,
+        graph_write=graph_insert,
+        graph_compensate=graph_delete,
+        chunk_size=graph_repo.write_batch_size,
+    )
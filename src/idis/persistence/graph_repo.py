@@ -11,23 +11,308 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from idis.persistence.cypher.q_4_4_1_full_chain import build_full_chain_query
+from idis.persistence.cypher.q_4_4_1_full_chain import (
+    build_full_chain_batch_query,
+    build_full_chain_query,
+)
 from idis.persistence.cypher.q_4_4_2_deal_claims_grades import build_deal_claims_grades_query
 from idis.persistence.cypher.q_4_4_3_independence_clusters import (
+    build_independence_clusters_batch_query,
     build_independence_clusters_query,
 )
-from idis.persistence.cypher.q_4_4_4_weakest_link import build_weakest_link_query
-from idis.persistence.cypher.q_4_4_5_defect_impact import build_defect_impact_query
+from idis.persistence.cypher.q_4_4_4_weakest_link import (
+    build_weakest_link_batch_query,
+    build_weakest_link_query,
+)
+from idis.persistence.cypher.q_4_4_5_defect_impact import (
+    build_defect_impact_batch_query,
+    build_defect_impact_query,
+)
 from idis.persistence.cypher.q_4_4_6_entity_cooccurrence import build_entity_cooccurrence_query
 from idis.persistence.neo4j_driver import (
     EdgeType,
     NodeLabel,
     execute_read,
     execute_write,
+    execute_write_unwind,
+    get_write_batch_size,
 )
 
 logger = logging.getLogger(__name__)
 
+# Projection writes: one UNWIND statement per node/edge family. Shared parameters ($tenant_id,
+# $deal_id / $claim_id) come from the call; per-row values come from $rows.
+
+_UPSERT_DEAL = f"""\
+UNWIND $rows AS row
+MERGE (deal:{NodeLabel.DEAL} {{deal_id: $deal_id, tenant_id: $tenant_id}})
+SET deal.updated_at = datetime()
+"""
+
+_UPSERT_DOCUMENTS = f"""\
+UNWIND $rows AS row
+MERGE (doc:{NodeLabel.DOCUMENT} {{document_id: row.document_id, tenant_id: $tenant_id}})
+SET doc.doc_type = row.doc_type, doc.updated_at = datetime()
+WITH doc
+MATCH (deal:{NodeLabel.DEAL} {{deal_id: $deal_id, tenant_id: $tenant_id}})
+MERGE (deal)-[:{EdgeType.HAS_DOCUMENT}]->(doc)
+"""
+
+_UPSERT_SPANS = f"""\
+UNWIND $rows AS row
+MERGE (span:{NodeLabel.SPAN} {{span_id: row.span_id, tenant_id: $tenant_id}})
+SET span.span_type = row.span_type, span.updated_at = datetime()
+WITH span, row
+MATCH (doc:{NodeLabel.DOCUMENT} {{document_id: row.document_id, tenant_id: $tenant_id}})
+MERGE (doc)-[:{EdgeType.HAS_SPAN}]->(span)
+"""
+
+_UPSERT_ENTITIES = f"""\
+UNWIND $rows AS row
+MERGE (e:{NodeLabel.ENTITY} {{entity_id: row.entity_id, tenant_id: $tenant_id}})
+SET e.name = row.name, e.type = row.entity_type, e.updated_at = datetime()
+"""
+
+_LINK_ENTITY_MENTIONS = f"""\
+UNWIND $rows AS row
+MATCH (e:{NodeLabel.ENTITY} {{entity_id: row.entity_id, tenant_id: $tenant_id}})
+MATCH (span:{NodeLabel.SPAN} {{span_id: row.span_id, tenant_id: $tenant_id}})
+MERGE (e)-[:{EdgeType.MENTIONED_IN}]->(span)
+"""
+
+_UPSERT_CLAIM = f"""\
+UNWIND $rows AS row
+MERGE (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
+SET c.claim_text = row.claim_text,
+    c.claim_grade = row.claim_grade,
+    c.claim_verdict = row.claim_verdict,
+    c.materiality = row.materiality,
+    c.claim_class = row.claim_class,
+    c.updated_at = datetime()
+"""
+
+_UPSERT_EVIDENCE = f"""\
+UNWIND $rows AS row
+MERGE (ev:{NodeLabel.EVIDENCE_ITEM} {{evidence_id: row.evidence_id, tenant_id: $tenant_id}})
+SET ev.source_grade = row.source_grade,
+    ev.source_system = row.source_system,
+    ev.upstream_origin_id = row.upstream_origin_id,
+    ev.updated_at = datetime()
+WITH ev
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.SUPPORTED_BY}]->(ev)
+"""
+
+_UPSERT_TRANSMISSION_NODES = f"""\
+UNWIND $rows AS row
+MERGE (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: row.node_id, tenant_id: $tenant_id}})
+SET tn.timestamp = row.timestamp,
+    tn.updated_at = datetime()
+WITH tn
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.HAS_SANAD_STEP}]->(tn)
+MERGE (tn)-[:{EdgeType.OUTPUT}]->(c)
+"""
+
+_INPUT_EDGE_TARGETS: dict[str, tuple[NodeLabel, str]] = {
+    "span": (NodeLabel.SPAN, "span_id"),
+    "evidence": (NodeLabel.EVIDENCE_ITEM, "evidence_id"),
+    "claim": (NodeLabel.CLAIM, "claim_id"),
+    "calculation": (NodeLabel.CALCULATION, "calc_id"),
+}
+
+_INPUT_EDGES: dict[str, str] = {
+    ref_type: f"""\
+UNWIND $rows AS row
+MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: row.node_id, tenant_id: $tenant_id}})
+MATCH (ref:{label} {{{key}: row.ref_id, tenant_id: $tenant_id}})
+MERGE (tn)-[:{EdgeType.INPUT}]->(ref)
+"""
+    for ref_type, (label, key) in _INPUT_EDGE_TARGETS.items()
+}
+
+_UPSERT_DEFECTS = f"""\
+UNWIND $rows AS row
+MERGE (d:{NodeLabel.DEFECT} {{defect_id: row.defect_id, tenant_id: $tenant_id}})
+SET d.defect_type = row.defect_type,
+    d.severity = row.severity,
+    d.updated_at = datetime()
+WITH d
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.HAS_DEFECT}]->(d)
+"""
+
+_UPSERT_CALCULATIONS = f"""\
+UNWIND $rows AS row
+MERGE (calc:{NodeLabel.CALCULATION} {{calc_id: row.calc_id, tenant_id: $tenant_id}})
+SET calc.calc_type = row.calc_type,
+    calc.updated_at = datetime()
+WITH calc
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
+MERGE (calc)-[:{EdgeType.DERIVED_FROM}]->(c)
+"""
+
+# Multi-claim variants for batched dual-write sagas: the claim comes from row.claim_id and the
+# claim-owned nodes (Claim, TransmissionNode, Defect) the batch creates are stamped with
+# $batch_id so a failed batch can be compensated with one delete per label. The stamp is set
+# ON CREATE only: nodes that existed before the batch keep their stamp and survive compensation.
+
+_BATCH_UPSERT_CLAIMS = f"""\
+UNWIND $rows AS row
+MERGE (c:{NodeLabel.CLAIM} {{claim_id: row.claim_id, tenant_id: $tenant_id}})
+ON CREATE SET c.projection_batch_id = $batch_id
+SET c.claim_text = row.claim_text,
+    c.claim_grade = row.claim_grade,
+    c.claim_verdict = row.claim_verdict,
+    c.materiality = row.materiality,
+    c.claim_class = row.claim_class,
+    c.updated_at = datetime()
+"""
+
+_BATCH_UPSERT_EVIDENCE = f"""\
+UNWIND $rows AS row
+MERGE (ev:{NodeLabel.EVIDENCE_ITEM} {{evidence_id: row.evidence_id, tenant_id: $tenant_id}})
+SET ev.source_grade = row.source_grade,
+    ev.source_system = row.source_system,
+    ev.upstream_origin_id = row.upstream_origin_id,
+    ev.updated_at = datetime()
+WITH ev, row
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: row.claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.SUPPORTED_BY}]->(ev)
+"""
+
+_BATCH_UPSERT_TRANSMISSION_NODES = f"""\
+UNWIND $rows AS row
+MERGE (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: row.node_id, tenant_id: $tenant_id}})
+ON CREATE SET tn.projection_batch_id = $batch_id
+SET tn.timestamp = row.timestamp,
+    tn.updated_at = datetime()
+WITH tn, row
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: row.claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.HAS_SANAD_STEP}]->(tn)
+MERGE (tn)-[:{EdgeType.OUTPUT}]->(c)
+"""
+
+_BATCH_UPSERT_DEFECTS = f"""\
+UNWIND $rows AS row
+MERGE (d:{NodeLabel.DEFECT} {{defect_id: row.defect_id, tenant_id: $tenant_id}})
+ON CREATE SET d.projection_batch_id = $batch_id
+SET d.defect_type = row.defect_type,
+    d.severity = row.severity,
+    d.updated_at = datetime()
+WITH d, row
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: row.claim_id, tenant_id: $tenant_id}})
+MERGE (c)-[:{EdgeType.HAS_DEFECT}]->(d)
+"""
+
+_BATCH_UPSERT_CALCULATIONS = f"""\
+UNWIND $rows AS row
+MERGE (calc:{NodeLabel.CALCULATION} {{calc_id: row.calc_id, tenant_id: $tenant_id}})
+SET calc.calc_type = row.calc_type,
+    calc.updated_at = datetime()
+WITH calc, row
+MATCH (c:{NodeLabel.CLAIM} {{claim_id: row.claim_id, tenant_id: $tenant_id}})
+MERGE (calc)-[:{EdgeType.DERIVED_FROM}]->(c)
+"""
+
+_DELETE_PROJECTION_BATCH: tuple[str, ...] = tuple(
+    f"MATCH (n:{label} {{tenant_id: $tenant_id, projection_batch_id: $batch_id}}) DETACH DELETE n"
+    for label in (NodeLabel.DEFECT, NodeLabel.TRANSMISSION_NODE, NodeLabel.CLAIM)
+)
+
+
+def _claim_sanad_rows(
+    *,
+    claim: dict[str, Any],
+    evidence_items: list[dict[str, Any]],
+    transmission_nodes: list[dict[str, Any]],
+    defects: list[dict[str, Any]] | None,
+    calculations: list[dict[str, Any]] | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Build the UNWIND rows of one claim's Sanad projection, keyed by family.
+
+    INPUT edge rows are keyed ``input:<ref type>``; unknown ref types are skipped.
+    """
+    rows: dict[str, list[dict[str, Any]]] = {
+        "claim": [
+            {
+                "claim_text": claim.get("claim_text", ""),
+                "claim_grade": claim.get("claim_grade", "D"),
+                "claim_verdict": claim.get("claim_verdict", "UNVERIFIED"),
+                "materiality": claim.get("materiality", "MEDIUM"),
+                "claim_class": claim.get("claim_class", "OTHER"),
+            }
+        ],
+        "evidence": [
+            {
+                "evidence_id": ev["evidence_id"],
+                "source_grade": ev.get("source_grade", "D"),
+                "source_system": ev.get("source_system", ""),
+                "upstream_origin_id": ev.get("upstream_origin_id", ""),
+            }
+            for ev in evidence_items
+        ],
+        "transmission_nodes": [
+            {"node_id": tn["node_id"], "timestamp": tn.get("timestamp", "")}
+            for tn in transmission_nodes
+        ],
+        **{f"input:{ref}": [] for ref in _INPUT_EDGES},
+        "defects": [
+            {
+                "defect_id": defect["defect_id"],
+                "defect_type": defect.get("defect_type", ""),
+                "severity": defect.get("severity", "MINOR"),
+            }
+            for defect in defects or []
+        ],
+        "calculations": [
+            {"calc_id": calc["calc_id"], "calc_type": calc.get("calc_type", "")}
+            for calc in calculations or []
+        ],
+    }
+    for tn in transmission_nodes:
+        for input_ref in tn.get("input_refs", []):
+            input_rows = rows.get(f"input:{input_ref.get('type', '')}")
+            if input_rows is not None:
+                input_rows.append({"node_id": tn["node_id"], "ref_id": input_ref.get("id", "")})
+    return rows
+
+
+_CLAIM_SANAD_STATEMENTS: dict[str, str] = {
+    "claim": _UPSERT_CLAIM,
+    "evidence": _UPSERT_EVIDENCE,
+    "transmission_nodes": _UPSERT_TRANSMISSION_NODES,
+    **{f"input:{ref}": query for ref, query in _INPUT_EDGES.items()},
+    "defects": _UPSERT_DEFECTS,
+    "calculations": _UPSERT_CALCULATIONS,
+}
+
+_BATCH_CLAIM_SANAD_STATEMENTS: dict[str, str] = {
+    **_CLAIM_SANAD_STATEMENTS,
+    "claim": _BATCH_UPSERT_CLAIMS,
+    "evidence": _BATCH_UPSERT_EVIDENCE,
+    "transmission_nodes": _BATCH_UPSERT_TRANSMISSION_NODES,
+    "defects": _BATCH_UPSERT_DEFECTS,
+    "calculations": _BATCH_UPSERT_CALCULATIONS,
+}
+
+_BATCH_KEY = "batch_key"
+
+
+def _group_by_batch_key(
+    ids: list[str], records: list[dict[str, Any]]
+) -> dict[str, list[dict[str, Any]]]:
+    """Split batched-query records per id, dropping batch_key so records match the per-id query.
+
+    Every requested id is present in the result (empty list when the graph has no match).
+    """
+    grouped: dict[str, list[dict[str, Any]]] = {item_id: [] for item_id in ids}
+    for record in records:
+        row = dict(record)
+        key = str(row.pop(_BATCH_KEY))
+        grouped.setdefault(key, []).append(row)
+    return grouped
+
 
 class GraphProjectionError(Exception):
     """Raised when a graph projection operation fails.
@@ -44,6 +329,30 @@ class GraphRepository:
     because every node carries tenant_id and every query filters on it.
     """
 
+    def __init__(self, *, batch_size: int | None = None) -> None:
+        """Initialize the repository.
+
+        Args:
+            batch_size: Rows per UNWIND write transaction. Defaults to
+                IDIS_NEO4J_WRITE_BATCH_SIZE (read at write time).
+        """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self._batch_size = batch_size
+
+    @property
+    def write_batch_size(self) -> int:
+        """Rows per UNWIND write transaction (constructor value or IDIS_NEO4J_WRITE_BATCH_SIZE)."""
+        return self._batch_size or get_write_batch_size()
+
+    def _write_batches(
+        self,
+        statements: list[tuple[str, list[dict[str, Any]]]],
+        parameters: dict[str, Any],
+    ) -> int:
+        """Run UNWIND statements in order, batched into write transactions."""
+        return execute_write_unwind(statements, parameters, batch_size=self.write_batch_size)
+
     def upsert_deal_graph_projection(
         self,
         *,
@@ -56,7 +365,9 @@ class GraphRepository:
         """Project deal structure (Deal→Document→Span) into Neo4j.
 
         Uses MERGE to be idempotent. Creates Deal, Document, and Span
-        nodes with HAS_DOCUMENT and HAS_SPAN edges.
+        nodes with HAS_DOCUMENT and HAS_SPAN edges. Each node and edge
+        family is written as one UNWIND statement, batched into write
+        transactions of at most ``batch_size`` rows.
 
         Args:
             tenant_id: Tenant UUID for isolation.
@@ -69,83 +380,57 @@ class GraphRepository:
             GraphProjectionError: If projection fails.
         """
         try:
-            query = f"""\
-MERGE (deal:{NodeLabel.DEAL} {{deal_id: $deal_id, tenant_id: $tenant_id}})
-SET deal.updated_at = datetime()
-"""
-            execute_write(query, {"deal_id": deal_id, "tenant_id": tenant_id})
-
-            for doc in documents:
-                query = f"""\
-MERGE (doc:{NodeLabel.DOCUMENT} {{document_id: $document_id, tenant_id: $tenant_id}})
-SET doc.doc_type = $doc_type, doc.updated_at = datetime()
-WITH doc
-MATCH (deal:{NodeLabel.DEAL} {{deal_id: $deal_id, tenant_id: $tenant_id}})
-MERGE (deal)-[:{EdgeType.HAS_DOCUMENT}]->(doc)
-"""
-                execute_write(
-                    query,
-                    {
-                        "document_id": doc["document_id"],
-                        "doc_type": doc.get("doc_type", ""),
-                        "deal_id": deal_id,
-                        "tenant_id": tenant_id,
-                    },
-                )
-
-            for span in spans:
-                query = f"""\
-MERGE (span:{NodeLabel.SPAN} {{span_id: $span_id, tenant_id: $tenant_id}})
-SET span.span_type = $span_type, span.updated_at = datetime()
-WITH span
-MATCH (doc:{NodeLabel.DOCUMENT} {{document_id: $document_id, tenant_id: $tenant_id}})
-MERGE (doc)-[:{EdgeType.HAS_SPAN}]->(span)
-"""
-                execute_write(
-                    query,
-                    {
-                        "span_id": span["span_id"],
-                        "span_type": span.get("span_type", ""),
-                        "document_id": span["document_id"],
-                        "tenant_id": tenant_id,
-                    },
-                )
-
-            for entity in entities or []:
-                query = f"""\
-MERGE (e:{NodeLabel.ENTITY} {{entity_id: $entity_id, tenant_id: $tenant_id}})
-SET e.name = $name, e.type = $entity_type, e.updated_at = datetime()
-"""
-                execute_write(
-                    query,
-                    {
-                        "entity_id": entity["entity_id"],
-                        "name": entity.get("name", ""),
-                        "entity_type": entity.get("type", ""),
-                        "tenant_id": tenant_id,
-                    },
-                )
-
-                for span_id in entity.get("span_ids", []):
-                    link_query = f"""\
-MATCH (e:{NodeLabel.ENTITY} {{entity_id: $entity_id, tenant_id: $tenant_id}})
-MATCH (span:{NodeLabel.SPAN} {{span_id: $span_id, tenant_id: $tenant_id}})
-MERGE (e)-[:{EdgeType.MENTIONED_IN}]->(span)
-"""
-                    execute_write(
-                        link_query,
+            entities = entities or []
+            statements: list[tuple[str, list[dict[str, Any]]]] = [
+                (_UPSERT_DEAL, [{}]),
+                (
+                    _UPSERT_DOCUMENTS,
+                    [
+                        {"document_id": doc["document_id"], "doc_type": doc.get("doc_type", "")}
+                        for doc in documents
+                    ],
+                ),
+                (
+                    _UPSERT_SPANS,
+                    [
+                        {
+                            "span_id": span["span_id"],
+                            "span_type": span.get("span_type", ""),
+                            "document_id": span["document_id"],
+                        }
+                        for span in spans
+                    ],
+                ),
+                (
+                    _UPSERT_ENTITIES,
+                    [
                         {
                             "entity_id": entity["entity_id"],
-                            "span_id": span_id,
-                            "tenant_id": tenant_id,
-                        },
-                    )
+                            "name": entity.get("name", ""),
+                            "entity_type": entity.get("type", ""),
+                        }
+                        for entity in entities
+                    ],
+                ),
+                (
+                    _LINK_ENTITY_MENTIONS,
+                    [
+                        {"entity_id": entity["entity_id"], "span_id": span_id}
+                        for entity in entities
+                        for span_id in entity.get("span_ids", [])
+                    ],
+                ),
+            ]
+            transactions = self._write_batches(
+                statements, {"deal_id": deal_id, "tenant_id": tenant_id}
+            )
 
             logger.info(
-                "Deal graph projection complete: deal=%s docs=%d spans=%d",
+                "Deal graph projection complete: deal=%s docs=%d spans=%d transactions=%d",
                 deal_id,
                 len(documents),
                 len(spans),
+                transactions,
             )
 
         except Exception as exc:
@@ -167,7 +452,8 @@ MERGE (e)-[:{EdgeType.MENTIONED_IN}]->(span)
 
         Creates Claim, EvidenceItem, TransmissionNode nodes and their
         edges (SUPPORTED_BY, HAS_SANAD_STEP, INPUT, OUTPUT, HAS_DEFECT,
-        DERIVED_FROM).
+        DERIVED_FROM). Each node and edge family is written as one UNWIND
+        statement, batched into write transactions.
 
         Args:
             tenant_id: Tenant UUID for isolation.
@@ -182,176 +468,115 @@ MERGE (e)-[:{EdgeType.MENTIONED_IN}]->(span)
         """
         try:
             claim_id = claim["claim_id"]
-
-            claim_query = f"""\
-MERGE (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-SET c.claim_text = $claim_text,
-    c.claim_grade = $claim_grade,
-    c.claim_verdict = $claim_verdict,
-    c.materiality = $materiality,
-    c.claim_class = $claim_class,
-    c.updated_at = datetime()
-"""
-            execute_write(
-                claim_query,
-                {
-                    "claim_id": claim_id,
-                    "claim_text": claim.get("claim_text", ""),
-                    "claim_grade": claim.get("claim_grade", "D"),
-                    "claim_verdict": claim.get("claim_verdict", "UNVERIFIED"),
-                    "materiality": claim.get("materiality", "MEDIUM"),
-                    "claim_class": claim.get("claim_class", "OTHER"),
-                    "tenant_id": tenant_id,
-                },
+            rows = _claim_sanad_rows(
+                claim=claim,
+                evidence_items=evidence_items,
+                transmission_nodes=transmission_nodes,
+                defects=defects,
+                calculations=calculations,
+            )
+            statements = [(_CLAIM_SANAD_STATEMENTS[family], rows[family]) for family in rows]
+            transactions = self._write_batches(
+                statements, {"claim_id": claim_id, "tenant_id": tenant_id}
             )
 
-            for ev in evidence_items:
-                ev_query = f"""\
-MERGE (ev:{NodeLabel.EVIDENCE_ITEM} {{evidence_id: $evidence_id, tenant_id: $tenant_id}})
-SET ev.source_grade = $source_grade,
-    ev.source_system = $source_system,
-    ev.upstream_origin_id = $upstream_origin_id,
-    ev.updated_at = datetime()
-WITH ev
-MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-MERGE (c)-[:{EdgeType.SUPPORTED_BY}]->(ev)
-"""
-                execute_write(
-                    ev_query,
-                    {
-                        "evidence_id": ev["evidence_id"],
-                        "source_grade": ev.get("source_grade", "D"),
-                        "source_system": ev.get("source_system", ""),
-                        "upstream_origin_id": ev.get("upstream_origin_id", ""),
-                        "claim_id": claim_id,
-                        "tenant_id": tenant_id,
-                    },
-                )
+            logger.info(
+                "Claim Sanad projection complete: claim=%s evidence=%d tns=%d transactions=%d",
+                claim_id,
+                len(evidence_items),
+                len(transmission_nodes),
+                transactions,
+            )
 
-            for tn in transmission_nodes:
-                tn_query = f"""\
-MERGE (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-SET tn.timestamp = $timestamp,
-    tn.updated_at = datetime()
-WITH tn
-MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-MERGE (c)-[:{EdgeType.HAS_SANAD_STEP}]->(tn)
-"""
-                execute_write(
-                    tn_query,
-                    {
-                        "node_id": tn["node_id"],
-                        "timestamp": tn.get("timestamp", ""),
-                        "claim_id": claim_id,
-                        "tenant_id": tenant_id,
-                    },
-                )
+        except GraphProjectionError:
+            raise
+        except Exception as exc:
+            raise GraphProjectionError(
+                f"Failed to project claim {claim.get('claim_id', '?')} Sanad chain: {exc}"
+            ) from exc
 
-                tn_query_output = f"""\
-MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-MERGE (tn)-[:{EdgeType.OUTPUT}]->(c)
-"""
-                execute_write(
-                    tn_query_output,
-                    {
-                        "node_id": tn["node_id"],
-                        "claim_id": claim_id,
-                        "tenant_id": tenant_id,
-                    },
-                )
+    def upsert_claim_sanad_projection_batch(
+        self,
+        *,
+        tenant_id: str,
+        batch_id: str,
+        projections: list[dict[str, Any]],
+    ) -> None:
+        """Project the Sanad chains of several claims in one set of UNWIND statements.
 
-                for input_ref in tn.get("input_refs", []):
-                    ref_type = input_ref.get("type", "")
-                    ref_id = input_ref.get("id", "")
-                    if ref_type == "span":
-                        input_q = f"""\
-MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-MATCH (s:{NodeLabel.SPAN} {{span_id: $ref_id, tenant_id: $tenant_id}})
-MERGE (tn)-[:{EdgeType.INPUT}]->(s)
-"""
-                    elif ref_type == "evidence":
-                        input_q = f"""\
-MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-MATCH (ev:{NodeLabel.EVIDENCE_ITEM} {{evidence_id: $ref_id, tenant_id: $tenant_id}})
-MERGE (tn)-[:{EdgeType.INPUT}]->(ev)
-"""
-                    elif ref_type == "claim":
-                        input_q = f"""\
-MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-MATCH (c2:{NodeLabel.CLAIM} {{claim_id: $ref_id, tenant_id: $tenant_id}})
-MERGE (tn)-[:{EdgeType.INPUT}]->(c2)
-"""
-                    elif ref_type == "calculation":
-                        input_q = f"""\
-MATCH (tn:{NodeLabel.TRANSMISSION_NODE} {{node_id: $node_id, tenant_id: $tenant_id}})
-MATCH (calc:{NodeLabel.CALCULATION} {{calc_id: $ref_id, tenant_id: $tenant_id}})
-MERGE (tn)-[:{EdgeType.INPUT}]->(calc)
-"""
-                    else:
-                        continue
+        Writes the same nodes and edges as ``upsert_claim_sanad_projection`` for every claim,
+        but each node and edge family is one UNWIND statement across all claims (rows carry
+        their claim_id). Claim, TransmissionNode and Defect nodes created by the batch are
+        stamped with ``projection_batch_id`` so ``delete_claim_sanad_projection_batch`` can
+        compensate; nodes that already existed are updated but keep their original stamp.
 
-                    execute_write(
-                        input_q,
-                        {
-                            "node_id": tn["node_id"],
-                            "ref_id": ref_id,
-                            "tenant_id": tenant_id,
-                        },
-                    )
-
-            for defect in defects or []:
-                defect_query = f"""\
-MERGE (d:{NodeLabel.DEFECT} {{defect_id: $defect_id, tenant_id: $tenant_id}})
-SET d.defect_type = $defect_type,
-    d.severity = $severity,
-    d.updated_at = datetime()
-WITH d
-MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-MERGE (c)-[:{EdgeType.HAS_DEFECT}]->(d)
-"""
-                execute_write(
-                    defect_query,
-                    {
-                        "defect_id": defect["defect_id"],
-                        "defect_type": defect.get("defect_type", ""),
-                        "severity": defect.get("severity", "MINOR"),
-                        "claim_id": claim_id,
-                        "tenant_id": tenant_id,
-                    },
-                )
+        Args:
+            tenant_id: Tenant UUID for isolation.
+            batch_id: Saga batch identifier stamped on the claim-owned nodes.
+            projections: Dicts with the keyword arguments of
+                ``upsert_claim_sanad_projection`` (claim, evidence_items, transmission_nodes,
+                optional defects and calculations).
 
-            for calc in calculations or []:
-                calc_query = f"""\
-MERGE (calc:{NodeLabel.CALCULATION} {{calc_id: $calc_id, tenant_id: $tenant_id}})
-SET calc.calc_type = $calc_type,
-    calc.updated_at = datetime()
-WITH calc
-MATCH (c:{NodeLabel.CLAIM} {{claim_id: $claim_id, tenant_id: $tenant_id}})
-MERGE (calc)-[:{EdgeType.DERIVED_FROM}]->(c)
-"""
-                execute_write(
-                    calc_query,
-                    {
-                        "calc_id": calc["calc_id"],
-                        "calc_type": calc.get("calc_type", ""),
-                        "claim_id": claim_id,
-                        "tenant_id": tenant_id,
-                    },
+        Raises:
+            GraphProjectionError: If projection fails.
+        """
+        try:
+            family_rows: dict[str, list[dict[str, Any]]] = {
+                family: [] for family in _BATCH_CLAIM_SANAD_STATEMENTS
+            }
+            for projection in projections:
+                claim_id = projection["claim"]["claim_id"]
+                rows = _claim_sanad_rows(
+                    claim=projection["claim"],
+                    evidence_items=projection.get("evidence_items", []),
+                    transmission_nodes=projection.get("transmission_nodes", []),
+                    defects=projection.get("defects"),
+                    calculations=projection.get("calculations"),
                 )
+                for family, claim_rows in rows.items():
+                    family_rows[family].extend({**row, "claim_id": claim_id} for row in claim_rows)
+
+            statements = [
+                (_BATCH_CLAIM_SANAD_STATEMENTS[family], rows)
+                for family, rows in family_rows.items()
+            ]
+            transactions = self._write_batches(
+                statements, {"batch_id": batch_id, "tenant_id": tenant_id}
+            )
 
             logger.info(
-                "Claim Sanad projection complete: claim=%s evidence=%d tns=%d",
-                claim_id,
-                len(evidence_items),
-                len(transmission_nodes),
+                "Claim Sanad batch projection complete: batch=%s claims=%d transactions=%d",
+                batch_id,
+                len(projections),
+                transactions,
             )
 
-        except GraphProjectionError:
-            raise
         except Exception as exc:
             raise GraphProjectionError(
-                f"Failed to project claim {claim.get('claim_id', '?')} Sanad chain: {exc}"
+                f"Failed to project claim batch {batch_id} Sanad chains: {exc}"
+            ) from exc
+
+    def delete_claim_sanad_projection_batch(self, *, tenant_id: str, batch_id: str) -> None:
+        """Delete the claim-owned nodes a batch projection created (stamped with ``batch_id``).
+
+        Nodes that existed before the batch are not deleted, like the single-claim saga, whose
+        graph compensation leaves earlier projections in place; properties and edges the batch
+        wrote onto them remain. Shared nodes (evidence items, calculations, spans) are left in
+        place; MERGE makes re-projecting them idempotent.
+
+        Args:
+            tenant_id: Tenant UUID for isolation.
+            batch_id: Saga batch identifier.
+
+        Raises:
+            GraphProjectionError: If the delete fails.
+        """
+        try:
+            for query in _DELETE_PROJECTION_BATCH:
+                execute_write(query, {"batch_id": batch_id, "tenant_id": tenant_id})
+        except Exception as exc:
+            raise GraphProjectionError(
+                f"Failed to compensate claim batch {batch_id} projection: {exc}"
             ) from exc
 
     def get_claim_sanad_chain(
@@ -461,3 +686,85 @@ MERGE (calc)-[:{EdgeType.DERIVED_FROM}]->(c)
         """
         query, params = build_entity_cooccurrence_query(deal_id=deal_id, tenant_id=tenant_id)
         return execute_read(query, params)
+
+    def get_claim_sanad_chain_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """§4.4.1 for many claims in one read transaction.
+
+        Args:
+            tenant_id: Tenant UUID.
+            claim_ids: Claim UUIDs.
+
+        Returns:
+            Chain records per claim_id, each list identical to get_claim_sanad_chain.
+        """
+        if not claim_ids:
+            return {}
+        query, params = build_full_chain_batch_query(claim_ids=claim_ids, tenant_id=tenant_id)
+        return _group_by_batch_key(claim_ids, execute_read(query, params))
+
+    def get_independence_clusters_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """§4.4.3 for many claims in one read transaction.
+
+        Args:
+            tenant_id: Tenant UUID.
+            claim_ids: Claim UUIDs.
+
+        Returns:
+            Cluster records per claim_id, each list identical to get_independence_clusters.
+        """
+        if not claim_ids:
+            return {}
+        query, params = build_independence_clusters_batch_query(
+            claim_ids=claim_ids, tenant_id=tenant_id
+        )
+        return _group_by_batch_key(claim_ids, execute_read(query, params))
+
+    def get_weakest_link_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """§4.4.4 for many claims in one read transaction.
+
+        Args:
+            tenant_id: Tenant UUID.
+            claim_ids: Claim UUIDs.
+
+        Returns:
+            Single-record (or empty) list per claim_id, as get_weakest_link.
+        """
+        if not claim_ids:
+            return {}
+        query, params = build_weakest_link_batch_query(claim_ids=claim_ids, tenant_id=tenant_id)
+        return _group_by_batch_key(claim_ids, execute_read(query, params))
+
+    def get_defect_impact_batch(
+        self,
+        *,
+        tenant_id: str,
+        defect_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """§4.4.5 for many defects in one read transaction.
+
+        Args:
+            tenant_id: Tenant UUID.
+            defect_ids: Defect UUIDs.
+
+        Returns:
+            Impact records per defect_id, each list identical to get_defect_impact.
+        """
+        if not defect_ids:
+            return {}
+        query, params = build_defect_impact_batch_query(defect_ids=defect_ids, tenant_id=tenant_id)
+        return _group_by_batch_key(defect_ids, execute_read(query, params))
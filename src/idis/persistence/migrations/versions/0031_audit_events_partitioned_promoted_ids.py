@@ -0,0 +1,257 @@
+"""Partition audit_events monthly and promote deal_id/run_id to indexed columns.
+
+Revision ID: 0031
+Revises: 0030
+Create Date: 2026-10-18
+
+``PostgresAuditQueryRepository`` filtered deals with ``event->'request'->>'deal_id'``, which
+extracts JSON on every row and cannot use an index, and the append-only table grows without
+bound. This migration rebuilds ``audit_events`` as a table RANGE-partitioned by month on
+``occurred_at`` with real ``deal_id`` / ``run_id`` columns (populated by
+``PostgresAuditSink`` at insert time; backfilled here from the stored JSON).
+
+- Primary key becomes (event_id, occurred_at): Postgres requires the partition key in every
+  unique constraint. event_ids are server-generated UUIDv4s, so uniqueness is unchanged in
+  practice.
+- Keyset pagination (``ORDER BY occurred_at DESC, event_id DESC``) is served by covering
+  indexes that INCLUDE event_type, so list pages are index-only scans per partition.
+- ``idis_ensure_audit_events_partition(date)`` creates a month partition idempotently. It is
+  SECURITY DEFINER (owned by the migration role) and EXECUTE is granted only to the app role
+  (revoked from PUBLIC), so the janitor's partition upkeep runs over the app connection without
+  the app role owning the table. The role is read from ``IDIS_PG_APP_USER`` (default
+  ``idis_app``), the setting ``scripts/pg_bootstrap_ci.py`` creates it from; if that role does
+  not exist yet the migration emits a WARNING instead of granting. A DEFAULT partition catches
+  any row outside the provisioned months, so an audit INSERT can never fail for lack of a
+  partition.
+- RLS (guarded NULLIF form, FORCE) and the immutability trigger are re-created on the
+  partitioned parent; reads and writes go through the parent.
+
+The backfill copies every existing row inside the migration transaction; on very large
+installations run it in a maintenance window.
+"""
+
+import os
+
+from alembic import op
+
+revision = "0031"
+down_revision = "0030"
+branch_labels = None
+depends_on = None
+
+# Months provisioned ahead of the current month at migration time; the compliance janitor
+# keeps extending this horizon (idis.audit.partitions.ensure_audit_event_partitions).
+_MONTHS_AHEAD = 3
+
+# The app role name comes from the same setting scripts/pg_bootstrap_ci.py creates it from.
+APP_ROLE_ENV = "IDIS_PG_APP_USER"
+DEFAULT_APP_ROLE = "idis_app"
+
+
+def _app_role() -> str:
+    return os.environ.get(APP_ROLE_ENV, "").strip() or DEFAULT_APP_ROLE
+
+
+def _grant_partition_upkeep(role: str) -> None:
+    """GRANT EXECUTE on the partition helper to ``role``; WARN (not skip silently) if missing."""
+    literal = role.replace("'", "''")
+    op.execute(
+        f"""
+        DO $grant$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = '{literal}') THEN
+                EXECUTE format(
+                    'GRANT EXECUTE ON FUNCTION idis_ensure_audit_events_partition(DATE) TO %I',
+                    '{literal}'
+                );
+            ELSE
+                RAISE WARNING 'app role % not found: grant it EXECUTE on %',
+                    '{literal}', 'idis_ensure_audit_events_partition(DATE)'
+                    USING HINT = 'Set {APP_ROLE_ENV} to the app role before migrating.';
+            END IF;
+        END
+        $grant$;
+        """
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE audit_events_partitioned (
+            event_id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            occurred_at TIMESTAMPTZ NOT NULL,
+            event_type TEXT NOT NULL,
+            request_id TEXT,
+            idempotency_key TEXT,
+            event JSONB NOT NULL,
+            deal_id TEXT,
+            run_id TEXT,
+            PRIMARY KEY (event_id, occurred_at)
+        ) PARTITION BY RANGE (occurred_at);
+
+        CREATE TABLE audit_events_default
+            PARTITION OF audit_events_partitioned DEFAULT;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION idis_ensure_audit_events_partition(month_start DATE)
+        RETURNS TEXT
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $$
+        DECLARE
+            lower_bound TIMESTAMPTZ :=
+                date_trunc('month', month_start)::timestamp AT TIME ZONE 'UTC';
+            upper_bound TIMESTAMPTZ :=
+                (date_trunc('month', month_start) + INTERVAL '1 month')::timestamp
+                AT TIME ZONE 'UTC';
+            partition_name TEXT := 'audit_events_p' || to_char(month_start, 'YYYYMM');
+        BEGIN
+            IF to_regclass(partition_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_events FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, lower_bound, upper_bound
+                );
+            END IF;
+            RETURN partition_name;
+        END;
+        $$;
+
+        REVOKE ALL ON FUNCTION idis_ensure_audit_events_partition(DATE) FROM PUBLIC;
+        """
+    )
+    _grant_partition_upkeep(_app_role())
+
+    # Swap the new parent in under the canonical name before provisioning partitions, so the
+    # helper function (which targets "audit_events") attaches to the partitioned table.
+    op.execute(
+        """
+        ALTER TABLE audit_events RENAME TO audit_events_legacy;
+        ALTER TABLE audit_events_partitioned RENAME TO audit_events;
+        """
+    )
+
+    op.execute(
+        f"""
+        SELECT idis_ensure_audit_events_partition(month_start::date)
+        FROM generate_series(
+            date_trunc(
+                'month',
+                COALESCE(
+                    (SELECT MIN(occurred_at) FROM audit_events_legacy) AT TIME ZONE 'UTC',
+                    now() AT TIME ZONE 'UTC'
+                )
+            ),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '{_MONTHS_AHEAD} months',
+            INTERVAL '1 month'
+        ) AS month_start
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO audit_events (
+            event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key,
+            event, deal_id, run_id
+        )
+        SELECT
+            event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key, event,
+            COALESCE(event->'request'->>'deal_id', event->'resource'->>'deal_id'),
+            COALESCE(
+                event->'request'->>'run_id',
+                event->'resource'->>'run_id',
+                event->'payload'->'safe'->>'run_id'
+            )
+        FROM audit_events_legacy;
+
+        DROP TABLE audit_events_legacy;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE INDEX ix_audit_events_tenant_keyset
+            ON audit_events (tenant_id, occurred_at DESC, event_id DESC)
+            INCLUDE (event_type);
+
+        CREATE INDEX ix_audit_events_tenant_deal_keyset
+            ON audit_events (tenant_id, deal_id, occurred_at DESC, event_id DESC)
+            INCLUDE (event_type)
+            WHERE deal_id IS NOT NULL;
+
+        CREATE INDEX ix_audit_events_tenant_run_keyset
+            ON audit_events (tenant_id, run_id, occurred_at DESC, event_id DESC)
+            INCLUDE (event_type)
+            WHERE run_id IS NOT NULL;
+
+        CREATE INDEX ix_audit_events_tenant_type_keyset
+            ON audit_events (tenant_id, event_type, occurred_at DESC, event_id DESC);
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE audit_events ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE audit_events FORCE ROW LEVEL SECURITY;
+
+        CREATE POLICY audit_events_tenant_isolation
+            ON audit_events
+            USING (
+                NULLIF(current_setting('idis.tenant_id', true), '') IS NOT NULL
+                AND tenant_id = NULLIF(current_setting('idis.tenant_id', true), '')::uuid
+            )
+            WITH CHECK (
+                NULLIF(current_setting('idis.tenant_id', true), '') IS NOT NULL
+                AND tenant_id = NULLIF(current_setting('idis.tenant_id', true), '')::uuid
+            );
+
+        CREATE TRIGGER audit_events_immutability
+            BEFORE UPDATE OR DELETE ON audit_events
+            FOR EACH ROW EXECUTE FUNCTION idis_reject_audit_mutation();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE audit_events_unpartitioned (
+            event_id UUID PRIMARY KEY,
+            tenant_id UUID NOT NULL,
+            occurred_at TIMESTAMPTZ NOT NULL,
+            event_type TEXT NOT NULL,
+            request_id TEXT,
+            idempotency_key TEXT,
+            event JSONB NOT NULL
+        );
+
+        INSERT INTO audit_events_unpartitioned
+            (event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key, event)
+        SELECT event_id, tenant_id, occurred_at, event_type, request_id, idempotency_key, event
+        FROM audit_events;
+
+        DROP TABLE audit_events CASCADE;
+        DROP FUNCTION IF EXISTS idis_ensure_audit_events_partition(DATE);
+        ALTER TABLE audit_events_unpartitioned RENAME TO audit_events;
+
+        CREATE INDEX IF NOT EXISTS ix_audit_events_tenant_id ON audit_events (tenant_id);
+        CREATE INDEX IF NOT EXISTS ix_audit_events_occurred_at ON audit_events (occurred_at);
+        CREATE INDEX IF NOT EXISTS ix_audit_events_event_type ON audit_events (event_type);
+
+        ALTER TABLE audit_events ENABLE ROW LEVEL SECURITY;
+        ALTER TABLE audit_events FORCE ROW LEVEL SECURITY;
+
+        CREATE POLICY audit_events_tenant_isolation ON audit_events
+            USING (tenant_id = NULLIF(current_setting('idis.tenant_id', true), '')::uuid)
+            WITH CHECK (tenant_id = NULLIF(current_setting('idis.tenant_id', true), '')::uuid);
+
+        CREATE TRIGGER audit_events_immutability
+            BEFORE UPDATE OR DELETE ON audit_events
+            FOR EACH ROW EXECUTE FUNCTION idis_reject_audit_mutation();
+        """
+    )
@@ -0,0 +1,44 @@
+"""Keyset indexes on (tenant_id, deal_id, changed_at, id) for the bulk export endpoint.
+
+Revision ID: 0032
+Revises: 0031
+Create Date: 2026-10-18
+
+``GET /v1/deals/{dealId}/export/{entity}`` streams a deal's claims, sanads or defects ordered
+by (changed_at, id), optionally filtered to ``changed_at >= updated_since`` for incremental
+sync, where ``changed_at = COALESCE(updated_at, created_at)``. ``updated_at`` is NULL until
+a row is first updated, so a plain ``updated_at`` index would miss every never-updated row;
+indexing the COALESCE expression keeps the filter and the ORDER BY a single index range scan
+per deal. The id column is the keyset tie-breaker.
+
+Built with CREATE INDEX (not CONCURRENTLY) because alembic runs each migration in a
+transaction; on large installations build them concurrently ahead of the upgrade.
+"""
+
+from alembic import op
+
+revision = "0032"
+down_revision = "0031"
+branch_labels = None
+depends_on = None
+
+_EXPORT_TABLES = (
+    ("claims", "claim_id"),
+    ("sanads", "sanad_id"),
+    ("defects", "defect_id"),
+)
+
+
+def upgrade() -> None:
+    for table, id_column in _EXPORT_TABLES:
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_{table}_tenant_deal_changed
+            ON {table} (tenant_id, deal_id, (COALESCE(updated_at, created_at)), {id_column})
+            """
+        )
+
+
+def downgrade() -> None:
+    for table, _ in _EXPORT_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_tenant_deal_changed")
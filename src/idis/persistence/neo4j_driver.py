@@ -7,6 +7,7 @@ Environment Variables:
     NEO4J_URI: Neo4j connection URI (bolt:// or neo4j+s://)
     NEO4J_USERNAME: Neo4j username
     NEO4J_PASSWORD: Neo4j password
+    IDIS_NEO4J_WRITE_BATCH_SIZE: Rows per UNWIND write transaction (default: 1000)
 
 Design Requirements (v6.3 Data Model §4):
     - No Tenant node; tenant isolation via tenant_id property on every node
@@ -18,11 +19,11 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from enum import StrEnum
 from typing import Any
 
-from neo4j import Driver, GraphDatabase, Session
+from neo4j import Driver, GraphDatabase, ManagedTransaction, Session
 from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,9 @@ NEO4J_URI_ENV = "NEO4J_URI"
 NEO4J_USERNAME_ENV = "NEO4J_USERNAME"
 NEO4J_PASSWORD_ENV = "NEO4J_PASSWORD"
 NEO4J_DATABASE_ENV = "NEO4J_DATABASE"
+NEO4J_WRITE_BATCH_SIZE_ENV = "IDIS_NEO4J_WRITE_BATCH_SIZE"
+
+DEFAULT_WRITE_BATCH_SIZE = 1000
 
 _driver: Driver | None = None
 
@@ -333,6 +337,84 @@ def execute_write(
         return [dict(record) for record in result]
 
 
+def get_write_batch_size() -> int:
+    """Return the configured UNWIND batch size for projection writes.
+
+    Returns:
+        IDIS_NEO4J_WRITE_BATCH_SIZE if set, else DEFAULT_WRITE_BATCH_SIZE.
+
+    Raises:
+        Neo4jConfigError: If the value is not a positive integer.
+    """
+    raw = os.environ.get(NEO4J_WRITE_BATCH_SIZE_ENV, "").strip()
+    if not raw:
+        return DEFAULT_WRITE_BATCH_SIZE
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise Neo4jConfigError(
+            f"{NEO4J_WRITE_BATCH_SIZE_ENV} must be a positive integer, got '{raw}'"
+        ) from exc
+    if value <= 0:
+        raise Neo4jConfigError(f"{NEO4J_WRITE_BATCH_SIZE_ENV} must be positive, got {value}")
+    return value
+
+
+def _run_unwind_batch(tx: ManagedTransaction, query: str, parameters: dict[str, Any]) -> None:
+    tx.run(query, parameters).consume()
+
+
+def execute_write_unwind(
+    statements: Sequence[tuple[str, Sequence[dict[str, Any]]]],
+    parameters: dict[str, Any],
+    *,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    database: str = "neo4j",
+) -> int:
+    """Execute ``UNWIND $rows`` write statements in batched write transactions.
+
+    Statements run in order on one session. Each statement's rows are split into chunks of
+    ``batch_size`` and every chunk is written in its own managed write transaction (retried by
+    the driver on transient errors), so a projection costs one round-trip per chunk instead of
+    one per node or edge. Statements with no rows are skipped.
+
+    Args:
+        statements: (query, rows) pairs. Each query must read its rows from ``$rows``.
+        parameters: Parameters shared by every statement (must include tenant_id).
+        batch_size: Maximum rows per transaction.
+        database: Neo4j database name.
+
+    Returns:
+        Number of write transactions committed.
+
+    Raises:
+        Neo4jConfigError: If Neo4j is not configured.
+        ValueError: If tenant_id is missing, a query does not UNWIND $rows, or
+            batch_size is not positive.
+    """
+    if "tenant_id" not in parameters:
+        raise ValueError(
+            "tenant_id is required in all Neo4j query parameters. "
+            "Tenant isolation is enforced at the driver level."
+        )
+    if "rows" in parameters:
+        raise ValueError("'rows' is reserved for the UNWIND batch and cannot be a shared parameter")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    for query, _rows in statements:
+        if "UNWIND $rows" not in query:
+            raise ValueError("Batched write statements must UNWIND $rows")
+
+    transactions = 0
+    with get_session(database=database) as session:
+        for query, rows in statements:
+            for start in range(0, len(rows), batch_size):
+                chunk = list(rows[start : start + batch_size])
+                session.execute_write(_run_unwind_batch, query, {**parameters, "rows": chunk})
+                transactions += 1
+    return transactions
+
+
 def reset_driver_for_testing() -> None:
     """Reset the singleton driver. For test use only."""
     global _driver  # noqa: PLW0603
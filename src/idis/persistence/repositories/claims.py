@@ -5,20 +5,54 @@ Provides tenant-scoped CRUD operations for claims, sanads, and defects with RLS
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import json
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from sqlalchemy import text
 
-from idis.persistence.db import set_tenant_local
+from idis.persistence.db import execute_prepared, set_tenant_local
 
 if TYPE_CHECKING:
     from sqlalchemy import Connection
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT/UPDATE (keeps bind parameter counts well below driver limits).
+MAX_ROWS_PER_STATEMENT: Final[int] = 500
+
+
+def _chunked(rows: Sequence[dict[str, Any]]) -> Iterator[Sequence[dict[str, Any]]]:
+    """Yield ``rows`` in chunks of at most MAX_ROWS_PER_STATEMENT."""
+    for start in range(0, len(rows), MAX_ROWS_PER_STATEMENT):
+        yield rows[start : start + MAX_ROWS_PER_STATEMENT]
+
+
+def _multi_row_values(
+    templates: Sequence[str], chunk: Sequence[dict[str, Any]]
+) -> tuple[str, dict[str, Any]]:
+    """Build a VALUES list and its bind parameters for a chunk of rows.
+
+    Args:
+        templates: One SQL expression per column; ``{col}`` is replaced by the row's
+            indexed bind parameter (e.g. ``CAST({computed} AS JSONB)``).
+        chunk: Row dicts keyed by column name.
+
+    Returns:
+        Tuple of (``(...), (...)`` VALUES SQL, bind parameters).
+    """
+    params: dict[str, Any] = {}
+    tuples: list[str] = []
+    for index, row in enumerate(chunk):
+        names = {column: f":{column}_{index}" for column in row}
+        tuples.append("(" + ", ".join(t.format(**names) for t in templates) + ")")
+        params.update({f"{column}_{index}": value for column, value in row.items()})
+    return ",\n".join(tuples), params
+
 
 class ClaimNotFoundError(Exception):
     """Raised when a claim is not found."""
@@ -125,6 +159,36 @@ class ClaimsRepository:
 
     def get(self, claim_id: str) -> dict[str, Any] | None:
         """Get a claim by ID."""
+        result = execute_prepared(
+            self._conn,
+            "idis_claims_get",
+            """
+            SELECT claim_id, tenant_id, deal_id, claim_class, claim_text,
+                   predicate, value, sanad_id, claim_grade, corroboration,
+                   claim_verdict, claim_action, defect_ids, materiality,
+                   ic_bound, primary_span_id, created_at, updated_at
+            FROM claims
+            WHERE claim_id = :claim_id
+            """,
+            {"claim_id": claim_id},
+        ).fetchone()
+
+        if result is None:
+            return None
+
+        return self._row_to_dict(result)
+
+    def get_many(self, claim_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get many claims in one query.
+
+        Args:
+            claim_ids: Claim UUIDs (duplicates allowed).
+
+        Returns:
+            Mapping of claim_id to claim dict; IDs not visible to the tenant are absent.
+        """
+        if not claim_ids:
+            return {}
         result = self._conn.execute(
             text(
                 """
@@ -133,16 +197,13 @@ class ClaimsRepository:
                        claim_verdict, claim_action, defect_ids, materiality,
                        ic_bound, primary_span_id, created_at, updated_at
                 FROM claims
-                WHERE claim_id = :claim_id
+                WHERE claim_id = ANY(CAST(:claim_ids AS UUID[]))
                 """
             ),
-            {"claim_id": claim_id},
-        ).fetchone()
-
-        if result is None:
-            return None
-
-        return self._row_to_dict(result)
+            {"claim_ids": list(dict.fromkeys(claim_ids))},
+        ).fetchall()
+        claims = (self._row_to_dict(row) for row in result)
+        return {claim["claim_id"]: claim for claim in claims}
 
     def list_by_deal(
         self,
@@ -154,35 +215,35 @@ class ClaimsRepository:
         effective_limit = min(max(1, limit), 200)
 
         if cursor:
-            result = self._conn.execute(
-                text(
-                    """
-                    SELECT claim_id, tenant_id, deal_id, claim_class, claim_text,
-                           predicate, value, sanad_id, claim_grade, corroboration,
-                           claim_verdict, claim_action, defect_ids, materiality,
-                           ic_bound, primary_span_id, created_at, updated_at
-                    FROM claims
-                    WHERE deal_id = :deal_id AND claim_id > :cursor
-                    ORDER BY claim_id
-                    LIMIT :limit
-                    """
-                ),
+            result = execute_prepared(
+                self._conn,
+                "idis_claims_list_by_deal_after",
+                """
+                SELECT claim_id, tenant_id, deal_id, claim_class, claim_text,
+                       predicate, value, sanad_id, claim_grade, corroboration,
+                       claim_verdict, claim_action, defect_ids, materiality,
+                       ic_bound, primary_span_id, created_at, updated_at
+                FROM claims
+                WHERE deal_id = :deal_id AND claim_id > :cursor
+                ORDER BY claim_id
+                LIMIT :limit
+                """,
                 {"deal_id": deal_id, "cursor": cursor, "limit": effective_limit + 1},
             ).fetchall()
         else:
-            result = self._conn.execute(
-                text(
-                    """
-                    SELECT claim_id, tenant_id, deal_id, claim_class, claim_text,
-                           predicate, value, sanad_id, claim_grade, corroboration,
-                           claim_verdict, claim_action, defect_ids, materiality,
-                           ic_bound, primary_span_id, created_at, updated_at
-                    FROM claims
-                    WHERE deal_id = :deal_id
-                    ORDER BY claim_id
-                    LIMIT :limit
-                    """
-                ),
+            result = execute_prepared(
+                self._conn,
+                "idis_claims_list_by_deal",
+                """
+                SELECT claim_id, tenant_id, deal_id, claim_class, claim_text,
+                       predicate, value, sanad_id, claim_grade, corroboration,
+                       claim_verdict, claim_action, defect_ids, materiality,
+                       ic_bound, primary_span_id, created_at, updated_at
+                FROM claims
+                WHERE deal_id = :deal_id
+                ORDER BY claim_id
+                LIMIT :limit
+                """,
                 {"deal_id": deal_id, "limit": effective_limit + 1},
             ).fetchall()
 
@@ -222,6 +283,40 @@ class ClaimsRepository:
         sql = f"UPDATE claims SET {', '.join(sets)} WHERE claim_id = :claim_id"
         self._conn.execute(text(sql), params)
 
+    def update_grades(self, updates: Sequence[tuple[str, str | None, str | None]]) -> None:
+        """Apply many ``update_grade`` calls with multi-row UPDATE statements.
+
+        None leaves the column unchanged, as in ``update_grade``.
+
+        Args:
+            updates: (claim_id, claim_grade, sanad_id) tuples.
+        """
+        rows = [
+            {"claim_id": claim_id, "claim_grade": grade, "sanad_id": sanad_id}
+            for claim_id, grade, sanad_id in updates
+            if grade is not None or sanad_id is not None
+        ]
+        templates = (
+            "CAST({claim_id} AS UUID)",
+            "CAST({claim_grade} AS TEXT)",
+            "CAST({sanad_id} AS UUID)",
+        )
+        for chunk in _chunked(rows):
+            values, params = _multi_row_values(templates, chunk)
+            self._conn.execute(
+                text(
+                    f"""
+                    UPDATE claims AS c SET
+                        claim_grade = COALESCE(v.claim_grade, c.claim_grade),
+                        sanad_id = COALESCE(v.sanad_id, c.sanad_id),
+                        updated_at = NOW()
+                    FROM (VALUES {values}) AS v (claim_id, claim_grade, sanad_id)
+                    WHERE c.claim_id = v.claim_id
+                    """
+                ),
+                params,
+            )
+
     def delete(self, claim_id: str) -> bool:
         """Delete a claim by ID."""
         result = self._conn.execute(
@@ -340,18 +435,83 @@ class SanadsRepository:
             "updated_at": None,
         }
 
+    def create_many(self, sanads: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create many sanads with multi-row INSERT statements.
+
+        Args:
+            sanads: Dicts with the keyword arguments of ``create``.
+
+        Returns:
+            Created sanad dicts, in input order.
+        """
+        now = datetime.now(UTC)
+        created = [
+            {
+                "sanad_id": s["sanad_id"],
+                "tenant_id": self._tenant_id,
+                "claim_id": s["claim_id"],
+                "deal_id": s["deal_id"],
+                "primary_evidence_id": s["primary_evidence_id"],
+                "corroborating_evidence_ids": s.get("corroborating_evidence_ids") or [],
+                "transmission_chain": s.get("transmission_chain") or [],
+                "computed": s.get("computed") or {},
+                "created_at": now.isoformat().replace("+00:00", "Z"),
+                "updated_at": None,
+            }
+            for s in sanads
+        ]
+        rows = [
+            {
+                "sanad_id": s["sanad_id"],
+                "claim_id": s["claim_id"],
+                "deal_id": s["deal_id"],
+                "primary_evidence_id": s["primary_evidence_id"],
+                "corroborating_evidence_ids": json.dumps(s["corroborating_evidence_ids"]),
+                "transmission_chain": json.dumps(s["transmission_chain"]),
+                "computed": json.dumps(s["computed"]),
+            }
+            for s in created
+        ]
+        templates = (
+            "{sanad_id}",
+            ":tenant_id",
+            "{claim_id}",
+            "{deal_id}",
+            "{primary_evidence_id}",
+            "CAST({corroborating_evidence_ids} AS JSONB)",
+            "CAST({transmission_chain} AS JSONB)",
+            "CAST({computed} AS JSONB)",
+            ":created_at",
+            "NULL",
+        )
+        for chunk in _chunked(rows):
+            values, params = _multi_row_values(templates, chunk)
+            self._conn.execute(
+                text(
+                    f"""
+                    INSERT INTO sanads (
+                        sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
+                        corroborating_evidence_ids, transmission_chain, computed,
+                        created_at, updated_at
+                    ) VALUES {values}
+                    """
+                ),
+                {**params, "tenant_id": self._tenant_id, "created_at": now},
+            )
+        return created
+
     def get(self, sanad_id: str) -> dict[str, Any] | None:
         """Get a sanad by ID."""
-        result = self._conn.execute(
-            text(
-                """
-                SELECT sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
-                       corroborating_evidence_ids, transmission_chain, computed,
-                       created_at, updated_at
-                FROM sanads
-                WHERE sanad_id = :sanad_id
-                """
-            ),
+        result = execute_prepared(
+            self._conn,
+            "idis_sanads_get",
+            """
+            SELECT sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
+                   corroborating_evidence_ids, transmission_chain, computed,
+                   created_at, updated_at
+            FROM sanads
+            WHERE sanad_id = :sanad_id
+            """,
             {"sanad_id": sanad_id},
         ).fetchone()
 
@@ -362,23 +522,51 @@ class SanadsRepository:
 
     def get_by_claim(self, claim_id: str) -> dict[str, Any] | None:
         """Get sanad by claim ID."""
+        result = execute_prepared(
+            self._conn,
+            "idis_sanads_get_by_claim",
+            """
+            SELECT sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
+                   corroborating_evidence_ids, transmission_chain, computed,
+                   created_at, updated_at
+            FROM sanads
+            WHERE claim_id = :claim_id
+            """,
+            {"claim_id": claim_id},
+        ).fetchone()
+
+        if result is None:
+            return None
+
+        return self._row_to_dict(result)
+
+    def get_latest_by_claims(self, claim_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get the most recently created sanad of many claims in one query.
+
+        Args:
+            claim_ids: Claim UUIDs.
+
+        Returns:
+            Mapping of claim_id to its latest sanad; claims without a sanad are omitted.
+        """
+        if not claim_ids:
+            return {}
         result = self._conn.execute(
             text(
                 """
-                SELECT sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
+                SELECT DISTINCT ON (claim_id)
+                       sanad_id, tenant_id, claim_id, deal_id, primary_evidence_id,
                        corroborating_evidence_ids, transmission_chain, computed,
                        created_at, updated_at
                 FROM sanads
-                WHERE claim_id = :claim_id
+                WHERE claim_id = ANY(CAST(:claim_ids AS UUID[]))
+                ORDER BY claim_id, created_at DESC, sanad_id DESC
                 """
             ),
-            {"claim_id": claim_id},
-        ).fetchone()
-
-        if result is None:
-            return None
-
-        return self._row_to_dict(result)
+            {"claim_ids": list(dict.fromkeys(claim_ids))},
+        ).fetchall()
+        sanads = (self._row_to_dict(row) for row in result)
+        return {sanad["claim_id"]: sanad for sanad in sanads}
 
     def update(
         self,
@@ -599,6 +787,123 @@ class DefectsRepository:
             "updated_at": None,
         }
 
+    def create_many(self, defects: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create many defects with multi-row INSERT statements.
+
+        Args:
+            defects: Dicts with the keyword arguments of ``create``.
+
+        Returns:
+            Created defect dicts, in input order.
+        """
+        now = datetime.now(UTC)
+        created = [
+            {
+                "defect_id": d["defect_id"],
+                "tenant_id": self._tenant_id,
+                "claim_id": d.get("claim_id"),
+                "deal_id": d.get("deal_id"),
+                "defect_type": d["defect_type"],
+                "severity": d["severity"],
+                "description": d["description"],
+                "cure_protocol": d["cure_protocol"],
+                "status": d.get("status", "OPEN"),
+                "waiver_reason": d.get("waiver_reason"),
+                "waived_by": d.get("waived_by"),
+                "cured_by": d.get("cured_by"),
+                "cured_reason": d.get("cured_reason"),
+                "waived": False,
+                "waived_at": None,
+                "cured_at": None,
+                "created_at": now.isoformat().replace("+00:00", "Z"),
+                "updated_at": None,
+            }
+            for d in defects
+        ]
+        columns = (
+            "defect_id",
+            "claim_id",
+            "deal_id",
+            "defect_type",
+            "severity",
+            "description",
+            "cure_protocol",
+            "status",
+            "waiver_reason",
+            "waived_by",
+            "cured_by",
+            "cured_reason",
+        )
+        rows = [{column: d[column] for column in columns} for d in created]
+        templates = (
+            "{defect_id}",
+            ":tenant_id",
+            *(f"{{{column}}}" for column in columns[1:]),
+            "FALSE",
+            "NULL",
+            "NULL",
+            ":created_at",
+            "NULL",
+        )
+        for chunk in _chunked(rows):
+            values, params = _multi_row_values(templates, chunk)
+            self._conn.execute(
+                text(
+                    f"""
+                    INSERT INTO defects (
+                        defect_id, tenant_id, claim_id, deal_id, defect_type, severity,
+                        description, cure_protocol, status, waiver_reason, waived_by,
+                        cured_by, cured_reason, waived, waived_at, cured_at,
+                        created_at, updated_at
+                    ) VALUES {values}
+                    """
+                ),
+                {**params, "tenant_id": self._tenant_id, "created_at": now},
+            )
+        return created
+
+    def list_by_claims(
+        self, claim_ids: Sequence[str], limit: int = 50
+    ) -> dict[str, list[dict[str, Any]]]:
+        """List the first ``limit`` defects of many claims in one query.
+
+        Each claim's list matches the first page of ``list_by_claim(claim_id, limit)``.
+
+        Args:
+            claim_ids: Claim UUIDs.
+            limit: Maximum defects per claim.
+
+        Returns:
+            Mapping of every requested claim_id to its defects (empty list when none).
+        """
+        by_claim: dict[str, list[dict[str, Any]]] = {claim_id: [] for claim_id in claim_ids}
+        if not by_claim:
+            return by_claim
+        result = self._conn.execute(
+            text(
+                """
+                SELECT defect_id, tenant_id, claim_id, deal_id, defect_type, severity,
+                       description, cure_protocol, status, waiver_reason, waived_by,
+                       cured_by, cured_reason, waived, waived_at, cured_at,
+                       created_at, updated_at
+                FROM (
+                    SELECT d.*, ROW_NUMBER() OVER (
+                        PARTITION BY d.claim_id ORDER BY d.defect_id
+                    ) AS claim_rank
+                    FROM defects d
+                    WHERE d.claim_id = ANY(CAST(:claim_ids AS UUID[]))
+                ) ranked
+                WHERE claim_rank <= :limit
+                ORDER BY claim_id, defect_id
+                """
+            ),
+            {"claim_ids": list(by_claim), "limit": min(max(1, limit), 200)},
+        ).fetchall()
+        for row in result:
+            defect = self._row_to_dict(row)
+            by_claim[defect["claim_id"]].append(defect)
+        return by_claim
+
     def get(self, defect_id: str) -> dict[str, Any] | None:
         """Get a defect by ID."""
         result = self._conn.execute(
@@ -859,10 +1164,138 @@ class DefectsRepository:
         }
 
 
-_claims_in_memory_store: dict[str, dict[str, Any]] = {}
-_sanad_in_memory_store: dict[str, dict[str, Any]] = {}
-_defects_in_memory_store: dict[str, dict[str, Any]] = {}
-_evidence_in_memory_store: dict[str, dict[str, Any]] = {}
+_IndexKey = tuple[str, str]
+
+
+class _IndexedStore(dict[str, dict[str, Any]]):
+    """In-memory record store with maintained secondary indexes.
+
+    Each indexed field maps (tenant_id, field value) to the ids of matching records as a
+    sorted list, so listing a deal or claim is a bisect into that list instead of a scan of
+    the whole store. The indexes are updated by every dict mutation (including direct
+    ``store[id] = record`` writes and ``clear()``), so callers that bypass the repositories
+    stay consistent. Indexed fields must not be mutated in place on a stored record.
+    """
+
+    def __init__(self, *fields: str) -> None:
+        super().__init__()
+        self._indexes: dict[str, dict[_IndexKey, list[str]]] = {f: {} for f in fields}
+        self._order: dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def __setitem__(self, record_id: str, record: dict[str, Any]) -> None:
+        if record_id in self:
+            self._unindex(record_id, self[record_id])
+        else:
+            self._order[record_id] = next(self._counter)
+        super().__setitem__(record_id, record)
+        self._index(record_id, record)
+
+    def __delitem__(self, record_id: str) -> None:
+        record = self[record_id]
+        super().__delitem__(record_id)
+        self._unindex(record_id, record)
+        del self._order[record_id]
+
+    def pop(self, record_id: str, *default: Any) -> Any:
+        if record_id not in self:
+            return super().pop(record_id, *default)
+        record = self[record_id]
+        del self[record_id]
+        return record
+
+    def popitem(self) -> tuple[str, dict[str, Any]]:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        record_id = next(reversed(self))
+        return record_id, self.pop(record_id)
+
+    def setdefault(self, record_id: str, default: Any = None) -> Any:
+        if record_id not in self:
+            self[record_id] = default
+        return self[record_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for record_id, record in dict(*args, **kwargs).items():
+            self[record_id] = record
+
+    def __ior__(self, other: Any) -> _IndexedStore:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._order.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def _keys(self, record: dict[str, Any]) -> Iterator[tuple[str, _IndexKey]]:
+        tenant_id = record.get("tenant_id")
+        if tenant_id is None:
+            return
+        for field in self._indexes:
+            value = record.get(field)
+            if value is not None:
+                yield field, (tenant_id, value)
+
+    def _index(self, record_id: str, record: dict[str, Any]) -> None:
+        for field, key in self._keys(record):
+            bisect.insort(self._indexes[field].setdefault(key, []), record_id)
+
+    def _unindex(self, record_id: str, record: dict[str, Any]) -> None:
+        for field, key in self._keys(record):
+            ids = self._indexes[field].get(key)
+            if ids is None:
+                continue
+            pos = bisect.bisect_left(ids, record_id)
+            if pos < len(ids) and ids[pos] == record_id:
+                del ids[pos]
+            if not ids:
+                del self._indexes[field][key]
+
+    def ids(self, field: str, tenant_id: str, value: str) -> Sequence[str]:
+        """Sorted ids of the tenant's records whose ``field`` equals ``value`` (read-only)."""
+        return self._indexes[field].get((tenant_id, value), [])
+
+    def records(self, field: str, tenant_id: str, value: str) -> list[dict[str, Any]]:
+        """Matching records in store insertion order (the order a full scan would yield)."""
+        matched = sorted(self.ids(field, tenant_id, value), key=self._order.__getitem__)
+        return [self[record_id] for record_id in matched]
+
+    def page(
+        self,
+        field: str,
+        tenant_id: str,
+        value: str,
+        limit: int,
+        cursor: str | None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Cursor page over matching records ordered by id, in O(log n + limit).
+
+        Args:
+            field: Indexed field name.
+            tenant_id: Tenant scope.
+            value: Field value to match.
+            limit: Page size, clamped to 1..200.
+            cursor: Last id of the previous page (exclusive), or None.
+
+        Returns:
+            Tuple of (records, next_cursor); next_cursor is None on the last page.
+        """
+        ids = self.ids(field, tenant_id, value)
+        start = bisect.bisect_right(ids, cursor) if cursor else 0
+        effective_limit = min(max(1, limit), 200)
+        page_ids = ids[start : start + effective_limit]
+        next_cursor = None
+        if start + effective_limit < len(ids):
+            next_cursor = page_ids[-1]
+        return [self[record_id] for record_id in page_ids], next_cursor
+
+
+_claims_in_memory_store = _IndexedStore("deal_id")
+_sanad_in_memory_store = _IndexedStore("deal_id", "claim_id")
+_defects_in_memory_store = _IndexedStore("deal_id", "claim_id")
+_evidence_in_memory_store = _IndexedStore("claim_id")
 
 
 class InMemoryClaimsRepository:
@@ -926,31 +1359,19 @@ class InMemoryClaimsRepository:
             return None
         return claim
 
+    def get_many(self, claim_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get many claims from memory (see ``ClaimsRepository.get_many``)."""
+        claims = ((claim_id, self.get(claim_id)) for claim_id in claim_ids)
+        return {claim_id: claim for claim_id, claim in claims if claim is not None}
+
     def list_by_deal(
         self,
         deal_id: str,
         limit: int = 50,
         cursor: str | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
-        """List claims for a deal from memory."""
-        claims = [
-            c
-            for c in _claims_in_memory_store.values()
-            if c.get("tenant_id") == self._tenant_id and c.get("deal_id") == deal_id
-        ]
-        claims.sort(key=lambda x: x["claim_id"])
-
-        if cursor:
-            claims = [c for c in claims if c["claim_id"] > cursor]
-
-        effective_limit = min(max(1, limit), 200)
-        items = claims[:effective_limit]
-
-        next_cursor = None
-        if len(claims) > effective_limit:
-            next_cursor = items[-1]["claim_id"]
-
-        return items, next_cursor
+        """List claims for a deal from memory (bisect over the deal index)."""
+        return _claims_in_memory_store.page("deal_id", self._tenant_id, deal_id, limit, cursor)
 
     def update_grade(
         self,
@@ -974,6 +1395,15 @@ class InMemoryClaimsRepository:
         if sanad_id is not None:
             claim["sanad_id"] = sanad_id
 
+    def update_grades(self, updates: Sequence[tuple[str, str | None, str | None]]) -> None:
+        """Apply many ``update_grade`` calls in memory.
+
+        Args:
+            updates: (claim_id, claim_grade, sanad_id) tuples.
+        """
+        for claim_id, claim_grade, sanad_id in updates:
+            self.update_grade(claim_id, claim_grade=claim_grade, sanad_id=sanad_id)
+
     def delete(self, claim_id: str) -> bool:
         """Delete a claim from memory."""
         claim = _claims_in_memory_store.get(claim_id)
@@ -1027,10 +1457,21 @@ class InMemorySanadsRepository:
 
     def get_by_claim(self, claim_id: str) -> dict[str, Any] | None:
         """Get sanad by claim ID from memory."""
-        for sanad in _sanad_in_memory_store.values():
-            if sanad.get("claim_id") == claim_id and sanad.get("tenant_id") == self._tenant_id:
-                return sanad
-        return None
+        sanads = _sanad_in_memory_store.records("claim_id", self._tenant_id, claim_id)
+        return sanads[0] if sanads else None
+
+    def get_latest_by_claims(self, claim_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get the most recently created sanad of many claims (see ``SanadsRepository``)."""
+        latest: dict[str, dict[str, Any]] = {}
+        for claim_id in claim_ids:
+            sanads = _sanad_in_memory_store.records("claim_id", self._tenant_id, claim_id)
+            if sanads:
+                latest[claim_id] = sanads[-1]
+        return latest
+
+    def create_many(self, sanads: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create many sanads in memory (see ``SanadsRepository.create_many``)."""
+        return [self.create(**sanad) for sanad in sanads]
 
     def update(
         self,
@@ -1063,25 +1504,8 @@ class InMemorySanadsRepository:
         limit: int = 50,
         cursor: str | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
-        """List sanads for a deal from memory."""
-        sanads = [
-            s
-            for s in _sanad_in_memory_store.values()
-            if s.get("tenant_id") == self._tenant_id and s.get("deal_id") == deal_id
-        ]
-        sanads.sort(key=lambda x: x["sanad_id"])
-
-        if cursor:
-            sanads = [s for s in sanads if s["sanad_id"] > cursor]
-
-        effective_limit = min(max(1, limit), 200)
-        items = sanads[:effective_limit]
-
-        next_cursor = None
-        if len(sanads) > effective_limit:
-            next_cursor = items[-1]["sanad_id"]
-
-        return items, next_cursor
+        """List sanads for a deal from memory (bisect over the deal index)."""
+        return _sanad_in_memory_store.page("deal_id", self._tenant_id, deal_id, limit, cursor)
 
 
 class InMemoryDefectsRepository:
@@ -1132,6 +1556,21 @@ class InMemoryDefectsRepository:
         _defects_in_memory_store[defect_id] = defect
         return defect
 
+    def create_many(self, defects: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create many defects in memory (see ``DefectsRepository.create_many``)."""
+        return [self.create(**defect) for defect in defects]
+
+    def list_by_claims(
+        self, claim_ids: Sequence[str], limit: int = 50
+    ) -> dict[str, list[dict[str, Any]]]:
+        """List the first ``limit`` defects of many claims from the claim index."""
+        return {
+            claim_id: _defects_in_memory_store.page(
+                "claim_id", self._tenant_id, claim_id, limit, None
+            )[0]
+            for claim_id in claim_ids
+        }
+
     def get(self, defect_id: str) -> dict[str, Any] | None:
         """Get a defect by ID from memory."""
         defect = _defects_in_memory_store.get(defect_id)
@@ -1145,25 +1584,8 @@ class InMemoryDefectsRepository:
         limit: int = 50,
         cursor: str | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
-        """List defects for a claim from memory."""
-        defects = [
-            d
-            for d in _defects_in_memory_store.values()
-            if d.get("tenant_id") == self._tenant_id and d.get("claim_id") == claim_id
-        ]
-        defects.sort(key=lambda x: x["defect_id"])
-
-        if cursor:
-            defects = [d for d in defects if d["defect_id"] > cursor]
-
-        effective_limit = min(max(1, limit), 200)
-        items = defects[:effective_limit]
-
-        next_cursor = None
-        if len(defects) > effective_limit:
-            next_cursor = items[-1]["defect_id"]
-
-        return items, next_cursor
+        """List defects for a claim from memory (bisect over the claim index)."""
+        return _defects_in_memory_store.page("claim_id", self._tenant_id, claim_id, limit, cursor)
 
     def list_by_deal(
         self,
@@ -1171,25 +1593,8 @@ class InMemoryDefectsRepository:
         limit: int = 50,
         cursor: str | None = None,
     ) -> tuple[list[dict[str, Any]], str | None]:
-        """List defects for a deal from memory."""
-        defects = [
-            d
-            for d in _defects_in_memory_store.values()
-            if d.get("tenant_id") == self._tenant_id and d.get("deal_id") == deal_id
-        ]
-        defects.sort(key=lambda x: x["defect_id"])
-
-        if cursor:
-            defects = [d for d in defects if d["defect_id"] > cursor]
-
-        effective_limit = min(max(1, limit), 200)
-        items = defects[:effective_limit]
-
-        next_cursor = None
-        if len(defects) > effective_limit:
-            next_cursor = items[-1]["defect_id"]
-
-        return items, next_cursor
+        """List defects for a deal from memory (bisect over the deal index)."""
+        return _defects_in_memory_store.page("deal_id", self._tenant_id, deal_id, limit, cursor)
 
     def update(
         self,
@@ -1352,8 +1757,18 @@ class InMemoryEvidenceRepository:
         Returns:
             List of evidence dicts for this claim and tenant.
         """
-        return [
-            ev
-            for ev in _evidence_in_memory_store.values()
-            if ev.get("claim_id") == claim_id and ev.get("tenant_id") == self._tenant_id
-        ]
+        return _evidence_in_memory_store.records("claim_id", self._tenant_id, claim_id)
+
+    def get_by_claims(self, claim_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get evidence items for many claims from the claim index.
+
+        Args:
+            claim_ids: Parent claim UUIDs.
+
+        Returns:
+            Mapping of every requested claim_id to its evidence (``get_by_claim`` order).
+        """
+        return {
+            claim_id: _evidence_in_memory_store.records("claim_id", self._tenant_id, claim_id)
+            for claim_id in claim_ids
+        }
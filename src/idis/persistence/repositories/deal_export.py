@@ -0,0 +1,335 @@
+"""Streaming bulk export of a deal's claims, sanads and defects.
+
+``list_by_deal`` pages are capped at 200 rows and select every column, so a warehouse sync that
+walks every deal spends its time in round-trips and row marshalling. An export instead runs
+one statement per entity on a server-side cursor (``yield_per``), optionally projected to a
+subset of columns and filtered to rows changed since ``updated_since``, and rows are encoded
+as NDJSON chunks while they are still being fetched.
+
+Rows are ordered by (changed_at, id) where ``changed_at = COALESCE(updated_at, created_at)``
+(never-updated rows have a NULL updated_at). That is the key of the
+``ix_<table>_tenant_deal_changed`` indexes (migration 0032), so both the incremental filter
+and the ordering are one index range scan and the database never sorts the export.
+``updated_since`` is inclusive: a sync can resume from the last ``changed_at`` it saw and
+upsert the boundary rows again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import text
+
+from idis.persistence.db import set_tenant_local
+from idis.persistence.repositories.claims import (
+    _claims_in_memory_store,
+    _defects_in_memory_store,
+    _IndexedStore,
+    _sanad_in_memory_store,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+EXPORT_YIELD_PER_ENV: Final[str] = "IDIS_EXPORT_YIELD_PER"
+DEFAULT_EXPORT_YIELD_PER: Final[int] = 1000
+
+# Bytes buffered before a chunk is handed to the HTTP layer.
+EXPORT_CHUNK_BYTES: Final[int] = 64 * 1024
+
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+
+
+class ExportConfigError(Exception):
+    """Raised when export configuration is invalid."""
+
+
+class ExportProjectionError(ValueError):
+    """Raised when a requested export column does not exist for the entity."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExportEntity:
+    """An exportable table.
+
+    Attributes:
+        table: Table name.
+        id_column: Primary key column, always included in a projection.
+        columns: Exportable columns in default output order.
+        json_columns: JSONB columns (decoded if the driver returns text).
+    """
+
+    table: str
+    id_column: str
+    columns: tuple[str, ...]
+    json_columns: frozenset[str] = frozenset()
+
+
+EXPORT_ENTITIES: Final[dict[str, ExportEntity]] = {
+    "claims": ExportEntity(
+        table="claims",
+        id_column="claim_id",
+        columns=(
+            "claim_id",
+            "tenant_id",
+            "deal_id",
+            "claim_class",
+            "claim_text",
+            "predicate",
+            "value",
+            "sanad_id",
+            "claim_grade",
+            "corroboration",
+            "claim_verdict",
+            "claim_action",
+            "defect_ids",
+            "materiality",
+            "ic_bound",
+            "primary_span_id",
+            "created_at",
+            "updated_at",
+        ),
+        json_columns=frozenset({"value", "corroboration", "defect_ids"}),
+    ),
+    "sanads": ExportEntity(
+        table="sanads",
+        id_column="sanad_id",
+        columns=(
+            "sanad_id",
+            "tenant_id",
+            "claim_id",
+            "deal_id",
+            "primary_evidence_id",
+            "corroborating_evidence_ids",
+            "transmission_chain",
+            "computed",
+            "created_at",
+            "updated_at",
+        ),
+        json_columns=frozenset({"corroborating_evidence_ids", "transmission_chain", "computed"}),
+    ),
+    "defects": ExportEntity(
+        table="defects",
+        id_column="defect_id",
+        columns=(
+            "defect_id",
+            "tenant_id",
+            "claim_id",
+            "deal_id",
+            "defect_type",
+            "severity",
+            "description",
+            "cure_protocol",
+            "status",
+            "waiver_reason",
+            "waived_by",
+            "cured_by",
+            "cured_reason",
+            "waived",
+            "waived_at",
+            "cured_at",
+            "created_at",
+            "updated_at",
+        ),
+    ),
+}
+
+_IN_MEMORY_STORES: Final[dict[str, _IndexedStore]] = {
+    "claims": _claims_in_memory_store,
+    "sanads": _sanad_in_memory_store,
+    "defects": _defects_in_memory_store,
+}
+
+
+def get_export_yield_per() -> int:
+    """Return the server-side cursor batch size for exports.
+
+    Returns:
+        IDIS_EXPORT_YIELD_PER if set, else DEFAULT_EXPORT_YIELD_PER.
+
+    Raises:
+        ExportConfigError: If the value is not a positive integer.
+    """
+    raw = os.environ.get(EXPORT_YIELD_PER_ENV, "").strip()
+    if not raw:
+        return DEFAULT_EXPORT_YIELD_PER
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ExportConfigError(
+            f"{EXPORT_YIELD_PER_ENV} must be a positive integer, got '{raw}'"
+        ) from exc
+    if value <= 0:
+        raise ExportConfigError(f"{EXPORT_YIELD_PER_ENV} must be positive, got {value}")
+    return value
+
+
+def resolve_columns(entity: str, fields: str | None) -> tuple[str, ...]:
+    """Resolve a comma-separated column projection for an entity.
+
+    Args:
+        entity: Key of EXPORT_ENTITIES.
+        fields: Comma-separated column names, or None/empty for every column.
+
+    Returns:
+        Columns to export; the id column is always first.
+
+    Raises:
+        ExportProjectionError: If a column is not exportable for the entity.
+    """
+    spec = EXPORT_ENTITIES[entity]
+    if not fields or not fields.strip():
+        return spec.columns
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(spec.columns))
+    if unknown:
+        raise ExportProjectionError(f"Unknown {entity} export fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys([spec.id_column, *requested]))
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _changed_at(record: dict[str, Any]) -> datetime:
+    raw = record.get("updated_at") or record.get("created_at")
+    if isinstance(raw, datetime):
+        return raw if raw.tzinfo else raw.replace(tzinfo=UTC)
+    if isinstance(raw, str) and raw:
+        parsed = datetime.fromisoformat(raw)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return datetime.min.replace(tzinfo=UTC)
+
+
+class PostgresDealExporter:
+    """Streams a deal's rows from Postgres on a server-side cursor."""
+
+    def __init__(self, conn: Connection, tenant_id: str) -> None:
+        """Initialize with connection and tenant context.
+
+        Args:
+            conn: SQLAlchemy connection (inside the request transaction).
+            tenant_id: Tenant UUID for RLS scoping.
+        """
+        self._conn = conn
+        self._tenant_id = tenant_id
+        set_tenant_local(conn, tenant_id)
+
+    def iter_rows(
+        self,
+        entity: str,
+        deal_id: str,
+        *,
+        columns: tuple[str, ...] | None = None,
+        updated_since: datetime | None = None,
+        yield_per: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a deal's rows of one entity in (changed_at, id) order.
+
+        Args:
+            entity: Key of EXPORT_ENTITIES.
+            deal_id: Deal UUID.
+            columns: Projection from ``resolve_columns`` (default: every column).
+            updated_since: Only rows with changed_at >= this instant.
+            yield_per: Rows fetched per server-side cursor round-trip.
+
+        Yields:
+            Row dicts with JSON-ready values.
+        """
+        spec = EXPORT_ENTITIES[entity]
+        columns = columns or spec.columns
+        if not set(columns) <= set(spec.columns):
+            raise ExportProjectionError(f"Unknown {entity} export fields")
+        changed_at = "COALESCE(updated_at, created_at)"
+        conditions = ["tenant_id = :tenant_id", "deal_id = :deal_id"]
+        params: dict[str, Any] = {"tenant_id": self._tenant_id, "deal_id": deal_id}
+        if updated_since is not None:
+            conditions.append(f"{changed_at} >= :updated_since")
+            params["updated_since"] = updated_since
+        # yield_per is set on the statement: Connection.execution_options() would switch the
+        # request-scoped connection to streamed results for every later statement.
+        statement = text(
+            f"SELECT {', '.join(columns)} FROM {spec.table} "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {changed_at}, {spec.id_column}"
+        ).execution_options(yield_per=yield_per or get_export_yield_per())
+        result = self._conn.execute(statement, params)
+        try:
+            for row in result.mappings():
+                record = {column: _export_value(row[column]) for column in columns}
+                for column in spec.json_columns.intersection(columns):
+                    if isinstance(record[column], str):
+                        record[column] = json.loads(record[column])
+                yield record
+        finally:
+            result.close()
+
+
+class InMemoryDealExporter:
+    """In-memory twin of PostgresDealExporter over the indexed claim stores."""
+
+    def __init__(self, tenant_id: str) -> None:
+        """Initialize with tenant context."""
+        self._tenant_id = tenant_id
+
+    def iter_rows(
+        self,
+        entity: str,
+        deal_id: str,
+        *,
+        columns: tuple[str, ...] | None = None,
+        updated_since: datetime | None = None,
+        yield_per: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a deal's rows of one entity (see ``PostgresDealExporter.iter_rows``)."""
+        spec = EXPORT_ENTITIES[entity]
+        columns = columns or spec.columns
+        store = _IN_MEMORY_STORES[entity]
+        keyed = []
+        for record_id in store.ids("deal_id", self._tenant_id, deal_id):
+            record = store[record_id]
+            keyed.append((_changed_at(record), record_id, record))
+        keyed.sort(key=lambda item: (item[0], item[1]))
+        for changed_at, _, record in keyed:
+            if updated_since is not None and changed_at < updated_since:
+                continue
+            yield {column: _export_value(record.get(column)) for column in columns}
+
+
+def ndjson_chunks(
+    rows: Iterable[dict[str, Any]],
+    *,
+    chunk_bytes: int = EXPORT_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Encode rows as NDJSON, yielding chunks of roughly ``chunk_bytes``.
+
+    Args:
+        rows: Row dicts (JSON-ready values).
+        chunk_bytes: Buffered bytes per yielded chunk.
+
+    Yields:
+        Byte chunks, each ending on a line boundary.
+    """
+    buffer: list[bytes] = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row, separators=(",", ":"), ensure_ascii=False, default=str)
+        encoded = line.encode("utf-8") + b"\n"
+        buffer.append(encoded)
+        size += len(encoded)
+        if size >= chunk_bytes:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
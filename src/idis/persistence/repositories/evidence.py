@@ -8,6 +8,7 @@ the Postgres implementation and factory function for Phase 7.A cutover.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -47,6 +48,13 @@ class EvidenceRepo(Protocol):
     def get_by_claim(self, claim_id: str) -> list[dict[str, Any]]: ...
 
 
+@runtime_checkable
+class BatchEvidenceRepo(Protocol):
+    """Evidence repositories that can load many claims' evidence in one query."""
+
+    def get_by_claims(self, claim_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]: ...
+
+
 class PostgresEvidenceRepository:
     """Tenant-scoped Postgres repository for evidence items.
 
@@ -178,6 +186,37 @@ class PostgresEvidenceRepository:
         )
         return [self._row_to_dict(row) for row in result.fetchall()]
 
+    def get_by_claims(self, claim_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get evidence items for many claims in one query.
+
+        RLS ensures only evidence for the current tenant is visible.
+
+        Args:
+            claim_ids: Parent claim UUIDs.
+
+        Returns:
+            Mapping of every requested claim_id to its evidence (``get_by_claim`` order).
+        """
+        by_claim: dict[str, list[dict[str, Any]]] = {claim_id: [] for claim_id in claim_ids}
+        if not by_claim:
+            return by_claim
+        result = self._conn.execute(
+            text(
+                """
+                SELECT evidence_id, tenant_id, deal_id, claim_id,
+                       source_span_id, source_grade, created_at
+                FROM evidence_items
+                WHERE claim_id = ANY(CAST(:claim_ids AS UUID[]))
+                ORDER BY claim_id, evidence_id
+                """
+            ),
+            {"claim_ids": list(by_claim)},
+        )
+        for row in result.fetchall():
+            evidence = self._row_to_dict(row)
+            by_claim[evidence["claim_id"]].append(evidence)
+        return by_claim
+
     def _row_to_dict(self, row: Any) -> dict[str, Any]:
         """Convert database row to dict."""
         created_at = row.created_at
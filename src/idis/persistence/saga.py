@@ -6,6 +6,8 @@ both roll back. Implements saga pattern with compensation actions.
 Design:
 - SagaStep: Individual write operation with compensation action
 - SagaExecutor: Orchestrates multi-store writes with rollback on failure
+- BatchDualWriteSagaExecutor: One Postgres transaction and chunked graph writes per batch,
+  compensated by batch id with per-item results
 - Fail-closed: Any failure triggers compensation for all completed steps
 """
 
@@ -432,3 +434,287 @@ def create_sanad_dual_write_saga(
         .add_postgres_step("postgres_sanad_insert", postgres_insert, postgres_delete)
         .add_graph_step("graph_sanad_insert", graph_insert, graph_delete)
     )
+
+
+@dataclass
+class SagaItemResult:
+    """Per-item outcome of a batch saga (one claim or Sanad)."""
+
+    item_id: str
+    status: SagaStepStatus
+    error: Exception | None = None
+
+
+@dataclass
+class BatchSagaResult:
+    """Result of executing a batch dual-write saga."""
+
+    batch_id: str
+    status: SagaStatus
+    item_results: list[SagaItemResult] = field(default_factory=list)
+    step_results: list[SagaStepResult] = field(default_factory=list)
+    error: Exception | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    @property
+    def is_success(self) -> bool:
+        """Check if every item was written to both stores."""
+        return self.status == SagaStatus.COMPLETED
+
+    @property
+    def is_compensated(self) -> bool:
+        """Check if the batch was compensated (rolled back)."""
+        return self.status == SagaStatus.COMPENSATED
+
+    @property
+    def failed_item_ids(self) -> list[str]:
+        """IDs of the items whose write failed (the cause of compensation)."""
+        return [r.item_id for r in self.item_results if r.status == SagaStepStatus.FAILED]
+
+
+class BatchDualWriteSagaExecutor(Generic[T]):
+    """Executor for batched dual-write sagas (Postgres + Graph DB).
+
+    Replaces one Postgres step and one graph step per item with:
+    - One Postgres write for the whole batch (the callable runs a single transaction)
+    - Graph projection in chunks of ``chunk_size`` items (UNWIND batches)
+    - Compensation by batch id: one graph delete and one Postgres delete for the batch
+
+    Fail-closed semantics:
+    - A Postgres failure fails every item; nothing was written, so nothing is compensated
+    - A graph chunk failure stops projection, compensates the graph (the failed chunk may
+      have partially committed) and then Postgres
+    - Items in the failed chunk are reported FAILED; every other item is reported
+      COMPENSATED, or COMPENSATION_FAILED if a compensation action failed
+    """
+
+    def __init__(
+        self,
+        batch_id: str,
+        *,
+        item_id: Callable[[T], str],
+        postgres_write: Callable[[str, list[T]], None],
+        postgres_compensate: Callable[[str], None],
+        graph_write: Callable[[str, list[T]], None],
+        graph_compensate: Callable[[str], None],
+        chunk_size: int | None = None,
+    ) -> None:
+        """Initialize the batch saga executor.
+
+        Args:
+            batch_id: Unique identifier for this batch; passed to every callable.
+            item_id: Returns the ID reported for an item.
+            postgres_write: Writes all items in one Postgres transaction.
+            postgres_compensate: Deletes/reverses the rows written for a batch id.
+            graph_write: Projects one chunk of items into the Graph DB.
+            graph_compensate: Deletes the graph projection of a batch id.
+            chunk_size: Items per graph_write call. Defaults to the whole batch.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.batch_id = batch_id
+        self._item_id = item_id
+        self._postgres_write = postgres_write
+        self._postgres_compensate = postgres_compensate
+        self._graph_write = graph_write
+        self._graph_compensate = graph_compensate
+        self._chunk_size = chunk_size
+
+    def execute(self, items: list[T]) -> BatchSagaResult:
+        """Execute the batch saga.
+
+        Args:
+            items: Items to write to both stores.
+
+        Returns:
+            BatchSagaResult with overall status, per-item and per-step results.
+        """
+        started_at = datetime.now()
+        item_ids = [self._item_id(item) for item in items]
+        step_results: list[SagaStepResult] = []
+
+        logger.info("Starting batch saga %s with %d items", self.batch_id, len(items))
+
+        pg_error = self._run_step("postgres_batch_write", self._postgres_write, items, step_results)
+        if pg_error is not None:
+            return BatchSagaResult(
+                batch_id=self.batch_id,
+                status=SagaStatus.COMPENSATED,
+                item_results=[SagaItemResult(i, SagaStepStatus.FAILED, pg_error) for i in item_ids],
+                step_results=step_results,
+                error=pg_error,
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+
+        chunk_size = self._chunk_size or max(len(items), 1)
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start : start + chunk_size]
+            graph_error = self._run_step(
+                f"graph_batch_projection[{start}:{start + len(chunk)}]",
+                self._graph_write,
+                chunk,
+                step_results,
+            )
+            if graph_error is None:
+                continue
+
+            # Reverse order; both run even if the first fails.
+            compensated = all(
+                [
+                    self._compensate(
+                        "graph_batch_projection", self._graph_compensate, step_results
+                    ),
+                    self._compensate(
+                        "postgres_batch_write", self._postgres_compensate, step_results
+                    ),
+                ]
+            )
+            other_status = (
+                SagaStepStatus.COMPENSATED if compensated else SagaStepStatus.COMPENSATION_FAILED
+            )
+            failed = set(item_ids[start : start + len(chunk)])
+            return BatchSagaResult(
+                batch_id=self.batch_id,
+                status=SagaStatus.COMPENSATED if compensated else SagaStatus.COMPENSATION_FAILED,
+                item_results=[
+                    SagaItemResult(i, SagaStepStatus.FAILED, graph_error)
+                    if i in failed
+                    else SagaItemResult(i, other_status)
+                    for i in item_ids
+                ],
+                step_results=step_results,
+                error=graph_error,
+                started_at=started_at,
+                completed_at=datetime.now(),
+            )
+
+        logger.info("Batch saga %s completed successfully", self.batch_id)
+        return BatchSagaResult(
+            batch_id=self.batch_id,
+            status=SagaStatus.COMPLETED,
+            item_results=[SagaItemResult(i, SagaStepStatus.COMPLETED) for i in item_ids],
+            step_results=step_results,
+            started_at=started_at,
+            completed_at=datetime.now(),
+        )
+
+    def _run_step(
+        self,
+        name: str,
+        write: Callable[[str, list[T]], None],
+        items: list[T],
+        step_results: list[SagaStepResult],
+    ) -> Exception | None:
+        """Run one forward write, record its result and return its error (if any)."""
+        step_result = SagaStepResult(
+            step_name=name, status=SagaStepStatus.EXECUTING, started_at=datetime.now()
+        )
+        try:
+            write(self.batch_id, items)
+            step_result.status = SagaStepStatus.COMPLETED
+            return None
+        except Exception as e:
+            step_result.status = SagaStepStatus.FAILED
+            step_result.error = e
+            logger.error("Step %s failed: %s", name, e)
+            return e
+        finally:
+            step_result.completed_at = datetime.now()
+            step_results.append(step_result)
+
+    def _compensate(
+        self,
+        name: str,
+        compensate: Callable[[str], None],
+        step_results: list[SagaStepResult],
+    ) -> bool:
+        """Run one batch compensation action; return whether it succeeded."""
+        comp_result = SagaStepResult(
+            step_name=f"{name}_compensation",
+            status=SagaStepStatus.COMPENSATING,
+            started_at=datetime.now(),
+        )
+        try:
+            compensate(self.batch_id)
+            comp_result.status = SagaStepStatus.COMPENSATED
+            logger.debug("Compensated step %s for batch %s", name, self.batch_id)
+            return True
+        except Exception as e:
+            comp_result.status = SagaStepStatus.COMPENSATION_FAILED
+            comp_result.error = e
+            logger.error("Compensation failed for step %s: %s", name, e)
+            return False
+        finally:
+            comp_result.completed_at = datetime.now()
+            step_results.append(comp_result)
+
+
+def create_claim_batch_dual_write_saga(
+    batch_id: str,
+    postgres_insert: Callable[[str, list[dict[str, Any]]], None],
+    postgres_delete: Callable[[str], None],
+    graph_insert: Callable[[str, list[dict[str, Any]]], None],
+    graph_delete: Callable[[str], None],
+    *,
+    chunk_size: int | None = None,
+) -> BatchDualWriteSagaExecutor[dict[str, Any]]:
+    """Create a saga for dual-writing a batch of claims to Postgres and Graph DB.
+
+    Args:
+        batch_id: Unique batch identifier.
+        postgres_insert: Function to insert all claims in one Postgres transaction.
+        postgres_delete: Function to delete the claims written for a batch id.
+        graph_insert: Function to project one chunk of claims into Graph DB.
+        graph_delete: Function to delete the graph projection of a batch id.
+        chunk_size: Claims per graph write. Defaults to the whole batch.
+
+    Returns:
+        Configured batch saga executor ready to execute.
+    """
+    return BatchDualWriteSagaExecutor(
+        batch_id,
+        item_id=lambda claim: str(claim["claim_id"]),
+        postgres_write=postgres_insert,
+        postgres_compensate=postgres_delete,
+        graph_write=graph_insert,
+        graph_compensate=graph_delete,
+        chunk_size=chunk_size,
+    )
+
+
+def create_sanad_batch_dual_write_saga(
+    batch_id: str,
+    postgres_insert: Callable[[str, list[dict[str, Any]]], None],
+    postgres_delete: Callable[[str], None],
+    graph_insert: Callable[[str, list[dict[str, Any]]], None],
+    graph_delete: Callable[[str], None],
+    *,
+    chunk_size: int | None = None,
+) -> BatchDualWriteSagaExecutor[dict[str, Any]]:
+    """Create a saga for dual-writing a batch of Sanads to Postgres and Graph DB.
+
+    Args:
+        batch_id: Unique batch identifier.
+        postgres_insert: Function to insert all Sanads in one Postgres transaction.
+        postgres_delete: Function to delete the Sanads written for a batch id.
+        graph_insert: Function to project one chunk of Sanad chains into Graph DB.
+        graph_delete: Function to delete the graph projection of a batch id.
+        chunk_size: Sanads per graph write. Defaults to the whole batch.
+
+    Returns:
+        Configured batch saga executor ready to execute.
+    """
+    return BatchDualWriteSagaExecutor(
+        batch_id,
+        item_id=lambda sanad: str(sanad["sanad_id"]),
+        postgres_write=postgres_insert,
+        postgres_compensate=postgres_delete,
+        graph_write=graph_insert,
+        graph_compensate=graph_delete,
+        chunk_size=chunk_size,
+    )
@@ -17,6 +17,7 @@ from pydantic import ValidationError
 from idis.models.run_source import RunSource
 from idis.models.run_step import RunStep, StepName, StepStatus
 from idis.observability.runtime_signals import RUN_QUEUE_OBSERVED, emit_run_signal
+from idis.parsers.registry import warm_parsers
 from idis.persistence.db import get_app_engine, set_tenant_local
 from idis.persistence.repositories.run_steps import get_run_steps_repository
 from idis.persistence.repositories.runs import get_runs_repository
@@ -31,6 +32,8 @@ from idis.services.runs.strict_full_live import (
 
 logger = logging.getLogger(__name__)
 
+IDIS_WORKER_WARM_PARSERS_ENV = "IDIS_WORKER_WARM_PARSERS"
+
 ExecutionServiceFactory = Callable[..., RunExecutionService]
 RunContextFactory = Callable[..., RunContext]
 
@@ -334,6 +337,34 @@ def get_worker_tenant_ids() -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
+def get_worker_parser_warmup() -> list[str] | None:
+    """Return the parser families to import at worker startup.
+
+    ``IDIS_WORKER_WARM_PARSERS`` is a comma-separated list of parser families (e.g.
+    ``PDF,XLSX``) or ``all``. Unset or empty keeps parsers lazy (imported on first parse).
+
+    Returns:
+        Families to warm, None for every registered parser, or an empty list for none.
+    """
+    raw = os.getenv(IDIS_WORKER_WARM_PARSERS_ENV, "").strip()
+    if raw.lower() == "all":
+        return None
+    return [item.strip().upper() for item in raw.split(",") if item.strip()]
+
+
+async def _warm_worker_parsers() -> None:
+    """Import configured parsers off the event loop; failures leave parsers lazy."""
+    parser_formats = get_worker_parser_warmup()
+    if parser_formats == []:
+        return
+    try:
+        warmed = await asyncio.to_thread(warm_parsers, parser_formats)
+    except (ValueError, ImportError) as e:
+        logger.error("Parser warm-up failed; parsers stay lazy: %s", e)
+        return
+    logger.info("Warmed parsers: %s", ",".join(warmed))
+
+
 def get_gdbs_path() -> str | None:
     """Get GDBS dataset path from environment or default location."""
     env_path = os.getenv("IDIS_GDBS_PATH")
@@ -497,6 +528,7 @@ async def start_worker() -> None:
         logger.warning("Worker already started")
         return
 
+    await _warm_worker_parsers()
     gdbs_path = get_gdbs_path()
     _worker = PipelineWorker(poll_interval=5, gdbs_path=gdbs_path)
     await _worker.start()
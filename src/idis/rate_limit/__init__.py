@@ -6,13 +6,17 @@ Provides tenant-scoped rate limiting with token bucket algorithm.
 from idis.rate_limit.limiter import (
     RateLimitConfig,
     RateLimitDecision,
+    RateLimitScope,
     RateLimitTier,
+    RouteClass,
     TenantRateLimiter,
 )
 
 __all__ = [
     "RateLimitConfig",
     "RateLimitDecision",
+    "RateLimitScope",
     "RateLimitTier",
+    "RouteClass",
     "TenantRateLimiter",
 ]
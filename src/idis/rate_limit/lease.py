@@ -0,0 +1,269 @@
+"""Local token lease in front of the Redis rate-limit store.
+
+Every API request used to pay one Redis round-trip in RateLimitMiddleware. LeasedRateLimitStore
+keeps a small per-bucket lease of tokens that were already taken from Redis, so most requests
+are admitted from process memory with no network hop:
+
+- Miss: no (or an exhausted) local lease for one of the request's buckets. One synchronous
+  ``_LUA_MULTI_TOKEN_BUCKET`` call consumes the request's token from every bucket and, in the same
+  round-trip, leases up to ``lease_size`` extra tokens per bucket. Redis stays authoritative: all
+  denials come from Redis.
+- Hit: every bucket has a local token. They are decremented in memory. When a lease drops below
+  half, a background top-up (cost 0, same script) reconciles it with Redis off the request path.
+
+Error budget: leased tokens are deducted in Redis up front, so the cluster never admits more than
+the bucket allows; the only error is timing. A replica may hold at most ``lease_size`` tokens per
+bucket (IDIS_RATE_LIMIT_LEASE_PCT percent of capacity, capped by IDIS_RATE_LIMIT_LEASE_MAX), which
+other replicas cannot use, and unused leases are dropped after ``lease_ttl_ms``. Buckets whose
+budget rounds to zero tokens (small limits) bypass the lease and hit Redis on every request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Final
+
+from idis.rate_limit.limiter import (
+    BucketSpec,
+    MultiBucketResult,
+    RateLimitConfigError,
+    RateLimitStore,
+    RedisTokenBucketStore,
+)
+
+logger = logging.getLogger(__name__)
+
+ENV_RATE_LIMIT_LEASE_PCT: Final[str] = "IDIS_RATE_LIMIT_LEASE_PCT"
+ENV_RATE_LIMIT_LEASE_MAX: Final[str] = "IDIS_RATE_LIMIT_LEASE_MAX"
+
+DEFAULT_LEASE_PCT: Final[int] = 2
+DEFAULT_LEASE_MAX: Final[int] = 50
+DEFAULT_LEASE_TTL_MS: Final[int] = 1000
+
+
+@dataclass(slots=True)
+class _Lease:
+    tokens: int = 0
+    expires_ns: int = 0
+    remaining_hint: int = 0
+    refreshing: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class LeaseStats:
+    """Lease effectiveness counters.
+
+    Attributes:
+        local_hits: Requests admitted from the local lease (no network hop).
+        remote_calls: Synchronous Redis calls on the request path.
+        top_ups: Background lease top-ups completed.
+        top_up_failures: Background top-ups that raised.
+    """
+
+    local_hits: int
+    remote_calls: int
+    top_ups: int
+    top_up_failures: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of requests served without a network hop."""
+        total = self.local_hits + self.remote_calls
+        return self.local_hits / total if total else 0.0
+
+
+class LeasedRateLimitStore:
+    """RedisTokenBucketStore fronted by a bounded per-bucket local token lease."""
+
+    def __init__(
+        self,
+        backing: RedisTokenBucketStore,
+        *,
+        budget_pct: int = DEFAULT_LEASE_PCT,
+        max_lease: int = DEFAULT_LEASE_MAX,
+        lease_ttl_ms: int = DEFAULT_LEASE_TTL_MS,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the lease.
+
+        Args:
+            backing: The authoritative Redis store.
+            budget_pct: Percent of a bucket's capacity one replica may hold locally.
+            max_lease: Upper bound on tokens leased per bucket.
+            lease_ttl_ms: Unused leased tokens are dropped after this long.
+            executor: Runs background top-ups (default: one daemon worker thread).
+
+        Raises:
+            RateLimitConfigError: If a bound is negative or the TTL is not positive.
+        """
+        if budget_pct < 0 or max_lease < 0:
+            raise RateLimitConfigError("lease budget_pct and max_lease must be >= 0")
+        if lease_ttl_ms <= 0:
+            raise RateLimitConfigError(f"lease_ttl_ms must be positive, got {lease_ttl_ms}")
+        self._backing = backing
+        self._budget_pct = budget_pct
+        self._max_lease = max_lease
+        self._ttl_ns = lease_ttl_ms * 1_000_000
+        self._executor = executor
+        self._leases: dict[str, _Lease] = {}
+        self._lock = threading.Lock()
+        self._local_hits = 0
+        self._remote_calls = 0
+        self._top_ups = 0
+        self._top_up_failures = 0
+
+    def lease_size(self, capacity: int) -> int:
+        """Tokens one replica may lease for a bucket of ``capacity``."""
+        return min(self._max_lease, capacity * self._budget_pct // 100)
+
+    def consume(
+        self, *, key: str, capacity: int, refill_rate_per_sec: float, cost: int = 1
+    ) -> tuple[bool, int, int]:
+        spec = BucketSpec(
+            key=key,
+            capacity=capacity,
+            refill_rate_per_sec=refill_rate_per_sec,
+            limit_rpm=round(refill_rate_per_sec * 60),
+        )
+        result = self.consume_many([spec], cost=cost)
+        return (result.allowed, result.retry_after_seconds, result.remaining[0])
+
+    def consume_many(self, buckets: Sequence[BucketSpec], *, cost: int = 1) -> MultiBucketResult:
+        """Admit from the local lease when every bucket has tokens, else ask Redis."""
+        sizes = [self.lease_size(bucket.capacity) for bucket in buckets]
+        now = time.monotonic_ns()
+        if all(sizes):
+            served = self._serve_locally(buckets, sizes, cost, now)
+            if served is not None:
+                return served
+
+        with self._lock:
+            wants = [
+                max(0, size - self._live(bucket.key, now).tokens)
+                for bucket, size in zip(buckets, sizes, strict=True)
+            ]
+            self._remote_calls += 1
+        result = self._backing.consume_many(buckets, cost=cost, lease=wants)
+        self._absorb(buckets, result, time.monotonic_ns())
+        return result
+
+    def _live(self, key: str, now: int) -> _Lease:
+        """The bucket's lease, emptied if expired. Caller holds the lock."""
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = _Lease()
+        if lease.tokens and now >= lease.expires_ns:
+            lease.tokens = 0
+        return lease
+
+    def _serve_locally(
+        self, buckets: Sequence[BucketSpec], sizes: list[int], cost: int, now: int
+    ) -> MultiBucketResult | None:
+        with self._lock:
+            leases = [self._live(bucket.key, now) for bucket in buckets]
+            if any(lease.tokens < cost for lease in leases):
+                return None
+            stale: list[tuple[BucketSpec, int]] = []
+            for bucket, lease, size in zip(buckets, leases, sizes, strict=True):
+                lease.tokens -= cost
+                if lease.tokens * 2 < size and not lease.refreshing:
+                    lease.refreshing = True
+                    stale.append((bucket, size - lease.tokens))
+            self._local_hits += 1
+            remaining = tuple(lease.remaining_hint + lease.tokens for lease in leases)
+        if stale:
+            self._schedule_top_up(stale)
+        return MultiBucketResult(
+            allowed=True,
+            retry_after_seconds=0,
+            remaining=remaining,
+            granted=(0,) * len(buckets),
+        )
+
+    def _absorb(self, buckets: Sequence[BucketSpec], result: MultiBucketResult, now: int) -> None:
+        with self._lock:
+            for bucket, remaining, granted in zip(
+                buckets, result.remaining, result.granted, strict=True
+            ):
+                lease = self._live(bucket.key, now)
+                if granted:
+                    lease.tokens += granted
+                    lease.expires_ns = now + self._ttl_ns
+                lease.remaining_hint = remaining
+
+    def _schedule_top_up(self, stale: list[tuple[BucketSpec, int]]) -> None:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="idis-ratelimit-lease"
+                    )
+        self._executor.submit(self._top_up, stale)
+
+    def _top_up(self, stale: list[tuple[BucketSpec, int]]) -> None:
+        buckets = [bucket for bucket, _ in stale]
+        try:
+            result = self._backing.consume_many(buckets, cost=0, lease=[want for _, want in stale])
+        except Exception as e:  # never surfaces on the request path; the next miss retries
+            logger.warning("Rate-limit lease top-up failed: %s", e)
+            with self._lock:
+                self._top_up_failures += 1
+        else:
+            self._absorb(buckets, result, time.monotonic_ns())
+            with self._lock:
+                self._top_ups += 1
+        finally:
+            with self._lock:
+                for bucket in buckets:
+                    self._leases[bucket.key].refreshing = False
+
+    def stats(self) -> LeaseStats:
+        """Return lease effectiveness counters."""
+        with self._lock:
+            return LeaseStats(
+                local_hits=self._local_hits,
+                remote_calls=self._remote_calls,
+                top_ups=self._top_ups,
+                top_up_failures=self._top_up_failures,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._leases.clear()
+        self._backing.reset()
+
+
+def _non_negative_int(env_var: str, default: int) -> int:
+    raw = os.environ.get(env_var, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as e:
+        raise RateLimitConfigError(f"{env_var} must be a non-negative integer, got '{raw}'") from e
+    if value < 0:
+        raise RateLimitConfigError(f"{env_var} must be a non-negative integer, got {value}")
+    return value
+
+
+def maybe_lease(store: RedisTokenBucketStore) -> RateLimitStore:
+    """Front ``store`` with a local lease unless IDIS_RATE_LIMIT_LEASE_PCT is 0.
+
+    Environment variables:
+        IDIS_RATE_LIMIT_LEASE_PCT: Percent of bucket capacity leased per replica (default: 2)
+        IDIS_RATE_LIMIT_LEASE_MAX: Max tokens leased per bucket (default: 50)
+
+    Raises:
+        RateLimitConfigError: If a value is not a non-negative integer.
+    """
+    budget_pct = _non_negative_int(ENV_RATE_LIMIT_LEASE_PCT, DEFAULT_LEASE_PCT)
+    max_lease = _non_negative_int(ENV_RATE_LIMIT_LEASE_MAX, DEFAULT_LEASE_MAX)
+    if budget_pct == 0 or max_lease == 0:
+        return store
+    return LeasedRateLimitStore(store, budget_pct=budget_pct, max_lease=max_lease)
@@ -4,6 +4,12 @@ Implements tenant-scoped rate limiting per v6.3 API contracts:
 - User tier: 600 req/min (default), burst 2x
 - Integration tier: 1200 req/min (default), burst 2x
 
+Optional extra buckets are evaluated together with the tenant tier bucket on every request:
+- Actor: per (tenant, actor) RPM (IDIS_RATE_LIMIT_ACTOR_RPM, unset = disabled)
+- Route class: per-tenant RPM for mutating requests (IDIS_RATE_LIMIT_WRITE_RPM, unset = disabled)
+A request is admitted only if every applicable bucket has a token, and then consumes from all
+of them (the Redis store does this in one Lua script call).
+
 Uses monotonic time and integer arithmetic to avoid float drift.
 Thread-safe for concurrent access within a single process.
 """
@@ -14,6 +20,7 @@ import logging
 import os
 import threading
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any, Final, Protocol, runtime_checkable
@@ -23,6 +30,8 @@ logger = logging.getLogger(__name__)
 ENV_RATE_LIMIT_USER_RPM: Final[str] = "IDIS_RATE_LIMIT_USER_RPM"
 ENV_RATE_LIMIT_INTEGRATION_RPM: Final[str] = "IDIS_RATE_LIMIT_INTEGRATION_RPM"
 ENV_RATE_LIMIT_BURST_MULTIPLIER: Final[str] = "IDIS_RATE_LIMIT_BURST_MULTIPLIER"
+ENV_RATE_LIMIT_ACTOR_RPM: Final[str] = "IDIS_RATE_LIMIT_ACTOR_RPM"
+ENV_RATE_LIMIT_WRITE_RPM: Final[str] = "IDIS_RATE_LIMIT_WRITE_RPM"
 ENV_REDIS_URL: Final[str] = "IDIS_REDIS_URL"
 
 DEFAULT_USER_RPM: Final[int] = 600
@@ -40,6 +49,21 @@ class RateLimitTier(StrEnum):
     INTEGRATION = "integration"
 
 
+class RouteClass(StrEnum):
+    """Route classification for the per-tenant route-class bucket."""
+
+    READ = "read"
+    WRITE = "write"
+
+
+class RateLimitScope(StrEnum):
+    """Which bucket a rate limit decision was driven by."""
+
+    TIER = "tier"
+    ACTOR = "actor"
+    ROUTE = "route"
+
+
 class RateLimitConfigError(Exception):
     """Raised when rate limit configuration is invalid."""
 
@@ -52,11 +76,15 @@ class RateLimitConfig:
         user_rpm: Requests per minute for user tier.
         integration_rpm: Requests per minute for integration tier.
         burst_multiplier: Multiplier for burst capacity (capacity = rpm * burst_multiplier).
+        actor_rpm: Requests per minute per (tenant, actor); None disables the actor bucket.
+        write_rpm: Mutating requests per minute per tenant; None disables the route bucket.
     """
 
     user_rpm: int
     integration_rpm: int
     burst_multiplier: int
+    actor_rpm: int | None = None
+    write_rpm: int | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -74,6 +102,14 @@ class RateLimitConfig:
                 f"IDIS_RATE_LIMIT_BURST_MULTIPLIER must be a positive integer, "
                 f"got {self.burst_multiplier}"
             )
+        if self.actor_rpm is not None and self.actor_rpm <= 0:
+            raise RateLimitConfigError(
+                f"IDIS_RATE_LIMIT_ACTOR_RPM must be a positive integer, got {self.actor_rpm}"
+            )
+        if self.write_rpm is not None and self.write_rpm <= 0:
+            raise RateLimitConfigError(
+                f"IDIS_RATE_LIMIT_WRITE_RPM must be a positive integer, got {self.write_rpm}"
+            )
 
     def get_rpm(self, tier: RateLimitTier) -> int:
         """Get RPM limit for the specified tier."""
@@ -125,6 +161,8 @@ def load_rate_limit_config() -> RateLimitConfig:
         IDIS_RATE_LIMIT_USER_RPM: User tier requests per minute (default: 600)
         IDIS_RATE_LIMIT_INTEGRATION_RPM: Integration tier RPM (default: 1200)
         IDIS_RATE_LIMIT_BURST_MULTIPLIER: Burst multiplier (default: 2)
+        IDIS_RATE_LIMIT_ACTOR_RPM: Per-actor RPM within a tenant (default: unset, disabled)
+        IDIS_RATE_LIMIT_WRITE_RPM: Per-tenant RPM for mutating requests (default: unset, disabled)
 
     Returns:
         RateLimitConfig with validated values.
@@ -138,10 +176,15 @@ def load_rate_limit_config() -> RateLimitConfig:
         ENV_RATE_LIMIT_BURST_MULTIPLIER, DEFAULT_BURST_MULTIPLIER
     )
 
+    actor_rpm = _parse_positive_int(ENV_RATE_LIMIT_ACTOR_RPM, 0) or None
+    write_rpm = _parse_positive_int(ENV_RATE_LIMIT_WRITE_RPM, 0) or None
+
     return RateLimitConfig(
         user_rpm=user_rpm,
         integration_rpm=integration_rpm,
         burst_multiplier=burst_multiplier,
+        actor_rpm=actor_rpm,
+        write_rpm=write_rpm,
     )
 
 
@@ -156,6 +199,8 @@ class RateLimitDecision:
         limit_rpm: The RPM limit for this tier.
         burst_multiplier: The burst multiplier applied.
         tier: The rate limit tier applied.
+        scope: The bucket that denied the request, or (if allowed) the one with the fewest
+            tokens left; limit_rpm and remaining_tokens describe that bucket.
     """
 
     allowed: bool
@@ -164,6 +209,43 @@ class RateLimitDecision:
     limit_rpm: int
     burst_multiplier: int
     tier: RateLimitTier
+    scope: RateLimitScope = RateLimitScope.TIER
+
+
+@dataclass(frozen=True, slots=True)
+class BucketSpec:
+    """One token bucket a request must draw from.
+
+    Attributes:
+        key: Store key (unprefixed), e.g. ``<tenant>:user``.
+        capacity: Bucket capacity (rpm * burst_multiplier).
+        refill_rate_per_sec: Tokens added per second (rpm / 60).
+        limit_rpm: The RPM this bucket enforces.
+        scope: Which kind of bucket this is.
+    """
+
+    key: str
+    capacity: int
+    refill_rate_per_sec: float
+    limit_rpm: int
+    scope: RateLimitScope = RateLimitScope.TIER
+
+
+@dataclass(frozen=True, slots=True)
+class MultiBucketResult:
+    """Outcome of an all-or-nothing consume across several buckets.
+
+    Attributes:
+        allowed: True if every bucket had ``cost`` tokens (and all were consumed).
+        retry_after_seconds: 0 if allowed, else seconds until the slowest bucket refills.
+        remaining: Tokens left per bucket, in request order.
+        granted: Extra tokens leased out per bucket (see RedisTokenBucketStore.consume_many).
+    """
+
+    allowed: bool
+    retry_after_seconds: int
+    remaining: tuple[int, ...]
+    granted: tuple[int, ...]
 
 
 class _TokenBucket:
@@ -196,36 +278,49 @@ class _TokenBucket:
             Tuple of (allowed, retry_after_seconds, remaining_tokens).
             retry_after_seconds is 0 if allowed, >= 1 if denied.
         """
+        with self._lock:
+            allowed, retry_after_sec, remaining = self.check_locked(cost)
+            if allowed:
+                remaining = self.consume_locked(cost)
+            return (allowed, retry_after_sec, remaining)
+
+    @property
+    def lock(self) -> threading.Lock:
+        """The bucket lock (held by InMemoryRateLimitStore across a multi-bucket consume)."""
+        return self._lock
+
+    def check_locked(self, cost: int) -> tuple[bool, int, int]:
+        """Refill, then report whether ``cost`` tokens are available. Caller holds the lock."""
         cost_ns = cost * NANOSECONDS_PER_SECOND
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_refill_ns
+
+        if elapsed_ns > 0 and self._refill_rate_ns > 0:
+            refill_ns = (elapsed_ns * self._refill_rate_ns) // NANOSECONDS_PER_SECOND
+            self._tokens_ns = min(
+                self._capacity * NANOSECONDS_PER_SECOND,
+                self._tokens_ns + refill_ns,
+            )
+            self._last_refill_ns = now_ns
 
-        with self._lock:
-            now_ns = time.monotonic_ns()
-            elapsed_ns = now_ns - self._last_refill_ns
-
-            if elapsed_ns > 0 and self._refill_rate_ns > 0:
-                refill_ns = (elapsed_ns * self._refill_rate_ns) // NANOSECONDS_PER_SECOND
-                self._tokens_ns = min(
-                    self._capacity * NANOSECONDS_PER_SECOND,
-                    self._tokens_ns + refill_ns,
-                )
-                self._last_refill_ns = now_ns
-
-            if self._tokens_ns >= cost_ns:
-                self._tokens_ns -= cost_ns
-                remaining = self._tokens_ns // NANOSECONDS_PER_SECOND
-                return (True, 0, remaining)
-
-            deficit_ns = cost_ns - self._tokens_ns
-            if self._refill_rate_ns > 0:
-                wait_ns = (deficit_ns * NANOSECONDS_PER_SECOND) // self._refill_rate_ns
-                retry_after_sec = max(
-                    1, (wait_ns + NANOSECONDS_PER_SECOND - 1) // NANOSECONDS_PER_SECOND
-                )
-            else:
-                retry_after_sec = 60
+        remaining = self._tokens_ns // NANOSECONDS_PER_SECOND
+        if self._tokens_ns >= cost_ns:
+            return (True, 0, remaining)
 
-            remaining = self._tokens_ns // NANOSECONDS_PER_SECOND
-            return (False, int(retry_after_sec), remaining)
+        deficit_ns = cost_ns - self._tokens_ns
+        if self._refill_rate_ns > 0:
+            wait_ns = (deficit_ns * NANOSECONDS_PER_SECOND) // self._refill_rate_ns
+            retry_after_sec = max(
+                1, (wait_ns + NANOSECONDS_PER_SECOND - 1) // NANOSECONDS_PER_SECOND
+            )
+        else:
+            retry_after_sec = 60
+        return (False, int(retry_after_sec), remaining)
+
+    def consume_locked(self, cost: int) -> int:
+        """Consume ``cost`` tokens (after a passing check); return whole tokens left."""
+        self._tokens_ns -= cost * NANOSECONDS_PER_SECOND
+        return self._tokens_ns // NANOSECONDS_PER_SECOND
 
 
 @runtime_checkable
@@ -248,6 +343,15 @@ class RateLimitStore(Protocol):
         ...
 
 
+@runtime_checkable
+class MultiBucketRateLimitStore(Protocol):
+    """A store that can check and consume several buckets atomically (all or nothing)."""
+
+    def consume_many(self, buckets: Sequence[BucketSpec], *, cost: int = 1) -> MultiBucketResult:
+        """Consume ``cost`` from every bucket only if every bucket has ``cost`` tokens."""
+        ...
+
+
 class InMemoryRateLimitStore:
     """Per-process in-memory token-bucket store — the default. NOT shared across replicas, so in a
     multi-replica deployment each pod holds its own counters (see DEC-A / RedisTokenBucketStore)."""
@@ -256,15 +360,42 @@ class InMemoryRateLimitStore:
         self._buckets: dict[str, _TokenBucket] = {}
         self._lock = threading.Lock()
 
-    def consume(
-        self, *, key: str, capacity: int, refill_rate_per_sec: float, cost: int = 1
-    ) -> tuple[bool, int, int]:
+    def _bucket(self, key: str, capacity: int, refill_rate_per_sec: float) -> _TokenBucket:
         with self._lock:
             bucket = self._buckets.get(key)
             if bucket is None:
                 bucket = _TokenBucket(capacity, refill_rate_per_sec)
                 self._buckets[key] = bucket
-        return bucket.try_consume(cost)
+        return bucket
+
+    def consume(
+        self, *, key: str, capacity: int, refill_rate_per_sec: float, cost: int = 1
+    ) -> tuple[bool, int, int]:
+        return self._bucket(key, capacity, refill_rate_per_sec).try_consume(cost)
+
+    def consume_many(self, buckets: Sequence[BucketSpec], *, cost: int = 1) -> MultiBucketResult:
+        resolved = [self._bucket(b.key, b.capacity, b.refill_rate_per_sec) for b in buckets]
+        # Lock distinct buckets in one global order so concurrent consumes cannot deadlock.
+        ordered = sorted({id(b): b for b in resolved}.values(), key=id)
+        for bucket in ordered:
+            bucket.lock.acquire()
+        try:
+            checks = [bucket.check_locked(cost) for bucket in resolved]
+            allowed = all(ok for ok, _, _ in checks)
+            if allowed:
+                remaining = tuple(bucket.consume_locked(cost) for bucket in resolved)
+            else:
+                remaining = tuple(left for _, _, left in checks)
+        finally:
+            for bucket in reversed(ordered):
+                bucket.lock.release()
+        retry = 0 if allowed else max(retry for ok, retry, _ in checks if not ok)
+        return MultiBucketResult(
+            allowed=allowed,
+            retry_after_seconds=retry,
+            remaining=remaining,
+            granted=(0,) * len(buckets),
+        )
 
     def reset(self) -> None:
         with self._lock:
@@ -303,6 +434,58 @@ return {allowed, math.floor(tokens), retry}
 """
 
 
+# All-or-nothing refill+consume across several buckets in ONE round-trip, plus optional lease
+# grants for LeasedRateLimitStore. KEYS = bucket keys; ARGV = now_ms, ttl_ms, cost, then per key
+# (capacity, refill_per_sec, lease_wanted). Uses the same hash fields as _LUA_TOKEN_BUCKET, so both
+# scripts share buckets. Returns {allowed, retry, remaining_1, granted_1, remaining_2, ...}.
+_LUA_MULTI_TOKEN_BUCKET: Final[str] = """
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local tokens = {}
+local wants = {}
+local allowed = 1
+local retry = 0
+for i = 1, #KEYS do
+  local base = 3 + (i - 1) * 3
+  local capacity = tonumber(ARGV[base + 1])
+  local refill = tonumber(ARGV[base + 2])
+  wants[i] = tonumber(ARGV[base + 3])
+  local data = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local t = tonumber(data[1])
+  local ts = tonumber(data[2])
+  if t == nil then t = capacity end
+  if ts == nil then ts = now end
+  local elapsed = now - ts
+  if elapsed < 0 then elapsed = 0 end
+  t = math.min(capacity, t + elapsed * refill / 1000.0)
+  tokens[i] = t
+  if t < cost then
+    allowed = 0
+    local r = 60
+    if refill > 0 then r = math.ceil((cost - t) / refill) end
+    if r < 1 then r = 1 end
+    if r > retry then retry = r end
+  end
+end
+local out = {allowed, retry}
+for i = 1, #KEYS do
+  local t = tokens[i]
+  local granted = 0
+  if allowed == 1 then
+    t = t - cost
+    granted = math.max(0, math.min(wants[i], math.floor(t)))
+    t = t - granted
+  end
+  redis.call('HMSET', KEYS[i], 'tokens', t, 'ts', now)
+  redis.call('PEXPIRE', KEYS[i], ttl)
+  out[#out + 1] = math.floor(t)
+  out[#out + 1] = granted
+end
+return out
+"""
+
+
 class RedisTokenBucketStore:
     """Redis-backed token-bucket store: an atomic Lua script keeps the bucket state in Redis so a
     tenant's limit is enforced across ALL replicas (DEC-A). The client is injected (duck-typed on
@@ -339,6 +522,43 @@ class RedisTokenBucketStore:
         retry = int(result[2])
         return (allowed, 0 if allowed else retry, remaining)
 
+    def consume_many(
+        self,
+        buckets: Sequence[BucketSpec],
+        *,
+        cost: int = 1,
+        lease: Sequence[int] | None = None,
+    ) -> MultiBucketResult:
+        """Check and consume every bucket in one Lua script call (all or nothing).
+
+        Args:
+            buckets: Buckets the request draws from.
+            cost: Tokens to consume from each bucket (0 only tops up leases).
+            lease: Extra tokens to lease out per bucket if the request is admitted; each grant is
+                capped by what the bucket holds after ``cost`` is taken.
+
+        Returns:
+            MultiBucketResult with per-bucket remaining tokens and lease grants.
+        """
+        wants = list(lease) if lease is not None else [0] * len(buckets)
+        args: list[Any] = [int(time.time() * 1000), _REDIS_TTL_MS, cost]
+        for bucket, want in zip(buckets, wants, strict=True):
+            args.extend((bucket.capacity, bucket.refill_rate_per_sec, want))
+        result = self._client.eval(
+            _LUA_MULTI_TOKEN_BUCKET,
+            len(buckets),
+            *(self._prefix + bucket.key for bucket in buckets),
+            *args,
+        )
+        allowed = bool(int(result[0]))
+        per_bucket = [int(value) for value in result[2:]]
+        return MultiBucketResult(
+            allowed=allowed,
+            retry_after_seconds=0 if allowed else int(result[1]),
+            remaining=tuple(per_bucket[0::2]),
+            granted=tuple(per_bucket[1::2]),
+        )
+
     def reset(self) -> None:
         # Rate-limit keys are ephemeral (they PEXPIRE); a global reset is a safe no-op for the
         # shared store — the in-memory default provides a real reset() for tests.
@@ -347,10 +567,13 @@ class RedisTokenBucketStore:
 
 def build_default_rate_limit_store() -> RateLimitStore:
     """Select the rate-limit store: Redis (cross-replica) when IDIS_REDIS_URL is set, else the
-    per-process in-memory default."""
+    per-process in-memory default. The Redis store is fronted by a local token lease
+    (``idis.rate_limit.lease``) unless IDIS_RATE_LIMIT_LEASE_PCT is 0."""
     url = os.environ.get(ENV_REDIS_URL, "").strip()
     if url:
-        return RedisTokenBucketStore.from_url(url)
+        from idis.rate_limit.lease import maybe_lease  # lease builds on this module
+
+        return maybe_lease(RedisTokenBucketStore.from_url(url))
     return InMemoryRateLimitStore()
 
 
@@ -411,6 +634,111 @@ class TenantRateLimiter:
             tier=tier,
         )
 
+    def buckets_for(
+        self,
+        tenant_id: str,
+        tier: RateLimitTier,
+        *,
+        actor_id: str | None = None,
+        route_class: RouteClass | None = None,
+    ) -> list[BucketSpec]:
+        """Every bucket a request draws from; the tenant tier bucket is always first."""
+        burst = self._config.burst_multiplier
+        rpm = self._config.get_rpm(tier)
+        buckets = [
+            BucketSpec(
+                key=f"{tenant_id}:{tier.value}",
+                capacity=rpm * burst,
+                refill_rate_per_sec=rpm / SECONDS_PER_MINUTE,
+                limit_rpm=rpm,
+            )
+        ]
+        actor_rpm = self._config.actor_rpm
+        if actor_rpm is not None and actor_id:
+            buckets.append(
+                BucketSpec(
+                    key=f"{tenant_id}:actor:{actor_id}",
+                    capacity=actor_rpm * burst,
+                    refill_rate_per_sec=actor_rpm / SECONDS_PER_MINUTE,
+                    limit_rpm=actor_rpm,
+                    scope=RateLimitScope.ACTOR,
+                )
+            )
+        write_rpm = self._config.write_rpm
+        if write_rpm is not None and route_class == RouteClass.WRITE:
+            buckets.append(
+                BucketSpec(
+                    key=f"{tenant_id}:route:{route_class.value}",
+                    capacity=write_rpm * burst,
+                    refill_rate_per_sec=write_rpm / SECONDS_PER_MINUTE,
+                    limit_rpm=write_rpm,
+                    scope=RateLimitScope.ROUTE,
+                )
+            )
+        return buckets
+
+    def check_request(
+        self,
+        tenant_id: str,
+        tier: RateLimitTier,
+        *,
+        actor_id: str | None = None,
+        route_class: RouteClass | None = None,
+    ) -> RateLimitDecision:
+        """Check and consume a token from every applicable bucket (tier, actor, route class).
+
+        The request is admitted only if all buckets have a token. Stores implementing
+        MultiBucketRateLimitStore do this atomically (one Redis call); other stores are consumed
+        bucket by bucket, stopping at the first denial. Every shipped store is atomic; a custom
+        store offering only ``consume()`` keeps the tokens already taken from earlier buckets, so
+        its denied requests still spend quota on the buckets checked before the denying one.
+
+        Args:
+            tenant_id: The tenant identifier.
+            tier: The rate limit tier (user or integration).
+            actor_id: The authenticated actor, for the per-actor bucket.
+            route_class: The route class, for the route-class bucket.
+
+        Returns:
+            RateLimitDecision describing the denying (or tightest) bucket.
+        """
+        buckets = self.buckets_for(tenant_id, tier, actor_id=actor_id, route_class=route_class)
+        if isinstance(self._store, MultiBucketRateLimitStore):
+            atomic = True
+            result = self._store.consume_many(buckets)
+            allowed, retry_after = result.allowed, result.retry_after_seconds
+            remaining = list(result.remaining)
+        else:
+            atomic = False
+            allowed, retry_after, remaining = True, 0, []
+            for spec in buckets:
+                ok, retry, left = self._store.consume(
+                    key=spec.key,
+                    capacity=spec.capacity,
+                    refill_rate_per_sec=spec.refill_rate_per_sec,
+                )
+                remaining.append(left)
+                if not ok:
+                    allowed, retry_after = False, retry
+                    break
+
+        if not allowed and not atomic:
+            index = len(remaining) - 1  # consumption stopped at the denying bucket
+        else:
+            # Denied: the bucket without a token. Allowed: the tightest bucket. Ties keep the
+            # tier bucket, so responses are unchanged when no extra buckets are configured.
+            index = min(range(len(remaining)), key=remaining.__getitem__)
+        bucket = buckets[index]
+        return RateLimitDecision(
+            allowed=allowed,
+            retry_after_seconds=retry_after if not allowed else None,
+            remaining_tokens=remaining[index],
+            limit_rpm=bucket.limit_rpm,
+            burst_multiplier=self._config.burst_multiplier,
+            tier=tier,
+            scope=bucket.scope,
+        )
+
     def reset(self) -> None:
         """Reset all buckets (useful for testing)."""
         self._store.reset()
@@ -429,3 +757,10 @@ def classify_tier(roles: frozenset[str]) -> RateLimitTier:
     if "INTEGRATION_SERVICE" in roles:
         return RateLimitTier.INTEGRATION
     return RateLimitTier.USER
+
+
+def classify_route_class(method: str) -> RouteClass:
+    """Classify an HTTP method: mutating methods are WRITE, everything else READ."""
+    if method.upper() in ("POST", "PUT", "PATCH", "DELETE"):
+        return RouteClass.WRITE
+    return RouteClass.READ
@@ -472,6 +472,7 @@ class ComplianceJanitorWorker:
             await asyncio.sleep(self._poll_interval)
 
     def _sweep_all_tenants(self) -> None:
+        self._maintain_audit_partitions()
         # Fail-safe scoping (mirrors the other workers): no tenants configured -> no scan.
         for tenant_id in get_worker_tenant_ids():
             try:
@@ -479,6 +480,21 @@ class ComplianceJanitorWorker:
             except Exception:  # one tenant's failure must not starve the others
                 logger.warning("Compliance sweep failed for a tenant", exc_info=True)
 
+    def _maintain_audit_partitions(self) -> None:
+        """Keep monthly audit_events partitions provisioned ahead (cross-tenant DDL upkeep)."""
+        from idis.persistence.db import is_postgres_configured
+
+        if not is_postgres_configured():
+            return
+        try:
+            from idis.audit.partitions import ensure_audit_event_partitions
+            from idis.persistence.db import begin_app_conn
+
+            with begin_app_conn() as conn:
+                ensure_audit_event_partitions(conn)
+        except Exception:  # upkeep is best-effort: the DEFAULT partition keeps writes durable
+            logger.warning("Audit partition upkeep failed", exc_info=True)
+
     def _build_sources(self) -> list[RetentionSweepSource]:
         if self._sources is not None:
             return self._sources
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, field_validator
 
-from idis.audit.sink import AuditSink, InMemoryAuditSink
+from idis.audit.sink import AuditSink, InMemoryAuditSink, emit_audit_batch
 from idis.persistence.repositories.claims import (
     DefectsRepository,
     InMemoryDefectsRepository,
@@ -178,6 +178,11 @@ class DefectService:
         """Return the tenant context."""
         return self._tenant_id
 
+    @property
+    def audit_sink(self) -> AuditSink:
+        """Return the sink this service emits its audit events to."""
+        return self._audit_sink
+
     def _emit_audit_event(
         self,
         event_type: str,
@@ -187,6 +192,21 @@ class DefectService:
         request_id: str | None = None,
     ) -> None:
         """Emit an audit event for defect operations with request correlation."""
+        event = self._build_audit_event(event_type, defect_id, severity, details, request_id)
+        try:
+            self._audit_sink.emit(event)
+        except Exception as e:
+            logger.warning("Failed to emit audit event: %s", e)
+
+    def _build_audit_event(
+        self,
+        event_type: str,
+        defect_id: str,
+        severity: str = "MEDIUM",
+        details: dict[str, Any] | None = None,
+        request_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Build an audit event for defect operations with request correlation."""
         event: dict[str, Any] = {
             "event_id": str(uuid.uuid4()),
             "occurred_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
@@ -218,10 +238,7 @@ class DefectService:
         }
         if details:
             event["payload"]["details"] = details
-        try:
-            self._audit_sink.emit(event)
-        except Exception as e:
-            logger.warning("Failed to emit audit event: %s", e)
+        return event
 
     def create(self, input_data: CreateDefectInput) -> dict[str, Any]:
         """Create a new defect with severity matrix enforcement.
@@ -261,6 +278,60 @@ class DefectService:
 
         return defect_data
 
+    def create_many(
+        self,
+        inputs: list[CreateDefectInput],
+        *,
+        audit_events: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Create many defects with one multi-row insert and one audit batch.
+
+        Args:
+            inputs: Validated input data, one per defect.
+            audit_events: When given, ``defect.created`` events are appended here for the
+                caller to emit with its own batch instead of being emitted now.
+
+        Returns:
+            Created defect data dicts, in input order.
+        """
+        records: list[dict[str, Any]] = [
+            {
+                "defect_id": str(uuid.uuid4()),
+                "claim_id": input_data.claim_id,
+                "deal_id": input_data.deal_id,
+                "defect_type": input_data.defect_type,
+                "severity": input_data.severity or get_severity_for_type(input_data.defect_type),
+                "description": input_data.description,
+                "cure_protocol": input_data.cure_protocol,
+                "status": "OPEN",
+            }
+            for input_data in inputs
+        ]
+        created = self._defects_repo.create_many(records) if records else []
+
+        events = [
+            self._build_audit_event(
+                "defect.created",
+                record["defect_id"],
+                "HIGH" if record["severity"] == "FATAL" else "MEDIUM",
+                {
+                    "defect_type": record["defect_type"],
+                    "severity": record["severity"],
+                    "claim_id": record["claim_id"],
+                },
+                input_data.request_id,
+            )
+            for input_data, record in zip(inputs, records, strict=True)
+        ]
+        if audit_events is not None:
+            audit_events.extend(events)
+        else:
+            try:
+                emit_audit_batch(self._audit_sink, events)
+            except Exception as e:
+                logger.warning("Failed to emit audit events: %s", e)
+        return created
+
     def get(self, defect_id: str) -> dict[str, Any]:
         """Get a defect by ID.
 
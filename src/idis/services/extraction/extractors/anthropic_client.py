@@ -18,8 +18,12 @@ import time
 
 import anthropic
 
+from idis.observability.metrics import LLM_CALL_DURATION_SECONDS, observe_histogram
+
 logger = logging.getLogger(__name__)
 
+LLM_PROVIDER = "anthropic"
+
 MAX_RETRIES = 2
 RETRY_BACKOFF_BASE_SECONDS = 1.0
 REQUEST_TIMEOUT_SECONDS = 120
@@ -79,6 +83,21 @@ class AnthropicLLMClient:
         Raises:
             RuntimeError: If all retry attempts fail.
         """
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            text = self._call_with_retries(prompt, json_mode=json_mode)
+            outcome = "ok"
+            return text
+        finally:
+            observe_histogram(
+                LLM_CALL_DURATION_SECONDS,
+                time.perf_counter() - started,
+                labels={"provider": LLM_PROVIDER, "outcome": outcome},
+            )
+
+    def _call_with_retries(self, prompt: str, *, json_mode: bool) -> str:
+        """Send the prompt, retrying transient errors with exponential backoff."""
         system_parts: list[str] = []
         if json_mode:
             system_parts.append(
@@ -4,6 +4,7 @@ Provides:
 - Deduplicator: Identifies duplicate claims via UUIDv5 identity
 - ConflictDetector: Detects value conflicts between claims
 - ConflictRecord: Structured conflict data
+- engine: Sort-and-sweep grouping shared by both
 """
 
 from idis.services.extraction.resolution.conflict_detector import (
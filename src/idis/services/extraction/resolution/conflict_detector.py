@@ -1,8 +1,9 @@
 """ConflictDetector — detects value conflicts between claims per spec §5.
 
 Conflict rules per spec §5.2–5.3:
-- Same claim_class + same metric key with values differing >5% → conflict
-- Conflict records include both claim identities and resolution status
+- Same claim_class + predicate + time_window with values differing >5% → conflict
+- One conflict record per (class, predicate, time_window) cluster, carrying the min/max
+  spread and every member identity, instead of one record per conflicting pair
 """
 
 from __future__ import annotations
@@ -12,9 +13,12 @@ import uuid
 from dataclasses import dataclass, field
 from decimal import Decimal
 
-from idis.services.extraction.resolution.deduplicator import (
-    DeduplicatedClaim,
-    _extract_numeric_value,
+from idis.services.extraction.resolution.deduplicator import DeduplicatedClaim
+from idis.services.extraction.resolution.engine import (
+    NumericClaim,
+    ResolutionKey,
+    group_numeric_claims,
+    value_spread,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,16 +28,19 @@ CONFLICT_THRESHOLD = Decimal("0.05")
 
 @dataclass(frozen=True)
 class ConflictRecord:
-    """Structured conflict between two claims.
+    """Structured conflict across a cluster of claims.
 
     Attributes:
         conflict_id: Unique UUID for this conflict.
-        claim_identity_a: Identity hash of first claim.
-        claim_identity_b: Identity hash of second claim.
+        claim_identity_a: Identity hash of the claim with the lowest value.
+        claim_identity_b: Identity hash of the claim with the highest value.
         conflict_type: Type of conflict (VALUE_MISMATCH).
         resolution_status: Current status (PENDING, RESOLVED).
-        pct_difference: Percentage difference between values.
+        pct_difference: Relative min/max spread of the cluster.
         details: Additional context about the conflict.
+        member_identities: Identity hashes of every claim in the cluster, by value.
+        min_value: Lowest value in the cluster.
+        max_value: Highest value in the cluster.
     """
 
     conflict_id: str
@@ -43,6 +50,9 @@ class ConflictRecord:
     resolution_status: str = "PENDING"
     pct_difference: str = "0"
     details: str = ""
+    member_identities: tuple[str, ...] = ()
+    min_value: str = ""
+    max_value: str = ""
 
 
 @dataclass
@@ -56,8 +66,8 @@ class ConflictDetectionResult:
 class ConflictDetector:
     """Detects value conflicts between deduplicated claims.
 
-    Groups claims by claim_class and compares numeric values.
-    Conflicts are flagged when values differ by more than 5%.
+    Groups claims by (claim_class, predicate, time_window) and reports one conflict per
+    group whose min/max values differ by more than 5%.
     """
 
     def detect(
@@ -74,12 +84,10 @@ class ConflictDetector:
         """
         conflicts: list[ConflictRecord] = []
 
-        by_class: dict[str, list[DeduplicatedClaim]] = {}
-        for claim in claims:
-            by_class.setdefault(claim.claim_class, []).append(claim)
-
-        for class_claims in by_class.values():
-            conflicts.extend(self._detect_in_group(class_claims))
+        for key, group in group_numeric_claims(claims).items():
+            conflict = self._detect_in_group(key, group)
+            if conflict is not None:
+                conflicts.append(conflict)
 
         return ConflictDetectionResult(
             conflicts=conflicts,
@@ -88,49 +96,39 @@ class ConflictDetector:
 
     def _detect_in_group(
         self,
-        group: list[DeduplicatedClaim],
-    ) -> list[ConflictRecord]:
-        """Detect conflicts within a same-class group.
+        key: ResolutionKey,
+        group: list[NumericClaim],
+    ) -> ConflictRecord | None:
+        """Detect a conflict cluster within one resolution group.
 
         Args:
-            group: Claims of the same class.
+            key: The group's (claim_class, predicate, time_window).
+            group: Numeric claims of the group.
 
         Returns:
-            List of conflict records for this group.
+            Conflict record for the group, or None when its spread is within threshold.
         """
-        conflicts: list[ConflictRecord] = []
-
-        for i, a in enumerate(group):
-            val_a = _extract_numeric_value({"value": a.value})
-            if val_a is None:
-                continue
-
-            for b in group[i + 1 :]:
-                val_b = _extract_numeric_value({"value": b.value})
-                if val_b is None:
-                    continue
-
-                denominator = max(abs(val_a), abs(val_b))
-                if denominator == Decimal("0"):
-                    continue
-
-                pct_diff = abs(val_a - val_b) / denominator
-
-                if pct_diff > CONFLICT_THRESHOLD:
-                    conflicts.append(
-                        ConflictRecord(
-                            conflict_id=str(uuid.uuid4()),
-                            claim_identity_a=a.identity_hash,
-                            claim_identity_b=b.identity_hash,
-                            conflict_type="VALUE_MISMATCH",
-                            resolution_status="PENDING",
-                            pct_difference=str(pct_diff),
-                            details=(
-                                f"{a.claim_class}: "
-                                f"'{a.claim_text[:80]}' ({val_a}) vs "
-                                f"'{b.claim_text[:80]}' ({val_b})"
-                            ),
-                        )
-                    )
-
-        return conflicts
+        spread = value_spread(group)
+        if spread is None or spread.pct_difference <= CONFLICT_THRESHOLD:
+            return None
+
+        low, high = spread.low, spread.high
+        members = sorted(group, key=lambda m: (m.value, m.index))
+        claim_class, predicate, time_window = key
+        label = "/".join(part for part in (claim_class, predicate, time_window) if part)
+        return ConflictRecord(
+            conflict_id=str(uuid.uuid4()),
+            claim_identity_a=low.claim.identity_hash,
+            claim_identity_b=high.claim.identity_hash,
+            conflict_type="VALUE_MISMATCH",
+            resolution_status="PENDING",
+            pct_difference=str(spread.pct_difference),
+            details=(
+                f"{label}: {len(members)} claims span "
+                f"'{low.claim.claim_text[:80]}' ({low.value}) to "
+                f"'{high.claim.claim_text[:80]}' ({high.value})"
+            ),
+            member_identities=tuple(m.claim.identity_hash for m in members),
+            min_value=str(low.value),
+            max_value=str(high.value),
+        )
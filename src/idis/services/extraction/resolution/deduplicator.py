@@ -3,8 +3,8 @@
 Deduplication rules per spec §5.2:
 - Exact match: claim_text identical (normalized) → merge, keep highest confidence
 - Value match: same claim_class, same numeric value, same time_window → merge
-- Near match: same metric, values within 5% → flag for reconciliation
-- Conflict: same metric, values differ > 5% → create conflict record
+- Near match: same class, predicate and time_window, values within 5% → flag for reconciliation
+- Conflict: same class, predicate and time_window, values differ > 5% → create conflict record
 
 Claim identity is computed as UUIDv5(namespace=deal_id, name=normalized_claim_text).
 """
@@ -18,6 +18,14 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any
 
+from idis.services.extraction.resolution.engine import (
+    NEAR_MATCH_THRESHOLD,
+    group_numeric_claims,
+    parse_numeric_value,
+    parse_time_window,
+    sweep_near_matches,
+)
+
 logger = logging.getLogger(__name__)
 
 DEDUP_NAMESPACE = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
@@ -81,16 +89,7 @@ def _extract_numeric_value(claim: dict[str, Any]) -> Decimal | None:
     Returns:
         Decimal value or None if not numeric.
     """
-    value_struct = claim.get("value")
-    if not value_struct or not isinstance(value_struct, dict):
-        return None
-    raw_value = value_struct.get("value")
-    if raw_value is None:
-        return None
-    try:
-        return Decimal(str(raw_value))
-    except Exception:
-        return None
+    return parse_numeric_value(claim.get("value"))
 
 
 def _extract_time_window(claim: dict[str, Any]) -> str | None:
@@ -102,11 +101,7 @@ def _extract_time_window(claim: dict[str, Any]) -> str | None:
     Returns:
         Time window string or None.
     """
-    value_struct = claim.get("value")
-    if not value_struct or not isinstance(value_struct, dict):
-        return None
-    tw = value_struct.get("time_window")
-    return str(tw) if tw is not None else None
+    return parse_time_window(claim.get("value"))
 
 
 def _value_merge_key(claim: dict[str, Any]) -> tuple[str, str, str] | None:
@@ -134,7 +129,8 @@ class Deduplicator:
     """Identifies and merges duplicate claims using deterministic identity.
 
     Uses UUIDv5(deal_id, normalized_text) for exact match detection.
-    Near matches (within 5%) and conflicts (>5% diff) are flagged separately.
+    Near matches (within 5%) and conflicts (>5% diff) are flagged separately, both through
+    the sort-and-sweep resolution engine.
     """
 
     def deduplicate(
@@ -260,10 +256,11 @@ class Deduplicator:
         self,
         claims: list[DeduplicatedClaim],
     ) -> list[tuple[str, str]]:
-        """Find near matches: same claim_class with values within 5%.
+        """Find near matches: same class, predicate and time window with values within 5%.
 
         Values that differ by ≤5% are near-matches (flagged for reconciliation).
         Values that differ by >5% are conflicts (handled by ConflictDetector).
+        Each bucket is sorted once and swept with a sliding window.
 
         Args:
             claims: Deduplicated claims.
@@ -272,26 +269,9 @@ class Deduplicator:
             List of (identity_hash_a, identity_hash_b) pairs that are near matches.
         """
         near: list[tuple[str, str]] = []
-        by_class: dict[str, list[DeduplicatedClaim]] = {}
-        for claim in claims:
-            by_class.setdefault(claim.claim_class, []).append(claim)
-
-        for class_claims in by_class.values():
-            for i, a in enumerate(class_claims):
-                val_a = _extract_numeric_value({"value": a.value})
-                if val_a is None:
-                    continue
-                for b in class_claims[i + 1 :]:
-                    val_b = _extract_numeric_value({"value": b.value})
-                    if val_b is None:
-                        continue
-                    if val_a == Decimal("0") and val_b == Decimal("0"):
-                        continue
-                    denominator = max(abs(val_a), abs(val_b))
-                    if denominator == Decimal("0"):
-                        continue
-                    pct_diff = abs(val_a - val_b) / denominator
-                    if pct_diff <= Decimal("0.05"):
-                        near.append((a.identity_hash, b.identity_hash))
-
+        for group in group_numeric_claims(claims).values():
+            near.extend(
+                (a.claim.identity_hash, b.claim.identity_hash)
+                for a, b in sweep_near_matches(group, NEAR_MATCH_THRESHOLD)
+            )
         return near
@@ -0,0 +1,174 @@
+"""Resolution engine — sort-and-sweep grouping shared by dedup and conflict detection.
+
+Numeric claim values are parsed once and bucketed by (claim_class, predicate, time_window).
+Within a bucket the relative difference |a - b| / max(|a|, |b|) has two properties that
+replace pairwise scans:
+
+- Values of opposite sign always differ by at least 100%, and zero differs from any non-zero
+  value by exactly 100%, so near-matches only exist between non-zero values of the same sign.
+- For same-sign values the difference grows with the distance between magnitudes, so the
+  near-matches of a value form a contiguous window in magnitude order (a sliding window) and
+  the largest difference in the bucket is the one between its min and max values.
+
+Near-matches are therefore found in O(n log n + matches) and a conflict is reported once per
+bucket as a min/max spread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from idis.services.extraction.resolution.deduplicator import DeduplicatedClaim
+
+NEAR_MATCH_THRESHOLD: Final[Decimal] = Decimal("0.05")
+
+ResolutionKey = tuple[str, str | None, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class NumericClaim:
+    """A claim with its numeric value parsed once.
+
+    Attributes:
+        index: Position of the claim in the input list (stable tie-breaker).
+        value: Parsed numeric value.
+        claim: The deduplicated claim.
+    """
+
+    index: int
+    value: Decimal
+    claim: DeduplicatedClaim
+
+
+@dataclass(frozen=True, slots=True)
+class ValueSpread:
+    """Min/max spread of the numeric values in one resolution bucket.
+
+    Attributes:
+        low: Claim holding the smallest value.
+        high: Claim holding the largest value.
+        pct_difference: Relative difference between low and high.
+    """
+
+    low: NumericClaim
+    high: NumericClaim
+    pct_difference: Decimal
+
+
+def parse_numeric_value(value_struct: Any) -> Decimal | None:
+    """Parse the numeric ``value`` of a claim value struct.
+
+    Args:
+        value_struct: Claim ``value`` field (dict or None).
+
+    Returns:
+        Decimal value or None if absent or not numeric.
+    """
+    if not value_struct or not isinstance(value_struct, dict):
+        return None
+    raw_value = value_struct.get("value")
+    if raw_value is None:
+        return None
+    try:
+        return Decimal(str(raw_value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def parse_time_window(value_struct: Any) -> str | None:
+    """Parse the ``time_window`` of a claim value struct.
+
+    Args:
+        value_struct: Claim ``value`` field (dict or None).
+
+    Returns:
+        Time window string or None.
+    """
+    if not value_struct or not isinstance(value_struct, dict):
+        return None
+    tw = value_struct.get("time_window")
+    return str(tw) if tw is not None else None
+
+
+def relative_difference(a: Decimal, b: Decimal) -> Decimal | None:
+    """Relative difference |a - b| / max(|a|, |b|), or None when both are zero."""
+    denominator = max(abs(a), abs(b))
+    if denominator == 0:
+        return None
+    return abs(a - b) / denominator
+
+
+def group_numeric_claims(
+    claims: list[DeduplicatedClaim],
+) -> dict[ResolutionKey, list[NumericClaim]]:
+    """Bucket claims with a numeric value by (claim_class, predicate, time_window).
+
+    Claims without a numeric value are skipped. Buckets preserve input order.
+
+    Args:
+        claims: Deduplicated claims.
+
+    Returns:
+        Mapping of resolution key to the bucket's numeric claims.
+    """
+    groups: dict[ResolutionKey, list[NumericClaim]] = {}
+    for index, claim in enumerate(claims):
+        value = parse_numeric_value(claim.value)
+        if value is None:
+            continue
+        key = (claim.claim_class, claim.predicate, parse_time_window(claim.value))
+        groups.setdefault(key, []).append(NumericClaim(index=index, value=value, claim=claim))
+    return groups
+
+
+def sweep_near_matches(
+    group: list[NumericClaim],
+    threshold: Decimal = NEAR_MATCH_THRESHOLD,
+) -> list[tuple[NumericClaim, NumericClaim]]:
+    """Find all pairs within ``threshold`` relative difference using a sliding window.
+
+    Args:
+        group: Numeric claims of one resolution bucket.
+        threshold: Maximum relative difference for a near-match (inclusive).
+
+    Returns:
+        Pairs ordered by input position, each as (earlier, later).
+    """
+    pairs: list[tuple[NumericClaim, NumericClaim]] = []
+    factor = 1 - threshold
+    for same_sign in (
+        [m for m in group if m.value > 0],
+        [m for m in group if m.value < 0],
+    ):
+        same_sign.sort(key=lambda m: (abs(m.value), m.index))
+        lo = 0
+        for hi, b in enumerate(same_sign):
+            floor = abs(b.value) * factor
+            while abs(same_sign[lo].value) < floor:
+                lo += 1
+            for a in same_sign[lo:hi]:
+                pairs.append((a, b) if a.index < b.index else (b, a))
+    pairs.sort(key=lambda pair: (pair[0].index, pair[1].index))
+    return pairs
+
+
+def value_spread(group: list[NumericClaim]) -> ValueSpread | None:
+    """Compute the min/max spread of a resolution bucket.
+
+    Args:
+        group: Numeric claims of one resolution bucket.
+
+    Returns:
+        ValueSpread, or None for fewer than two claims or an all-zero bucket.
+    """
+    if len(group) < 2:
+        return None
+    low = min(group, key=lambda m: (m.value, m.index))
+    high = max(group, key=lambda m: (m.value, -m.index))
+    pct = relative_difference(low.value, high.value)
+    if pct is None:
+        return None
+    return ValueSpread(low=low, high=high, pct_difference=pct)
@@ -99,6 +99,34 @@ class SafePreflightClassificationInput:
 PlannerClassification = DocumentClassification | SafePreflightClassificationInput
 
 
+@dataclass(frozen=True)
+class _SpanPlanningIndex:
+    """Source spans indexed once per planning run.
+
+    ``spans_by_document_id`` holds each document's spans sorted by span_id.
+    ``tag_postings`` maps a normalized evidence tag to the documents carrying it and the
+    number of tagged span occurrences per document.
+    """
+
+    spans_by_document_id: dict[str, list[SourceSpanReference]]
+    tag_postings: dict[str, dict[str, int]]
+
+    def documents_with_required_evidence(self, question: MethodologyQuestion) -> set[str] | None:
+        """Return documents meeting every evidence min_count, or None if nothing is required."""
+        satisfied: set[str] | None = None
+        for evidence in question.required_evidence:
+            postings = self.tag_postings.get(evidence.evidence_type.lower().strip(), {})
+            documents = {
+                document_id
+                for document_id, count in postings.items()
+                if count >= evidence.min_count
+            }
+            satisfied = documents if satisfied is None else satisfied & documents
+            if not satisfied:
+                break
+        return satisfied
+
+
 class InMemoryExtractionTaskPlanner:
     """Plan extraction task metadata without executing extraction."""
 
@@ -130,6 +158,7 @@ class InMemoryExtractionTaskPlanner:
         )
 
         tasks: list[ExtractionTask] = []
+        span_index = _build_span_planning_index(source_spans_by_document_id)
         question_records = _question_records_for_planning(
             tenant_id=tenant_id,
             deal_id=deal_id,
@@ -147,7 +176,7 @@ class InMemoryExtractionTaskPlanner:
                     coverage_record.coverage_record_id if coverage_record is not None else None
                 ),
                 classifications=scoped_classifications,
-                source_spans_by_document_id=source_spans_by_document_id,
+                span_index=span_index,
             )
             tasks.extend(question_tasks)
 
@@ -178,7 +207,7 @@ class InMemoryExtractionTaskPlanner:
         question: MethodologyQuestion,
         coverage_record_id: str | None,
         classifications: Sequence[PlannerClassification],
-        source_spans_by_document_id: dict[str, list[SourceSpanReference]],
+        span_index: _SpanPlanningIndex,
     ) -> list[ExtractionTask]:
         if not classifications:
             return [
@@ -194,11 +223,7 @@ class InMemoryExtractionTaskPlanner:
                 )
             ]
 
-        category_matches = [
-            classification
-            for classification in classifications
-            if _classification_matches_question(question, classification)
-        ]
+        category_matches = _classifications_matching_question(question, classifications)
         if not category_matches:
             return [
                 _blocked_task(
@@ -213,16 +238,18 @@ class InMemoryExtractionTaskPlanner:
                 )
             ]
 
+        evidence_documents = span_index.documents_with_required_evidence(question)
         tasks: list[ExtractionTask] = []
         for classification in category_matches:
             blocker_reason = _triage_blocker_for(classification)
-            spans = sorted(
-                source_spans_by_document_id.get(classification.document_id, []),
-                key=lambda span: span.span_id,
-            )
+            spans = span_index.spans_by_document_id.get(classification.document_id, [])
             if blocker_reason is None and not spans:
                 blocker_reason = ExtractionTaskBlockerReason.NO_SOURCE_SPANS
-            if blocker_reason is None and not _required_evidence_is_present(question, spans):
+            if (
+                blocker_reason is None
+                and evidence_documents is not None
+                and classification.document_id not in evidence_documents
+            ):
                 blocker_reason = ExtractionTaskBlockerReason.REQUIRED_EVIDENCE_MISSING
 
             if blocker_reason is not None:
@@ -241,26 +268,14 @@ class InMemoryExtractionTaskPlanner:
                 continue
 
             tasks.append(
-                ExtractionTask(
+                _ready_task(
                     tenant_id=tenant_id,
                     deal_id=deal_id,
                     run_id=run_id,
-                    status=ExtractionTaskStatus.READY,
-                    methodology_id=question.methodology_id,
-                    methodology_version_id=question.methodology_version_id,
-                    methodology_question_id=question.methodology_question_id,
-                    methodology_type=question.methodology_type,
-                    methodology_section=question.section,
+                    question=question,
                     coverage_record_id=coverage_record_id,
-                    document_id=classification.document_id,
-                    classification_id=classification.classification_id,
+                    classification=classification,
                     source_spans=spans,
-                    target_fdd_category=classification.fdd_category,
-                    target_cdd_category=classification.cdd_category,
-                    required_evidence=question.required_evidence,
-                    expected_answer_schema=build_expected_answer_schema(question),
-                    validation_requirements=question.validation_requirements,
-                    reason_codes=["ready"],
                 )
             )
         return tasks
@@ -281,6 +296,39 @@ def build_expected_answer_schema(question: MethodologyQuestion) -> ExpectedAnswe
     )
 
 
+def _ready_task(
+    *,
+    tenant_id: str,
+    deal_id: str,
+    run_id: str,
+    question: MethodologyQuestion,
+    coverage_record_id: str | None,
+    classification: PlannerClassification,
+    source_spans: list[SourceSpanReference],
+) -> ExtractionTask:
+    return ExtractionTask(
+        tenant_id=tenant_id,
+        deal_id=deal_id,
+        run_id=run_id,
+        status=ExtractionTaskStatus.READY,
+        methodology_id=question.methodology_id,
+        methodology_version_id=question.methodology_version_id,
+        methodology_question_id=question.methodology_question_id,
+        methodology_type=question.methodology_type,
+        methodology_section=question.section,
+        coverage_record_id=coverage_record_id,
+        document_id=classification.document_id,
+        classification_id=classification.classification_id,
+        source_spans=source_spans,
+        target_fdd_category=classification.fdd_category,
+        target_cdd_category=classification.cdd_category,
+        required_evidence=question.required_evidence,
+        expected_answer_schema=build_expected_answer_schema(question),
+        validation_requirements=question.validation_requirements,
+        reason_codes=["ready"],
+    )
+
+
 def _blocked_task(
     *,
     tenant_id: str,
@@ -321,13 +369,33 @@ def _blocked_task(
     )
 
 
-def _classification_matches_question(
+def _build_span_planning_index(
+    source_spans_by_document_id: dict[str, list[SourceSpanReference]],
+) -> _SpanPlanningIndex:
+    spans_by_document_id: dict[str, list[SourceSpanReference]] = {}
+    tag_postings: dict[str, dict[str, int]] = {}
+    for document_id, document_spans in source_spans_by_document_id.items():
+        spans = sorted(document_spans, key=lambda span: span.span_id)
+        spans_by_document_id[document_id] = spans
+        for span in spans:
+            for tag in span.evidence_tags:
+                postings = tag_postings.setdefault(tag.lower().strip(), {})
+                postings[document_id] = postings.get(document_id, 0) + 1
+    return _SpanPlanningIndex(
+        spans_by_document_id=spans_by_document_id,
+        tag_postings=tag_postings,
+    )
+
+
+def _classifications_matching_question(
     question: MethodologyQuestion,
-    classification: PlannerClassification,
-) -> bool:
+    classifications: Sequence[PlannerClassification],
+) -> list[PlannerClassification]:
     if question.methodology_type == MethodologyType.FINANCIAL_DD:
-        return classification.fdd_category in _normalized_fdd_targets(question)
-    return classification.cdd_category in _normalized_cdd_targets(question)
+        fdd_targets = _normalized_fdd_targets(question)
+        return [c for c in classifications if c.fdd_category in fdd_targets]
+    cdd_targets = _normalized_cdd_targets(question)
+    return [c for c in classifications if c.cdd_category in cdd_targets]
 
 
 def _normalized_fdd_targets(question: MethodologyQuestion) -> set[FddDocumentCategory]:
@@ -354,17 +422,6 @@ def _normalized_cdd_targets(question: MethodologyQuestion) -> set[CddDocumentCat
     return targets
 
 
-def _required_evidence_is_present(
-    question: MethodologyQuestion,
-    spans: list[SourceSpanReference],
-) -> bool:
-    available_counts = Counter(tag.lower().strip() for span in spans for tag in span.evidence_tags)
-    return all(
-        available_counts[evidence.evidence_type.lower().strip()] >= evidence.min_count
-        for evidence in question.required_evidence
-    )
-
-
 def _triage_blocker_for(
     classification: PlannerClassification,
 ) -> ExtractionTaskBlockerReason | None:
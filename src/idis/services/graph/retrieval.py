@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 from idis.persistence.graph_repo import GraphRepository
 
@@ -53,6 +53,42 @@ class GraphRepositoryProtocol(Protocol):
     ) -> list[dict[str, Any]]: ...
 
 
+@runtime_checkable
+class BatchedGraphRepositoryProtocol(Protocol):
+    """Set-based variants: one read per query family for all claims/defects, keyed by id."""
+
+    def get_claim_sanad_chain_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+    def get_independence_clusters_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+    def get_weakest_link_batch(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+    def get_defect_impact_batch(
+        self,
+        *,
+        tenant_id: str,
+        defect_ids: list[str],
+    ) -> dict[str, list[dict[str, Any]]]: ...
+
+
+_Records = dict[str, list[dict[str, Any]]]
+
+
 class GraphRetrievalService:
     """Run existing Neo4j Cypher retrievals and return safe counts only."""
 
@@ -74,6 +110,9 @@ class GraphRetrievalService:
         derived deterministically from safe fields only (ids, grades, statuses, counts) — never
         raw spans/text/paths/source names. The defect-impact query is run only when ``defect_ids``
         are supplied.
+
+        When the repository implements the batched variants, each query family runs once for
+        all claims (or defects) instead of once per id; the summary is identical either way.
         """
         query_summaries: list[dict[str, Any]] = []
 
@@ -94,60 +133,50 @@ class GraphRetrievalService:
         )
 
         safe_claim_ids = sorted({claim_id for claim_id in claim_ids if claim_id})
-        claim_conclusions: list[dict[str, Any]] = []
-        for claim_id in safe_claim_ids:
-            chain = self._graph_repo.get_claim_sanad_chain(
-                tenant_id=tenant_id,
-                claim_id=claim_id,
-            )
-            query_summaries.append(
-                {
-                    "query": "claim_sanad_chain",
-                    "claim_id": claim_id,
-                    "record_count": len(chain),
-                }
-            )
-            clusters = self._graph_repo.get_independence_clusters(
+        safe_defect_ids = sorted({defect_id for defect_id in (defect_ids or []) if defect_id})
+        if isinstance(self._graph_repo, BatchedGraphRepositoryProtocol):
+            chains, clusters, weakest, impacts = self._read_batched(
+                self._graph_repo,
                 tenant_id=tenant_id,
-                claim_id=claim_id,
+                claim_ids=safe_claim_ids,
+                defect_ids=safe_defect_ids,
             )
-            query_summaries.append(
-                {
-                    "query": "independence_clusters",
-                    "claim_id": claim_id,
-                    "record_count": len(clusters),
-                }
-            )
-            weakest = self._graph_repo.get_weakest_link(
+        else:
+            chains, clusters, weakest, impacts = self._read_per_item(
                 tenant_id=tenant_id,
-                claim_id=claim_id,
-            )
-            query_summaries.append(
-                {
-                    "query": "weakest_link",
-                    "claim_id": claim_id,
-                    "record_count": len(weakest),
-                }
+                claim_ids=safe_claim_ids,
+                defect_ids=safe_defect_ids,
             )
+
+        claim_conclusions: list[dict[str, Any]] = []
+        for claim_id in safe_claim_ids:
+            for query, records in (
+                ("claim_sanad_chain", chains[claim_id]),
+                ("independence_clusters", clusters[claim_id]),
+                ("weakest_link", weakest[claim_id]),
+            ):
+                query_summaries.append(
+                    {"query": query, "claim_id": claim_id, "record_count": len(records)}
+                )
             claim_conclusions.append(
-                _claim_conclusion(claim_id, chain=chain, clusters=clusters, weakest=weakest)
+                _claim_conclusion(
+                    claim_id,
+                    chain=chains[claim_id],
+                    clusters=clusters[claim_id],
+                    weakest=weakest[claim_id],
+                )
             )
 
-        safe_defect_ids = sorted({defect_id for defect_id in (defect_ids or []) if defect_id})
         defect_impacts: list[dict[str, Any]] = []
         for defect_id in safe_defect_ids:
-            impact = self._graph_repo.get_defect_impact(
-                tenant_id=tenant_id,
-                defect_id=defect_id,
-            )
             query_summaries.append(
                 {
                     "query": "defect_impact",
                     "defect_id": defect_id,
-                    "record_count": len(impact),
+                    "record_count": len(impacts[defect_id]),
                 }
             )
-            defect_impacts.append(_defect_conclusion(defect_id, records=impact))
+            defect_impacts.append(_defect_conclusion(defect_id, records=impacts[defect_id]))
 
         return {
             "status": "retrieved",
@@ -163,6 +192,66 @@ class GraphRetrievalService:
             },
         }
 
+    def _read_per_item(
+        self,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+        defect_ids: list[str],
+    ) -> tuple[_Records, _Records, _Records, _Records]:
+        """Run the §4.4.1/3/4 queries per claim and §4.4.5 per defect (one read each)."""
+        chains = {
+            claim_id: self._graph_repo.get_claim_sanad_chain(tenant_id=tenant_id, claim_id=claim_id)
+            for claim_id in claim_ids
+        }
+        clusters = {
+            claim_id: self._graph_repo.get_independence_clusters(
+                tenant_id=tenant_id, claim_id=claim_id
+            )
+            for claim_id in claim_ids
+        }
+        weakest = {
+            claim_id: self._graph_repo.get_weakest_link(tenant_id=tenant_id, claim_id=claim_id)
+            for claim_id in claim_ids
+        }
+        impacts = {
+            defect_id: self._graph_repo.get_defect_impact(tenant_id=tenant_id, defect_id=defect_id)
+            for defect_id in defect_ids
+        }
+        return chains, clusters, weakest, impacts
+
+    def _read_batched(
+        self,
+        graph_repo: BatchedGraphRepositoryProtocol,
+        *,
+        tenant_id: str,
+        claim_ids: list[str],
+        defect_ids: list[str],
+    ) -> tuple[_Records, _Records, _Records, _Records]:
+        """Run each query family once for every claim/defect (at most four reads in total)."""
+        empty: _Records = {}
+        if claim_ids:
+            chains = graph_repo.get_claim_sanad_chain_batch(
+                tenant_id=tenant_id, claim_ids=claim_ids
+            )
+            clusters = graph_repo.get_independence_clusters_batch(
+                tenant_id=tenant_id, claim_ids=claim_ids
+            )
+            weakest = graph_repo.get_weakest_link_batch(tenant_id=tenant_id, claim_ids=claim_ids)
+        else:
+            chains, clusters, weakest = empty, empty, empty
+        impacts = (
+            graph_repo.get_defect_impact_batch(tenant_id=tenant_id, defect_ids=defect_ids)
+            if defect_ids
+            else empty
+        )
+        return (
+            {claim_id: chains.get(claim_id, []) for claim_id in claim_ids},
+            {claim_id: clusters.get(claim_id, []) for claim_id in claim_ids},
+            {claim_id: weakest.get(claim_id, []) for claim_id in claim_ids},
+            {defect_id: impacts.get(defect_id, []) for defect_id in defect_ids},
+        )
+
 
 def _claim_conclusion(
     claim_id: str,
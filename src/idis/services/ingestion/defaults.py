@@ -6,6 +6,7 @@ import os
 from collections.abc import Mapping
 
 from idis.audit.sink import AuditSink
+from idis.parsers.base import XlsxSpanMode
 from idis.parsers.media import (
     FASTER_WHISPER_ADAPTER_NAME,
     FasterWhisperMediaAdapter,
@@ -32,6 +33,7 @@ IDIS_MEDIA_TIMEOUT_SECONDS_ENV = "IDIS_MEDIA_TIMEOUT_SECONDS"
 IDIS_MEDIA_LANGUAGE_ENV = "IDIS_MEDIA_LANGUAGE"
 IDIS_MEDIA_COMPUTE_TYPE_ENV = "IDIS_MEDIA_COMPUTE_TYPE"
 IDIS_MEDIA_MAX_DURATION_SECONDS_ENV = "IDIS_MEDIA_MAX_DURATION_SECONDS"
+IDIS_XLSX_SPAN_MODE_ENV = "IDIS_XLSX_SPAN_MODE"
 
 
 def build_default_compliance_store() -> ComplianceEnforcedStore:
@@ -56,6 +58,7 @@ def build_default_ingestion_service(audit_sink: AuditSink | None = None) -> Inge
         audit_sink=audit_sink,
         ocr_config=build_default_ocr_config(),
         media_config=build_default_media_config(),
+        xlsx_span_mode=build_default_xlsx_span_mode(),
     )
 
 
@@ -102,6 +105,18 @@ def build_default_media_config(env: Mapping[str, str] | None = None) -> MediaCon
     )
 
 
+def build_default_xlsx_span_mode(env: Mapping[str, str] | None = None) -> XlsxSpanMode:
+    """Build the XLSX span granularity from runtime environment (per cell by default)."""
+    values = os.environ if env is None else env
+    mode_name = values.get(IDIS_XLSX_SPAN_MODE_ENV, "").strip().lower()
+    if not mode_name:
+        return XlsxSpanMode.CELL
+    try:
+        return XlsxSpanMode(mode_name)
+    except ValueError:
+        raise ValueError(f"Unsupported XLSX span mode for ingestion: {mode_name}") from None
+
+
 def _truthy(value: str | None) -> bool:
     return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
 
@@ -36,7 +36,7 @@ from idis.compliance.byok import DataClass
 from idis.models.document import Document, DocumentType, ParseStatus
 from idis.models.document_artifact import DocType, DocumentArtifact
 from idis.models.document_span import DocumentSpan
-from idis.parsers.base import ParseError, ParseErrorCode, ParseLimits, ParseResult
+from idis.parsers.base import ParseError, ParseErrorCode, ParseLimits, ParseResult, XlsxSpanMode
 from idis.parsers.media import FASTER_WHISPER_ADAPTER_NAME, FasterWhisperMediaAdapter, MediaConfig
 from idis.parsers.ocr import OcrConfig
 from idis.parsers.registry import parse_bytes
@@ -685,6 +685,7 @@ class IngestionService:
         parse_limits: ParseLimits | None = None,
         ocr_config: OcrConfig | None = None,
         media_config: MediaConfig | None = None,
+        xlsx_span_mode: XlsxSpanMode = XlsxSpanMode.CELL,
     ) -> None:
         """Initialize the ingestion service.
 
@@ -698,6 +699,7 @@ class IngestionService:
             parse_limits: Parser limits configuration.
             ocr_config: Explicit OCR execution config. Disabled by default.
             media_config: Explicit media transcription config. Disabled by default.
+            xlsx_span_mode: XLSX span granularity. One span per cell by default.
         """
         self._compliant_store = compliant_store
         self._audit_sink = audit_sink or InMemoryAuditSink()
@@ -707,6 +709,7 @@ class IngestionService:
         self._parse_limits = parse_limits or ParseLimits()
         self._ocr_config = ocr_config
         self._media_config = media_config
+        self._xlsx_span_mode = xlsx_span_mode
 
         self._artifacts: dict[str, DocumentArtifact] = {}
         self._documents: dict[str, Document] = {}
@@ -1098,6 +1101,7 @@ class IngestionService:
             limits=self._parse_limits,
             ocr_config=self._ocr_config,
             media_config=self._media_config,
+            xlsx_span_mode=self._xlsx_span_mode,
         )
 
     def _map_doc_type(self, parser_doc_type: str) -> DocumentType:
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -132,6 +133,7 @@ from idis.models.validated_evidence_package_materialization import (
     RunScopedValidatedEvidencePackageShell,
     RunScopedValidatedEvidencePackageSummary,
 )
+from idis.observability.metrics import RUN_STEP_DURATION_SECONDS, observe_histogram
 from idis.observability.runtime_signals import RUN_CANCELLED as RUN_CANCELLED_EVENT
 from idis.observability.runtime_signals import emit_run_signal
 from idis.persistence.repositories.run_steps import RunStepsRepo
@@ -438,6 +440,15 @@ class CancellationRunsRepository(Protocol):
         """Return persisted run row for cancellation/status checks."""
 
 
+def _observe_step_duration(step_name: StepName, outcome: str, started: float) -> None:
+    """Record a step's dispatch wall time in the run-step latency histogram."""
+    observe_histogram(
+        RUN_STEP_DURATION_SECONDS,
+        time.perf_counter() - started,
+        labels={"step": step_name.value, "outcome": outcome},
+    )
+
+
 class RunOrchestrator:
     """Orchestrates pipeline steps with durable step ledger and audit emissions.
 
@@ -570,11 +581,14 @@ class RunOrchestrator:
 
             step = self._start_step(ctx, step_name, existing)
 
+            started = time.perf_counter()
             try:
                 result = self._dispatch_step(step_name, ctx, accumulated)
             except AuditSinkError:
+                _observe_step_duration(step_name, "failed", started)
                 raise
             except Exception as exc:
+                _observe_step_duration(step_name, "failed", started)
                 if self._is_cancellation_requested(ctx):
                     return self._cancelled_result(ctx)
                 self._fail_step(step, exc)
@@ -588,6 +602,7 @@ class RunOrchestrator:
                     error_message=step.error_message,
                 )
 
+            _observe_step_duration(step_name, "completed", started)
             self._complete_step(step, result)
             accumulated.update(result)
             if self._is_cancellation_requested(ctx):
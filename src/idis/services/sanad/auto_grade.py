@@ -7,6 +7,15 @@ Orchestrates the post-extraction Sanad lifecycle for a SNAPSHOT run:
 4. Persist any defects via ``DefectService``.
 5. Emit audit events: ``sanad.created``, ``sanad.graded``, ``defect.detected``.
 
+By default the run is graded set-based: claims and evidence are fetched in
+two queries, grading happens in memory, and sanads, defects and claim grades
+are written with multi-row statements followed by one audit batch.
+
+Grades are memoized (see ``grade_cache``): when a claim's latest sanad was
+graded from the same claim value, evidence, chain inputs and grader version,
+it is reused: the claim is not regraded and no sanad or defects are persisted
+again, but the claim's grade and sanad_id are still written back when stale.
+
 Fail-closed:
 - Chain build failure → claim marked ``grade_failed``, not silently skipped.
 - All claims failing → run status ``FAILED``.
@@ -20,14 +29,23 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from idis.audit.sink import AuditSink
+from idis.audit.sink import AuditSink, emit_audit_batch
 from idis.persistence.repositories.claims import (
     ClaimsRepository,
     InMemoryClaimsRepository,
 )
-from idis.persistence.repositories.evidence import EvidenceRepo, get_evidence_repository
+from idis.persistence.repositories.evidence import (
+    BatchEvidenceRepo,
+    EvidenceRepo,
+    get_evidence_repository,
+)
 from idis.services.defects.service import CreateDefectInput, DefectService
 from idis.services.sanad.chain_builder import ChainBuildError, build_sanad_chain
+from idis.services.sanad.grade_cache import (
+    GRADE_CACHE_KEY_FIELD,
+    cached_grade,
+    compute_grade_cache_key,
+)
 from idis.services.sanad.grader import SanadGradeResult, grade_sanad_v2
 from idis.services.sanad.service import CreateSanadInput, SanadService
 
@@ -48,6 +66,10 @@ class ClaimGradeResult:
         defect_ids: IDs of persisted defects.
         status: ``graded`` or ``grade_failed``.
         error: Error message when status is ``grade_failed``.
+        reused: True when the claim's existing sanad was reused from the grade cache
+            (no defects are persisted again).
+        cached_defect_count: Defects recorded when the reused sanad was graded (0 unless
+            ``reused``).
     """
 
     claim_id: str
@@ -56,6 +78,13 @@ class ClaimGradeResult:
     defect_ids: list[str] = field(default_factory=list)
     status: str = "graded"
     error: str | None = None
+    reused: bool = False
+    cached_defect_count: int = 0
+
+    @property
+    def defect_count(self) -> int:
+        """Defects behind this grade: persisted now, or recorded with the reused sanad."""
+        return len(self.defect_ids) + self.cached_defect_count
 
 
 @dataclass
@@ -69,7 +98,9 @@ class AutoGradeRunResult:
         results: Per-claim grading results.
         graded_count: Number of successfully graded claims.
         failed_count: Number of claims that failed grading.
-        total_defects: Total defects detected across all claims.
+        total_defects: Defects behind every graded claim's grade, whether persisted by
+            this run or recorded with a reused sanad (so a rerun reports the same total).
+        reused_count: Graded claims whose sanad was reused from the grade cache.
     """
 
     run_id: str
@@ -79,38 +110,96 @@ class AutoGradeRunResult:
     graded_count: int = 0
     failed_count: int = 0
     total_defects: int = 0
+    reused_count: int = 0
 
     @property
     def all_failed(self) -> bool:
         """Return True when every claim failed grading."""
         return self.failed_count > 0 and self.graded_count == 0
 
+    @property
+    def recomputed_count(self) -> int:
+        """Graded claims that were graded from scratch."""
+        return self.graded_count - self.reused_count
 
-def _emit_audit(
-    sink: AuditSink,
+
+def _audit_event(
     event_type: str,
     tenant_id: str,
+    deal_id: str,
+    resource_type: str,
+    resource_id: str,
     details: dict[str, Any],
-) -> None:
-    """Emit a structured audit event.
+) -> dict[str, Any]:
+    """Build a structured audit event.
+
+    Carries the same required fields as the SanadService / DefectService builders
+    (``occurred_at``, resource, actor, request), so it can share a batch with their
+    events in any sink, including ``PostgresAuditSink``.
 
     Args:
-        sink: Audit sink instance.
         event_type: Audit event type string.
         tenant_id: Tenant UUID.
+        deal_id: Deal UUID.
+        resource_type: ``sanad`` or ``defect``.
+        resource_id: ID of the sanad or defect the event is about.
         details: Event payload.
     """
-    event: dict[str, Any] = {
+    return {
         "event_id": str(uuid.uuid4()),
-        "event_type": event_type,
+        "occurred_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
         "tenant_id": tenant_id,
-        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        "event_type": event_type,
+        "severity": "MEDIUM",
+        "resource": {
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "deal_id": deal_id,
+        },
+        "actor": {
+            "actor_type": "SERVICE",
+            "actor_id": "sanad_auto_grade",
+            "roles": ["INTEGRATION_SERVICE"],
+            "ip": "internal",
+            "user_agent": "SanadAutoGrade",
+        },
+        "request": {
+            "request_id": str(uuid.uuid4()),
+            "method": "SERVICE",
+            "path": "/internal/sanads/auto-grade",
+            "status_code": 200,
+        },
+        "summary": f"{event_type} for {resource_type} {resource_id}",
+        "payload": {
+            "hashes": [],
+            "refs": [f"{resource_type}_id:{resource_id}"],
+            "details": details,
+        },
         "details": details,
     }
+
+
+def _emit_audit(sink: AuditSink, event: dict[str, Any]) -> None:
+    """Emit a structured audit event, logging (not raising) on failure.
+
+    Args:
+        sink: Audit sink instance.
+        event: Event built by ``_audit_event``.
+    """
     try:
         sink.emit(event)
     except Exception as exc:
-        logger.warning("Failed to emit audit event %s: %s", event_type, exc)
+        logger.warning("Failed to emit audit event %s: %s", event["event_type"], exc)
+
+
+@dataclass
+class _ClaimPlan:
+    """In-memory grading outcome for one claim, ready to persist."""
+
+    claim_id: str
+    grade: str
+    sanad_input: CreateSanadInput
+    defect_inputs: list[CreateDefectInput]
 
 
 def auto_grade_claims_for_run(
@@ -125,6 +214,7 @@ def auto_grade_claims_for_run(
     audit_sink: AuditSink,
     prebuilt_sanads: dict[str, dict[str, Any]] | None = None,
     db_conn: Connection | None = None,
+    batched: bool = True,
 ) -> AutoGradeRunResult:
     """Auto-grade all extracted claims for a SNAPSHOT run.
 
@@ -141,6 +231,15 @@ def auto_grade_claims_for_run(
     directly.  This is the correct path for GDBS deals that ship with
     curated transmission chains, evidence items, and expected grades.
 
+    The batched path (default, when the evidence repository supports
+    ``get_by_claims``) loads claims and evidence in two queries, grades
+    in memory, persists sanads, defects and claim grades with multi-row
+    statements on ``db_conn`` (so they commit or roll back with the
+    caller's transaction) and emits its audit events as one batch. The
+    services' events join that batch only when they emit to
+    ``audit_sink``; injected services with their own sinks keep them.
+    Grades and persisted defects are the same as the per-claim path.
+
     Args:
         run_id: Pipeline run UUID.
         tenant_id: Tenant UUID.
@@ -158,6 +257,7 @@ def auto_grade_claims_for_run(
         db_conn: SQLAlchemy connection for Postgres persistence. When
             provided, repos/services default to Postgres instead of
             in-memory.
+        batched: Set False to grade and persist one claim at a time.
 
     Returns:
         AutoGradeRunResult summarising per-claim outcomes.
@@ -178,34 +278,214 @@ def auto_grade_claims_for_run(
     else:
         claims_repo = InMemoryClaimsRepository(tenant_id)
 
-    for claim_id in created_claim_ids:
-        claim_prebuilt = prebuilt.get(claim_id)
-        claim = claims_repo.get(claim_id)
-        extraction_confidence, dhabt_score = _claim_gate_scores(claim)
-        claim_result = _grade_single_claim(
+    if not created_claim_ids:
+        return result
+
+    if batched and isinstance(ev_repo, BatchEvidenceRepo):
+        claim_results = _grade_claims_batched(
             tenant_id=tenant_id,
             deal_id=deal_id,
-            claim_id=claim_id,
+            claim_ids=created_claim_ids,
+            claims_repo=claims_repo,
             evidence_repo=ev_repo,
             sanad_service=s_service,
             defect_service=d_service,
             audit_sink=sink,
-            prebuilt=claim_prebuilt,
-            extraction_confidence=extraction_confidence,
-            dhabt_score=dhabt_score,
+            prebuilt=prebuilt,
         )
+    else:
+        claim_results = []
+        for claim_id in created_claim_ids:
+            claim = claims_repo.get(claim_id)
+            extraction_confidence, dhabt_score = _claim_gate_scores(claim)
+            claim_result = _grade_single_claim(
+                tenant_id=tenant_id,
+                deal_id=deal_id,
+                claim_id=claim_id,
+                evidence_repo=ev_repo,
+                sanad_service=s_service,
+                defect_service=d_service,
+                audit_sink=sink,
+                prebuilt=prebuilt.get(claim_id),
+                extraction_confidence=extraction_confidence,
+                dhabt_score=dhabt_score,
+                claim_value=(claim or {}).get("value"),
+            )
+            if claim_result.status == "graded" and not _claim_is_current(claim, claim_result):
+                _update_claim_grade(
+                    claims_repo, claim_id, claim_result.grade, claim_result.sanad_id
+                )
+            claim_results.append(claim_result)
+
+    for claim_result in claim_results:
         result.results.append(claim_result)
-
         if claim_result.status == "graded":
             result.graded_count += 1
-            _update_claim_grade(claims_repo, claim_id, claim_result.grade, claim_result.sanad_id)
+            result.reused_count += claim_result.reused
         else:
             result.failed_count += 1
-        result.total_defects += len(claim_result.defect_ids)
+        result.total_defects += claim_result.defect_count
 
     return result
 
 
+def _grade_claims_batched(
+    *,
+    tenant_id: str,
+    deal_id: str,
+    claim_ids: list[str],
+    claims_repo: ClaimsRepository | InMemoryClaimsRepository,
+    evidence_repo: BatchEvidenceRepo,
+    sanad_service: SanadService,
+    defect_service: DefectService,
+    audit_sink: AuditSink,
+    prebuilt: dict[str, dict[str, Any]],
+) -> list[ClaimGradeResult]:
+    """Set-based grading: bulk fetch → grade in memory → bulk persist → one audit batch.
+
+    Args:
+        tenant_id: Tenant UUID.
+        deal_id: Deal UUID.
+        claim_ids: Claim IDs to grade, in result order.
+        claims_repo: Claims repository (Postgres or in-memory).
+        evidence_repo: Evidence repository supporting ``get_by_claims``.
+        sanad_service: SanadService for persistence.
+        defect_service: DefectService for defect persistence.
+        audit_sink: Audit sink.
+        prebuilt: Pre-built sanad data keyed by claim_id.
+
+    Returns:
+        Per-claim results in ``claim_ids`` order.
+
+    Raises:
+        SanadIntegrityError: If any sanad fails integrity validation (nothing is persisted).
+    """
+    claims = claims_repo.get_many(claim_ids)
+    evidence_by_claim = evidence_repo.get_by_claims(
+        [claim_id for claim_id in claim_ids if claim_id not in prebuilt]
+    )
+    latest_sanads = sanad_service.get_latest_by_claims(claim_ids)
+
+    outcomes: list[_ClaimPlan | ClaimGradeResult] = []
+    for claim_id in claim_ids:
+        if claim_id in prebuilt:
+            outcomes.append(
+                _plan_prebuilt_claim(
+                    deal_id, claim_id, prebuilt[claim_id], latest_sanads.get(claim_id)
+                )
+            )
+            continue
+        claim = claims.get(claim_id)
+        extraction_confidence, dhabt_score = _claim_gate_scores(claim)
+        outcomes.append(
+            _plan_claim(
+                tenant_id=tenant_id,
+                deal_id=deal_id,
+                claim_id=claim_id,
+                evidence_items=evidence_by_claim.get(claim_id, []),
+                extraction_confidence=extraction_confidence,
+                dhabt_score=dhabt_score,
+                claim_value=(claim or {}).get("value"),
+                latest_sanad=latest_sanads.get(claim_id),
+            )
+        )
+    plans = [outcome for outcome in outcomes if isinstance(outcome, _ClaimPlan)]
+
+    # Service events join the run's batch only when the service emits to the same sink;
+    # a service with its own sink keeps emitting there.
+    audit_events: list[dict[str, Any]] = []
+    sanads = sanad_service.create_many(
+        [plan.sanad_input for plan in plans],
+        audit_events=audit_events if sanad_service.audit_sink is audit_sink else None,
+    )
+    defects = defect_service.create_many(
+        [defect_input for plan in plans for defect_input in plan.defect_inputs],
+        audit_events=audit_events if defect_service.audit_sink is audit_sink else None,
+    )
+
+    graded: list[ClaimGradeResult] = []
+    offset = 0
+    for plan, sanad_data in zip(plans, sanads, strict=True):
+        sanad_id = sanad_data["sanad_id"]
+        plan_defects = defects[offset : offset + len(plan.defect_inputs)]
+        offset += len(plan.defect_inputs)
+        audit_events.extend(_graded_claim_events(tenant_id, deal_id, plan, sanad_id, plan_defects))
+        graded.append(
+            ClaimGradeResult(
+                claim_id=plan.claim_id,
+                sanad_id=sanad_id,
+                grade=plan.grade,
+                defect_ids=[defect["defect_id"] for defect in plan_defects],
+                status="graded",
+            )
+        )
+
+    reused = [o for o in outcomes if isinstance(o, ClaimGradeResult) and o.reused]
+    claims_repo.update_grades(
+        [
+            (r.claim_id, r.grade, r.sanad_id)
+            for r in [*graded, *reused]
+            if not _claim_is_current(claims.get(r.claim_id), r)
+        ]
+    )
+
+    try:
+        emit_audit_batch(audit_sink, audit_events)
+    except Exception as exc:
+        logger.warning("Failed to emit %d auto-grade audit events: %s", len(audit_events), exc)
+
+    graded_in_order = iter(graded)
+    return [
+        next(graded_in_order) if isinstance(outcome, _ClaimPlan) else outcome
+        for outcome in outcomes
+    ]
+
+
+def _graded_claim_events(
+    tenant_id: str,
+    deal_id: str,
+    plan: _ClaimPlan,
+    sanad_id: str,
+    defects: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Build the sanad.created / sanad.graded / defect.detected events for one claim."""
+    events = [
+        _audit_event(
+            "sanad.created",
+            tenant_id,
+            deal_id,
+            "sanad",
+            sanad_id,
+            {"sanad_id": sanad_id, "claim_id": plan.claim_id, "deal_id": deal_id},
+        ),
+        _audit_event(
+            "sanad.graded",
+            tenant_id,
+            deal_id,
+            "sanad",
+            sanad_id,
+            {"sanad_id": sanad_id, "claim_id": plan.claim_id, "grade": plan.grade},
+        ),
+    ]
+    for defect_input, defect_data in zip(plan.defect_inputs, defects, strict=True):
+        events.append(
+            _audit_event(
+                "defect.detected",
+                tenant_id,
+                deal_id,
+                "defect",
+                defect_data["defect_id"],
+                {
+                    "defect_id": defect_data["defect_id"],
+                    "claim_id": plan.claim_id,
+                    "defect_type": defect_input.defect_type,
+                    "severity": defect_input.severity,
+                },
+            )
+        )
+    return events
+
+
 def _grade_single_claim(
     *,
     tenant_id: str,
@@ -218,11 +498,13 @@ def _grade_single_claim(
     prebuilt: dict[str, Any] | None = None,
     extraction_confidence: float = 0.9,
     dhabt_score: float = 0.9,
+    claim_value: Any = None,
 ) -> ClaimGradeResult:
     """Grade a single claim: build chain → grade → persist.
 
     When ``prebuilt`` is provided (from GDBS), skip chain building and
-    use the pre-built sanad/evidence data directly for grading.
+    use the pre-built sanad/evidence data directly for grading. A claim
+    whose latest sanad matches its grade cache key is returned as reused.
 
     Args:
         tenant_id: Tenant UUID.
@@ -234,22 +516,117 @@ def _grade_single_claim(
         audit_sink: Audit sink.
         prebuilt: Optional pre-built sanad data with keys ``sanad``,
             ``sources``, and optionally ``claim``.
+        claim_value: The claim's ``value`` (part of the grade cache key).
 
     Returns:
         ClaimGradeResult with status ``graded`` or ``grade_failed``.
     """
+    latest_sanad = sanad_service.get_latest_by_claims([claim_id]).get(claim_id)
     if prebuilt is not None:
-        return _grade_single_claim_prebuilt(
+        plan = _plan_prebuilt_claim(deal_id, claim_id, prebuilt, latest_sanad)
+    else:
+        plan = _plan_claim(
             tenant_id=tenant_id,
             deal_id=deal_id,
             claim_id=claim_id,
-            prebuilt=prebuilt,
-            sanad_service=sanad_service,
-            defect_service=defect_service,
-            audit_sink=audit_sink,
+            evidence_items=evidence_repo.get_by_claim(claim_id),
+            extraction_confidence=extraction_confidence,
+            dhabt_score=dhabt_score,
+            claim_value=claim_value,
+            latest_sanad=latest_sanad,
+        )
+    if isinstance(plan, ClaimGradeResult):
+        return plan
+
+    # --- Persist Sanad via service ---
+    sanad_data = sanad_service.create(plan.sanad_input)
+    sanad_id = sanad_data["sanad_id"]
+
+    _emit_audit(
+        audit_sink,
+        _audit_event(
+            "sanad.created",
+            tenant_id,
+            deal_id,
+            "sanad",
+            sanad_id,
+            {"sanad_id": sanad_id, "claim_id": claim_id, "deal_id": deal_id},
+        ),
+    )
+
+    _emit_audit(
+        audit_sink,
+        _audit_event(
+            "sanad.graded",
+            tenant_id,
+            deal_id,
+            "sanad",
+            sanad_id,
+            {"sanad_id": sanad_id, "claim_id": claim_id, "grade": plan.grade},
+        ),
+    )
+
+    # --- Persist defects ---
+    persisted_defect_ids: list[str] = []
+    for defect_input in plan.defect_inputs:
+        defect_data = defect_service.create(defect_input)
+        persisted_defect_ids.append(defect_data["defect_id"])
+
+        _emit_audit(
+            audit_sink,
+            _audit_event(
+                "defect.detected",
+                tenant_id,
+                deal_id,
+                "defect",
+                defect_data["defect_id"],
+                {
+                    "defect_id": defect_data["defect_id"],
+                    "claim_id": claim_id,
+                    "defect_type": defect_input.defect_type,
+                    "severity": defect_input.severity,
+                },
+            ),
         )
 
-    evidence_items = evidence_repo.get_by_claim(claim_id)
+    return ClaimGradeResult(
+        claim_id=claim_id,
+        sanad_id=sanad_id,
+        grade=plan.grade,
+        defect_ids=persisted_defect_ids,
+        status="graded",
+    )
+
+
+def _plan_claim(
+    *,
+    tenant_id: str,
+    deal_id: str,
+    claim_id: str,
+    evidence_items: list[dict[str, Any]],
+    extraction_confidence: float,
+    dhabt_score: float,
+    claim_value: Any = None,
+    latest_sanad: dict[str, Any] | None = None,
+) -> _ClaimPlan | ClaimGradeResult:
+    """Build the chain and grade one claim in memory.
+
+    Returns:
+        The plan to persist, a reused result when ``latest_sanad`` was graded
+        under the same cache key, or a ``grade_failed`` result when the chain
+        cannot be built.
+    """
+    # The built chain carries fresh node ids and timestamps, so the key covers
+    # the builder's inputs rather than the chain itself.
+    cache_key = compute_grade_cache_key(
+        claim_value=claim_value,
+        sources=evidence_items,
+        transmission_chain={"builder": "build_sanad_chain", "deduped": False},
+        inputs={"extraction_confidence": extraction_confidence, "dhabt_score": dhabt_score},
+    )
+    reused = _reused_result(claim_id, latest_sanad, cache_key)
+    if reused is not None:
+        return reused
 
     # --- 1. Build chain (fail-closed on missing evidence) ---
     try:
@@ -279,7 +656,6 @@ def _grade_single_claim(
         sources=evidence_items,
     )
 
-    # --- 3. Persist Sanad via service ---
     sanad_input = CreateSanadInput(
         claim_id=claim_id,
         deal_id=deal_id,
@@ -287,78 +663,22 @@ def _grade_single_claim(
         transmission_chain=chain_data["transmission_chain"],
         extraction_confidence=extraction_confidence,
         dhabt_score=dhabt_score,
-        computed=_computed_from_grade_result(grade_result),
+        computed=_computed_from_grade_result(grade_result, cache_key=cache_key),
     )
-    sanad_data = sanad_service.create(sanad_input)
-    sanad_id = sanad_data["sanad_id"]
-
-    _emit_audit(
-        audit_sink,
-        "sanad.created",
-        tenant_id,
-        {
-            "sanad_id": sanad_id,
-            "claim_id": claim_id,
-            "deal_id": deal_id,
-        },
-    )
-
-    _emit_audit(
-        audit_sink,
-        "sanad.graded",
-        tenant_id,
-        {
-            "sanad_id": sanad_id,
-            "claim_id": claim_id,
-            "grade": grade_result.grade,
-        },
-    )
-
-    # --- 4. Persist defects ---
-    persisted_defect_ids: list[str] = []
-    for defect_summary in grade_result.all_defects:
-        defect_input = CreateDefectInput(
-            claim_id=claim_id,
-            deal_id=deal_id,
-            defect_type=_map_defect_code(defect_summary.code),
-            severity=defect_summary.severity,
-            description=defect_summary.description,
-            cure_protocol="HUMAN_ARBITRATION",
-        )
-        defect_data = defect_service.create(defect_input)
-        persisted_defect_ids.append(defect_data["defect_id"])
-
-        _emit_audit(
-            audit_sink,
-            "defect.detected",
-            tenant_id,
-            {
-                "defect_id": defect_data["defect_id"],
-                "claim_id": claim_id,
-                "defect_type": defect_input.defect_type,
-                "severity": defect_summary.severity,
-            },
-        )
-
-    return ClaimGradeResult(
+    return _ClaimPlan(
         claim_id=claim_id,
-        sanad_id=sanad_id,
         grade=grade_result.grade,
-        defect_ids=persisted_defect_ids,
-        status="graded",
+        sanad_input=sanad_input,
+        defect_inputs=_defect_inputs(claim_id, deal_id, grade_result),
     )
 
 
-def _grade_single_claim_prebuilt(
-    *,
-    tenant_id: str,
+def _plan_prebuilt_claim(
     deal_id: str,
     claim_id: str,
     prebuilt: dict[str, Any],
-    sanad_service: SanadService,
-    defect_service: DefectService,
-    audit_sink: AuditSink,
-) -> ClaimGradeResult:
+    latest_sanad: dict[str, Any] | None = None,
+) -> _ClaimPlan | ClaimGradeResult:
     """Grade a claim using GDBS pre-built sanad/evidence data.
 
     Skips chain building entirely. Uses the pre-built sanad dict and
@@ -368,17 +688,15 @@ def _grade_single_claim_prebuilt(
     GDBS dataset encodes).
 
     Args:
-        tenant_id: Tenant UUID.
         deal_id: Deal UUID.
         claim_id: Claim UUID.
         prebuilt: Dict with ``sanad`` (full sanad dict), ``sources``
             (evidence item list), and optionally ``claim``.
-        sanad_service: SanadService for persistence.
-        defect_service: DefectService for defect persistence.
-        audit_sink: Audit sink.
+        latest_sanad: The claim's latest persisted sanad, for grade cache reuse.
 
     Returns:
-        ClaimGradeResult with status ``graded`` or ``grade_failed``.
+        The plan to persist, a reused result on a grade cache hit, or a
+        ``grade_failed`` result when the sanad data is empty.
     """
     sanad_data = prebuilt.get("sanad", {})
     sources = prebuilt.get("sources", [])
@@ -395,6 +713,16 @@ def _grade_single_claim_prebuilt(
     primary_evidence_id = sanad_data.get("primary_evidence_id", "")
     transmission_chain = sanad_data.get("transmission_chain", [])
 
+    cache_key = compute_grade_cache_key(
+        claim_value=claim_dict,
+        sources=sources,
+        transmission_chain=transmission_chain,
+        inputs={"prebuilt_sanad": sanad_data},
+    )
+    reused = _reused_result(claim_id, latest_sanad, cache_key)
+    if reused is not None:
+        return reused
+
     sanad_for_grading: dict[str, Any] = {
         "transmission_chain": transmission_chain,
         "primary_source": sources[0] if sources else {},
@@ -420,27 +748,52 @@ def _grade_single_claim_prebuilt(
         transmission_chain=[],
         extraction_confidence=sanad_data.get("extraction_confidence", 0.9),
         dhabt_score=sanad_data.get("dhabt_score", 0.9),
-        computed=_computed_from_grade_result(grade_result, final_grade=final_grade),
+        computed=_computed_from_grade_result(
+            grade_result, final_grade=final_grade, cache_key=cache_key
+        ),
+    )
+    return _ClaimPlan(
+        claim_id=claim_id,
+        grade=final_grade,
+        sanad_input=sanad_input,
+        defect_inputs=_defect_inputs(claim_id, deal_id, grade_result),
     )
-    persisted = sanad_service.create(sanad_input)
-    sanad_id = persisted["sanad_id"]
 
-    _emit_audit(
-        audit_sink,
-        "sanad.created",
-        tenant_id,
-        {"sanad_id": sanad_id, "claim_id": claim_id, "deal_id": deal_id},
+
+def _reused_result(
+    claim_id: str, latest_sanad: dict[str, Any] | None, cache_key: str
+) -> ClaimGradeResult | None:
+    """Return a reused result when ``latest_sanad`` was graded under ``cache_key``."""
+    grade = cached_grade(latest_sanad, cache_key)
+    if latest_sanad is None or grade is None:
+        return None
+    grader = latest_sanad["computed"].get("grader")
+    cached_defects = grader.get("all_defects") if isinstance(grader, dict) else None
+    return ClaimGradeResult(
+        claim_id=claim_id,
+        sanad_id=latest_sanad["sanad_id"],
+        grade=grade,
+        status="graded",
+        reused=True,
+        cached_defect_count=len(cached_defects) if isinstance(cached_defects, list) else 0,
     )
-    _emit_audit(
-        audit_sink,
-        "sanad.graded",
-        tenant_id,
-        {"sanad_id": sanad_id, "claim_id": claim_id, "grade": final_grade},
+
+
+def _claim_is_current(claim: dict[str, Any] | None, result: ClaimGradeResult) -> bool:
+    """True when the stored claim already carries ``result``'s grade and sanad_id."""
+    return (
+        claim is not None
+        and claim.get("claim_grade") == result.grade
+        and claim.get("sanad_id") == result.sanad_id
     )
 
-    persisted_defect_ids: list[str] = []
-    for defect_summary in grade_result.all_defects:
-        defect_input = CreateDefectInput(
+
+def _defect_inputs(
+    claim_id: str, deal_id: str, grade_result: SanadGradeResult
+) -> list[CreateDefectInput]:
+    """Map grader defects to DefectService inputs."""
+    return [
+        CreateDefectInput(
             claim_id=claim_id,
             deal_id=deal_id,
             defect_type=_map_defect_code(defect_summary.code),
@@ -448,28 +801,8 @@ def _grade_single_claim_prebuilt(
             description=defect_summary.description,
             cure_protocol="HUMAN_ARBITRATION",
         )
-        defect_data = defect_service.create(defect_input)
-        persisted_defect_ids.append(defect_data["defect_id"])
-
-        _emit_audit(
-            audit_sink,
-            "defect.detected",
-            tenant_id,
-            {
-                "defect_id": defect_data["defect_id"],
-                "claim_id": claim_id,
-                "defect_type": defect_input.defect_type,
-                "severity": defect_summary.severity,
-            },
-        )
-
-    return ClaimGradeResult(
-        claim_id=claim_id,
-        sanad_id=sanad_id,
-        grade=final_grade,
-        defect_ids=persisted_defect_ids,
-        status="graded",
-    )
+        for defect_summary in grade_result.all_defects
+    ]
 
 
 def _update_claim_grade(
@@ -496,16 +829,20 @@ def _computed_from_grade_result(
     grade_result: SanadGradeResult,
     *,
     final_grade: str | None = None,
+    cache_key: str | None = None,
 ) -> dict[str, Any]:
     """Convert v2 grader output into the durable Sanad computed payload."""
     durable_grade = final_grade or grade_result.grade
-    return {
+    computed: dict[str, Any] = {
         "grade": durable_grade,
         "grade_rationale": grade_result.explanation.summary,
         "corroboration_level": grade_result.tawatur.status.value,
         "independent_chain_count": grade_result.tawatur.independent_count,
         "grader": grade_result.to_dict(),
     }
+    if cache_key is not None:
+        computed[GRADE_CACHE_KEY_FIELD] = cache_key
+    return computed
 
 
 def _claim_gate_scores(claim: dict[str, Any] | None) -> tuple[float, float]:
@@ -0,0 +1,111 @@
+"""Grade cache — content-addressed memoization of Sanad grading.
+
+``grade_sanad_v2`` and its defect detectors (Ilal, Shudhudh, COI, Tawatur) are pure functions of
+the claim, its evidence and its transmission chain, yet every GRADE step, retry and resume used
+to re-run them and persist a fresh sanad. A grade cache key is the SHA256 of canonical JSON over
+(claim value, sources, transmission chain, grading inputs, grader version). The auto-grade step
+stores it in the sanad's ``computed`` payload (``computed.grade_cache_key``) and, when the
+latest sanad of a claim carries the key it would compute now, reuses that sanad instead of
+regrading.
+
+The grader version combines ``SANAD_GRADER_VERSION`` with a fingerprint of the grading modules'
+source, so any rule change invalidates every key without a manual bump. Sanads re-graded by
+``SanadService.update`` drop the key and are recomputed on the next run.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import json
+from typing import Any, Final
+
+SANAD_GRADER_VERSION: Final[str] = "sanad-v2"
+
+GRADE_CACHE_KEY_FIELD: Final[str] = "grade_cache_key"
+
+# Modules whose code determines a grade, its defects or the persisted computed payload.
+_GRADER_MODULES: Final[tuple[str, ...]] = (
+    "idis.services.sanad.auto_grade",
+    "idis.services.sanad.chain_builder",
+    "idis.services.sanad.coi",
+    "idis.services.sanad.dabt",
+    "idis.services.sanad.defects",
+    "idis.services.sanad.grade_cache",
+    "idis.services.sanad.grader",
+    "idis.services.sanad.ilal",
+    "idis.services.sanad.independence",
+    "idis.services.sanad.shudhudh",
+    "idis.services.sanad.source_tiers",
+    "idis.services.sanad.tawatur",
+)
+
+
+@functools.cache
+def grader_code_version() -> str:
+    """Return the grader version: ``SANAD_GRADER_VERSION`` plus a grading-code fingerprint.
+
+    Returns:
+        ``"<SANAD_GRADER_VERSION>+<first 16 hex chars of the source SHA256>"``.
+    """
+    digest = hashlib.sha256()
+    for module in _GRADER_MODULES:
+        digest.update(module.encode("utf-8"))
+        spec = importlib.util.find_spec(module)
+        if spec is not None and spec.origin and spec.origin.endswith(".py"):
+            with open(spec.origin, "rb") as source:
+                digest.update(source.read())
+    return f"{SANAD_GRADER_VERSION}+{digest.hexdigest()[:16]}"
+
+
+def compute_grade_cache_key(
+    *,
+    claim_value: Any,
+    sources: list[dict[str, Any]],
+    transmission_chain: Any,
+    inputs: dict[str, Any] | None = None,
+    grader_version: str | None = None,
+) -> str:
+    """Compute the content hash a sanad grade is memoized under.
+
+    Args:
+        claim_value: The claim's ``value`` (or full claim dict when the grader reads it).
+        sources: Evidence items passed to the grader.
+        transmission_chain: The chain graded, or the inputs it is built from when the chain
+            carries generated node ids and timestamps.
+        inputs: Other grading inputs that affect the persisted sanad (gate scores, expected
+            grades).
+        grader_version: Override for tests; defaults to ``grader_code_version()``.
+
+    Returns:
+        SHA256 hex digest string.
+    """
+    canonical: dict[str, Any] = {
+        "claim_value": claim_value,
+        "grader_version": grader_version or grader_code_version(),
+        "inputs": inputs or {},
+        "sources": sources,
+        "transmission_chain": transmission_chain,
+    }
+    canonical_json = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+def cached_grade(sanad: dict[str, Any] | None, cache_key: str) -> str | None:
+    """Return the grade of ``sanad`` if it was graded under ``cache_key``.
+
+    Args:
+        sanad: Latest persisted sanad of the claim, or None.
+        cache_key: Key computed for the claim's current grading inputs.
+
+    Returns:
+        The memoized grade letter, or None on a cache miss.
+    """
+    if sanad is None:
+        return None
+    computed = sanad.get("computed")
+    if not isinstance(computed, dict) or computed.get(GRADE_CACHE_KEY_FIELD) != cache_key:
+        return None
+    grade = computed.get("grade")
+    return grade if isinstance(grade, str) and grade else None
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
-from idis.audit.sink import AuditSink, InMemoryAuditSink
+from idis.audit.sink import AuditSink, InMemoryAuditSink, emit_audit_batch
 from idis.persistence.repositories.claims import (
     DefectsRepository,
     InMemoryDefectsRepository,
@@ -158,6 +158,11 @@ class SanadService:
         """Return the tenant context."""
         return self._tenant_id
 
+    @property
+    def audit_sink(self) -> AuditSink:
+        """Return the sink this service emits its audit events to."""
+        return self._audit_sink
+
     def _emit_audit_event(
         self,
         event_type: str,
@@ -167,6 +172,21 @@ class SanadService:
         request_id: str | None = None,
     ) -> None:
         """Emit an audit event for sanad operations with request correlation."""
+        event = self._build_audit_event(event_type, sanad_id, severity, details, request_id)
+        try:
+            self._audit_sink.emit(event)
+        except Exception as e:
+            logger.warning("Failed to emit audit event: %s", e)
+
+    def _build_audit_event(
+        self,
+        event_type: str,
+        sanad_id: str,
+        severity: str = "MEDIUM",
+        details: dict[str, Any] | None = None,
+        request_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Build an audit event for sanad operations with request correlation."""
         event: dict[str, Any] = {
             "event_id": str(uuid.uuid4()),
             "occurred_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
@@ -198,10 +218,7 @@ class SanadService:
         }
         if details:
             event["payload"]["details"] = details
-        try:
-            self._audit_sink.emit(event)
-        except Exception as e:
-            logger.warning("Failed to emit audit event: %s", e)
+        return event
 
     def _compute_grade(
         self,
@@ -276,9 +293,95 @@ class SanadService:
         Returns:
             Created sanad data dict.
         """
-        sanad_id = str(uuid.uuid4())
-
         defects, _ = self._defects_repo.list_by_claim(input_data.claim_id, limit=100)
+        record = self._prepare_sanad(input_data, defects)
+
+        sanad_data = self._sanads_repo.create(**record)
+
+        # Ensure defects list is included in returned sanad (SAN-001 requirement)
+        sanad_data["defects"] = defects
+
+        self._emit_audit_event(
+            event_type="sanad.created",
+            sanad_id=record["sanad_id"],
+            severity="MEDIUM",
+            details={
+                "claim_id": input_data.claim_id,
+                "deal_id": input_data.deal_id,
+                "grade": record["computed"]["grade"],
+            },
+            request_id=input_data.request_id,
+        )
+
+        return sanad_data
+
+    def create_many(
+        self,
+        inputs: list[CreateSanadInput],
+        *,
+        audit_events: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Create many sanads: one defect lookup, one multi-row insert, one audit batch.
+
+        Each sanad is graded and integrity-checked exactly as ``create`` would; every
+        input is validated before anything is written, so an integrity failure persists
+        nothing.
+
+        Args:
+            inputs: Validated inputs, at most one per claim.
+            audit_events: When given, ``sanad.created`` events are appended here for the
+                caller to emit with its own batch instead of being emitted now.
+
+        Returns:
+            Created sanad data dicts, in input order.
+
+        Raises:
+            SanadIntegrityError: If any sanad fails integrity validation.
+        """
+        defects_by_claim = self._defects_repo.list_by_claims(
+            [input_data.claim_id for input_data in inputs], limit=100
+        )
+        records = [
+            self._prepare_sanad(input_data, defects_by_claim[input_data.claim_id])
+            for input_data in inputs
+        ]
+        created = self._sanads_repo.create_many(records) if records else []
+
+        events: list[dict[str, Any]] = []
+        for input_data, record, sanad_data in zip(inputs, records, created, strict=True):
+            sanad_data["defects"] = defects_by_claim[input_data.claim_id]
+            events.append(
+                self._build_audit_event(
+                    "sanad.created",
+                    record["sanad_id"],
+                    "MEDIUM",
+                    {
+                        "claim_id": input_data.claim_id,
+                        "deal_id": input_data.deal_id,
+                        "grade": record["computed"]["grade"],
+                    },
+                    input_data.request_id,
+                )
+            )
+        if audit_events is not None:
+            audit_events.extend(events)
+        else:
+            try:
+                emit_audit_batch(self._audit_sink, events)
+            except Exception as e:
+                logger.warning("Failed to emit audit events: %s", e)
+        return created
+
+    def _prepare_sanad(
+        self, input_data: CreateSanadInput, defects: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Grade and integrity-check a new sanad; return its repository ``create`` kwargs.
+
+        Raises:
+            SanadIntegrityError: If integrity validation fails (after emitting
+                ``sanad.integrity.failed``).
+        """
+        sanad_id = str(uuid.uuid4())
 
         transmission_chain = input_data.transmission_chain
         if not transmission_chain:
@@ -333,32 +436,15 @@ class SanadService:
             )
             raise SanadIntegrityError(sanad_id, error_messages)
 
-        sanad_data = self._sanads_repo.create(
-            sanad_id=sanad_id,
-            claim_id=input_data.claim_id,
-            deal_id=input_data.deal_id,
-            primary_evidence_id=input_data.primary_evidence_id,
-            corroborating_evidence_ids=input_data.corroborating_evidence_ids,
-            transmission_chain=transmission_chain,
-            computed=computed,
-        )
-
-        # Ensure defects list is included in returned sanad (SAN-001 requirement)
-        sanad_data["defects"] = defects
-
-        self._emit_audit_event(
-            event_type="sanad.created",
-            sanad_id=sanad_id,
-            severity="MEDIUM",
-            details={
-                "claim_id": input_data.claim_id,
-                "deal_id": input_data.deal_id,
-                "grade": computed["grade"],
-            },
-            request_id=input_data.request_id,
-        )
-
-        return sanad_data
+        return {
+            "sanad_id": sanad_id,
+            "claim_id": input_data.claim_id,
+            "deal_id": input_data.deal_id,
+            "primary_evidence_id": input_data.primary_evidence_id,
+            "corroborating_evidence_ids": input_data.corroborating_evidence_ids,
+            "transmission_chain": transmission_chain,
+            "computed": computed,
+        }
 
     def get(self, sanad_id: str) -> dict[str, Any]:
         """Get a sanad by ID.
@@ -388,6 +474,17 @@ class SanadService:
         """
         return self._sanads_repo.get_by_claim(claim_id)
 
+    def get_latest_by_claims(self, claim_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the most recently created sanad of each claim.
+
+        Args:
+            claim_ids: Claim UUIDs.
+
+        Returns:
+            Mapping of claim_id to its latest sanad; claims without a sanad are omitted.
+        """
+        return self._sanads_repo.get_latest_by_claims(claim_ids)
+
     def list_by_deal(
         self,
         deal_id: str,
@@ -12,6 +12,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from idis.services.sanad.independence import build_chain_index
+
 
 class TawaturType(Enum):
     """Corroboration status classification."""
@@ -190,7 +192,8 @@ def _compute_time_clustering(timestamps: list[datetime | str | None]) -> float:
 def _compute_chain_overlap(sources: list[dict[str, Any]]) -> float:
     """Compute chain overlap factor for collusion risk.
 
-    Sources sharing transmission chain nodes suggest dependency.
+    Sources sharing transmission chain nodes suggest dependency. Counted over the interned
+    chain index (see ``idis.services.sanad.independence``) rather than pair by pair.
 
     Args:
         sources: List of evidence item dictionaries
@@ -198,34 +201,7 @@ def _compute_chain_overlap(sources: list[dict[str, Any]]) -> float:
     Returns:
         Overlap factor [0.0, 1.0] where 1.0 = high overlap
     """
-    all_node_ids: list[set[str]] = []
-
-    for source in sources:
-        chain = source.get("transmission_chain", [])
-        if isinstance(chain, list):
-            node_ids = {
-                str(n.get("node_id", "")) for n in chain if isinstance(n, dict) and n.get("node_id")
-            }
-            all_node_ids.append(node_ids)
-        else:
-            all_node_ids.append(set())
-
-    if len(all_node_ids) < 2:
-        return 0.0
-
-    overlap_count = 0
-    pair_count = 0
-
-    for i in range(len(all_node_ids)):
-        for j in range(i + 1, len(all_node_ids)):
-            pair_count += 1
-            if all_node_ids[i] & all_node_ids[j]:
-                overlap_count += 1
-
-    if pair_count == 0:
-        return 0.0
-
-    return overlap_count / pair_count
+    return build_chain_index(sources).overlap_fraction()
 
 
 def compute_collusion_risk(sources: list[dict[str, Any]]) -> float:
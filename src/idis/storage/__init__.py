@@ -16,16 +16,19 @@ Environment Variables:
 from idis.storage.errors import (
     ObjectNotFoundError,
     ObjectStorageError,
+    ObjectTooLargeError,
     PathTraversalError,
 )
-from idis.storage.models import StoredObject, StoredObjectMetadata
+from idis.storage.models import StoredObject, StoredObjectMetadata, StoredObjectStream
 from idis.storage.object_store import ObjectStore
 
 __all__ = [
     "ObjectStore",
     "StoredObject",
     "StoredObjectMetadata",
+    "StoredObjectStream",
     "ObjectStorageError",
     "ObjectNotFoundError",
+    "ObjectTooLargeError",
     "PathTraversalError",
 ]
@@ -14,7 +14,7 @@ import hashlib
 import json
 import logging
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from idis.compliance.byok import (
     BYOKPolicyRegistry,
@@ -27,9 +27,11 @@ from idis.compliance.retention import (
     LegalHoldRegistry,
     block_deletion_if_held,
 )
-from idis.storage.models import StoredObject, StoredObjectMetadata
+from idis.storage.models import StoredObject, StoredObjectMetadata, StoredObjectStream
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from idis.api.auth import TenantContext
     from idis.storage.object_store import ObjectStore
 
@@ -147,7 +149,58 @@ class ComplianceEnforcedStore:
             data=data,
             content_type=content_type,
         )
+        self._record_byok_evidence(tenant_ctx, key, data_class)
+        return metadata
+
+    def put_stream(
+        self,
+        tenant_ctx: TenantContext,
+        key: str,
+        source: Iterable[bytes] | BinaryIO,
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+        data_class: DataClass = DataClass.CLASS_2,
+    ) -> StoredObjectMetadata:
+        """Store a streamed object with BYOK enforcement and evidence persistence.
 
+        The BYOK check runs before the source is read; evidence is persisted only after
+        the inner store has committed the version.
+
+        Args:
+            tenant_ctx: Tenant context (required for compliance).
+            key: Object key.
+            source: Iterable of ``bytes`` chunks, or a binary file object.
+            content_type: MIME type.
+            max_bytes: Optional size limit, enforced while reading.
+            data_class: Data classification (default CLASS_2).
+
+        Returns:
+            StoredObjectMetadata for the stored object.
+
+        Raises:
+            IdisHttpError: 403 if BYOK key is revoked for Class2/3.
+            ObjectTooLargeError: If the source exceeds ``max_bytes``.
+        """
+        self._enforce_byok_for_class(tenant_ctx, data_class, "put_stream")
+
+        metadata = self._inner.put_stream(
+            tenant_id=tenant_ctx.tenant_id,
+            key=key,
+            source=source,
+            content_type=content_type,
+            max_bytes=max_bytes,
+        )
+        self._record_byok_evidence(tenant_ctx, key, data_class)
+        return metadata
+
+    def _record_byok_evidence(
+        self,
+        tenant_ctx: TenantContext,
+        key: str,
+        data_class: DataClass,
+    ) -> None:
+        """Persist BYOK sidecar evidence for a Class2/3 write when BYOK is configured."""
         byok_metadata = get_key_metadata(tenant_ctx, self._byok_registry)
         if byok_metadata and data_class in (DataClass.CLASS_2, DataClass.CLASS_3):
             self._persist_byok_evidence(
@@ -163,8 +216,6 @@ class ComplianceEnforcedStore:
                 byok_metadata.get("kms_key_alias_hash"),
             )
 
-        return metadata
-
     def _persist_byok_evidence(
         self,
         tenant_ctx: TenantContext,
@@ -253,6 +304,42 @@ class ComplianceEnforcedStore:
             version_id=version_id,
         )
 
+    def get_stream(
+        self,
+        tenant_ctx: TenantContext,
+        key: str,
+        *,
+        version_id: str | None = None,
+        byte_range: tuple[int, int] | None = None,
+        data_class: DataClass = DataClass.CLASS_2,
+    ) -> StoredObjectStream:
+        """Stream an object or inclusive byte range with BYOK enforcement.
+
+        For Class2/3 data, BYOK key must be active if configured. The check runs before the
+        stream is opened; a revocation mid-download does not cut an open stream.
+
+        Args:
+            tenant_ctx: Tenant context (required for compliance).
+            key: Object key.
+            version_id: Optional specific version.
+            byte_range: Optional inclusive ``(start, end)`` offsets.
+            data_class: Data classification (default CLASS_2).
+
+        Returns:
+            StoredObjectStream with metadata and the chunk iterator.
+
+        Raises:
+            IdisHttpError: 403 if BYOK key is revoked for Class2/3.
+        """
+        self._enforce_byok_for_class(tenant_ctx, data_class, "get_stream")
+
+        return self._inner.get_stream(
+            tenant_id=tenant_ctx.tenant_id,
+            key=key,
+            version_id=version_id,
+            byte_range=byte_range,
+        )
+
     def head(
         self,
         tenant_ctx: TenantContext,
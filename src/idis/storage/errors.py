@@ -95,3 +95,24 @@ class StorageBackendError(ObjectStorageError):
     ) -> None:
         super().__init__(message, tenant_id=tenant_id, key=key)
         self.cause = cause
+
+
+class ObjectTooLargeError(ObjectStorageError):
+    """Raised when a streamed write exceeds its size limit.
+
+    The write is aborted as soon as the limit is crossed; no version is created.
+
+    Attributes:
+        max_bytes: The size limit that was exceeded.
+    """
+
+    def __init__(
+        self,
+        message: str = "Object exceeds size limit",
+        *,
+        tenant_id: str | None = None,
+        key: str | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        super().__init__(message, tenant_id=tenant_id, key=key)
+        self.max_bytes = max_bytes
@@ -20,16 +20,24 @@ import os
 import re
 import tempfile
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from idis.storage.errors import (
     ObjectNotFoundError,
+    ObjectTooLargeError,
     PathTraversalError,
     StorageBackendError,
 )
-from idis.storage.models import StoredObject, StoredObjectMetadata
-from idis.storage.object_store import ObjectStore
+from idis.storage.models import StoredObject, StoredObjectMetadata, StoredObjectStream
+from idis.storage.object_store import (
+    STREAM_CHUNK_BYTES,
+    ObjectStore,
+    iter_source_chunks,
+    resolve_byte_range,
+)
 from idis.storage.tracing import traced_storage_operation
 
 logger = logging.getLogger(__name__)
@@ -110,6 +118,33 @@ def _compute_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def _read_chunks(handle: BinaryIO, offset: int, length: int) -> Iterator[bytes]:
+    """Yield ``length`` bytes from ``offset`` in bounded chunks, closing ``handle`` at the end."""
+    with handle:
+        handle.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(STREAM_CHUNK_BYTES, remaining))
+            if not chunk:
+                raise StorageBackendError(message="Version content is shorter than its metadata")
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash (best effort)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 class FilesystemObjectStore(ObjectStore):
     """Filesystem-based object storage implementation.
 
@@ -184,6 +219,58 @@ class FilesystemObjectStore(ObjectStore):
             ) from e
         return resolved
 
+    def _prepare_object_dir(self, tenant_id: str, key: str) -> Path:
+        """Validate inputs and create the object directory for a new version."""
+        obj_dir = self._get_object_dir(tenant_id, key)
+        self._ensure_resolved_within_base(obj_dir, tenant_id, key)
+
+        try:
+            obj_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise StorageBackendError(
+                message=f"Failed to create object directory: {e}",
+                tenant_id=tenant_id,
+                key=key,
+                cause=e,
+            ) from e
+        return obj_dir
+
+    def _resolve_version(
+        self,
+        tenant_id: str,
+        key: str,
+        version_id: str | None,
+    ) -> tuple[Path, str, StoredObjectMetadata]:
+        """Locate an object version (latest if None) and read its metadata."""
+        obj_dir = self._get_object_dir(tenant_id, key)
+        self._ensure_resolved_within_base(obj_dir, tenant_id, key)
+
+        if not obj_dir.exists():
+            raise ObjectNotFoundError(
+                message="Object not found",
+                tenant_id=tenant_id,
+                key=key,
+            )
+
+        if version_id is None:
+            version_id = self._read_latest_pointer(obj_dir)
+            if version_id is None:
+                raise ObjectNotFoundError(
+                    message="Object has no versions",
+                    tenant_id=tenant_id,
+                    key=key,
+                )
+
+        metadata = self._read_metadata(obj_dir, version_id)
+        if metadata is None:
+            raise ObjectNotFoundError(
+                message="Version not found",
+                tenant_id=tenant_id,
+                key=key,
+                version_id=version_id,
+            )
+        return obj_dir, version_id, metadata
+
     def _read_latest_pointer(self, obj_dir: Path) -> str | None:
         """Read the latest version pointer file."""
         latest_file = obj_dir / _LATEST_POINTER
@@ -280,18 +367,7 @@ class FilesystemObjectStore(ObjectStore):
         content_type: str | None = None,
     ) -> StoredObjectMetadata:
         """Store an object."""
-        obj_dir = self._get_object_dir(tenant_id, key)
-        self._ensure_resolved_within_base(obj_dir, tenant_id, key)
-
-        try:
-            obj_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise StorageBackendError(
-                message=f"Failed to create object directory: {e}",
-                tenant_id=tenant_id,
-                key=key,
-                cause=e,
-            ) from e
+        obj_dir = self._prepare_object_dir(tenant_id, key)
 
         version_id = str(uuid.uuid4())
         sha256 = _compute_sha256(data)
@@ -321,42 +397,98 @@ class FilesystemObjectStore(ObjectStore):
 
         return metadata
 
-    @traced_storage_operation("get")
-    def get(
+    @traced_storage_operation("put_stream")
+    def put_stream(
         self,
         tenant_id: str,
         key: str,
+        source: Iterable[bytes] | BinaryIO,
         *,
-        version_id: str | None = None,
-    ) -> StoredObject:
-        """Retrieve an object."""
-        obj_dir = self._get_object_dir(tenant_id, key)
-        self._ensure_resolved_within_base(obj_dir, tenant_id, key)
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> StoredObjectMetadata:
+        """Store an object from a chunk iterable or file object without buffering it.
 
-        if not obj_dir.exists():
-            raise ObjectNotFoundError(
-                message="Object not found",
-                tenant_id=tenant_id,
-                key=key,
-            )
+        Chunks are hashed and appended to a temp file in the object directory, which is
+        fsynced and renamed onto the version's content file only once the source is
+        exhausted. Metadata and the latest pointer follow, so a failed, oversized or
+        interrupted write leaves no partial version and the previous latest intact.
+        """
+        obj_dir = self._prepare_object_dir(tenant_id, key)
 
-        if version_id is None:
-            version_id = self._read_latest_pointer(obj_dir)
-            if version_id is None:
-                raise ObjectNotFoundError(
-                    message="Object has no versions",
-                    tenant_id=tenant_id,
-                    key=key,
-                )
+        version_id = str(uuid.uuid4())
+        content_file = obj_dir / f"{version_id}{_CONTENT_SUFFIX}"
+        tmp_file = obj_dir / f"{version_id}.data.{uuid.uuid4().hex}.tmp"
+        hasher = hashlib.sha256()
+        size_bytes = 0
 
-        metadata = self._read_metadata(obj_dir, version_id)
-        if metadata is None:
-            raise ObjectNotFoundError(
-                message="Version not found",
+        try:
+            with tmp_file.open("wb") as handle:
+                for chunk in iter_source_chunks(source):
+                    size_bytes += len(chunk)
+                    if max_bytes is not None and size_bytes > max_bytes:
+                        raise ObjectTooLargeError(
+                            f"Object exceeds {max_bytes} bytes",
+                            tenant_id=tenant_id,
+                            key=key,
+                            max_bytes=max_bytes,
+                        )
+                    hasher.update(chunk)
+                    handle.write(chunk)
+                handle.flush()
+                os.fsync(handle.fileno())
+            tmp_file.replace(content_file)
+            _fsync_directory(obj_dir)
+        except OSError as e:
+            tmp_file.unlink(missing_ok=True)
+            raise StorageBackendError(
+                message=f"Failed to write content: {e}",
                 tenant_id=tenant_id,
                 key=key,
-                version_id=version_id,
-            )
+                cause=e,
+            ) from e
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        metadata = StoredObjectMetadata(
+            tenant_id=tenant_id,
+            key=key,
+            version_id=version_id,
+            sha256=hasher.hexdigest(),
+            size_bytes=size_bytes,
+            content_type=content_type,
+            created_at=datetime.now(UTC),
+        )
+
+        try:
+            self._write_metadata(obj_dir, version_id, metadata)
+        except StorageBackendError:
+            content_file.unlink(missing_ok=True)
+            raise
+        self._write_latest_pointer(obj_dir, version_id)
+
+        logger.debug(
+            "Stored streamed object: tenant=%s key=%s version=%s sha256=%s size=%d",
+            tenant_id,
+            key,
+            version_id,
+            metadata.sha256,
+            size_bytes,
+        )
+
+        return metadata
+
+    @traced_storage_operation("get")
+    def get(
+        self,
+        tenant_id: str,
+        key: str,
+        *,
+        version_id: str | None = None,
+    ) -> StoredObject:
+        """Retrieve an object."""
+        obj_dir, version_id, metadata = self._resolve_version(tenant_id, key, version_id)
 
         content = self._read_content(obj_dir, version_id)
         if content is None:
@@ -378,35 +510,46 @@ class FilesystemObjectStore(ObjectStore):
         version_id: str | None = None,
     ) -> StoredObjectMetadata:
         """Get object metadata without retrieving content."""
-        obj_dir = self._get_object_dir(tenant_id, key)
-        self._ensure_resolved_within_base(obj_dir, tenant_id, key)
-
-        if not obj_dir.exists():
-            raise ObjectNotFoundError(
-                message="Object not found",
-                tenant_id=tenant_id,
-                key=key,
-            )
+        _, _, metadata = self._resolve_version(tenant_id, key, version_id)
+        return metadata
 
-        if version_id is None:
-            version_id = self._read_latest_pointer(obj_dir)
-            if version_id is None:
-                raise ObjectNotFoundError(
-                    message="Object has no versions",
-                    tenant_id=tenant_id,
-                    key=key,
-                )
+    @traced_storage_operation("get_stream")
+    def get_stream(
+        self,
+        tenant_id: str,
+        key: str,
+        *,
+        version_id: str | None = None,
+        byte_range: tuple[int, int] | None = None,
+    ) -> StoredObjectStream:
+        """Stream an object or byte range from its version file in bounded chunks."""
+        obj_dir, version_id, metadata = self._resolve_version(tenant_id, key, version_id)
+        start, end = resolve_byte_range(metadata.size_bytes, byte_range)
 
-        metadata = self._read_metadata(obj_dir, version_id)
-        if metadata is None:
+        content_file = obj_dir / f"{version_id}{_CONTENT_SUFFIX}"
+        try:
+            handle = content_file.open("rb")
+        except FileNotFoundError as e:
             raise ObjectNotFoundError(
-                message="Version not found",
+                message="Version content not found",
                 tenant_id=tenant_id,
                 key=key,
                 version_id=version_id,
-            )
+            ) from e
+        except OSError as e:
+            raise StorageBackendError(
+                message=f"Failed to open content: {e}",
+                tenant_id=tenant_id,
+                key=key,
+                cause=e,
+            ) from e
 
-        return metadata
+        return StoredObjectStream(
+            metadata=metadata,
+            start=start,
+            end=end,
+            chunks=_read_chunks(handle, start, end - start + 1),
+        )
 
     @traced_storage_operation("delete")
     def delete(
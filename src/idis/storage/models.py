@@ -5,6 +5,7 @@ Provides typed dataclasses for object storage metadata and objects.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -83,3 +84,27 @@ class StoredObject:
 
     metadata: StoredObjectMetadata
     body: bytes
+
+
+@dataclass(frozen=True)
+class StoredObjectStream:
+    """An inclusive byte range of a stored object, read lazily in chunks.
+
+    Attributes:
+        metadata: Object metadata. ``sha256`` and ``size_bytes`` describe the whole object,
+            not the range.
+        start: First byte offset served.
+        end: Last byte offset served (inclusive); ``start - 1`` for an empty object.
+        chunks: Iterator over the range's bytes. Exhausting or closing it releases the
+            backend's read handle.
+    """
+
+    metadata: StoredObjectMetadata
+    start: int
+    end: int
+    chunks: Iterator[bytes]
+
+    @property
+    def content_length(self) -> int:
+        """Number of bytes in the range."""
+        return self.end - self.start + 1
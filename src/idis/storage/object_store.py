@@ -6,8 +6,47 @@ Provides the ObjectStore protocol/interface that all storage backends must imple
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
 
-from idis.storage.models import StoredObject, StoredObjectMetadata
+from idis.storage.errors import ObjectTooLargeError
+from idis.storage.models import StoredObject, StoredObjectMetadata, StoredObjectStream
+
+# Chunk size for streamed reads and writes: bounds per-request memory regardless of object size.
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def iter_source_chunks(source: Iterable[bytes] | BinaryIO) -> Iterator[bytes]:
+    """Yield non-empty byte chunks from an iterable of bytes or a binary file object."""
+    read = getattr(source, "read", None)
+    if callable(read):
+        while chunk := read(STREAM_CHUNK_BYTES):
+            yield chunk
+        return
+    for chunk in source:
+        if chunk:
+            yield bytes(chunk)
+
+
+def resolve_byte_range(size_bytes: int, byte_range: tuple[int, int] | None) -> tuple[int, int]:
+    """Validate an inclusive ``(start, end)`` byte range against an object size.
+
+    Args:
+        size_bytes: Size of the whole object.
+        byte_range: Inclusive offsets, or None for the whole object.
+
+    Returns:
+        The inclusive ``(start, end)`` to serve; ``(0, -1)`` for a whole empty object.
+
+    Raises:
+        ValueError: If the range is empty, reversed or extends past the object.
+    """
+    if byte_range is None:
+        return 0, size_bytes - 1
+    start, end = byte_range
+    if start < 0 or end < start or end >= size_bytes:
+        raise ValueError(f"byte_range {byte_range} is not within an object of {size_bytes} bytes")
+    return start, end
 
 
 class ObjectStore(ABC):
@@ -60,6 +99,47 @@ class ObjectStore(ABC):
         """
         ...
 
+    def put_stream(
+        self,
+        tenant_id: str,
+        key: str,
+        source: Iterable[bytes] | BinaryIO,
+        *,
+        content_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> StoredObjectMetadata:
+        """Store an object read from an iterable of byte chunks or a binary file object.
+
+        The default buffers the source and delegates to ``put``. Backends that can write
+        incrementally override this to keep memory flat regardless of object size.
+
+        Args:
+            tenant_id: UUID of the tenant.
+            key: Logical key/path for the object.
+            source: Iterable of ``bytes`` chunks, or a file object with ``read``.
+            content_type: Optional MIME type of the content.
+            max_bytes: Optional size limit, enforced while reading.
+
+        Returns:
+            Metadata for the stored object including version_id and sha256.
+
+        Raises:
+            ObjectTooLargeError: If the source exceeds ``max_bytes``; nothing is stored.
+            PathTraversalError: If key contains traversal sequences.
+            StorageBackendError: If the backend cannot complete the write.
+        """
+        buffer = bytearray()
+        for chunk in iter_source_chunks(source):
+            buffer += chunk
+            if max_bytes is not None and len(buffer) > max_bytes:
+                raise ObjectTooLargeError(
+                    f"Object exceeds {max_bytes} bytes",
+                    tenant_id=tenant_id,
+                    key=key,
+                    max_bytes=max_bytes,
+                )
+        return self.put(tenant_id, key, bytes(buffer), content_type=content_type)
+
     @abstractmethod
     def get(
         self,
@@ -86,6 +166,45 @@ class ObjectStore(ABC):
         """
         ...
 
+    def get_stream(
+        self,
+        tenant_id: str,
+        key: str,
+        *,
+        version_id: str | None = None,
+        byte_range: tuple[int, int] | None = None,
+    ) -> StoredObjectStream:
+        """Retrieve an object, or an inclusive byte range of it, as a chunk iterator.
+
+        The default reads the whole object through ``get`` and slices it. Backends that can
+        seek override this to read in bounded chunks.
+
+        Args:
+            tenant_id: UUID of the tenant.
+            key: Logical key/path of the object.
+            version_id: Optional specific version to retrieve.
+                If None, streams the latest version.
+            byte_range: Optional inclusive ``(start, end)`` offsets. Resolve open-ended and
+                suffix HTTP ranges against ``head().size_bytes`` first.
+
+        Returns:
+            StoredObjectStream with metadata, the served offsets and the chunk iterator.
+
+        Raises:
+            ObjectNotFoundError: If object or version does not exist.
+            PathTraversalError: If key contains traversal sequences.
+            StorageBackendError: If the backend cannot complete the read.
+            ValueError: If ``byte_range`` is not within the object.
+        """
+        stored = self.get(tenant_id, key, version_id=version_id)
+        start, end = resolve_byte_range(stored.metadata.size_bytes, byte_range)
+        return StoredObjectStream(
+            metadata=stored.metadata,
+            start=start,
+            end=end,
+            chunks=iter((stored.body[start : end + 1],)),
+        )
+
     @abstractmethod
     def head(
         self,
@@ -105,13 +105,13 @@ def _add_result_attributes(span: Any, result: Any, operation: str) -> None:
     Never adds filesystem paths.
     """
     try:
-        from idis.storage.models import StoredObject, StoredObjectMetadata
+        from idis.storage.models import StoredObject, StoredObjectMetadata, StoredObjectStream
 
         metadata: StoredObjectMetadata | None = None
 
         if isinstance(result, StoredObjectMetadata):
             metadata = result
-        elif isinstance(result, StoredObject):
+        elif isinstance(result, (StoredObject, StoredObjectStream)):
             metadata = result.metadata
 
         if metadata is not None:
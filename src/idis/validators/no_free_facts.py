@@ -29,6 +29,8 @@ Rules:
 
 from __future__ import annotations
 
+import functools
+import importlib
 import re
 from dataclasses import dataclass
 from typing import Any
@@ -165,6 +167,74 @@ SEMANTIC_RULES: list[tuple[re.Pattern[str], re.Pattern[str], str]] = [
     for subj, pred, desc in SEMANTIC_SUBJECT_PREDICATES
 ]
 
+# Literal gates: a pattern only runs over a text that contains one of the literals every match
+# of it must include (ASCII or uncased characters). The text is case-folded once per call. Before
+# lowering, the only non-ASCII characters IGNORECASE equates with an ASCII letter but whose
+# lower() is not that letter are mapped to it: dotted capital I (lowers to "i" plus a combining
+# dot), dotless i and long s. The Kelvin sign lowers to "k" already. Skipping a gated pattern
+# therefore never changes its findings.
+#
+# Gates come from CPython's private regex parser. Where it is unavailable every pattern runs
+# ungated, which is slower but gives the same findings.
+try:
+    _re_parser: Any = importlib.import_module("re._parser")
+except ImportError:
+    _re_parser = None
+_GATE_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _fold_for_gates(text: str) -> str:
+    """Case-fold text for literal-gate lookups."""
+    return text.translate(_GATE_FOLDS).lower()
+
+
+def _required_literals(items: Any) -> tuple[str, ...] | None:
+    """Return lowercase literals one of which every match of a parsed pattern contains."""
+    best: tuple[str, ...] | None = None
+    run: list[str] = []
+
+    def consider(gate: tuple[str, ...] | None) -> None:
+        nonlocal best
+        if gate and (best is None or min(map(len, gate)) > min(map(len, best))):
+            best = gate
+
+    for op, av in [*items, (None, None)]:
+        if op is _re_parser.LITERAL and (av < 128 or chr(av).lower() == chr(av).upper()):
+            run.append(chr(av).lower())
+            continue
+        if run:
+            consider(("".join(run),))
+            run = []
+        if op is _re_parser.SUBPATTERN:
+            consider(_required_literals(av[-1]))
+        elif op is _re_parser.ATOMIC_GROUP:
+            consider(_required_literals(av))
+        elif op in (_re_parser.MAX_REPEAT, _re_parser.MIN_REPEAT, _re_parser.POSSESSIVE_REPEAT):
+            if av[0] >= 1:
+                consider(_required_literals(av[2]))
+        elif op is _re_parser.BRANCH:
+            alternatives = [_required_literals(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(tuple(sorted({lit for alt in alternatives if alt for lit in alt})))
+    return best
+
+
+@functools.cache
+def _literal_gate(pattern: str) -> tuple[str, ...] | None:
+    """Return the literal gate of an IGNORECASE pattern, or None when it cannot be gated."""
+    if _re_parser is None:
+        return None
+    try:
+        return _required_literals(_re_parser.parse(pattern, re.IGNORECASE))
+    except Exception:
+        return None
+
+
+def _may_match(pattern: re.Pattern[str], folded: str) -> bool:
+    """Return False only if ``pattern`` cannot match the text ``folded`` was built from."""
+    gate = _literal_gate(pattern.pattern)
+    return gate is None or any(literal in folded for literal in gate)
+
 
 @dataclass
 class SemanticMatch:
@@ -231,14 +301,18 @@ class NoFreeFactsValidator:
         """
         self._enable_semantic_rules = enable_semantic_rules
 
-    def _extract_semantic_matches(self, text: str) -> list[SemanticMatch]:
+    def _extract_semantic_matches(
+        self, text: str, folded: str | None = None
+    ) -> list[SemanticMatch]:
         """Extract semantic subject-predicate pattern matches from text.
 
         Phase POST-5.2: Semantic rule library for enhanced factual detection.
-        Uses deterministic rules only (no external models).
+        Uses deterministic rules only (no external models). Rules whose subject or
+        predicate literals are absent from the text are skipped.
 
         Args:
             text: Text to analyze.
+            folded: ``_fold_for_gates(text)`` when the caller already computed it.
 
         Returns:
             List of semantic matches found.
@@ -249,7 +323,12 @@ class NoFreeFactsValidator:
         matches: list[SemanticMatch] = []
         seen_positions: set[int] = set()
 
+        if folded is None:
+            folded = _fold_for_gates(text)
+
         for subj_pattern, pred_pattern, rule_name in SEMANTIC_RULES:
+            if not (_may_match(subj_pattern, folded) and _may_match(pred_pattern, folded)):
+                continue
             # Find subject matches
             for subj_match in subj_pattern.finditer(text):
                 subj_end = subj_match.end()
@@ -272,15 +351,22 @@ class NoFreeFactsValidator:
 
         return sorted(matches, key=lambda m: m.position)
 
-    def _extract_factual_assertions(self, text: str) -> list[FactualAssertion]:
+    def _extract_factual_assertions(
+        self, text: str, folded: str | None = None
+    ) -> list[FactualAssertion]:
         """Extract potential factual assertions from text using heuristic patterns.
 
         This is a FALLBACK method used only when is_factual field is not provided.
+        Patterns whose literal gate is absent from the text are skipped.
         """
         assertions: list[FactualAssertion] = []
         seen_positions: set[tuple[int, int]] = set()
+        if folded is None:
+            folded = _fold_for_gates(text)
 
         for regex in FACTUAL_REGEXES:
+            if not _may_match(regex, folded):
+                continue
             for match in regex.finditer(text):
                 pos_key = (match.start(), match.end())
                 if pos_key not in seen_positions:
@@ -358,10 +444,11 @@ class NoFreeFactsValidator:
         Returns list of detected factual assertions (empty if none found).
         """
         # Get regex-based assertions
-        assertions = self._extract_factual_assertions(text)
+        folded = _fold_for_gates(text)
+        assertions = self._extract_factual_assertions(text, folded)
 
         # Get semantic matches and convert to FactualAssertion format
-        semantic_matches = self._extract_semantic_matches(text)
+        semantic_matches = self._extract_semantic_matches(text, folded)
         seen_positions = {a.position for a in assertions}
 
         for match in semantic_matches:
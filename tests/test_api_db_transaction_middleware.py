@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
 
 from idis.api.middleware.db_tx import DBTransactionMiddleware
 
@@ -70,3 +72,90 @@ def test_non_exempt_v1_path_still_opens_db_transaction() -> None:
 
     assert response.status_code == 200
     open_conn.assert_called_once()
+
+
+def test_export_stream_is_forwarded_before_commit() -> None:
+    """Export GETs stream through the transaction; the body is sent before the commit runs."""
+    events: list[str] = []
+    middleware = DBTransactionMiddleware(_successful_inner_app)
+
+    async def app(scope: object, receive: object, send: object) -> None:
+        async def client_send(message: dict[str, object]) -> None:
+            events.append(str(message["type"]))
+            await send(message)  # type: ignore[operator]
+
+        await middleware(scope, receive, client_send)  # type: ignore[arg-type]
+
+    with (
+        patch("idis.persistence.db.is_postgres_configured", return_value=True),
+        patch(
+            "idis.api.middleware.db_tx._open_connection", return_value=(MagicMock(), MagicMock())
+        ),
+        patch(
+            "idis.api.middleware.db_tx._commit",
+            side_effect=lambda _: events.append("commit"),
+        ),
+        patch("idis.api.middleware.db_tx._close"),
+    ):
+        client = TestClient(app, raise_server_exceptions=False)  # type: ignore[arg-type]
+        streamed = client.get("/v1/deals/d-1/export/claims")
+        buffered = client.get("/v1/deals/d-1/claims")
+
+    assert streamed.status_code == buffered.status_code == 200
+    assert events == [
+        "http.response.start",
+        "http.response.body",
+        "commit",
+        "commit",
+        "http.response.start",
+        "http.response.body",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("path", "streamed"),
+    [
+        ("/v1/deliverables/del-1/content", True),
+        ("/v1/deals/d-1/export/claims", True),
+        ("/v1/deliverables/del-1", False),
+    ],
+)
+def test_streaming_reads_forward_each_chunk_before_the_next_is_produced(
+    path: str, streamed: bool
+) -> None:
+    """Download and export bodies reach the client chunk by chunk, not after the app returns."""
+    events: list[str] = []
+
+    async def chunked_inner_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in (b"a", b"b"):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            events.append(f"produced {chunk.decode()}")
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        events.append("app done")
+
+    middleware = DBTransactionMiddleware(chunked_inner_app)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def client_send(message: Message) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                events.append(f"sent {message['body'].decode()}")
+            await send(message)
+
+        await middleware(scope, receive, client_send)
+
+    with (
+        patch("idis.persistence.db.is_postgres_configured", return_value=True),
+        patch(
+            "idis.api.middleware.db_tx._open_connection", return_value=(MagicMock(), MagicMock())
+        ),
+        patch("idis.api.middleware.db_tx._commit"),
+        patch("idis.api.middleware.db_tx._close"),
+    ):
+        response = TestClient(app).get(path)
+
+    assert response.content == b"ab"
+    if streamed:
+        assert events == ["sent a", "produced a", "sent b", "produced b", "app done"]
+    else:
+        assert events == ["produced a", "produced b", "app done", "sent a", "sent b"]
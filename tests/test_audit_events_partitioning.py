@@ -0,0 +1,276 @@
+"""Tests for the partitioned audit_events table with promoted deal_id/run_id (migration 0031).
+
+Unit tests (always run):
+- Migration 0031 declares monthly RANGE partitioning, a DEFAULT partition, covering keyset
+  indexes, FORCE RLS and the immutability trigger on the partitioned parent.
+- PostgresAuditSink populates deal_id/run_id at insert time from the event shapes emitted by
+  the API middleware (request.deal_id) and the run orchestrator (resource.deal_id,
+  payload.safe.run_id).
+- PostgresAuditQueryRepository filters deals on the real column, never on extracted JSON,
+  and the JSONL backend applies the same deal resolution.
+- Partition upkeep provisions the current month plus the configured horizon.
+
+Postgres tests (IDIS_DATABASE_ADMIN_URL + IDIS_DATABASE_URL, else skipped):
+- Rows route into their month partition and the deal filter returns them via the column.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import uuid
+from collections.abc import Generator
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import text
+
+from idis.audit.partitions import months_to_provision
+from idis.audit.postgres_sink import PostgresAuditSink, _event_row
+from idis.audit.query import JsonlAuditQueryRepository, PostgresAuditQueryRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+ADMIN_URL_ENV = "IDIS_DATABASE_ADMIN_URL"
+APP_URL_ENV = "IDIS_DATABASE_URL"
+REQUIRE_POSTGRES_ENV = "IDIS_REQUIRE_POSTGRES"
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+DEAL_ID = "33333333-3333-3333-3333-333333333333"
+RUN_ID = "44444444-4444-4444-4444-444444444444"
+
+_MIGRATION = (
+    Path(__file__).resolve().parents[1]
+    / "src"
+    / "idis"
+    / "persistence"
+    / "migrations"
+    / "versions"
+    / "0031_audit_events_partitioned_promoted_ids.py"
+)
+
+
+def _orchestrator_event(occurred_at: str = "2026-03-15T10:00:00Z") -> dict[str, Any]:
+    return {
+        "event_id": str(uuid.uuid4()),
+        "tenant_id": TENANT_ID,
+        "occurred_at": occurred_at,
+        "event_type": "deal.run.step.completed",
+        "request": {"request_id": RUN_ID, "method": "POST", "path": f"/v1/runs/{RUN_ID}"},
+        "resource": {"resource_type": "deal", "resource_id": DEAL_ID, "deal_id": DEAL_ID},
+        "payload": {"safe": {"run_id": RUN_ID}, "hashes": [], "refs": []},
+    }
+
+
+def _api_event(deal_id: str, occurred_at: str) -> dict[str, Any]:
+    return {
+        "event_id": str(uuid.uuid4()),
+        "tenant_id": TENANT_ID,
+        "occurred_at": occurred_at,
+        "event_type": "deal.updated",
+        "request": {"request_id": "req-1", "deal_id": deal_id},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Migration shape
+# ---------------------------------------------------------------------------
+
+
+def test_migration_declares_partitioning_indexes_rls_and_immutability() -> None:
+    sql = _MIGRATION.read_text(encoding="utf-8")
+
+    assert 'down_revision = "0030"' in sql
+    assert "PARTITION BY RANGE (occurred_at)" in sql
+    assert "PARTITION OF audit_events_partitioned DEFAULT" in sql
+    assert "PRIMARY KEY (event_id, occurred_at)" in sql
+    assert "ON audit_events (tenant_id, deal_id, occurred_at DESC, event_id DESC)" in sql
+    assert "INCLUDE (event_type)" in sql
+    assert "FORCE ROW LEVEL SECURITY" in sql
+    assert "BEFORE UPDATE OR DELETE ON audit_events" in sql
+    assert "SECURITY DEFINER" in sql
+    assert "REVOKE ALL ON FUNCTION idis_ensure_audit_events_partition(DATE) FROM PUBLIC" in sql
+    assert "GRANT EXECUTE ON FUNCTION idis_ensure_audit_events_partition(DATE) TO %I" in sql
+    assert "TO idis_app" not in sql
+
+
+@pytest.mark.parametrize(
+    ("configured", "role"),
+    [(None, "idis_app"), ("", "idis_app"), ("svc_idis", "svc_idis"), ("o'app", "o''app")],
+)
+def test_partition_upkeep_grant_targets_the_configured_app_role(
+    monkeypatch: pytest.MonkeyPatch, configured: str | None, role: str
+) -> None:
+    spec = importlib.util.spec_from_file_location("_migration_0031", _MIGRATION)
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    executed: list[str] = []
+    monkeypatch.setattr(migration.op, "execute", executed.append, raising=False)
+    if configured is None:
+        monkeypatch.delenv(migration.APP_ROLE_ENV, raising=False)
+    else:
+        monkeypatch.setenv(migration.APP_ROLE_ENV, configured)
+
+    migration._grant_partition_upkeep(migration._app_role())
+
+    (sql,) = executed
+    assert f"WHERE rolname = '{role}'" in sql
+    assert sql.count(f"'{role}'") == 3  # existence check, GRANT ... TO %I, WARNING
+
+
+# ---------------------------------------------------------------------------
+# Insert-time promotion
+# ---------------------------------------------------------------------------
+
+
+def test_sink_promotes_ids_from_orchestrator_event_shape() -> None:
+    row = _event_row(_orchestrator_event())
+
+    assert row["deal_id"] == DEAL_ID
+    assert row["run_id"] == RUN_ID
+
+
+def test_sink_promotes_request_deal_id_and_leaves_absent_ids_null() -> None:
+    row = _event_row(_api_event(DEAL_ID, "2026-03-15T10:00:00Z"))
+
+    assert row["deal_id"] == DEAL_ID
+    assert row["run_id"] is None
+
+
+class _RecordingConn:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any]) -> Any:
+        self.calls.append((str(statement), params))
+        return self
+
+    def fetchall(self) -> list[Any]:
+        return []
+
+
+def test_emit_in_tx_binds_promoted_columns() -> None:
+    conn = _RecordingConn()
+
+    PostgresAuditSink(group_commit=None).emit_in_tx(conn, _orchestrator_event())  # type: ignore[arg-type]
+
+    sql, params = conn.calls[0]
+    assert ":deal_id" in sql and ":run_id" in sql
+    assert params["deal_id"] == DEAL_ID
+
+
+def test_postgres_query_filters_deal_on_column_not_json() -> None:
+    conn = _RecordingConn()
+    repo = PostgresAuditQueryRepository(conn, TENANT_ID)  # type: ignore[arg-type]
+
+    repo.list_events(limit=10, deal_id=DEAL_ID)
+
+    sql, params = conn.calls[0]
+    assert "deal_id = :deal_id" in sql
+    assert "->>" not in sql and "jsonb" not in sql
+    assert "ORDER BY occurred_at DESC, event_id DESC" in sql
+    assert params["deal_id"] == DEAL_ID
+
+
+def test_jsonl_query_resolves_deal_like_the_promoted_column(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = [
+        _orchestrator_event("2026-03-15T10:00:00Z"),
+        _api_event(DEAL_ID, "2026-03-15T11:00:00Z"),
+        _api_event("55555555-5555-5555-5555-555555555555", "2026-03-15T12:00:00Z"),
+    ]
+    log.write_text("".join(json.dumps(e) + "\n" for e in events), encoding="utf-8")
+
+    page = JsonlAuditQueryRepository(log, TENANT_ID).list_events(limit=10, deal_id=DEAL_ID)
+
+    assert [item.event_id for item in page.items] == [events[1]["event_id"], events[0]["event_id"]]
+
+
+# ---------------------------------------------------------------------------
+# Partition upkeep
+# ---------------------------------------------------------------------------
+
+
+def test_months_to_provision_wraps_year_and_uses_utc() -> None:
+    months = months_to_provision(datetime(2026, 11, 30, 23, 30, tzinfo=UTC), months_ahead=3)
+
+    assert months == [date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1), date(2027, 2, 1)]
+
+
+# ---------------------------------------------------------------------------
+# Postgres integration
+# ---------------------------------------------------------------------------
+
+
+def _skip_or_fail_if_no_postgres() -> None:
+    admin_url = os.environ.get(ADMIN_URL_ENV)
+    app_url = os.environ.get(APP_URL_ENV)
+    if not admin_url or not app_url:
+        msg = f"PostgreSQL integration tests require {ADMIN_URL_ENV} and {APP_URL_ENV} env vars"
+        if os.environ.get(REQUIRE_POSTGRES_ENV, "0") == "1":
+            pytest.fail(f"REQUIRED: {msg} (IDIS_REQUIRE_POSTGRES=1)")
+        pytest.skip(msg)
+
+
+@pytest.fixture(scope="module")
+def migrated_engines() -> Generator[tuple[Engine, Engine], None, None]:
+    _skip_or_fail_if_no_postgres()
+
+    from alembic import command
+    from alembic.config import Config
+
+    import idis.persistence.migrations as migrations_pkg
+    from idis.persistence.db import get_admin_engine, get_app_engine, reset_engines
+
+    admin_engine = get_admin_engine()
+    config = Config()
+    config.set_main_option("script_location", os.path.dirname(migrations_pkg.__file__))
+    with admin_engine.begin() as conn:
+        config.attributes["connection"] = conn
+        command.upgrade(config, "head")
+        conn.execute(text("TRUNCATE audit_events"))
+
+    yield admin_engine, get_app_engine()
+
+    with admin_engine.begin() as conn:
+        conn.execute(text("TRUNCATE audit_events"))
+    reset_engines()
+
+
+def test_rows_route_to_month_partition_and_deal_filter_uses_column(
+    migrated_engines: tuple[Engine, Engine],
+) -> None:
+    from idis.audit.partitions import ensure_audit_event_partitions
+    from idis.persistence.db import set_tenant_local
+
+    admin_engine, app_engine = migrated_engines
+    occurred = datetime.now(UTC).replace(microsecond=0)
+    event = _orchestrator_event(occurred.isoformat())
+
+    # Partition upkeep runs as the app role, exactly as the compliance janitor does.
+    with app_engine.begin() as conn:
+        ensured = ensure_audit_event_partitions(conn, now=occurred, months_ahead=1)
+    assert ensured == [
+        f"audit_events_p{month:%Y%m}" for month in months_to_provision(occurred, months_ahead=1)
+    ]
+
+    with app_engine.begin() as conn:
+        set_tenant_local(conn, TENANT_ID)
+        PostgresAuditSink(group_commit=None).emit_in_tx(conn, event)
+
+    with admin_engine.begin() as conn:
+        partition = conn.execute(
+            text("SELECT tableoid::regclass::text FROM audit_events WHERE event_id = :e"),
+            {"e": event["event_id"]},
+        ).scalar()
+    assert partition == f"audit_events_p{occurred:%Y%m}"
+
+    with app_engine.begin() as conn:
+        set_tenant_local(conn, TENANT_ID)
+        page = PostgresAuditQueryRepository(conn, TENANT_ID).list_events(deal_id=DEAL_ID)
+    assert [item.event_id for item in page.items] == [event["event_id"]]
@@ -0,0 +1,218 @@
+"""Tests for the group-commit audit writer (idis.audit.group_commit).
+
+Pins the batching contract without a database (the commit function is injected):
+
+1. A lone sequential emitter commits one event per batch and never lingers.
+2. Concurrent emitters are coalesced into fewer, larger per-tenant batches.
+3. Callers block until their own batch is committed; a failed tenant batch raises
+   AuditSinkError for exactly that tenant's emitters (fail closed), others succeed.
+4. Throughput counters are recorded in stats() and the metrics registry.
+5. PostgresAuditSink routes standalone emit() through an attached writer and builds
+   chunked multi-row INSERT statements.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from idis.audit.group_commit import GroupCommitAuditWriter
+from idis.audit.postgres_sink import (
+    MAX_ROWS_PER_INSERT,
+    PostgresAuditSink,
+    _multi_row_insert_sql,
+    insert_events,
+)
+from idis.audit.sink import AuditSinkError
+from idis.observability.metrics import get_counter, reset_metrics
+
+TENANT_A = "11111111-1111-1111-1111-111111111111"
+TENANT_B = "22222222-2222-2222-2222-222222222222"
+
+
+def _event(tenant_id: str, event_type: str = "claim.created") -> dict[str, Any]:
+    return {
+        "event_id": str(uuid.uuid4()),
+        "tenant_id": tenant_id,
+        "occurred_at": datetime.now(UTC).isoformat(),
+        "event_type": event_type,
+        "request": {"request_id": "req-1"},
+    }
+
+
+class _RecordingCommit:
+    """Thread-safe commit function that records batches and can fail a tenant."""
+
+    def __init__(self, *, delay_seconds: float = 0.0, fail_tenant: str | None = None) -> None:
+        self.batches: list[tuple[str, list[dict[str, Any]]]] = []
+        self._delay = delay_seconds
+        self._fail_tenant = fail_tenant
+        self._lock = threading.Lock()
+
+    def __call__(self, tenant_id: str, events: Sequence[dict[str, Any]]) -> None:
+        if self._delay:
+            time.sleep(self._delay)
+        if tenant_id == self._fail_tenant:
+            raise RuntimeError("synthetic commit failure")
+        with self._lock:
+            self.batches.append((tenant_id, list(events)))
+
+
+def test_sequential_emitter_commits_each_event_without_linger() -> None:
+    commit = _RecordingCommit()
+    writer = GroupCommitAuditWriter(commit, linger_ms=200)
+
+    started = time.perf_counter()
+    for _ in range(5):
+        writer.emit(_event(TENANT_A))
+    elapsed = time.perf_counter() - started
+
+    assert [len(events) for _, events in commit.batches] == [1, 1, 1, 1, 1]
+    assert elapsed < 0.2, "a lone emitter must never wait out the linger window"
+
+
+def test_concurrent_emitters_are_coalesced_per_tenant() -> None:
+    commit = _RecordingCommit(delay_seconds=0.01)
+    writer = GroupCommitAuditWriter(commit, linger_ms=5)
+    emitted: list[dict[str, Any]] = []
+    emitted_lock = threading.Lock()
+
+    def worker(tenant_id: str) -> None:
+        for _ in range(20):
+            event = _event(tenant_id)
+            writer.emit(event)
+            with emitted_lock:
+                emitted.append(event)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in [TENANT_A, TENANT_B] * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    committed_ids = [e["event_id"] for _, events in commit.batches for e in events]
+    assert sorted(committed_ids) == sorted(e["event_id"] for e in emitted)
+    assert len(committed_ids) == 160
+    assert len(commit.batches) < 160, "concurrent events must share commits"
+    for tenant_id, events in commit.batches:
+        assert {e["tenant_id"] for e in events} == {tenant_id}
+
+
+def test_failed_tenant_batch_fails_closed_for_its_emitters_only() -> None:
+    commit = _RecordingCommit(delay_seconds=0.02, fail_tenant=TENANT_B)
+    writer = GroupCommitAuditWriter(commit, linger_ms=10)
+    results: dict[str, list[BaseException | None]] = {TENANT_A: [], TENANT_B: []}
+    results_lock = threading.Lock()
+
+    def worker(tenant_id: str) -> None:
+        outcome: BaseException | None = None
+        try:
+            writer.emit(_event(tenant_id))
+        except AuditSinkError as exc:
+            outcome = exc
+        with results_lock:
+            results[tenant_id].append(outcome)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in [TENANT_A, TENANT_B] * 5]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    assert all(outcome is None for outcome in results[TENANT_A])
+    assert len(results[TENANT_B]) == 5
+    assert all(isinstance(outcome, AuditSinkError) for outcome in results[TENANT_B])
+    assert writer.stats().failed_batches >= 1
+
+
+def test_missing_tenant_is_rejected_before_queueing() -> None:
+    commit = _RecordingCommit()
+    writer = GroupCommitAuditWriter(commit)
+
+    with pytest.raises(AuditSinkError, match="tenant_id"):
+        writer.emit({"event_id": "e1", "event_type": "x", "occurred_at": "2026-01-01T00:00:00Z"})
+    assert commit.batches == []
+
+
+def test_stats_and_metrics_record_throughput() -> None:
+    reset_metrics()
+    writer = GroupCommitAuditWriter(_RecordingCommit())
+
+    for _ in range(3):
+        writer.emit(_event(TENANT_A))
+
+    stats = writer.stats()
+    assert stats.batches == 3
+    assert stats.events == 3
+    assert stats.largest_batch == 1
+    assert stats.events_per_batch == 1.0
+    assert get_counter("audit_group_commit_batches_total") == 3
+    assert get_counter("audit_group_commit_events_total") == 3
+    assert get_counter("audit_group_commit_failures_total") == 0
+
+
+def test_invalid_configuration_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        GroupCommitAuditWriter(_RecordingCommit(), max_batch_events=0)
+    with pytest.raises(ValueError):
+        GroupCommitAuditWriter(_RecordingCommit(), linger_ms=-1)
+
+
+def test_postgres_sink_emit_routes_through_attached_writer() -> None:
+    commit = _RecordingCommit()
+    sink = PostgresAuditSink(group_commit=GroupCommitAuditWriter(commit))
+    event = _event(TENANT_A)
+
+    sink.emit(event)
+
+    assert commit.batches == [(TENANT_A, [event])]
+
+
+def test_postgres_sink_reads_group_commit_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    from idis.audit import group_commit
+
+    monkeypatch.setenv("IDIS_AUDIT_GROUP_COMMIT", "1")
+    group_commit.reset_group_commit_writer()
+    try:
+        assert PostgresAuditSink().group_commit is group_commit.get_group_commit_writer()
+    finally:
+        group_commit.reset_group_commit_writer()
+    monkeypatch.delenv("IDIS_AUDIT_GROUP_COMMIT")
+    assert PostgresAuditSink().group_commit is None
+
+
+class _RecordingConn:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any]) -> None:
+        self.calls.append((str(statement), params))
+
+
+def test_insert_events_chunks_multi_row_statements() -> None:
+    conn = _RecordingConn()
+    events = [_event(TENANT_A) for _ in range(MAX_ROWS_PER_INSERT + 3)]
+
+    insert_events(conn, events)  # type: ignore[arg-type]
+
+    assert len(conn.calls) == 2
+    first_sql, first_params = conn.calls[0]
+    assert first_sql.count("(:event_id_") == MAX_ROWS_PER_INSERT
+    assert len(first_params) == MAX_ROWS_PER_INSERT * 9
+    assert conn.calls[1][1]["event_id_2"] == events[-1]["event_id"]
+    assert _multi_row_insert_sql(3) is _multi_row_insert_sql(3)
+
+
+def test_insert_events_validates_every_row_before_executing() -> None:
+    conn = _RecordingConn()
+    events = [_event(TENANT_A), {"tenant_id": TENANT_A}]
+
+    with pytest.raises(AuditSinkError, match="missing required fields"):
+        insert_events(conn, events)  # type: ignore[arg-type]
+    assert conn.calls == []
@@ -0,0 +1,243 @@
+"""Tests for the JSONL audit sidecar segment index (idis.audit.jsonl_index).
+
+1. Parity: indexed list_events returns exactly what a full scan + sort + paginate returns,
+   across tenants, filters and every page of a cursor walk.
+2. Pruning: segments for other tenants / deals are never read, and the newest-first scan
+   stops once the page is settled.
+3. Incremental maintenance: the sink seals segments as it appends, refresh only scans new
+   bytes, a truncated or replaced log rebuilds the index, duplicate records are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from idis.audit.jsonl_index import JsonlAuditIndex, SegmentInfo, bloom_may_contain
+from idis.audit.query import JsonlAuditQueryRepository
+from idis.audit.sink import JsonlFileAuditSink, audit_event_deal_id
+
+TENANTS = [
+    "11111111-1111-1111-1111-111111111111",
+    "22222222-2222-2222-2222-222222222222",
+    "33333333-3333-3333-3333-333333333333",
+]
+EVENT_TYPES = ["deal.created", "claim.created", "sanad.graded"]
+DEALS = [f"deal-{i}" for i in range(6)]
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _random_events(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    events: list[dict[str, Any]] = []
+    for i in range(count):
+        # Mostly increasing time with jitter, so segments overlap like multi-writer logs do.
+        occurred = BASE + timedelta(seconds=i * 10 + rng.randint(-300, 300))
+        event: dict[str, Any] = {
+            "event_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "tenant_id": rng.choice(TENANTS),
+            "event_type": rng.choice(EVENT_TYPES),
+            "occurred_at": occurred.isoformat().replace("+00:00", "Z"),
+            "request": {"request_id": f"r{i}"},
+        }
+        if rng.random() < 0.5:
+            event["request"]["deal_id"] = rng.choice(DEALS)
+        elif rng.random() < 0.5:
+            event["resource"] = {"resource_type": "deal", "deal_id": rng.choice(DEALS)}
+        events.append(event)
+    return events
+
+
+def _write_log(path: Path, events: list[dict[str, Any]]) -> None:
+    sink = JsonlFileAuditSink(str(path), index_segment_events=None)
+    for event in events:
+        sink.emit(event)
+
+
+def _reference_page(
+    events: list[dict[str, Any]],
+    tenant_id: str,
+    *,
+    limit: int,
+    cursor: tuple[str, str] | None,
+    deal_id: str | None = None,
+    event_type: str | None = None,
+    after: datetime | None = None,
+    before: datetime | None = None,
+) -> list[str]:
+    """Full-scan reference implementation (the pre-index algorithm)."""
+    matched = []
+    for ev in events:
+        if ev["tenant_id"] != tenant_id:
+            continue
+        if event_type and ev["event_type"] != event_type:
+            continue
+        if deal_id and audit_event_deal_id(ev) != deal_id:
+            continue
+        dt = datetime.fromisoformat(ev["occurred_at"].replace("Z", "+00:00"))
+        if after and dt <= after:
+            continue
+        if before and dt >= before:
+            continue
+        if cursor and (ev["occurred_at"], ev["event_id"]) >= cursor:
+            continue
+        matched.append(ev)
+    matched.sort(key=lambda ev: (ev["occurred_at"], ev["event_id"]), reverse=True)
+    return [ev["event_id"] for ev in matched[:limit]]
+
+
+def _walk_all_pages(repo: JsonlAuditQueryRepository, limit: int, **filters: Any) -> list[str]:
+    ids: list[str] = []
+    cursor = None
+    while True:
+        page = repo.list_events(limit=limit, cursor=cursor, **filters)
+        ids.extend(item.event_id for item in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"deal_id": "deal-3"},
+        {"event_type": "sanad.graded"},
+        {"after": BASE + timedelta(hours=1), "before": BASE + timedelta(hours=3)},
+    ],
+)
+def test_indexed_pages_match_full_scan_reference(tmp_path: Path, filters: dict[str, Any]) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(1500)
+    _write_log(log, events)
+
+    for tenant_id in TENANTS:
+        repo = JsonlAuditQueryRepository(log, tenant_id, segment_events=64)
+        walked = _walk_all_pages(repo, limit=37, **filters)
+        expected = _reference_page(events, tenant_id, limit=10**9, cursor=None, **filters)
+        assert walked == expected
+
+
+def test_first_page_matches_reference_with_unsealed_tail(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(300)
+    _write_log(log, events)
+
+    repo = JsonlAuditQueryRepository(log, TENANTS[0], segment_events=128)
+    page = repo.list_events(limit=25)
+
+    assert [i.event_id for i in page.items] == _reference_page(
+        events, TENANTS[0], limit=25, cursor=None
+    )
+    sealed = JsonlAuditIndex(log, segment_events=128).refresh()
+    assert len(sealed) == 2, "300 lines at 128 per segment: two sealed + a 44-line tail"
+
+
+def test_other_tenant_segments_are_never_read(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(400)
+    for ev in events[:200]:
+        ev["tenant_id"] = TENANTS[0]
+    for ev in events[200:]:
+        ev["tenant_id"] = TENANTS[1]
+    _write_log(log, events)
+
+    repo = JsonlAuditQueryRepository(log, TENANTS[0], segment_events=50)
+    read: list[SegmentInfo] = []
+    original = repo._index.read_segment_reversed
+
+    def spy(segment: SegmentInfo) -> Any:
+        read.append(segment)
+        return original(segment)
+
+    repo._index.read_segment_reversed = spy  # type: ignore[method-assign]
+    page = repo.list_events(limit=10)
+
+    assert len(page.items) == 10
+    assert all(segment.end <= read[0].end or TENANTS[0] in segment.tenants for segment in read)
+    assert all(TENANTS[1] not in segment.tenants for segment in read if segment.sealed)
+    assert len(read) < 4, "newest-first scan must stop once the page is settled"
+
+
+def test_sink_seals_segments_incrementally(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    sink = JsonlFileAuditSink(str(log), index_segment_events=10)
+    index = JsonlAuditIndex(log, segment_events=10)
+
+    for ev in _random_events(25):
+        sink.emit(ev)
+
+    lines = index.index_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3, "header + two sealed segments after 25 appends"
+    first, second = (json.loads(line) for line in lines[1:])
+    assert first["start"] == 0 and second["start"] == first["end"]
+    assert [s.events for s in index.refresh()] == [10, 10]
+
+
+def test_refresh_only_scans_new_bytes_and_ignores_duplicates(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(40)
+    _write_log(log, events[:20])
+    index = JsonlAuditIndex(log, segment_events=10)
+    index.refresh()
+
+    with open(index.index_path, "a", encoding="utf-8") as f:
+        dup = index.refresh()[-1].to_record()
+        f.write(json.dumps(dup) + "\n")  # a concurrent refresher sealed the same range
+
+    _write_log(log, events[20:])
+    segments = index.refresh()
+
+    assert [s.start for s in segments] == [0, segments[0].end, segments[1].end, segments[2].end]
+    assert segments[-1].end == log.stat().st_size
+
+
+def test_truncated_log_rebuilds_index(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(50)
+    _write_log(log, events)
+    JsonlAuditIndex(log, segment_events=10).refresh()
+
+    log.unlink()
+    _write_log(log, events[:5])
+    repo = JsonlAuditQueryRepository(log, TENANTS[0], segment_events=10)
+
+    page = repo.list_events(limit=50)
+    assert [i.event_id for i in page.items] == _reference_page(
+        events[:5], TENANTS[0], limit=50, cursor=None
+    )
+
+
+def test_deal_bloom_has_no_false_negatives(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(200)
+    _write_log(log, events)
+
+    for segment in JsonlAuditIndex(log, segment_events=32).refresh():
+        with open(log, "rb") as f:
+            f.seek(segment.start)
+            chunk = f.read(segment.end - segment.start)
+        for line in chunk.splitlines():
+            deal_id = audit_event_deal_id(json.loads(line))
+            if deal_id:
+                assert bloom_may_contain(segment.deal_bloom, deal_id)
+
+
+def test_malformed_lines_are_skipped(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    events = _random_events(30)
+    _write_log(log, events[:15])
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("{not json}\n\n")
+    _write_log(log, events[15:])
+
+    repo = JsonlAuditQueryRepository(log, TENANTS[1], segment_events=8)
+    assert _walk_all_pages(repo, limit=5) == _reference_page(
+        events, TENANTS[1], limit=100, cursor=None
+    )
@@ -0,0 +1,261 @@
+"""Tests for the long-lived JSONL audit writer (idis.audit.jsonl_writer).
+
+1. Format + handle reuse: lines are byte-identical to the previous open/write/close sink, one
+   handle is shared by every sink on the path, and an externally removed file is reopened.
+2. fsync policy: always = one fsync per event; batch = every N events or after T ms; a failed
+   background fsync fails the next emit closed.
+3. Rotation: the live file rotates at the size limit, each segment is recorded in the manifest
+   (size, count, range, sha256), and queries span live + rotated segments with parity.
+4. Counters: stats() and the audit_jsonl_* metrics track bytes, fsyncs and rotations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from idis.audit.jsonl_index import JsonlAuditIndex
+from idis.audit.jsonl_writer import (
+    FSYNC_ALWAYS,
+    FSYNC_BATCH,
+    JsonlWriterConfig,
+    load_jsonl_writer_config,
+    read_segment_manifest,
+    rotated_segment_paths,
+)
+from idis.audit.query import JsonlAuditQueryRepository
+from idis.audit.sink import AuditSinkError, JsonlFileAuditSink
+from idis.observability.metrics import (
+    AUDIT_JSONL_BYTES_WRITTEN_TOTAL,
+    AUDIT_JSONL_FSYNC_TOTAL,
+    AUDIT_JSONL_ROTATIONS_TOTAL,
+    get_counter,
+    reset_metrics,
+)
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _event(i: int, tenant_id: str = TENANT_ID) -> dict[str, Any]:
+    return {
+        "event_id": f"00000000-0000-0000-0000-{i:012d}",
+        "tenant_id": tenant_id,
+        "event_type": "deal.updated",
+        "occurred_at": f"2026-02-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+        "request": {"request_id": f"r{i:04d}", "deal_id": f"deal-{i % 3}"},
+    }
+
+
+def _line(event: dict[str, Any]) -> str:
+    return json.dumps(event, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def test_lines_are_unchanged_and_handle_is_shared(tmp_path: Path) -> None:
+    log = tmp_path / "nested" / "audit.jsonl"
+    first = JsonlFileAuditSink(str(log), index_segment_events=None)
+    second = JsonlFileAuditSink(str(log), index_segment_events=None)
+
+    first.emit(_event(1))
+    handle = first._writer._file  # type: ignore[union-attr]
+    second.emit(_event(2))
+    first.emit(_event(3))
+
+    assert first._writer is second._writer
+    assert first._writer._file is handle  # type: ignore[union-attr]
+    assert log.read_text(encoding="utf-8") == "".join(_line(_event(i)) for i in (1, 2, 3))
+
+
+def test_externally_removed_log_is_reopened(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    sink = JsonlFileAuditSink(str(log), index_segment_events=None)
+    sink.emit(_event(1))
+
+    log.unlink()
+    sink.emit(_event(2))
+
+    assert log.read_text(encoding="utf-8") == _line(_event(2))
+
+
+def test_concurrent_emits_never_interleave(tmp_path: Path) -> None:
+    log = tmp_path / "audit.jsonl"
+    sink = JsonlFileAuditSink(str(log), index_segment_events=None)
+
+    def worker(offset: int) -> None:
+        for i in range(200):
+            sink.emit(_event(offset * 1000 + i))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1600
+    assert len({json.loads(line)["event_id"] for line in lines}) == 1600
+
+
+def test_fsync_always_syncs_every_event(tmp_path: Path) -> None:
+    sink = JsonlFileAuditSink(
+        str(tmp_path / "audit.jsonl"),
+        index_segment_events=None,
+        writer_config=JsonlWriterConfig(fsync=FSYNC_ALWAYS),
+    )
+    for i in range(5):
+        sink.emit(_event(i))
+
+    stats = sink.stats()
+    assert stats is not None
+    assert stats.fsyncs == 5 and stats.events == 5
+
+
+def test_fsync_batch_by_count_then_by_interval(tmp_path: Path) -> None:
+    sink = JsonlFileAuditSink(
+        str(tmp_path / "audit.jsonl"),
+        index_segment_events=None,
+        writer_config=JsonlWriterConfig(
+            fsync=FSYNC_BATCH, fsync_every_events=10, fsync_interval_ms=20
+        ),
+    )
+    for i in range(25):
+        sink.emit(_event(i))
+    assert sink.stats().fsyncs == 2  # type: ignore[union-attr]
+
+    deadline = time.monotonic() + 5
+    while sink.stats().fsyncs < 3 and time.monotonic() < deadline:  # type: ignore[union-attr]
+        time.sleep(0.01)
+    assert sink.stats().fsyncs == 3  # type: ignore[union-attr]
+
+
+def test_failed_background_fsync_fails_next_emit_closed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sink = JsonlFileAuditSink(
+        str(tmp_path / "audit.jsonl"),
+        index_segment_events=None,
+        writer_config=JsonlWriterConfig(fsync=FSYNC_BATCH, fsync_interval_ms=5),
+    )
+    sink.emit(_event(1))
+    writer = sink._writer
+    assert writer is not None
+
+    def broken_fsync(fd: int) -> None:
+        raise OSError(5, "Input/output error")
+
+    monkeypatch.setattr("idis.audit.jsonl_writer.os.fsync", broken_fsync)
+    deadline = time.monotonic() + 5
+    while writer._deferred_error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(AuditSinkError, match="Input/output error"):
+        sink.emit(_event(2))
+
+
+def test_invalid_env_policy_fails_closed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IDIS_AUDIT_FSYNC", "sometimes")
+    sink = JsonlFileAuditSink(str(tmp_path / "audit.jsonl"), index_segment_events=None)
+
+    with pytest.raises(AuditSinkError, match="writer configuration"):
+        sink.emit(_event(1))
+
+
+def test_env_policy_is_loaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IDIS_AUDIT_FSYNC", "Batch")
+    monkeypatch.setenv("IDIS_AUDIT_FSYNC_EVERY_EVENTS", "32")
+    monkeypatch.setenv("IDIS_AUDIT_LOG_MAX_BYTES", "1048576")
+
+    assert load_jsonl_writer_config() == JsonlWriterConfig(
+        fsync=FSYNC_BATCH, fsync_every_events=32, max_bytes=1048576
+    )
+
+
+def test_rotation_writes_manifest_and_queries_span_segments(tmp_path: Path) -> None:
+    reset_metrics()
+    log = tmp_path / "audit.jsonl"
+    line_bytes = len(_line(_event(0)))
+    sink = JsonlFileAuditSink(
+        str(log),
+        index_segment_events=4,
+        writer_config=JsonlWriterConfig(max_bytes=line_bytes * 10),
+    )
+    events = [
+        _event(i, TENANT_ID if i % 4 else "22222222-2222-2222-2222-222222222222") for i in range(45)
+    ]
+    for event in events:
+        sink.emit(event)
+
+    segments = rotated_segment_paths(log)
+    manifest = read_segment_manifest(log)
+    assert [seq for seq, _ in segments] == [1, 2, 3, 4]
+    assert sorted(manifest) == [1, 2, 3, 4]
+    for seq, path in segments:
+        entry = manifest[seq]
+        assert entry.events == 10 and entry.bytes == path.stat().st_size
+        assert entry.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert path.with_name(path.name + ".idx").exists(), "sidecar index moves with segment"
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 5
+    assert get_counter(AUDIT_JSONL_ROTATIONS_TOTAL) == 4
+    assert get_counter(AUDIT_JSONL_BYTES_WRITTEN_TOTAL) == line_bytes * 45
+
+    repo = JsonlAuditQueryRepository(log, TENANT_ID, segment_events=4)
+    walked: list[str] = []
+    cursor = None
+    while True:
+        page = repo.list_events(limit=7, cursor=cursor)
+        walked.extend(item.event_id for item in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    expected = sorted(
+        (e for e in events if e["tenant_id"] == TENANT_ID),
+        key=lambda e: (e["occurred_at"], e["event_id"]),
+        reverse=True,
+    )
+    assert walked == [e["event_id"] for e in expected]
+
+
+def test_manifest_range_skips_old_segments_once_page_is_settled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "audit.jsonl"
+    sink = JsonlFileAuditSink(
+        str(log),
+        index_segment_events=None,
+        writer_config=JsonlWriterConfig(max_bytes=len(_line(_event(0))) * 20),
+    )
+    for i in range(100):
+        sink.emit(_event(i))
+
+    opened: list[Path] = []
+    original = JsonlAuditIndex.segments_with_tail
+
+    def spy(self: JsonlAuditIndex) -> Any:
+        opened.append(self._log_path)
+        return original(self)
+
+    monkeypatch.setattr(JsonlAuditIndex, "segments_with_tail", spy)
+    page = JsonlAuditQueryRepository(log, TENANT_ID).list_events(limit=25)
+
+    assert [item.event_id for item in page.items] == [
+        _event(i)["event_id"] for i in range(99, 74, -1)
+    ]
+    assert opened == [log, log.with_name("audit.jsonl.000004")]
+
+
+def test_fsync_counter_is_recorded(tmp_path: Path) -> None:
+    reset_metrics()
+    sink = JsonlFileAuditSink(
+        str(tmp_path / "audit.jsonl"),
+        index_segment_events=None,
+        writer_config=JsonlWriterConfig(fsync=FSYNC_ALWAYS),
+    )
+    sink.emit(_event(1))
+    sink.flush()
+
+    assert get_counter(AUDIT_JSONL_FSYNC_TOTAL) == 1
@@ -0,0 +1,454 @@
+"""Batched dual-write saga for claim / Sanad Postgres + Neo4j projection.
+
+1. BatchDualWriteSagaExecutor writes Postgres once per batch and projects the graph in chunks.
+2. A failed graph chunk compensates by batch id (graph first, then Postgres) and reports
+   FAILED for the chunk's items and COMPENSATED (or COMPENSATION_FAILED) for the rest.
+3. A Postgres failure fails every item without touching the graph.
+4. GraphRepository batch projection writes one UNWIND statement per family across claims,
+   stamps the claim-owned nodes it creates with the batch id and deletes them by batch id;
+   nodes that existed before the batch survive its compensation.
+5. The projection batch saga and GraphProjectionService batch method keep the per-claim
+   graph_projection.claim_sanad.* audit events, and a compensated batch records a
+   ``compensated`` event for every claim an earlier chunk reported as ``success``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import pytest
+
+from idis.persistence import graph_repo as graph_repo_module
+from idis.persistence import neo4j_driver
+from idis.persistence.graph_consistency import (
+    GraphProjectionService,
+    ProjectionStatus,
+    create_claim_projection_batch_saga,
+)
+from idis.persistence.graph_repo import GraphProjectionError, GraphRepository
+from idis.persistence.saga import (
+    BatchDualWriteSagaExecutor,
+    SagaStatus,
+    SagaStepStatus,
+    create_claim_batch_dual_write_saga,
+)
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+BATCH_ID = "batch-001"
+
+
+class _FakeResult:
+    def consume(self) -> None:
+        return None
+
+    def __iter__(self) -> Any:
+        return iter(())
+
+
+class _FakeTx:
+    def __init__(self, session: _FakeSession) -> None:
+        self._session = session
+
+    def run(self, query: str, parameters: dict[str, Any]) -> _FakeResult:
+        if self._session.fail_on and self._session.fail_on in query:
+            raise RuntimeError("write failed")
+        self._session.runs.append((query, parameters))
+        return _FakeResult()
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.runs: list[tuple[str, dict[str, Any]]] = []
+        self.fail_on: str | None = None
+
+    def __enter__(self) -> _FakeSession:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute_write(self, fn: Any, *args: Any) -> Any:
+        return fn(_FakeTx(self), *args)
+
+
+@pytest.fixture
+def sessions(monkeypatch: pytest.MonkeyPatch) -> list[_FakeSession]:
+    opened: list[_FakeSession] = []
+
+    def fake_get_session(*, database: str = "neo4j") -> _FakeSession:
+        opened.append(_FakeSession())
+        return opened[-1]
+
+    monkeypatch.setattr(neo4j_driver, "get_session", fake_get_session)
+    return opened
+
+
+_MERGE = re.compile(r"MERGE \((\w+):(\w+) \{(\w+): row\.(\w+), tenant_id: \$tenant_id\}\)")
+_DELETE = re.compile(
+    r"MATCH \(n:(\w+) \{tenant_id: \$tenant_id, projection_batch_id: \$batch_id\}\)"
+)
+
+
+class _StampGraph:
+    """Models the node MERGE / projection_batch_id semantics of the batch Cypher.
+
+    Only the first MERGE of each UNWIND statement (the node the statement owns) is modelled,
+    with ``ON CREATE SET`` applied to new nodes and a plain ``SET`` applied to every node.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: dict[tuple[str, str], dict[str, Any]] = {}
+        self.fail_on: str | None = None
+
+    def run(self, query: str, parameters: dict[str, Any]) -> _FakeResult:
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("write failed")
+        if deleted := _DELETE.match(query):
+            self.nodes = {
+                key: props
+                for key, props in self.nodes.items()
+                if key[0] != deleted.group(1)
+                or props.get("projection_batch_id") != parameters["batch_id"]
+            }
+            return _FakeResult()
+        merged = _MERGE.search(query)
+        if merged is None:
+            return _FakeResult()
+        var, label, _, row_key = merged.groups()
+        stamp = f"{var}.projection_batch_id = $batch_id"
+        for row in parameters["rows"]:
+            key = (label, row[row_key])
+            created = key not in self.nodes
+            node = self.nodes.setdefault(key, {})
+            if f"ON CREATE SET {stamp}" in query:
+                if created:
+                    node["projection_batch_id"] = parameters["batch_id"]
+            elif stamp in query:
+                node["projection_batch_id"] = parameters["batch_id"]
+        return _FakeResult()
+
+    def __enter__(self) -> _StampGraph:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute_write(self, fn: Any, *args: Any) -> Any:
+        return fn(self, *args)
+
+    def labelled(self, label: str) -> list[str]:
+        return sorted(key for node_label, key in self.nodes if node_label == label)
+
+
+class _RecordingAuditSink:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+
+    def emit(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+
+
+def _claims(n: int) -> list[dict[str, Any]]:
+    return [{"claim_id": f"claim-{i}"} for i in range(n)]
+
+
+def _projections(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "claim": {"claim_id": f"claim-{i}", "claim_text": f"claim {i}"},
+            "evidence_items": [{"evidence_id": f"ev-{i}"}],
+            "transmission_nodes": [
+                {"node_id": f"tn-{i}", "input_refs": [{"type": "evidence", "id": f"ev-{i}"}]}
+            ],
+            "defects": [{"defect_id": f"d-{i}"}] if i % 2 else [],
+        }
+        for i in range(n)
+    ]
+
+
+def _saga(
+    calls: list[Any],
+    *,
+    fail_pg: bool = False,
+    fail_chunk: int | None = None,
+    fail_compensation: bool = False,
+    chunk_size: int | None = 2,
+) -> BatchDualWriteSagaExecutor[dict[str, Any]]:
+    def pg_insert(batch_id: str, items: list[dict[str, Any]]) -> None:
+        calls.append(("pg_insert", batch_id, [c["claim_id"] for c in items]))
+        if fail_pg:
+            raise RuntimeError("Postgres connection failed")
+
+    def pg_delete(batch_id: str) -> None:
+        calls.append(("pg_delete", batch_id))
+        if fail_compensation:
+            raise RuntimeError("delete failed")
+
+    def graph_insert(batch_id: str, chunk: list[dict[str, Any]]) -> None:
+        chunks = sum(call[0] == "graph_insert" for call in calls)
+        calls.append(("graph_insert", batch_id, [c["claim_id"] for c in chunk]))
+        if chunks == fail_chunk:
+            raise RuntimeError("Graph connection failed")
+
+    def graph_delete(batch_id: str) -> None:
+        calls.append(("graph_delete", batch_id))
+
+    return create_claim_batch_dual_write_saga(
+        BATCH_ID, pg_insert, pg_delete, graph_insert, graph_delete, chunk_size=chunk_size
+    )
+
+
+def test_batch_saga_writes_postgres_once_and_graph_in_chunks() -> None:
+    calls: list[Any] = []
+
+    result = _saga(calls).execute(_claims(5))
+
+    assert result.is_success
+    assert calls == [
+        ("pg_insert", BATCH_ID, [f"claim-{i}" for i in range(5)]),
+        ("graph_insert", BATCH_ID, ["claim-0", "claim-1"]),
+        ("graph_insert", BATCH_ID, ["claim-2", "claim-3"]),
+        ("graph_insert", BATCH_ID, ["claim-4"]),
+    ]
+    assert [(r.item_id, r.status) for r in result.item_results] == [
+        (f"claim-{i}", SagaStepStatus.COMPLETED) for i in range(5)
+    ]
+    assert [s.step_name for s in result.step_results] == [
+        "postgres_batch_write",
+        "graph_batch_projection[0:2]",
+        "graph_batch_projection[2:4]",
+        "graph_batch_projection[4:5]",
+    ]
+    assert result.failed_item_ids == []
+
+
+def test_graph_chunk_failure_compensates_batch_and_reports_per_claim() -> None:
+    calls: list[Any] = []
+
+    result = _saga(calls, fail_chunk=1).execute(_claims(5))
+
+    assert result.is_compensated
+    assert calls[-2:] == [("graph_delete", BATCH_ID), ("pg_delete", BATCH_ID)]
+    assert sum(call[0] == "graph_insert" for call in calls) == 2, "later chunks not attempted"
+    assert result.failed_item_ids == ["claim-2", "claim-3"]
+    statuses = {r.item_id: r.status for r in result.item_results}
+    assert statuses["claim-0"] == statuses["claim-4"] == SagaStepStatus.COMPENSATED
+    assert str(result.error) == "Graph connection failed"
+
+    calls.clear()
+    failed = _saga(calls, fail_chunk=0, fail_compensation=True).execute(_claims(3))
+    assert failed.status == SagaStatus.COMPENSATION_FAILED
+    assert failed.failed_item_ids == ["claim-0", "claim-1"]
+    assert failed.item_results[2].status == SagaStepStatus.COMPENSATION_FAILED
+    assert [s.step_name for s in failed.step_results][-2:] == [
+        "graph_batch_projection_compensation",
+        "postgres_batch_write_compensation",
+    ]
+
+
+def test_postgres_failure_fails_every_item_without_graph_writes() -> None:
+    calls: list[Any] = []
+
+    result = _saga(calls, fail_pg=True, chunk_size=None).execute(_claims(3))
+
+    assert result.is_compensated
+    assert [call[0] for call in calls] == ["pg_insert"]
+    assert result.failed_item_ids == ["claim-0", "claim-1", "claim-2"]
+    with pytest.raises(ValueError, match="chunk_size"):
+        _saga(calls, chunk_size=0)
+
+
+def test_repository_batch_projection_unwinds_across_claims(
+    monkeypatch: pytest.MonkeyPatch, sessions: list[_FakeSession]
+) -> None:
+    GraphRepository(batch_size=1000).upsert_claim_sanad_projection_batch(
+        tenant_id=TENANT_ID, batch_id=BATCH_ID, projections=_projections(3)
+    )
+
+    assert len(sessions) == 1
+    runs = sessions[0].runs
+    # claims, evidence, transmission nodes, evidence INPUT edges, defects
+    assert len(runs) == 5
+    assert all(p["batch_id"] == BATCH_ID and p["tenant_id"] == TENANT_ID for _, p in runs)
+    claim_query, claim_params = runs[0]
+    assert "row.claim_id" in claim_query and "projection_batch_id = $batch_id" in claim_query
+    assert [row["claim_id"] for row in claim_params["rows"]] == ["claim-0", "claim-1", "claim-2"]
+    assert [p["rows"] for q, p in runs if ":HAS_DEFECT" in q] == [
+        [{"defect_id": "d-1", "defect_type": "", "severity": "MINOR", "claim_id": "claim-1"}]
+    ]
+    assert [p["rows"] for q, p in runs if ":INPUT" in q][0][2] == {
+        "node_id": "tn-2",
+        "ref_id": "ev-2",
+        "claim_id": "claim-2",
+    }
+
+    deletes: list[tuple[str, dict[str, Any]]] = []
+    monkeypatch.setattr(
+        graph_repo_module, "execute_write", lambda q, p: deletes.append((q, p)) or []
+    )
+    GraphRepository().delete_claim_sanad_projection_batch(tenant_id=TENANT_ID, batch_id=BATCH_ID)
+    assert [q.split(" ")[1].split(" ")[0] for q, _ in deletes] == [
+        "(n:Defect",
+        "(n:TransmissionNode",
+        "(n:Claim",
+    ]
+    assert all("DETACH DELETE" in q for q, _ in deletes)
+    assert all(p == {"batch_id": BATCH_ID, "tenant_id": TENANT_ID} for _, p in deletes)
+
+
+def test_compensated_batch_keeps_nodes_that_existed_before_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    graph = _StampGraph()
+    monkeypatch.setattr(neo4j_driver, "get_session", lambda *, database="neo4j": graph)
+    repo = GraphRepository(batch_size=2)
+    repo.upsert_claim_sanad_projection_batch(
+        tenant_id=TENANT_ID, batch_id="batch-000", projections=_projections(2)
+    )
+    graph.fail_on = ":HAS_DEFECT"  # the second chunk of the next batch fails
+
+    saga = create_claim_projection_batch_saga(
+        graph_repo=repo,
+        tenant_id=TENANT_ID,
+        batch_id=BATCH_ID,
+        postgres_insert=lambda batch_id, items: None,
+        postgres_delete=lambda batch_id: None,
+    )
+    projections = _projections(4)
+    projections[1]["defects"] = []  # only the second chunk writes defects
+    result = saga.execute(projections)
+
+    assert result.is_compensated
+    assert result.failed_item_ids == ["claim-2", "claim-3"]
+    assert graph.labelled("Claim") == ["claim-0", "claim-1"]
+    assert graph.labelled("TransmissionNode") == ["tn-0", "tn-1"]
+    assert graph.labelled("Defect") == ["d-1"]
+    assert graph.labelled("EvidenceItem") == ["ev-0", "ev-1", "ev-2", "ev-3"]  # shared
+    assert {p.get("projection_batch_id") for p in graph.nodes.values()} == {"batch-000", None}
+
+
+def test_compensated_batch_audits_the_rollback_of_earlier_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sink = _RecordingAuditSink()
+    graph = _StampGraph()
+    graph.fail_on = ":HAS_DEFECT"
+    monkeypatch.setattr(neo4j_driver, "get_session", lambda *, database="neo4j": graph)
+    projections = _projections(4)
+    projections[1]["defects"] = []
+    saga = create_claim_projection_batch_saga(
+        graph_repo=GraphRepository(batch_size=2),
+        tenant_id=TENANT_ID,
+        batch_id=BATCH_ID,
+        postgres_insert=lambda batch_id, items: None,
+        postgres_delete=lambda batch_id: None,
+        audit_sink=sink,
+    )
+
+    assert saga.execute(projections).is_compensated
+
+    assert [(e["resource"]["resource_id"], e["payload"]["status"]) for e in sink.events] == [
+        ("claim-0", "success"),
+        ("claim-1", "success"),
+        ("claim-2", "failed"),
+        ("claim-3", "failed"),
+        ("claim-0", "compensated"),
+        ("claim-1", "compensated"),
+    ]
+    assert sink.events[-1]["event_type"] == "graph_projection.claim_sanad.compensated"
+    assert sink.events[-1]["severity"] == "HIGH"
+    assert graph.labelled("Claim") == graph.labelled("TransmissionNode") == []
+
+    sink.events.clear()
+    graph.fail_on = None
+    assert saga.execute(projections).is_success
+    assert {e["payload"]["status"] for e in sink.events} == {"success"}
+
+
+def test_projection_batch_saga_keeps_per_claim_audit_events(
+    monkeypatch: pytest.MonkeyPatch, sessions: list[_FakeSession]
+) -> None:
+    sink = _RecordingAuditSink()
+    deleted: list[str] = []
+    repo = GraphRepository(batch_size=2)
+    monkeypatch.setattr(
+        repo,
+        "delete_claim_sanad_projection_batch",
+        lambda *, tenant_id, batch_id: deleted.append(batch_id),
+    )
+    saga = create_claim_projection_batch_saga(
+        graph_repo=repo,
+        tenant_id=TENANT_ID,
+        batch_id=BATCH_ID,
+        postgres_insert=lambda batch_id, items: None,
+        postgres_delete=lambda batch_id: deleted.append(f"pg:{batch_id}"),
+        audit_sink=sink,
+    )
+
+    assert saga.execute(_projections(3)).is_success
+    assert [e["event_type"] for e in sink.events] == ["graph_projection.claim_sanad.success"] * 3
+    assert [e["resource"]["resource_id"] for e in sink.events] == ["claim-0", "claim-1", "claim-2"]
+
+    sink.events.clear()
+    original = neo4j_driver.get_session
+
+    def failing_session(*, database: str = "neo4j") -> Any:
+        session = original(database=database)
+        session.fail_on = ":SUPPORTED_BY"
+        return session
+
+    monkeypatch.setattr(neo4j_driver, "get_session", failing_session)
+    result = saga.execute(_projections(3))
+
+    assert result.is_compensated
+    assert deleted == [BATCH_ID, f"pg:{BATCH_ID}"]
+    assert result.failed_item_ids == ["claim-0", "claim-1"]
+    assert isinstance(result.error, GraphProjectionError)
+    assert [e["event_type"] for e in sink.events] == ["graph_projection.claim_sanad.failed"] * 2
+    assert all(e["severity"] == "HIGH" for e in sink.events)
+
+
+def test_service_batch_projection_reports_partial_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sink = _RecordingAuditSink()
+    written: list[list[str]] = []
+
+    class _FlakyRepo(GraphRepository):
+        def upsert_claim_sanad_projection_batch(self, **kwargs: Any) -> None:
+            ids = [p["claim"]["claim_id"] for p in kwargs["projections"]]
+            written.append(ids)
+            if "claim-2" in ids:
+                raise GraphProjectionError("chunk failed")
+
+    service = GraphProjectionService(graph_repo=_FlakyRepo(batch_size=2), audit_sink=sink)
+
+    monkeypatch.setattr("idis.persistence.graph_consistency.is_neo4j_configured", lambda: False)
+    skipped = service.project_claim_sanad_batch(
+        tenant_id=TENANT_ID, batch_id=BATCH_ID, projections=_projections(2)
+    )
+    assert [r.status for r in skipped] == [ProjectionStatus.SKIPPED] * 2
+    assert written == [] and sink.events == []
+
+    monkeypatch.setattr("idis.persistence.graph_consistency.is_neo4j_configured", lambda: True)
+    results = service.project_claim_sanad_batch(
+        tenant_id=TENANT_ID, batch_id=BATCH_ID, projections=_projections(5)
+    )
+
+    assert written == [["claim-0", "claim-1"], ["claim-2", "claim-3"], ["claim-4"]]
+    assert [r.status for r in results] == [
+        ProjectionStatus.SUCCESS,
+        ProjectionStatus.SUCCESS,
+        ProjectionStatus.FAILED,
+        ProjectionStatus.FAILED,
+        ProjectionStatus.SUCCESS,
+    ]
+    assert results[2].error == "chunk failed"
+    assert [e["event_type"].rsplit(".", 1)[1] for e in sink.events] == [
+        "success",
+        "success",
+        "failed",
+        "failed",
+        "success",
+    ]
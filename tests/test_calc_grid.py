@@ -0,0 +1,239 @@
+"""Tests for batched sensitivity grids and scenarios in the Calc Engine.
+
+Tests verify:
+- Every grid cell equals the single-run output for the same inputs
+- The grid hash is computed once and is stable; cells hash from grid hash + coordinates
+- Gate/validation failures abort before any cell; formula rejections are per cell
+- Named scenarios share the same machinery on a single "scenario" axis
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from idis.calc.engine import (
+    CalcEngine,
+    CalcGridResult,
+    CalcIntegrityError,
+    CalcMissingInputError,
+    CalcUnsupportedValueError,
+    InputGradeInfo,
+)
+from idis.calc.formulas.core import register_core_formulas
+from idis.calc.formulas.registry import FormulaRegistry
+from idis.models.calc_sanad import SanadGrade
+from idis.models.deterministic_calculation import CalcType
+from idis.validators.extraction_gate import ExtractionGateBlockedError
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+DEAL_ID = "22222222-2222-2222-2222-222222222222"
+
+BURNS = [Decimal(v) for v in ("40000", "50000", "0", "80000")]
+CASH = [Decimal(v) for v in ("500000", "1000000", "1500000")]
+
+
+@pytest.fixture
+def engine() -> CalcEngine:
+    """Create a calc engine with a fresh registry of core formulas."""
+    FormulaRegistry.reset_instance()
+    registry = FormulaRegistry()
+    register_core_formulas(registry)
+    return CalcEngine(registry=registry, code_version="test-1.0.0")
+
+
+def _verified_grades() -> list[InputGradeInfo]:
+    return [
+        InputGradeInfo(
+            claim_id="claim-cash",
+            grade=SanadGrade.A,
+            extraction_confidence=Decimal("0.99"),
+            dhabt_score=Decimal("0.95"),
+        ),
+        InputGradeInfo(
+            claim_id="claim-burn",
+            grade=SanadGrade.B,
+            extraction_confidence=Decimal("0.97"),
+            dhabt_score=Decimal("0.93"),
+        ),
+    ]
+
+
+def _runway_grid(engine: CalcEngine, burns: list[Decimal] = BURNS) -> CalcGridResult:
+    return engine.run_grid(
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        calc_type=CalcType.RUNWAY,
+        base_inputs={},
+        axes={"monthly_burn_rate": burns, "cash_balance": CASH},
+        input_grades=_verified_grades(),
+        metadata={"unit": "months"},
+    )
+
+
+class TestGridEvaluation:
+    """Grid cells match single runs and form a compact row-major matrix."""
+
+    def test_cells_match_single_runs(self, engine: CalcEngine) -> None:
+        grid = _runway_grid(engine)
+
+        assert grid.shape == (4, 3)
+        assert len(grid.values) == 12
+        for i, burn in enumerate(BURNS):
+            for j, cash in enumerate(CASH):
+                inputs = grid.inputs_at((i, j))
+                assert inputs == {"monthly_burn_rate": burn, "cash_balance": cash}
+                if burn == 0:
+                    continue
+                single = engine.run(
+                    tenant_id=TENANT_ID,
+                    deal_id=DEAL_ID,
+                    calc_type=CalcType.RUNWAY,
+                    input_values=inputs,
+                    input_grades=_verified_grades(),
+                    metadata={"unit": "months"},
+                )
+                assert grid.value_at((i, j)) == single.calculation.output.primary_value
+
+        assert grid.value_at((1, 1)) == Decimal("20.0000")
+        assert grid.calc_sanad.calc_id == grid.grid_id
+        assert grid.calc_sanad.calc_grade == SanadGrade.B
+
+    def test_formula_rejections_are_recorded_per_cell(self, engine: CalcEngine) -> None:
+        grid = _runway_grid(engine)
+
+        assert sorted(grid.errors) == [(2, 0), (2, 1), (2, 2)]
+        assert grid.errors[(2, 0)] == "monthly_burn_rate must be positive"
+        assert grid.value_at((2, 1)) is None
+        assert sum(v is not None for v in grid.values) == 9
+
+        serialized = grid.to_dict()
+        assert serialized["shape"] == [4, 3]
+        assert serialized["values"][3:9] == ["10.0000", "20.0000", "30.0000", None, None, None]
+        assert serialized["errors"][0] == {
+            "coordinates": [2, 0],
+            "error": "monthly_burn_rate must be positive",
+        }
+
+    def test_coordinates_outside_grid_raise(self, engine: CalcEngine) -> None:
+        grid = _runway_grid(engine)
+
+        with pytest.raises(IndexError):
+            grid.value_at((4, 0))
+        with pytest.raises(IndexError):
+            grid.inputs_at((0,))
+
+
+class TestGridHashing:
+    """The definition is hashed once; cells are reproducible from hash + coordinates."""
+
+    def test_grid_hash_stable_and_definition_sensitive(self, engine: CalcEngine) -> None:
+        first = _runway_grid(engine)
+        second = _runway_grid(engine)
+        changed = _runway_grid(engine, burns=[*BURNS[:3], Decimal("90000")])
+
+        assert first.grid_id != second.grid_id
+        assert first.grid_hash == second.grid_hash
+        assert first.cell_hash((1, 2)) == second.cell_hash((1, 2))
+        assert first.cell_hash((1, 2)) != first.cell_hash((2, 1))
+        assert changed.grid_hash != first.grid_hash
+
+    def test_gate_and_hash_run_once_per_grid(self, engine: CalcEngine) -> None:
+        with (
+            patch(
+                "idis.calc.engine.evaluate_extraction_gate_batch",
+                return_value=([], []),
+            ) as gate,
+            patch.object(
+                engine, "_compute_grid_hash", wraps=engine._compute_grid_hash
+            ) as grid_hash,
+        ):
+            _runway_grid(engine)
+
+        assert gate.call_count == 1
+        assert grid_hash.call_count == 1
+
+    def test_verify_detects_definition_tamper(self, engine: CalcEngine) -> None:
+        grid = _runway_grid(engine)
+        engine.verify_grid_reproducibility(grid)
+
+        tampered = dataclasses.replace(grid, metadata={"unit": "weeks"})
+        with pytest.raises(CalcIntegrityError):
+            engine.verify_grid_reproducibility(tampered)
+
+
+class TestGridValidation:
+    """Invalid definitions fail closed before any cell is evaluated."""
+
+    def test_blocked_input_blocks_whole_grid(self, engine: CalcEngine) -> None:
+        grades = [InputGradeInfo(claim_id="claim-x", grade=SanadGrade.A)]
+
+        with pytest.raises(ExtractionGateBlockedError):
+            engine.run_grid(TENANT_ID, DEAL_ID, CalcType.RUNWAY, {}, {"cash_balance": CASH}, grades)
+
+    def test_missing_unknown_and_float_inputs_rejected(self, engine: CalcEngine) -> None:
+        grades = _verified_grades()
+
+        with pytest.raises(CalcMissingInputError) as missing:
+            engine.run_grid(TENANT_ID, DEAL_ID, CalcType.RUNWAY, {}, {"cash_balance": CASH}, grades)
+        assert missing.value.missing_inputs == ["monthly_burn_rate"]
+
+        with pytest.raises(CalcUnsupportedValueError):
+            engine.run_grid(
+                TENANT_ID,
+                DEAL_ID,
+                CalcType.RUNWAY,
+                {"monthly_burn_rate": Decimal("1")},
+                {"cash_balance": CASH, "growth": CASH},
+                grades,
+            )
+
+        with pytest.raises(CalcUnsupportedValueError):
+            engine.run_grid(
+                TENANT_ID,
+                DEAL_ID,
+                CalcType.RUNWAY,
+                {"cash_balance": Decimal("1")},
+                {"monthly_burn_rate": [0.5]},  # type: ignore[list-item]
+                grades,
+            )
+
+        with pytest.raises(ValueError, match="no values"):
+            engine.run_grid(
+                TENANT_ID,
+                DEAL_ID,
+                CalcType.RUNWAY,
+                {"cash_balance": Decimal("1")},
+                {"monthly_burn_rate": []},
+                grades,
+            )
+
+
+class TestScenarios:
+    """Named scenarios evaluate on a single scenario axis."""
+
+    def test_scenarios_override_base_inputs(self, engine: CalcEngine) -> None:
+        result = engine.run_scenarios(
+            tenant_id=TENANT_ID,
+            deal_id=DEAL_ID,
+            calc_type=CalcType.RUNWAY,
+            base_inputs={"cash_balance": Decimal("1200000")},
+            scenarios={
+                "base": {"monthly_burn_rate": Decimal("100000")},
+                "bear": {"monthly_burn_rate": Decimal("150000")},
+                "bull": {
+                    "monthly_burn_rate": Decimal("80000"),
+                    "cash_balance": Decimal("2000000"),
+                },
+            },
+            input_grades=_verified_grades(),
+        )
+
+        assert [axis.name for axis in result.axes] == ["scenario"]
+        assert result.axes[0].labels == ("base", "bear", "bull")
+        assert result.values == (Decimal("12.0000"), Decimal("8.0000"), Decimal("25.0000"))
+        assert result.inputs_at((2,))["cash_balance"] == Decimal("2000000")
+        engine.verify_grid_reproducibility(result)
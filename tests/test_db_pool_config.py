@@ -0,0 +1,188 @@
+"""Application engine pool configuration, pool metrics and prepared hot queries.
+
+1. Pool sizing, timeout, recycle and pre-ping come from IDIS_DB_POOL_* with per-role overrides;
+   invalid values fail closed. Pre-ping is off by default (recycle-based liveness).
+2. The application pool records checkouts, checkout wait and connections in use at /metrics,
+   labeled by role.
+3. execute_prepared PREPAREs once per pooled connection and EXECUTEs thereafter on Postgres,
+   and falls back to a plain execution elsewhere or when disabled.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+
+from idis.observability.metrics import (
+    DB_POOL_CHECKOUTS_TOTAL,
+    DB_POOL_CHECKOUTS_WAITING,
+    DB_POOL_CONNECTIONS_IN_USE,
+    get_counter,
+    get_gauge,
+    render_prometheus_text,
+    reset_metrics,
+)
+from idis.persistence import db
+from idis.persistence.db import (
+    DatabaseConfigError,
+    DbPoolConfig,
+    execute_prepared,
+    get_app_engine,
+    get_pool_config,
+    reset_engines,
+)
+
+_POOL_ENVS = (
+    "IDIS_DB_POOL_ROLE",
+    "IDIS_DB_POOL_SIZE",
+    "IDIS_DB_POOL_SIZE_WORKER",
+    "IDIS_DB_POOL_MAX_OVERFLOW",
+    "IDIS_DB_POOL_TIMEOUT_SECONDS",
+    "IDIS_DB_POOL_RECYCLE_SECONDS",
+    "IDIS_DB_POOL_PRE_PING",
+    "IDIS_DB_POOL_PRE_PING_WORKER",
+    "IDIS_DB_PREPARED_STATEMENTS",
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch: pytest.MonkeyPatch) -> Any:
+    for name in _POOL_ENVS:
+        monkeypatch.delenv(name, raising=False)
+    reset_metrics()
+    yield
+    reset_engines()
+    reset_metrics()
+
+
+def test_pool_config_defaults_and_role_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_pool_config() == DbPoolConfig(
+        role="api",
+        pool_size=5,
+        max_overflow=10,
+        timeout_seconds=30,
+        recycle_seconds=1800,
+        pre_ping=False,
+    )
+
+    monkeypatch.setenv("IDIS_DB_POOL_ROLE", "Worker")
+    monkeypatch.setenv("IDIS_DB_POOL_SIZE", "8")
+    monkeypatch.setenv("IDIS_DB_POOL_SIZE_WORKER", "2")
+    monkeypatch.setenv("IDIS_DB_POOL_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("IDIS_DB_POOL_PRE_PING_WORKER", "true")
+    config = get_pool_config()
+    assert (config.role, config.pool_size, config.max_overflow, config.pre_ping) == (
+        "worker",
+        2,
+        0,
+        True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "match"),
+    [
+        ("IDIS_DB_POOL_ROLE", "scheduler", "IDIS_DB_POOL_ROLE"),
+        ("IDIS_DB_POOL_SIZE", "0", "IDIS_DB_POOL_SIZE must be >= 1"),
+        ("IDIS_DB_POOL_MAX_OVERFLOW", "-1", "IDIS_DB_POOL_MAX_OVERFLOW"),
+        ("IDIS_DB_POOL_RECYCLE_SECONDS", "soon", "must be an integer"),
+        ("IDIS_DB_POOL_PRE_PING", "maybe", "boolean flag"),
+    ],
+)
+def test_invalid_pool_settings_fail_closed(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str, match: str
+) -> None:
+    monkeypatch.setenv(name, value)
+    with pytest.raises(DatabaseConfigError, match=match):
+        get_pool_config()
+
+
+def test_app_pool_records_checkout_metrics(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("IDIS_DATABASE_URL", f"sqlite:///{tmp_path / 'pool.db'}")
+    monkeypatch.setenv("IDIS_DB_POOL_ROLE", "janitor")
+    monkeypatch.setenv("IDIS_DB_POOL_SIZE", "3")
+    labels = {"role": "janitor"}
+
+    engine = get_app_engine()
+    assert (engine.pool.size(), engine.pool._pre_ping, engine.pool._recycle) == (3, False, 1800)
+
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        assert get_gauge(DB_POOL_CONNECTIONS_IN_USE, labels=labels) == 2
+    assert get_gauge(DB_POOL_CONNECTIONS_IN_USE, labels=labels) == 0
+    assert get_gauge(DB_POOL_CHECKOUTS_WAITING, labels=labels) == 0
+    assert get_counter(DB_POOL_CHECKOUTS_TOTAL, labels=labels) == 2
+
+    engine.dispose()  # recreates the pool; the role label must survive
+    with engine.connect():
+        assert get_gauge(DB_POOL_CONNECTIONS_IN_USE, labels=labels) == 1
+
+    rendered = render_prometheus_text()
+    assert 'db_pool_connections_in_use{role="janitor"} 0' in rendered
+    assert 'db_pool_checkouts_total{role="janitor"} 3' in rendered
+    assert 'db_pool_checkout_wait_us_total{role="janitor"}' in rendered
+
+
+class _FakeResult:
+    def __init__(self, sql: str, params: dict[str, Any]) -> None:
+        self.sql = sql
+        self.params = params
+
+
+class _FakePostgresConn:
+    class dialect:  # noqa: N801 - mirrors Connection.dialect
+        name = "postgresql"
+
+    def __init__(self, info: dict[str, Any]) -> None:
+        self.connection = type("_Proxied", (), {"info": info})()
+        self.executed: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> _FakeResult:
+        self.executed.append((str(statement), params or {}))
+        return _FakeResult(str(statement), params or {})
+
+
+def test_execute_prepared_prepares_once_per_pooled_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sql = "SELECT * FROM claims WHERE deal_id = :deal_id AND claim_id > :cursor::uuid LIMIT :limit"
+    params = {"limit": 3, "deal_id": "d-1", "cursor": "c-1", "unused": "x"}
+    info: dict[str, Any] = {}
+
+    first = _FakePostgresConn(info)
+    execute_prepared(first, "idis_claims_page", sql, params)  # type: ignore[arg-type]
+    execute_prepared(first, "idis_claims_page", sql, params)  # type: ignore[arg-type]
+    reused = _FakePostgresConn(info)  # same DBAPI connection, later checkout
+    execute_prepared(reused, "idis_claims_page", sql, params)  # type: ignore[arg-type]
+
+    assert first.executed[0] == (
+        "PREPARE idis_claims_page AS SELECT * FROM claims "
+        "WHERE deal_id = $1 AND claim_id > $2::uuid LIMIT $3",
+        {},
+    )
+    execute = (
+        "EXECUTE idis_claims_page(:deal_id, :cursor, :limit)",
+        {"deal_id": "d-1", "cursor": "c-1", "limit": 3},
+    )
+    assert first.executed[1:] == [execute, execute]
+    assert reused.executed == [execute]
+
+    monkeypatch.setenv("IDIS_DB_PREPARED_STATEMENTS", "0")
+    disabled = _FakePostgresConn({})
+    execute_prepared(disabled, "idis_claims_page", sql, params)  # type: ignore[arg-type]
+    assert disabled.executed == [(sql, params)]
+
+    monkeypatch.delenv("IDIS_DB_PREPARED_STATEMENTS")
+    with pytest.raises(DatabaseConfigError, match="statement name"):
+        execute_prepared(first, "claims; DROP TABLE claims", sql, params)  # type: ignore[arg-type]
+
+
+def test_execute_prepared_falls_back_off_postgres(tmp_path: Path) -> None:
+    engine = db.create_engine(f"sqlite:///{tmp_path / 'fallback.db'}")
+    with engine.connect() as conn:
+        row = execute_prepared(conn, "idis_echo", "SELECT :value AS value", {"value": 7}).one()
+    assert row.value == 7
@@ -0,0 +1,271 @@
+"""Streaming NDJSON export of a deal's claims, sanads and defects.
+
+1. GET /v1/deals/{dealId}/export/{entity} streams one record per line in (changed_at, id)
+   order, tenant-isolated, with column projection and inclusive ``updated_since``.
+2. Unknown entities/fields and unknown deals are rejected before streaming starts.
+3. NDJSON chunks end on line boundaries and respect the chunk size.
+4. The Postgres exporter issues one projected, keyset-ordered statement on a server-side
+   cursor (``yield_per``) and decodes rows to JSON-ready values.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from idis.api.main import create_app
+from idis.api.policy import Role
+from idis.api.routes.claims import clear_all_stores, seed_claim, seed_defect, seed_sanad
+from idis.api.routes.deals import clear_deals_store
+from idis.audit.sink import JsonlFileAuditSink
+from idis.persistence.repositories.deal_export import (
+    EXPORT_YIELD_PER_ENV,
+    ExportConfigError,
+    ExportProjectionError,
+    PostgresDealExporter,
+    get_export_yield_per,
+    ndjson_chunks,
+    resolve_columns,
+)
+from idis.persistence.repositories.deals import _in_memory_store as _deals_store
+from tests.abac_seed import seed_deal_access
+
+TENANT_A = str(uuid.uuid4())
+TENANT_B = str(uuid.uuid4())
+DEAL_ID = str(uuid.uuid4())
+ACTOR_ID = "actor-export"
+HEADERS = {"X-IDIS-API-Key": "test-api-key"}
+
+
+@pytest.fixture(autouse=True)
+def _clean_stores() -> Any:
+    clear_deals_store()
+    clear_all_stores()
+    yield
+    clear_deals_store()
+    clear_all_stores()
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv(
+        "IDIS_API_KEYS_JSON",
+        json.dumps(
+            {
+                "test-api-key": {
+                    "tenant_id": TENANT_A,
+                    "actor_id": ACTOR_ID,
+                    "name": "Export Tenant",
+                    "timezone": "UTC",
+                    "data_region": "us-east-1",
+                    "roles": [Role.ANALYST.value],
+                }
+            }
+        ),
+    )
+    audit_log_path = tmp_path / "audit.jsonl"
+    monkeypatch.setenv("IDIS_AUDIT_LOG_PATH", str(audit_log_path))
+    app = create_app(
+        audit_sink=JsonlFileAuditSink(file_path=str(audit_log_path)), service_region="us-east-1"
+    )
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _seed() -> None:
+    _deals_store[DEAL_ID] = {
+        "deal_id": DEAL_ID,
+        "tenant_id": TENANT_A,
+        "name": "Export Deal",
+        "company_name": "Export Corp",
+        "status": "NEW",
+        "stage": "SEED",
+        "tags": [],
+        "created_at": "2026-01-10T00:00:00Z",
+        "updated_at": None,
+    }
+    seed_deal_access(TENANT_A, DEAL_ID, ACTOR_ID)
+    rows = [
+        ("claim-c", TENANT_A, "2026-01-03T00:00:00Z", None),
+        ("claim-a", TENANT_A, "2026-01-01T00:00:00Z", "2026-01-05T00:00:00Z"),
+        ("claim-b", TENANT_A, "2026-01-03T00:00:00Z", None),
+        ("claim-x", TENANT_B, "2026-01-02T00:00:00Z", None),
+    ]
+    for claim_id, tenant_id, created_at, updated_at in rows:
+        seed_claim(
+            {
+                "claim_id": claim_id,
+                "tenant_id": tenant_id,
+                "deal_id": DEAL_ID,
+                "claim_class": "FINANCIAL",
+                "claim_text": f"text of {claim_id}",
+                "value": {"value": 1, "unit": "USD"},
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+        )
+    seed_sanad(
+        {
+            "sanad_id": "sanad-1",
+            "tenant_id": TENANT_A,
+            "claim_id": "claim-a",
+            "deal_id": DEAL_ID,
+            "primary_evidence_id": "ev-1",
+            "created_at": "2026-01-01T00:00:00Z",
+        }
+    )
+    seed_defect(
+        {
+            "defect_id": "defect-1",
+            "tenant_id": TENANT_A,
+            "claim_id": "claim-a",
+            "deal_id": DEAL_ID,
+            "defect_type": "STALENESS",
+            "severity": "MINOR",
+            "created_at": "2026-01-02T00:00:00Z",
+        }
+    )
+
+
+def _lines(response: Any) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_streams_ndjson_in_changed_at_order(client: TestClient) -> None:
+    _seed()
+
+    response = client.get(f"/v1/deals/{DEAL_ID}/export/claims", headers=HEADERS)
+
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = _lines(response)
+    assert [r["claim_id"] for r in records] == ["claim-b", "claim-c", "claim-a"]
+    assert records[0]["value"] == {"value": 1, "unit": "USD"}
+    sanads = _lines(client.get(f"/v1/deals/{DEAL_ID}/export/sanads", headers=HEADERS))
+    assert [(s["sanad_id"], s["claim_id"]) for s in sanads] == [("sanad-1", "claim-a")]
+
+
+def test_export_projection_and_updated_since(client: TestClient) -> None:
+    _seed()
+
+    response = client.get(
+        f"/v1/deals/{DEAL_ID}/export/claims",
+        params={"fields": "claim_text,updated_at", "updated_since": "2026-01-03T00:00:00Z"},
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 200, response.text
+    assert _lines(response) == [
+        {"claim_id": "claim-b", "claim_text": "text of claim-b", "updated_at": None},
+        {"claim_id": "claim-c", "claim_text": "text of claim-c", "updated_at": None},
+        {
+            "claim_id": "claim-a",
+            "claim_text": "text of claim-a",
+            "updated_at": "2026-01-05T00:00:00Z",
+        },
+    ]
+    defects = client.get(
+        f"/v1/deals/{DEAL_ID}/export/defects", params={"fields": "severity"}, headers=HEADERS
+    )
+    assert _lines(defects) == [{"defect_id": "defect-1", "severity": "MINOR"}]
+
+
+def test_export_rejects_unknown_entity_field_and_deal(client: TestClient) -> None:
+    _seed()
+
+    assert client.get(f"/v1/deals/{DEAL_ID}/export/evidence", headers=HEADERS).status_code == 404
+    bad_field = client.get(
+        f"/v1/deals/{DEAL_ID}/export/claims", params={"fields": "secret"}, headers=HEADERS
+    )
+    assert bad_field.status_code == 400
+    missing_deal_id = str(uuid.uuid4())
+    seed_deal_access(TENANT_A, missing_deal_id, ACTOR_ID)
+    missing = client.get(f"/v1/deals/{missing_deal_id}/export/claims", headers=HEADERS)
+    assert missing.status_code == 404
+
+
+def test_resolve_columns_and_chunking() -> None:
+    assert resolve_columns("sanads", "computed, sanad_id,computed") == ("sanad_id", "computed")
+    assert resolve_columns("defects", None)[0] == "defect_id"
+    with pytest.raises(ExportProjectionError):
+        resolve_columns("claims", "claim_id,tenant")
+
+    rows = [{"i": i, "s": "x" * 10} for i in range(100)]
+    chunks = list(ndjson_chunks(rows, chunk_bytes=100))
+    assert len(chunks) > 10
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == rows
+
+
+def test_yield_per_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(EXPORT_YIELD_PER_ENV, "250")
+    assert get_export_yield_per() == 250
+    monkeypatch.setenv(EXPORT_YIELD_PER_ENV, "0")
+    with pytest.raises(ExportConfigError):
+        get_export_yield_per()
+
+
+class _RecordingResult:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+        self.closed = False
+
+    def mappings(self) -> list[dict[str, Any]]:
+        return self._rows
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _RecordingConnection:
+    """Connection double without execution_options(): options must stay on the statement."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.statements: list[tuple[Any, dict[str, Any]]] = []
+        self.result = _RecordingResult(rows)
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        self.statements.append((statement, params or {}))
+        return self.result
+
+
+def test_postgres_exporter_statement_shape() -> None:
+    claim_uuid = uuid.uuid4()
+    conn = _RecordingConnection(
+        [
+            {
+                "claim_id": claim_uuid,
+                "value": '{"value": 2}',
+                "updated_at": datetime(2026, 1, 5, tzinfo=UTC),
+            }
+        ]
+    )
+    exporter = PostgresDealExporter(conn, TENANT_A)  # type: ignore[arg-type]
+    since = datetime(2026, 1, 1, tzinfo=UTC)
+
+    rows = list(
+        exporter.iter_rows(
+            "claims",
+            DEAL_ID,
+            columns=("claim_id", "value", "updated_at"),
+            updated_since=since,
+            yield_per=500,
+        )
+    )
+
+    assert rows == [
+        {"claim_id": str(claim_uuid), "value": {"value": 2}, "updated_at": "2026-01-05T00:00:00Z"}
+    ]
+    assert conn.result.closed
+    statement, params = conn.statements[-1]
+    assert statement.get_execution_options() == {"yield_per": 500}
+    sql = str(statement)
+    assert sql.startswith("SELECT claim_id, value, updated_at FROM claims WHERE")
+    assert "COALESCE(updated_at, created_at) >= :updated_since" in sql
+    assert sql.endswith("ORDER BY COALESCE(updated_at, created_at), claim_id")
+    assert params == {"tenant_id": TENANT_A, "deal_id": DEAL_ID, "updated_since": since}
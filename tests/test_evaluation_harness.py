@@ -723,3 +723,79 @@ class TestMetrics:
         assert result.metrics["cases_total"] == 20
         assert result.metrics["cases_passed"] == 20
         assert result.metrics["cases_failed"] == 0
+
+
+class TestConcurrentExecution:
+    """Execute mode on a bounded worker pool with a shared pooled client."""
+
+    def test_concurrent_execution_keeps_case_order_and_records_timings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import threading
+        import time
+
+        import httpx
+
+        from idis.evaluation import harness
+        from idis.evaluation.types import CaseStatus
+
+        lock = threading.Lock()
+        in_flight = peak = 0
+        clients: set[int] = set()
+
+        def mock_send(
+            self: httpx.Client, request: httpx.Request, **kwargs: object
+        ) -> httpx.Response:  # type: ignore[override]
+            nonlocal in_flight, peak
+            clients.add(id(self))
+            if request.method == "POST" and str(request.url).endswith("/v1/deals"):
+                name = json.loads(request.content)["name"]
+                return httpx.Response(201, json={"deal_id": f"srv-{name}"}, request=request)
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            # Later cases finish first, so completion order differs from case order.
+            deal_number = int(str(request.url).split("srv-deal_")[1].split("/")[0])
+            time.sleep(0.002 * (21 - deal_number))
+            with lock:
+                in_flight -= 1
+            steps = [
+                {
+                    "step_name": "EXTRACT",
+                    "status": "COMPLETED",
+                    "started_at": "2026-01-01T00:00:00+00:00",
+                    "finished_at": "2026-01-01T00:00:01.250000+00:00",
+                }
+            ]
+            body = {"run_id": "run-1", "status": "SUCCEEDED", "steps": steps}
+            return httpx.Response(202, json=body, request=request)
+
+        monkeypatch.setattr(httpx.Client, "send", mock_send)
+        monkeypatch.setattr(harness, "_check_api_availability", lambda *_: (True, ""))
+        monkeypatch.setattr(harness, "_seed_and_ingest_documents", lambda **_: (1, []))
+
+        result = run_suite(
+            FIXTURES_DIR, "gdbs-s", mode="execute", base_url="http://fake:1", concurrency=4
+        )
+
+        expected_order = [c.case_id for c in load_gdbs_suite(FIXTURES_DIR, "gdbs-s").cases]
+        assert [c.case_id for c in result.cases] == expected_order
+        assert all(c.status == CaseStatus.PASS for c in result.cases)
+        assert 1 < peak <= 4
+        assert len(clients) == 1, "cases must share one pooled client"
+        assert result.metrics["concurrency"] == 4
+        assert result.metrics["cumulative_case_ms"] == sum(
+            c.execution_time_ms or 0 for c in result.cases
+        )
+        assert result.metrics["wall_clock_ms"] < result.metrics["cumulative_case_ms"]
+        first = result.cases[0].metrics
+        assert first["step_timings_ms"] == {"EXTRACT": 1250}
+        assert set(first["timings_ms"]) == {"create_deal", "seed_and_ingest", "run"}
+
+    def test_invalid_concurrency_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="concurrency must be >= 1"):
+            run_suite(FIXTURES_DIR, "gdbs-s", mode="execute", concurrency=0)
+        with pytest.raises(ValueError, match="requires concurrency=1"):
+            run_suite(
+                FIXTURES_DIR, "gdbs-s", mode="execute", concurrency=2, pre_case_fn=lambda: None
+            )
@@ -603,6 +603,46 @@ def test_multiple_required_evidence_types_each_enforce_min_count() -> None:
     assert satisfied.tasks[0].status == ExtractionTaskStatus.READY
 
 
+def test_evidence_counts_are_per_document_across_shared_span_index() -> None:
+    result = InMemoryExtractionTaskPlanner().plan_tasks(
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        run_id=RUN_ID,
+        methodology_registry=_registry(
+            [
+                _question(required_evidence_specs=[("schedule", 2)]),
+                _question(
+                    question_id="mq_financial_dd_revenue_quality_0002",
+                    required_evidence_specs=[("contract", 1)],
+                ),
+            ]
+        ),
+        classifications=[
+            _classification(document_id="doc-a"),
+            _classification(document_id="doc-b"),
+        ],
+        source_spans_by_document_id={
+            "doc-a": [
+                _span("doc-a", evidence_tags=[" Schedule "], span_id="span-003"),
+                _span("doc-a", evidence_tags=["schedule"], span_id="span-001"),
+            ],
+            "doc-b": [_span("doc-b", evidence_tags=["schedule", "contract"], span_id="span-002")],
+        },
+    )
+
+    statuses = {
+        (task.methodology_question_id, task.document_id): task.status for task in result.tasks
+    }
+    assert statuses == {
+        ("mq_financial_dd_revenue_quality_0001", "doc-a"): ExtractionTaskStatus.READY,
+        ("mq_financial_dd_revenue_quality_0001", "doc-b"): ExtractionTaskStatus.EVIDENCE_MISSING,
+        ("mq_financial_dd_revenue_quality_0002", "doc-a"): ExtractionTaskStatus.EVIDENCE_MISSING,
+        ("mq_financial_dd_revenue_quality_0002", "doc-b"): ExtractionTaskStatus.READY,
+    }
+    assert result.tasks[0].source_span_ids == ["span-001", "span-003"]
+    assert result.tasks[2].source_span_ids == ["span-001", "span-003"]
+
+
 def test_expected_answer_schema_is_populated_from_methodology() -> None:
     task = (
         InMemoryExtractionTaskPlanner()
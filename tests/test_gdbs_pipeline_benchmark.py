@@ -0,0 +1,121 @@
+"""GDBS pipeline benchmark: per-stage latency/memory report and its baseline tolerance gate.
+
+1. One deal replays through every stage in-process and reports p50/p95/max and peak memory per
+   stage, plus deterministic output counts; the calc stage computes the deal's GDBS calcs.
+2. The gate passes against a baseline pinned from the same report, flags latency, memory and
+   count regressions beyond tolerance, honors a wider latency ratio override, and fails closed
+   on a missing or foreign baseline.
+3. Empty replays are rejected up front and the RSS high-water mark is reported in KiB on every
+   platform.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from idis.evaluation.benchmarks import pipeline
+from idis.evaluation.benchmarks.pipeline import (
+    PIPELINE_STAGES,
+    build_pipeline_baseline_document,
+    compare_pipeline_to_baseline,
+    load_pipeline_baseline,
+    run_pipeline_benchmark,
+)
+
+GDBS_FULL = Path(__file__).resolve().parent.parent / "datasets" / "gdbs_full"
+PINNED_BASELINE = (
+    Path(__file__).resolve().parent
+    / "fixtures"
+    / "bench_baseline"
+    / "gdbs_pipeline_gdbs_s_baseline.json"
+)
+
+
+@pytest.fixture(scope="module")
+def report() -> dict[str, Any]:
+    return run_pipeline_benchmark(GDBS_FULL, "gdbs-s", iterations=1, max_cases=1)
+
+
+def test_single_deal_report_covers_every_stage(report: dict[str, Any]) -> None:
+    assert (report["benchmark"], report["case_count"], report["iterations"]) == (
+        "gdbs_pipeline",
+        1,
+        1,
+    )
+    assert list(report["stages"]) == list(PIPELINE_STAGES)
+    for stage in report["stages"].values():
+        assert stage["samples"] == 1
+        assert 0 < stage["p50_ms"] <= stage["p95_ms"] <= stage["max_ms"]
+        assert stage["peak_kib"] > 0
+
+    counts = report["counts"]
+    assert counts["documents"] == 2 and counts["spans"] > 0 and counts["chunks"] > 0
+    assert counts["claims"] == counts["graded"] > 0
+    assert counts["calcs"] == 2  # GROSS_MARGIN and RUNWAY from the deal's calcs.json
+    assert counts["deliverables"] == 4
+
+
+def test_gate_tolerates_noise_and_flags_regressions(report: dict[str, Any]) -> None:
+    baseline = build_pipeline_baseline_document(report)
+    assert compare_pipeline_to_baseline(baseline, report)["ok"] is True
+
+    noisy = copy.deepcopy(report)
+    noisy["stages"]["chunk"]["p95_ms"] += 4.0  # within the absolute floor
+    assert compare_pipeline_to_baseline(baseline, noisy)["ok"] is True
+
+    regressed = copy.deepcopy(report)
+    regressed["stages"]["grade"]["p95_ms"] = report["stages"]["grade"]["p95_ms"] * 3 + 20
+    regressed["stages"]["extract"]["peak_kib"] = report["stages"]["extract"]["peak_kib"] * 2
+    regressed["counts"]["claims"] += 1
+    gate = compare_pipeline_to_baseline(baseline, regressed)
+    assert gate["ok"] is False
+    assert gate["exceeded_metrics"] == [
+        "counts.claims",
+        "stages.extract.peak_kib",
+        "stages.grade.p95_ms",
+    ]
+
+    loaded_runner = copy.deepcopy(report)
+    for stage in loaded_runner["stages"].values():
+        stage["p50_ms"] *= 3
+        stage["p95_ms"] *= 3
+    assert compare_pipeline_to_baseline(baseline, loaded_runner)["ok"] is False
+    widened = compare_pipeline_to_baseline(baseline, loaded_runner, tolerances={"latency_ratio": 4})
+    assert widened["ok"] is True
+
+
+@pytest.mark.parametrize("max_cases", [0, -1])
+def test_empty_replay_is_rejected(max_cases: int) -> None:
+    with pytest.raises(ValueError, match="max_cases"):
+        run_pipeline_benchmark(GDBS_FULL, "gdbs-s", iterations=1, max_cases=max_cases)
+
+
+@pytest.mark.parametrize(("platform", "ru_maxrss"), [("linux", 2048), ("darwin", 2048 * 1024)])
+def test_max_rss_is_reported_in_kib(
+    monkeypatch: pytest.MonkeyPatch, platform: str, ru_maxrss: int
+) -> None:
+    import resource
+
+    monkeypatch.setattr(sys, "platform", platform)
+    monkeypatch.setattr(resource, "getrusage", lambda _who: SimpleNamespace(ru_maxrss=ru_maxrss))
+
+    assert pipeline._max_rss_kib() == 2048
+
+
+def test_baseline_loading_fails_closed(tmp_path: Path) -> None:
+    assert load_pipeline_baseline(tmp_path / "absent.json") == (None, "BASELINE_MISSING")
+
+    foreign = tmp_path / "foreign.json"
+    foreign.write_text(json.dumps({"baseline_version": 1, "suite_id": "gdbs-s"}))
+    assert load_pipeline_baseline(foreign) == (None, "BASELINE_INVALID")
+
+    pinned, error = load_pipeline_baseline(PINNED_BASELINE)
+    assert error is None and pinned is not None
+    assert pinned["case_count"] == 20 and set(pinned["stages"]) == set(PIPELINE_STAGES)
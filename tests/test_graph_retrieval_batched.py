@@ -0,0 +1,207 @@
+"""Set-based (batched) §4.4 graph retrieval for many claims at once.
+
+1. Parity: GraphRetrievalService produces the identical counts-only summary and conclusions
+   whether it reads per claim or through the batched repository methods.
+2. Round-trips: the batched path runs each query family once (2 + 3 + 1 reads) instead of
+   3 per claim + 1 per defect.
+3. Contract: batched queries enforce tenant_id, UNWIND the id list and tag records with
+   batch_key; the repository strips batch_key so per-id records match the per-claim queries.
+4. Live parity against Neo4j when NEO4J_URI is configured.
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from typing import Any
+
+import pytest
+
+from idis.persistence.cypher import q_4_4_1_full_chain as q441
+from idis.persistence.cypher import q_4_4_3_independence_clusters as q443
+from idis.persistence.cypher import q_4_4_4_weakest_link as q444
+from idis.persistence.cypher import q_4_4_5_defect_impact as q445
+from idis.persistence.graph_repo import GraphRepository
+from idis.services.graph.retrieval import (
+    BatchedGraphRepositoryProtocol,
+    GraphRetrievalService,
+)
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+
+# Records each query family returns per id (batch_key is added by the fake batched reads).
+_GRAPH: dict[str, dict[str, list[dict[str, Any]]]] = {
+    "chain": {
+        "claim-a": [{"chain_depth": 4}, {"chain_depth": 6}],
+        "claim-b": [{"chain_depth": 2}],
+    },
+    "clusters": {
+        "claim-a": [{"independent_source_count": 3, "corroboration_status": "MUTAWATIR"}],
+        "claim-b": [{"independent_source_count": 1, "corroboration_status": "AHAD_1"}],
+    },
+    "weakest": {"claim-a": [{"min_grade": "C", "weakest_node": "tn-2"}]},
+    "impact": {
+        "def-1": [
+            {
+                "defect_type": "CONTRADICTION",
+                "severity": "MAJOR",
+                "affected_claims": [{"claim_id": "claim-a", "claim_text": "private"}],
+                "affected_calculations": ["calc-1"],
+            }
+        ]
+    },
+}
+
+_FAMILIES = {
+    q441.QUERY: ("chain", "claim_id"),
+    q441.BATCH_QUERY: ("chain", "claim_ids"),
+    q443.QUERY: ("clusters", "claim_id"),
+    q443.BATCH_QUERY: ("clusters", "claim_ids"),
+    q444.QUERY: ("weakest", "claim_id"),
+    q444.BATCH_QUERY: ("weakest", "claim_ids"),
+    q445.QUERY: ("impact", "defect_id"),
+    q445.BATCH_QUERY: ("impact", "defect_ids"),
+}
+
+
+class _FakeReads:
+    def __init__(self) -> None:
+        self.reads: list[str] = []
+
+    def __call__(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        assert params["tenant_id"] == TENANT_ID
+        if query not in _FAMILIES:
+            self.reads.append("deal")
+            return [{"claim.claim_id": "claim-a"}]
+        family, param = _FAMILIES[query]
+        self.reads.append(family)
+        if param.endswith("_ids"):
+            return [
+                {"batch_key": item_id, **record}
+                for item_id in sorted(params[param])
+                for record in _GRAPH[family].get(item_id, [])
+            ]
+        return [dict(record) for record in _GRAPH[family].get(params[param], [])]
+
+
+class _PerClaimRepository:
+    """Exposes only the per-claim methods, forcing the per-claim retrieval path."""
+
+    def __init__(self, repo: GraphRepository) -> None:
+        self._repo = repo
+
+    def __getattr__(self, name: str) -> Any:
+        if name.endswith("_batch"):
+            raise AttributeError(name)
+        return getattr(self._repo, name)
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> _FakeReads:
+    fake = _FakeReads()
+    monkeypatch.setattr("idis.persistence.graph_repo.execute_read", fake)
+    return fake
+
+
+def _summary(repo: Any) -> dict[str, Any]:
+    return GraphRetrievalService(graph_repo=repo).retrieve_deal_graph_summary(
+        tenant_id=TENANT_ID,
+        deal_id="deal-1",
+        claim_ids=["claim-b", "claim-a", "claim-missing", "claim-a", ""],
+        defect_ids=["def-1", "def-missing"],
+    )
+
+
+def test_batched_summary_matches_per_claim_summary(reads: _FakeReads) -> None:
+    per_claim_repo = _PerClaimRepository(GraphRepository())
+    assert not isinstance(per_claim_repo, BatchedGraphRepositoryProtocol)
+    assert isinstance(GraphRepository(), BatchedGraphRepositoryProtocol)
+
+    per_claim = _summary(per_claim_repo)
+    per_claim_reads = list(reads.reads)
+    reads.reads.clear()
+    batched = _summary(GraphRepository())
+
+    assert batched == per_claim
+    assert per_claim["claim_ids"] == ["claim-a", "claim-b", "claim-missing"]
+    assert len(per_claim_reads) == 2 + 3 * 3 + 2
+    assert sorted(reads.reads) == sorted(["deal", "deal", "chain", "clusters", "weakest", "impact"])
+
+    conclusions = {c["claim_id"]: c for c in batched["graph_conclusions"]["claims"]}
+    assert conclusions["claim-a"]["chain_depth"] == 6
+    assert conclusions["claim-missing"] == {
+        "claim_id": "claim-missing",
+        "chain_depth": 0,
+        "weakest_grade": None,
+        "corroboration_status": None,
+        "independent_source_count": 0,
+    }
+
+
+def test_batch_methods_key_records_and_strip_batch_key(reads: _FakeReads) -> None:
+    repo = GraphRepository()
+
+    chains = repo.get_claim_sanad_chain_batch(tenant_id=TENANT_ID, claim_ids=["claim-a", "claim-x"])
+
+    assert chains == {"claim-a": _GRAPH["chain"]["claim-a"], "claim-x": []}
+    assert chains["claim-a"] == repo.get_claim_sanad_chain(tenant_id=TENANT_ID, claim_id="claim-a")
+    reads.reads.clear()
+    assert repo.get_weakest_link_batch(tenant_id=TENANT_ID, claim_ids=[]) == {}
+    assert reads.reads == [], "empty id list issues no read"
+
+
+@pytest.mark.parametrize(
+    ("module", "id_param"),
+    [(q441, "claim_ids"), (q443, "claim_ids"), (q444, "claim_ids"), (q445, "defect_ids")],
+)
+def test_batch_query_contract(module: Any, id_param: str) -> None:
+    query = module.BATCH_QUERY
+    assert query.startswith(f"UNWIND ${id_param} AS batch_key")
+    assert "$tenant_id" in query
+    assert query.index("$tenant_id") < query.index("RETURN")
+    assert "RETURN batch_key" in query.replace("\n", " ")
+    assert frozenset({id_param, "tenant_id"}) == module.BATCH_REQUIRED_PARAMS
+
+
+@pytest.mark.skipif(not os.environ.get("NEO4J_URI"), reason="requires a live Neo4j")
+def test_live_batched_reads_match_per_claim_reads() -> None:
+    from idis.persistence.neo4j_driver import execute_write
+
+    tenant_id = str(uuid.uuid4())
+    repo = GraphRepository()
+    repo.upsert_deal_graph_projection(
+        tenant_id=tenant_id,
+        deal_id="deal-1",
+        documents=[{"document_id": "doc-1"}],
+        spans=[{"span_id": f"span-{i}", "document_id": "doc-1"} for i in range(3)],
+    )
+    claim_ids = [f"claim-{i}" for i in range(3)]
+    for i, claim_id in enumerate(claim_ids):
+        repo.upsert_claim_sanad_projection(
+            tenant_id=tenant_id,
+            claim={"claim_id": claim_id},
+            evidence_items=[
+                {"evidence_id": f"{claim_id}-ev-{j}", "source_grade": "ABCD"[j], "source_system": s}
+                for j, s in enumerate(["crm", "bank", "crm"][: i + 1])
+            ],
+            transmission_nodes=[
+                {
+                    "node_id": f"{claim_id}-tn",
+                    "timestamp": "2026-01-01T00:00:00Z",
+                    "input_refs": [{"type": "span", "id": f"span-{i}"}]
+                    + [{"type": "evidence", "id": f"{claim_id}-ev-{j}"} for j in range(i + 1)],
+                }
+            ],
+            defects=[{"defect_id": "def-1"}] if i else [],
+        )
+    try:
+        per_claim = _PerClaimRepository(repo)
+        for method in ("get_claim_sanad_chain", "get_independence_clusters", "get_weakest_link"):
+            batched = getattr(repo, f"{method}_batch")(tenant_id=tenant_id, claim_ids=claim_ids)
+            for claim_id in claim_ids:
+                single = getattr(per_claim, method)(tenant_id=tenant_id, claim_id=claim_id)
+                assert batched[claim_id] == single, (method, claim_id)
+        impact = repo.get_defect_impact_batch(tenant_id=tenant_id, defect_ids=["def-1"])
+        assert impact["def-1"] == repo.get_defect_impact(tenant_id=tenant_id, defect_id="def-1")
+    finally:
+        execute_write("MATCH (n {tenant_id: $tenant_id}) DETACH DELETE n", {"tenant_id": tenant_id})
@@ -0,0 +1,184 @@
+"""Secondary indexes behind the in-memory claims/sanads/defects/evidence twins.
+
+1. Cursor pagination over the (tenant, deal) and (tenant, claim) indexes returns exactly the
+   pages a full scan + sort would, across many deals and tenants.
+2. Indexes stay consistent on create, update, delete, direct store writes, ``|=``, pop,
+   popitem and clear.
+3. Insertion-order lookups (evidence by claim, sanad by claim) keep full-scan order.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from idis.persistence.repositories.claims import (
+    InMemoryClaimsRepository,
+    InMemoryDefectsRepository,
+    InMemoryEvidenceRepository,
+    InMemorySanadsRepository,
+    _claims_in_memory_store,
+    _defects_in_memory_store,
+    clear_all_claims_stores,
+    seed_claim_in_memory,
+)
+
+TENANT_A = "a0000000-0000-0000-0000-000000000001"
+TENANT_B = "b0000000-0000-0000-0000-000000000002"
+
+
+@pytest.fixture(autouse=True)
+def _clean_stores() -> Any:
+    clear_all_claims_stores()
+    yield
+    clear_all_claims_stores()
+
+
+def _scan_pages(records: list[dict[str, Any]], id_field: str, limit: int) -> list[list[str]]:
+    ids = sorted(r[id_field] for r in records)
+    return [ids[i : i + limit] for i in range(0, len(ids), limit)] or [[]]
+
+
+def _walk(list_page: Any, id_field: str, limit: int) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        items, cursor = list_page(limit=limit, cursor=cursor)
+        pages.append([item[id_field] for item in items])
+        if cursor is None:
+            return pages
+
+
+def test_pages_match_full_scan_across_deals_and_tenants() -> None:
+    rng = random.Random(3)
+    repos = {t: InMemoryClaimsRepository(t) for t in (TENANT_A, TENANT_B)}
+    defects = {t: InMemoryDefectsRepository(t) for t in (TENANT_A, TENANT_B)}
+    for i in range(2_000):
+        tenant = rng.choice([TENANT_A, TENANT_B])
+        deal_id = f"deal-{rng.randrange(40)}"
+        claim_id = f"claim-{rng.randrange(10**9):09d}-{i}"
+        repos[tenant].create(
+            claim_id=claim_id, deal_id=deal_id, claim_class="FINANCIAL", claim_text="x"
+        )
+        defects[tenant].create(
+            defect_id=f"defect-{rng.randrange(10**9):09d}-{i}",
+            claim_id=f"claim-{i % 7}",
+            deal_id=deal_id,
+            defect_type="STALENESS",
+            severity="MINOR",
+            description="d",
+            cure_protocol="REQUEST_SOURCE",
+        )
+
+    all_claims = list(_claims_in_memory_store.values())
+    all_defects = list(_defects_in_memory_store.values())
+    for tenant in (TENANT_A, TENANT_B):
+        for deal_id in ("deal-0", "deal-17", "deal-missing"):
+            for limit in (1, 7, 200):
+                expected = [
+                    c for c in all_claims if c["tenant_id"] == tenant and c["deal_id"] == deal_id
+                ]
+                listed = _walk(
+                    lambda d=deal_id, r=repos[tenant], **kw: r.list_by_deal(d, **kw),
+                    "claim_id",
+                    limit,
+                )
+                assert listed == _scan_pages(expected, "claim_id", limit)
+
+        expected_defects = [
+            d for d in all_defects if d["tenant_id"] == tenant and d["claim_id"] == "claim-3"
+        ]
+        listed = _walk(
+            lambda r=defects[tenant], **kw: r.list_by_claim("claim-3", **kw), "defect_id", 50
+        )
+        assert listed == _scan_pages(expected_defects, "defect_id", 50)
+        batched = defects[tenant].list_by_claims(["claim-3"])["claim-3"]
+        assert [d["defect_id"] for d in batched] == listed[0]
+
+
+def test_cursor_between_ids_and_limit_clamping() -> None:
+    repo = InMemoryClaimsRepository(TENANT_A)
+    for claim_id in ("c-1", "c-3", "c-5"):
+        repo.create(claim_id=claim_id, deal_id="deal-1", claim_class="FINANCIAL", claim_text="x")
+
+    items, cursor = repo.list_by_deal("deal-1", limit=1, cursor="c-2")
+    assert [c["claim_id"] for c in items] == ["c-3"] and cursor == "c-3"
+    items, cursor = repo.list_by_deal("deal-1", limit=0, cursor="c-3")
+    assert [c["claim_id"] for c in items] == ["c-5"] and cursor is None
+    assert repo.list_by_deal("deal-1", cursor="c-9") == ([], None)
+
+
+def test_indexes_follow_every_store_mutation() -> None:
+    repo = InMemoryClaimsRepository(TENANT_A)
+    for i in range(4):
+        repo.create(claim_id=f"c-{i}", deal_id="deal-1", claim_class="FINANCIAL", claim_text="x")
+
+    assert repo.delete("c-1")
+    moved = dict(_claims_in_memory_store["c-2"], deal_id="deal-2")
+    _claims_in_memory_store["c-2"] = moved  # whole-record replace, as ClaimService.update does
+    _claims_in_memory_store.pop("c-3")
+    seed_claim_in_memory(
+        {"claim_id": "c-9", "tenant_id": TENANT_A, "deal_id": "deal-1", "claim_text": "seeded"}
+    )
+
+    assert [c["claim_id"] for c in repo.list_by_deal("deal-1")[0]] == ["c-0", "c-9"]
+    assert repo.list_by_deal("deal-2")[0] == [moved]
+    assert InMemoryClaimsRepository(TENANT_B).list_by_deal("deal-1") == ([], None)
+
+    _claims_in_memory_store.clear()
+    assert repo.list_by_deal("deal-1") == ([], None)
+
+
+def test_dict_contract_for_in_place_union_and_popitem() -> None:
+    repo = InMemoryClaimsRepository(TENANT_A)
+    repo.create(claim_id="c-0", deal_id="deal-1", claim_class="FINANCIAL", claim_text="x")
+
+    store = _claims_in_memory_store
+    store |= {"c-5": {"claim_id": "c-5", "tenant_id": TENANT_A, "deal_id": "deal-1"}}
+    assert store is _claims_in_memory_store
+    assert [c["claim_id"] for c in repo.list_by_deal("deal-1")[0]] == ["c-0", "c-5"]
+
+    assert store.popitem()[0] == "c-5"
+    assert store.popitem()[0] == "c-0"
+    assert repo.list_by_deal("deal-1") == ([], None)
+    with pytest.raises(KeyError):
+        store.popitem()
+
+
+def test_insertion_order_lookups_match_scan_order() -> None:
+    evidence = InMemoryEvidenceRepository(TENANT_A)
+    for evidence_id in ("ev-z", "ev-a", "ev-m"):
+        evidence.create(
+            evidence_id=evidence_id,
+            tenant_id=TENANT_A,
+            deal_id="deal-1",
+            claim_id="claim-1",
+            source_span_id="span-1",
+        )
+    evidence.create(
+        evidence_id="ev-other",
+        tenant_id=TENANT_B,
+        deal_id="deal-1",
+        claim_id="claim-1",
+        source_span_id="span-1",
+    )
+    evidence.create(  # overwrite keeps the original position, like a dict
+        evidence_id="ev-z",
+        tenant_id=TENANT_A,
+        deal_id="deal-1",
+        claim_id="claim-1",
+        source_span_id="span-2",
+    )
+
+    assert [e["evidence_id"] for e in evidence.get_by_claim("claim-1")] == ["ev-z", "ev-a", "ev-m"]
+    assert evidence.get_by_claims(["claim-1", "claim-x"])["claim-x"] == []
+
+    sanads = InMemorySanadsRepository(TENANT_A)
+    for sanad_id in ("s-2", "s-1"):
+        sanads.create(
+            sanad_id=sanad_id, claim_id="claim-1", deal_id="deal-1", primary_evidence_id="ev-a"
+        )
+    sanad = sanads.get_by_claim("claim-1")
+    assert sanad is not None and sanad["sanad_id"] == "s-2"
+    assert [s["sanad_id"] for s in sanads.list_by_deal("deal-1")[0]] == ["s-1", "s-2"]
@@ -0,0 +1,121 @@
+"""Latency histograms in the in-process metrics registry.
+
+1. Histograms use registered (or default) buckets with inclusive upper bounds, reject invalid
+   or conflicting bucket declarations, and render cumulative ``_bucket`` series plus ``_sum``
+   and ``_count`` in the Prometheus exposition format.
+2. Concurrent observations are never lost.
+3. Run steps and document parsing record their wall time by step name / document format.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from typing import Any
+
+import pytest
+
+from idis.audit.sink import InMemoryAuditSink
+from idis.observability.metrics import (
+    PARSER_DURATION_SECONDS,
+    RUN_STEP_DURATION_SECONDS,
+    get_histogram,
+    observe_histogram,
+    register_histogram,
+    render_prometheus_text,
+    reset_metrics,
+)
+from idis.parsers.registry import parse_bytes
+from idis.persistence.repositories.run_steps import (
+    InMemoryRunStepsRepository,
+    clear_run_steps_store,
+)
+from idis.services.runs.orchestrator import RunContext, RunOrchestrator
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+
+
+@pytest.fixture(autouse=True)
+def _clean_metrics() -> Any:
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_buckets_are_inclusive_and_cumulative() -> None:
+    register_histogram("test_latency_seconds", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 1.0, 7.0):
+        observe_histogram("test_latency_seconds", value, labels={"route": "/x"})
+
+    snapshot = get_histogram("test_latency_seconds", labels={"route": "/x"})
+    assert snapshot.buckets == ((0.1, 2), (1.0, 4), (float("inf"), 5))
+    assert (snapshot.count, snapshot.sum) == (5, pytest.approx(8.65))
+    assert get_histogram("test_latency_seconds", labels={"route": "/y"}).count == 0
+
+    lines = render_prometheus_text().splitlines()
+    assert lines == [
+        "# TYPE test_latency_seconds histogram",
+        'test_latency_seconds_bucket{route="/x",le="0.1"} 2',
+        'test_latency_seconds_bucket{route="/x",le="1.0"} 4',
+        'test_latency_seconds_bucket{route="/x",le="+Inf"} 5',
+        f'test_latency_seconds_sum{{route="/x"}} {snapshot.sum!r}',
+        'test_latency_seconds_count{route="/x"} 5',
+    ]
+
+
+def test_invalid_or_conflicting_buckets_are_rejected() -> None:
+    register_histogram("test_conflict_seconds", buckets=(1.0, 2.0))
+    register_histogram("test_conflict_seconds", buckets=(1, 2))  # idempotent
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_histogram("test_conflict_seconds", buckets=(1.0, 5.0))
+    with pytest.raises(ValueError, match="strictly increasing"):
+        register_histogram("test_unsorted_seconds", buckets=(2.0, 1.0))
+    with pytest.raises(ValueError, match="finite"):
+        register_histogram("test_infinite_seconds", buckets=(1.0, float("inf")))
+
+
+def test_concurrent_observations_are_not_lost() -> None:
+    def worker() -> None:
+        for i in range(2_000):
+            observe_histogram("test_concurrent_seconds", i % 3 * 0.01, labels={"k": "v"})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_histogram("test_concurrent_seconds", labels={"k": "v"}).count == 16_000
+
+
+def test_run_steps_and_parsers_record_durations() -> None:
+    clear_run_steps_store()
+    orchestrator = RunOrchestrator(
+        audit_sink=InMemoryAuditSink(), run_steps_repo=InMemoryRunStepsRepository(TENANT_ID)
+    )
+    ctx = RunContext(
+        run_id=str(uuid.uuid4()),
+        tenant_id=TENANT_ID,
+        deal_id=str(uuid.uuid4()),
+        mode="SNAPSHOT",
+        documents=[],
+        extract_fn=lambda **_: {},
+        grade_fn=lambda **_: {},
+    )
+    assert orchestrator.execute(ctx).status == "FAILED"
+
+    failed = get_histogram(
+        RUN_STEP_DURATION_SECONDS, labels={"step": "INGEST_CHECK", "outcome": "failed"}
+    )
+    completed = get_histogram(
+        RUN_STEP_DURATION_SECONDS,
+        labels={"step": "DATA_ROOM_INVENTORY_PACKAGE", "outcome": "completed"},
+    )
+    assert (failed.count, completed.count) == (1, 1)
+
+    parse_bytes(b"Revenue grew 20%.", filename="memo.txt")
+    parse_bytes(b"")
+    for doc_type, outcome in [("TEXT", "ok"), ("UNKNOWN", "error")]:
+        labels = {"format": doc_type, "outcome": outcome}
+        assert get_histogram(PARSER_DURATION_SECONDS, labels=labels).count == 1
@@ -0,0 +1,194 @@
+"""Batched (UNWIND) Neo4j projection writes in GraphRepository.
+
+1. One session per projection; each node/edge family is one UNWIND statement split into write
+   transactions of at most batch_size rows (no per-node round-trips).
+2. Tenant isolation is still enforced at the driver: tenant_id is required and every statement
+   must read its rows from $rows.
+3. Row content matches the previous per-node parameters (INPUT edges grouped by ref type,
+   unknown ref types skipped).
+4. Batch size comes from IDIS_NEO4J_WRITE_BATCH_SIZE; bad values and write errors fail closed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from idis.persistence import neo4j_driver
+from idis.persistence.graph_repo import GraphProjectionError, GraphRepository
+from idis.persistence.neo4j_driver import (
+    DEFAULT_WRITE_BATCH_SIZE,
+    Neo4jConfigError,
+    execute_write_unwind,
+    get_write_batch_size,
+)
+
+TENANT_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class _FakeResult:
+    def consume(self) -> None:
+        return None
+
+
+class _FakeTx:
+    def __init__(self, session: _FakeSession) -> None:
+        self._session = session
+
+    def run(self, query: str, parameters: dict[str, Any]) -> _FakeResult:
+        if self._session.fail_on and self._session.fail_on in query:
+            raise RuntimeError("write failed")
+        self._session.runs.append((query, parameters))
+        return _FakeResult()
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.runs: list[tuple[str, dict[str, Any]]] = []
+        self.transactions = 0
+        self.fail_on: str | None = None
+
+    def __enter__(self) -> _FakeSession:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute_write(self, fn: Any, *args: Any) -> Any:
+        self.transactions += 1
+        return fn(_FakeTx(self), *args)
+
+
+@pytest.fixture
+def sessions(monkeypatch: pytest.MonkeyPatch) -> list[_FakeSession]:
+    opened: list[_FakeSession] = []
+
+    def fake_get_session(*, database: str = "neo4j") -> _FakeSession:
+        opened.append(_FakeSession())
+        return opened[-1]
+
+    monkeypatch.setattr(neo4j_driver, "get_session", fake_get_session)
+    return opened
+
+
+def _rows_for(session: _FakeSession, marker: str) -> list[dict[str, Any]]:
+    return [row for query, params in session.runs if marker in query for row in params["rows"]]
+
+
+def test_deal_projection_batches_rows_into_few_transactions(
+    sessions: list[_FakeSession],
+) -> None:
+    documents = [{"document_id": f"doc-{i}", "doc_type": "PDF"} for i in range(3)]
+    spans = [
+        {"span_id": f"span-{i}", "document_id": f"doc-{i % 3}", "span_type": "PAGE"}
+        for i in range(2500)
+    ]
+    entities = [{"entity_id": "e-1", "name": "Acme", "type": "ORG", "span_ids": ["span-1"]}]
+
+    GraphRepository(batch_size=1000).upsert_deal_graph_projection(
+        tenant_id=TENANT_ID, deal_id="deal-1", documents=documents, spans=spans, entities=entities
+    )
+
+    assert len(sessions) == 1
+    session = sessions[0]
+    # deal 1 + documents 1 + spans 3 (1000/1000/500) + entities 1 + mentions 1
+    assert session.transactions == 7
+    assert all(params["tenant_id"] == TENANT_ID for _, params in session.runs)
+    assert all(len(params["rows"]) <= 1000 for _, params in session.runs)
+    assert [r["span_id"] for r in _rows_for(session, ":HAS_SPAN")] == [s["span_id"] for s in spans]
+    assert _rows_for(session, ":MENTIONED_IN") == [{"entity_id": "e-1", "span_id": "span-1"}]
+
+
+def test_claim_projection_groups_input_edges_by_ref_type(sessions: list[_FakeSession]) -> None:
+    transmission_nodes = [
+        {
+            "node_id": "tn-1",
+            "timestamp": "2026-01-01T00:00:00Z",
+            "input_refs": [
+                {"type": "span", "id": "span-1"},
+                {"type": "evidence", "id": "ev-1"},
+                {"type": "unknown", "id": "x"},
+            ],
+        },
+        {"node_id": "tn-2", "input_refs": [{"type": "evidence", "id": "ev-2"}]},
+    ]
+
+    GraphRepository().upsert_claim_sanad_projection(
+        tenant_id=TENANT_ID,
+        claim={"claim_id": "claim-1", "claim_text": "ARR is $5M"},
+        evidence_items=[{"evidence_id": "ev-1"}, {"evidence_id": "ev-2"}],
+        transmission_nodes=transmission_nodes,
+        defects=[{"defect_id": "d-1", "defect_type": "INCONSISTENCY"}],
+    )
+
+    session = sessions[0]
+    assert {params["claim_id"] for _, params in session.runs} == {"claim-1"}
+    input_queries = [(q, p["rows"]) for q, p in session.runs if ":INPUT" in q]
+    assert [(":Span" in q, rows) for q, rows in input_queries] == [
+        (True, [{"node_id": "tn-1", "ref_id": "span-1"}]),
+        (
+            False,
+            [{"node_id": "tn-1", "ref_id": "ev-1"}, {"node_id": "tn-2", "ref_id": "ev-2"}],
+        ),
+    ]
+    assert _rows_for(session, ":HAS_SANAD_STEP") == [
+        {"node_id": "tn-1", "timestamp": "2026-01-01T00:00:00Z"},
+        {"node_id": "tn-2", "timestamp": ""},
+    ]
+    assert _rows_for(session, ":HAS_DEFECT") == [
+        {"defect_id": "d-1", "defect_type": "INCONSISTENCY", "severity": "MINOR"}
+    ]
+    assert not _rows_for(session, ":DERIVED_FROM"), "empty families issue no transaction"
+
+
+def test_execute_write_unwind_enforces_tenant_and_rows(sessions: list[_FakeSession]) -> None:
+    with pytest.raises(ValueError, match="tenant_id"):
+        execute_write_unwind([("UNWIND $rows AS row RETURN row", [{}])], {})
+    with pytest.raises(ValueError, match="UNWIND"):
+        execute_write_unwind([("MATCH (n) RETURN n", [{}])], {"tenant_id": TENANT_ID})
+    with pytest.raises(ValueError, match="reserved"):
+        execute_write_unwind([], {"tenant_id": TENANT_ID, "rows": []})
+    assert not sessions
+
+
+def test_batch_size_env(monkeypatch: pytest.MonkeyPatch, sessions: list[_FakeSession]) -> None:
+    monkeypatch.delenv("IDIS_NEO4J_WRITE_BATCH_SIZE", raising=False)
+    assert get_write_batch_size() == DEFAULT_WRITE_BATCH_SIZE
+    monkeypatch.setenv("IDIS_NEO4J_WRITE_BATCH_SIZE", "2")
+    GraphRepository().upsert_deal_graph_projection(
+        tenant_id=TENANT_ID,
+        deal_id="deal-1",
+        documents=[{"document_id": f"doc-{i}"} for i in range(5)],
+        spans=[],
+    )
+    assert sessions[0].transactions == 1 + 3
+
+    monkeypatch.setenv("IDIS_NEO4J_WRITE_BATCH_SIZE", "0")
+    with pytest.raises(Neo4jConfigError):
+        get_write_batch_size()
+    with pytest.raises(GraphProjectionError, match="deal-1"):
+        GraphRepository().upsert_deal_graph_projection(
+            tenant_id=TENANT_ID, deal_id="deal-1", documents=[], spans=[]
+        )
+
+
+def test_failed_batch_raises_projection_error(
+    monkeypatch: pytest.MonkeyPatch, sessions: list[_FakeSession]
+) -> None:
+    original = neo4j_driver.get_session
+
+    def failing_session(*, database: str = "neo4j") -> Any:
+        session = original(database=database)
+        session.fail_on = ":SUPPORTED_BY"
+        return session
+
+    monkeypatch.setattr(neo4j_driver, "get_session", failing_session)
+
+    with pytest.raises(GraphProjectionError, match="claim-1"):
+        GraphRepository().upsert_claim_sanad_projection(
+            tenant_id=TENANT_ID,
+            claim={"claim_id": "claim-1"},
+            evidence_items=[{"evidence_id": "ev-1"}],
+            transmission_nodes=[],
+        )
@@ -0,0 +1,155 @@
+"""Literal-gated No-Free-Facts pattern matching.
+
+1. Findings are unchanged: factual assertions, semantic matches and the merged result equal
+   the ungated pattern loops over every distinct GDBS deal prose string and over seeded
+   synthetic memo text, including case-folding edge characters (dotted capital I, dotless i,
+   long s, Kelvin).
+2. Gates are derived from the patterns themselves and skip patterns whose literals are absent.
+3. Without the regex parser every pattern runs ungated.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from idis.validators import no_free_facts
+from idis.validators.no_free_facts import (
+    FACTUAL_REGEXES,
+    SEMANTIC_RULES,
+    FactualAssertion,
+    NoFreeFactsValidator,
+    SemanticMatch,
+    _literal_gate,
+)
+
+GDBS_DEALS = Path(__file__).parent.parent / "datasets" / "gdbs_full" / "deals"
+
+_VOCABULARY = (
+    "The company startup we they revenue ARR MRR sales grew increased reached exceeded "
+    "$5M 12% 3x growth percent TAM SAM market size of users customers DAU MAU in by since "
+    "as of 2024 FY24 Q3 the fact is known established raised funding Series B valuation "
+    "team headcount consists product launched on competitor holds CEO formerly churn is "
+    "retention stands at LTV CAC equals multiple pre-money €4,000 margin gross 1,200 "
+    "ſales gross margin ıs KPI İn unrelated narrative words about strategy mar\u212aet."
+)
+
+
+# Texts whose only match needs IGNORECASE to equate a non-ASCII letter with an ASCII one.
+_FOLDING_EDGE_TEXTS = (
+    "Operations began SİNCE 2020.",
+    "Revenue ıs $5M as of 2024.",
+    "Gross margin reached 40% in FY24 after ſales grew.",
+    "The mar\u212aet size is $2B.",
+)
+
+
+def _ungated_factual(text: str) -> list[FactualAssertion]:
+    assertions: list[FactualAssertion] = []
+    seen: set[tuple[int, int]] = set()
+    for regex in FACTUAL_REGEXES:
+        for match in regex.finditer(text):
+            if (match.start(), match.end()) not in seen:
+                seen.add((match.start(), match.end()))
+                assertions.append(FactualAssertion(match.group(), match.start(), regex.pattern))
+    return sorted(assertions, key=lambda a: a.position)
+
+
+def _ungated_semantic(text: str) -> list[SemanticMatch]:
+    matches: list[SemanticMatch] = []
+    seen: set[int] = set()
+    for subj_pattern, pred_pattern, rule_name in SEMANTIC_RULES:
+        for subj_match in subj_pattern.finditer(text):
+            pred_match = pred_pattern.search(text[subj_match.end() : subj_match.end() + 100])
+            if pred_match and subj_match.start() not in seen:
+                seen.add(subj_match.start())
+                matches.append(
+                    SemanticMatch(
+                        subj_match.group(), pred_match.group(), rule_name, subj_match.start()
+                    )
+                )
+    return sorted(matches, key=lambda m: m.position)
+
+
+def _strings(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [s for item in value.values() for s in _strings(item)]
+    if isinstance(value, list):
+        return [s for item in value for s in _strings(item)]
+    return []
+
+
+def _corpus() -> list[str]:
+    deal_files = sorted(GDBS_DEALS.glob("*/*.json"))
+    strings = {s for path in deal_files for s in _strings(json.loads(path.read_text("utf-8")))}
+    texts = sorted(s for s in strings if " " in s)
+    rng = random.Random(41)
+    words = _VOCABULARY.split()
+    texts += [" ".join(rng.choice(words) for _ in range(rng.randrange(1, 120))) for _ in range(400)]
+    return [*texts, *_FOLDING_EDGE_TEXTS]
+
+
+def test_gated_findings_match_ungated_loops() -> None:
+    validator = NoFreeFactsValidator()
+    corpus = _corpus()
+    assert len(corpus) > 1_000
+    findings = 0
+    for text in corpus:
+        factual = _ungated_factual(text)
+        semantic = _ungated_semantic(text)
+        assert validator._extract_factual_assertions(text) == factual, text
+        assert validator._extract_semantic_matches(text) == semantic, text
+        merged = validator._looks_like_fact(text)
+        factual_positions = {a.position for a in factual}
+        assert [a.position for a in merged] == sorted(
+            [a.position for a in factual]
+            + [m.position for m in semantic if m.position not in factual_positions]
+        )
+        findings += len(merged)
+    assert findings > 1_000
+
+
+def test_gates_derive_from_patterns_and_skip_absent_literals(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert _literal_gate(r"(?:the\s+)?fact\s+(?:is|that)") == ("fact",)
+    assert _literal_gate(r"€[\d,]+") == ("€",)
+    assert _literal_gate(r"\b(?:competitor|competition)\b") == ("competit",)
+    assert _literal_gate(r"\d+(?:\.\d+)?") is None
+
+    ran: list[str] = []
+    original = no_free_facts._may_match
+
+    def recording(pattern: Any, folded: str) -> bool:
+        result = original(pattern, folded)
+        if result:
+            ran.append(pattern.pattern)
+        return result
+
+    monkeypatch.setattr(no_free_facts, "_may_match", recording)
+    assert NoFreeFactsValidator()._looks_like_fact("A note on culture in general.") == []
+    assert ran == [FACTUAL_REGEXES[12].pattern]
+
+
+def test_dotted_capital_i_does_not_hide_a_gated_match() -> None:
+    text = "Operations began SİNCE 2020."
+
+    assert [a.text for a in _ungated_factual(text)] == ["SİNCE 2020"]
+    assert NoFreeFactsValidator()._extract_factual_assertions(text) == _ungated_factual(text)
+
+
+def test_missing_regex_parser_runs_every_pattern(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(no_free_facts, "_re_parser", None)
+    _literal_gate.cache_clear()
+    try:
+        assert _literal_gate(r"(?:the\s+)?fact\s+(?:is|that)") is None
+        text = "The fact is revenue reached $5M since 2021."
+        assert NoFreeFactsValidator()._extract_factual_assertions(text) == _ungated_factual(text)
+    finally:
+        _literal_gate.cache_clear()
@@ -5,6 +5,7 @@ Per v6.3 requirements:
 - Tenant isolation: Put for tenant A cannot be fetched using tenant B
 - Versioning: Different payloads produce distinct version_ids; default get() returns latest
 - Path traversal prevention: Keys like "../x", "..\\x", "/abs" are rejected
+- Streaming: chunked reads; streamed writes hash incrementally and never leave partial versions
 - OTel spans: With tracing enabled, verify spans are captured with safe attributes
 """
 
@@ -506,6 +507,144 @@ class TestErrorHandling:
             store.put("not-a-uuid", "key.txt", b"data")
 
 
+class TestStreaming:
+    """Tests for chunked get_stream reads."""
+
+    def test_get_stream_reads_whole_object_in_bounded_chunks(
+        self, store: Any, tenant_a: str
+    ) -> None:
+        """Streaming the whole object yields its bytes in chunks no larger than the read size."""
+        from idis.storage.object_store import STREAM_CHUNK_BYTES
+
+        data = os.urandom(STREAM_CHUNK_BYTES * 2 + 123)
+        stored = store.put(tenant_a, "big/bundle.zip", data)
+
+        stream = store.get_stream(tenant_a, "big/bundle.zip")
+        chunks = list(stream.chunks)
+
+        assert stream.metadata == stored
+        assert (stream.start, stream.end, stream.content_length) == (0, len(data) - 1, len(data))
+        assert [len(c) for c in chunks] == [STREAM_CHUNK_BYTES, STREAM_CHUNK_BYTES, 123]
+        assert b"".join(chunks) == data
+
+    def test_get_stream_byte_range_and_version(self, store: Any, tenant_a: str) -> None:
+        """A byte range of a pinned version returns exactly those bytes."""
+        first = store.put(tenant_a, "doc.pdf", b"0123456789")
+        store.put(tenant_a, "doc.pdf", b"abcdefghij")
+
+        stream = store.get_stream(
+            tenant_a, "doc.pdf", version_id=first.version_id, byte_range=(2, 5)
+        )
+
+        assert b"".join(stream.chunks) == b"2345"
+        assert stream.content_length == 4
+        empty = store.put(tenant_a, "empty.bin", b"")
+        assert list(store.get_stream(tenant_a, "empty.bin").chunks) == []
+        assert empty.size_bytes == 0
+
+    @pytest.mark.parametrize("byte_range", [(-1, 3), (5, 4), (0, 10)])
+    def test_get_stream_rejects_ranges_outside_object(
+        self, store: Any, tenant_a: str, byte_range: tuple[int, int]
+    ) -> None:
+        """Ranges that are reversed or extend past the object are rejected before reading."""
+        store.put(tenant_a, "doc.pdf", b"0123456789")
+
+        with pytest.raises(ValueError, match="byte_range"):
+            store.get_stream(tenant_a, "doc.pdf", byte_range=byte_range)
+
+    def test_get_stream_missing_object_raises_not_found(self, store: Any, tenant_a: str) -> None:
+        """Missing objects fail when the stream is opened, not mid-iteration."""
+        from idis.storage.errors import ObjectNotFoundError
+
+        with pytest.raises(ObjectNotFoundError):
+            store.get_stream(tenant_a, "absent.pdf")
+
+
+class TestStreamingWrites:
+    """Tests for chunked put_stream writes."""
+
+    def test_put_stream_from_chunks_and_file_matches_put(
+        self, store: Any, tenant_a: str, temp_storage_dir: Path
+    ) -> None:
+        """Iterable and file-object sources store the same bytes and sha256 as put()."""
+        from idis.storage.object_store import STREAM_CHUNK_BYTES
+
+        data = os.urandom(STREAM_CHUNK_BYTES * 3 + 7)
+        chunks = [data[i : i + 10_000] for i in range(0, len(data), 10_000)]
+
+        from_chunks = store.put_stream(tenant_a, "a.bin", iter(chunks), content_type="x/y")
+        source_file = temp_storage_dir / "source.bin"
+        source_file.write_bytes(data)
+        with source_file.open("rb") as handle:
+            from_file = store.put_stream(tenant_a, "b.bin", handle, max_bytes=len(data))
+
+        for metadata, key in ((from_chunks, "a.bin"), (from_file, "b.bin")):
+            assert metadata.sha256 == hashlib.sha256(data).hexdigest()
+            assert metadata.size_bytes == len(data)
+            assert store.get(tenant_a, key).body == data
+        assert from_chunks.content_type == "x/y"
+        assert list(temp_storage_dir.rglob("*.tmp")) == []
+
+    def test_put_stream_memory_stays_flat(self, store: Any, tenant_a: str) -> None:
+        """Peak allocation is bounded by the chunk size, not the object size."""
+        import tracemalloc
+
+        from idis.storage.object_store import STREAM_CHUNK_BYTES
+
+        chunk = b"x" * STREAM_CHUNK_BYTES
+        tracemalloc.start()
+        try:
+            metadata = store.put_stream(tenant_a, "large.bin", (chunk for _ in range(256)))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert metadata.size_bytes == STREAM_CHUNK_BYTES * 256
+        assert peak < STREAM_CHUNK_BYTES * 8
+
+    def test_put_stream_over_limit_leaves_no_version(
+        self, store: Any, tenant_a: str, temp_storage_dir: Path
+    ) -> None:
+        """Crossing max_bytes aborts mid-stream and keeps the previous latest."""
+        from idis.storage.errors import ObjectTooLargeError
+
+        previous = store.put(tenant_a, "doc.pdf", b"v1")
+        consumed: list[int] = []
+
+        def source() -> Any:
+            for i in range(10):
+                consumed.append(i)
+                yield b"y" * 100
+
+        with pytest.raises(ObjectTooLargeError) as excinfo:
+            store.put_stream(tenant_a, "doc.pdf", source(), max_bytes=250)
+
+        assert excinfo.value.max_bytes == 250
+        assert consumed == [0, 1, 2]
+        assert store.list_versions(tenant_a, "doc.pdf") == [previous]
+        assert store.get(tenant_a, "doc.pdf").body == b"v1"
+        assert list(temp_storage_dir.rglob("*.tmp")) == []
+
+    def test_put_stream_interrupted_source_leaves_no_partial_version(
+        self, store: Any, tenant_a: str, temp_storage_dir: Path
+    ) -> None:
+        """A source failing mid-stream removes the temp file; no version becomes visible."""
+        previous = store.put(tenant_a, "doc.pdf", b"v1")
+
+        def source() -> Any:
+            yield b"partial" * 1000
+            raise RuntimeError("upload aborted")
+
+        with pytest.raises(RuntimeError, match="upload aborted"):
+            store.put_stream(tenant_a, "doc.pdf", source())
+
+        obj_files = sorted(p.name for p in temp_storage_dir.rglob("*") if p.is_file())
+        assert obj_files == sorted(
+            ["_latest", f"{previous.version_id}.data", f"{previous.version_id}.meta.json"]
+        )
+        assert store.head(tenant_a, "doc.pdf") == previous
+
+
 class TestBackendProperties:
     """Tests for backend-specific properties."""
 
@@ -5,19 +5,30 @@ Tests cover:
 - Correct dispatch to PDF/XLSX/DOCX/PPTX parsers
 - Fail-closed behavior for unknown formats
 - Never raises exceptions on malformed input
+- Parsers are imported lazily on first use, with a warm-up hook
 """
 
 from __future__ import annotations
 
 import io
+import json
+import subprocess
+import sys
 
 import pytest
 from docx import Document
 from pptx import Presentation
 from pptx.util import Inches
 
+from idis.parsers import registry
 from idis.parsers.base import ParseErrorCode
-from idis.parsers.registry import detect_format, parse_bytes
+from idis.parsers.registry import (
+    PARSER_IMPORT_PATHS,
+    detect_format,
+    load_parser,
+    parse_bytes,
+    warm_parsers,
+)
 
 try:
     from openpyxl import Workbook
@@ -368,3 +379,66 @@ class TestRegistryIntegration:
             if span.span_type == "PARAGRAPH":
                 assert "shape" in span.locator
                 assert "paragraph" in span.locator
+
+
+class TestLazyParserLoading:
+    """Parsers and their heavy dependencies load on first use, not with the registry."""
+
+    def test_registry_import_defers_heavy_parser_dependencies(self) -> None:
+        """A fresh interpreter imports no parser dependency until that format is parsed."""
+        code = """
+import json, sys
+import idis.parsers, idis.parsers.registry
+from idis.parsers.registry import loaded_parser_formats, parse_bytes
+heavy = ("pypdf", "openpyxl", "docx", "pptx")
+before = [m for m in heavy if m in sys.modules]
+result = parse_bytes(b"plain notes", filename="notes.txt")
+after_text = [m for m in heavy if m in sys.modules]
+from idis.parsers import parse_docx
+print(json.dumps({
+    "before": before,
+    "after_text": after_text,
+    "text_ok": result.success,
+    "loaded": list(loaded_parser_formats()),
+    "docx_loaded": "docx" in sys.modules,
+}))
+"""
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        report = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert report == {
+            "before": [],
+            "after_text": [],
+            "text_ok": True,
+            "loaded": ["HTML_TEXT"],
+            "docx_loaded": True,
+        }
+
+    def test_warm_parsers_loads_and_caches(self) -> None:
+        """Warm-up imports the requested families; later lookups reuse the cached parser."""
+        from idis.parsers.docx import parse_docx
+
+        assert "DOCX" in warm_parsers(["DOCX"])
+        assert load_parser("DOCX") is parse_docx
+        assert set(warm_parsers()) == set(PARSER_IMPORT_PATHS)
+
+        with pytest.raises(ValueError, match="Unknown parser formats"):
+            warm_parsers(["PDF", "RTF"])
+
+    def test_unimportable_parser_is_captured_in_result(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A parser whose module fails to import yields INTERNAL_ERROR instead of raising."""
+
+        def unavailable(parser_format: str) -> None:
+            raise ImportError("No module named 'pypdf'", name="pypdf")
+
+        monkeypatch.setattr(registry, "load_parser", unavailable)
+
+        result = parse_bytes(b"%PDF-1.4 truncated", filename="deck.pdf")
+
+        assert result.success is False
+        assert result.errors[0].code == ParseErrorCode.INTERNAL_ERROR
+        assert result.errors[0].details["module"] == "pypdf"
@@ -7,7 +7,11 @@ from unittest.mock import MagicMock, patch
 
 from idis.audit.sink import InMemoryAuditSink
 from idis.persistence.repositories.run_steps import InMemoryRunStepsRepository
-from idis.pipeline.worker import PipelineWorker, _default_run_context_factory
+from idis.pipeline.worker import (
+    PipelineWorker,
+    _default_run_context_factory,
+    get_worker_parser_warmup,
+)
 from idis.services.runs.execution import RunExecutionService
 
 TENANT_ID = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
@@ -813,3 +817,15 @@ def _span_row(document_id: str) -> MagicMock:
             "updated_at": "2026-01-01T00:00:00Z",
         },
     )
+
+
+def test_worker_parser_warmup_env(monkeypatch) -> None:
+    """Parser warm-up is opt-in: unset stays lazy, 'all' warms every family."""
+    monkeypatch.delenv("IDIS_WORKER_WARM_PARSERS", raising=False)
+    assert get_worker_parser_warmup() == []
+
+    monkeypatch.setenv("IDIS_WORKER_WARM_PARSERS", "all")
+    assert get_worker_parser_warmup() is None
+
+    monkeypatch.setenv("IDIS_WORKER_WARM_PARSERS", " pdf, XLSX ,")
+    assert get_worker_parser_warmup() == ["PDF", "XLSX"]
@@ -0,0 +1,302 @@
+"""Multi-tier rate limiting (tier + actor + route class) and the local token lease.
+
+1. All-or-nothing: a request is admitted only if every applicable bucket has a token, and a
+   denial by one bucket consumes nothing from the others (in-memory and Redis stores).
+2. One round-trip: the Redis store evaluates every bucket in a single script call.
+3. Default config is unchanged: only the tier bucket applies, with the same decision fields.
+4. Local lease: most requests are served without a Redis call, tokens are taken from Redis up
+   front (two replicas never admit more than the shared capacity), small buckets bypass the lease,
+   and a failing background top-up never fails a request.
+5. Middleware wiring: the write route-class bucket denies mutating requests only.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from idis.rate_limit.lease import LeasedRateLimitStore, maybe_lease
+from idis.rate_limit.limiter import (
+    _LUA_MULTI_TOKEN_BUCKET,
+    InMemoryRateLimitStore,
+    RateLimitConfig,
+    RateLimitScope,
+    RateLimitTier,
+    RedisTokenBucketStore,
+    RouteClass,
+    TenantRateLimiter,
+    classify_route_class,
+)
+
+_TENANT = "11111111-1111-1111-1111-111111111111"
+
+
+class _FakeRedis:
+    """In-process stand-in for Redis implementing both token-bucket scripts the stores use."""
+
+    def __init__(self) -> None:
+        self.state: dict[str, tuple[float, float]] = {}
+        self.eval_calls = 0
+        self.fail = False
+
+    def _refill(self, key: str, capacity: float, refill: float, now: float) -> float:
+        tokens, ts = self.state.get(key, (capacity, now))
+        return min(capacity, tokens + max(0.0, now - ts) * refill / 1000.0)
+
+    def eval(self, script: str, numkeys: int, *args: Any) -> list[int]:
+        self.eval_calls += 1
+        if self.fail:
+            raise ConnectionError("redis unavailable")
+        keys = [str(k) for k in args[:numkeys]]
+        argv = [float(a) for a in args[numkeys:]]
+        if script != _LUA_MULTI_TOKEN_BUCKET:
+            capacity, refill, cost, now, _ttl = argv
+            tokens = self._refill(keys[0], capacity, refill, now)
+            allowed = tokens >= cost
+            tokens = tokens - cost if allowed else tokens
+            self.state[keys[0]] = (tokens, now)
+            retry = 0 if allowed else max(1, math.ceil((cost - tokens) / refill))
+            return [int(allowed), int(tokens), retry]
+
+        now, _ttl, cost = argv[:3]
+        specs = [argv[3 + i * 3 : 6 + i * 3] for i in range(numkeys)]
+        tokens = [
+            self._refill(k, cap, refill, now)
+            for k, (cap, refill, _) in zip(keys, specs, strict=True)
+        ]
+        denied = [i for i, t in enumerate(tokens) if t < cost]
+        retry = max(
+            (max(1, math.ceil((cost - tokens[i]) / specs[i][1])) for i in denied), default=0
+        )
+        out = [0 if denied else 1, retry]
+        for i, key in enumerate(keys):
+            t, granted = tokens[i], 0
+            if not denied:
+                t -= cost
+                granted = int(max(0, min(specs[i][2], math.floor(t))))
+                t -= granted
+            self.state[key] = (t, now)
+            out += [math.floor(t), granted]
+        return out
+
+
+class _ConsumeOnlyStore:
+    """Store without consume_many: buckets are consumed one by one."""
+
+    def __init__(self) -> None:
+        self._inner = InMemoryRateLimitStore()
+
+    def consume(
+        self, *, key: str, capacity: int, refill_rate_per_sec: float, cost: int = 1
+    ) -> tuple[bool, int, int]:
+        return self._inner.consume(
+            key=key, capacity=capacity, refill_rate_per_sec=refill_rate_per_sec, cost=cost
+        )
+
+    def reset(self) -> None:
+        self._inner.reset()
+
+
+class _InlineExecutor(Executor):
+    """Runs background top-ups synchronously so lease tests are deterministic."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _config(**overrides: int) -> RateLimitConfig:
+    values: dict[str, Any] = {"user_rpm": 100, "integration_rpm": 100, "burst_multiplier": 1}
+    values.update(overrides)
+    return RateLimitConfig(**values)
+
+
+@pytest.mark.parametrize(
+    "make_store", [InMemoryRateLimitStore, lambda: RedisTokenBucketStore(_FakeRedis())]
+)
+def test_actor_denial_consumes_nothing_from_tenant_bucket(make_store: Callable[[], Any]) -> None:
+    limiter = TenantRateLimiter(_config(user_rpm=3, actor_rpm=1), store=make_store())
+
+    first = limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="alice")
+    denied = limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="alice")
+    other = [
+        limiter.check_request(_TENANT, RateLimitTier.USER, actor_id=a) for a in ("bob", "carol")
+    ]
+    exhausted = limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="dave")
+
+    assert first.allowed and first.scope == RateLimitScope.ACTOR
+    assert not denied.allowed and denied.scope == RateLimitScope.ACTOR
+    assert denied.limit_rpm == 1 and denied.retry_after_seconds and denied.retry_after_seconds >= 1
+    assert all(d.allowed for d in other), "alice's denial must not have spent a tenant token"
+    assert not exhausted.allowed and exhausted.scope == RateLimitScope.TIER
+
+
+def test_consume_only_store_keeps_tokens_taken_before_a_denial() -> None:
+    limiter = TenantRateLimiter(_config(user_rpm=3, actor_rpm=1), store=_ConsumeOnlyStore())
+
+    assert limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="alice").allowed
+    assert not limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="alice").allowed
+    bob = limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="bob")
+
+    assert bob.allowed
+    assert not limiter.check_request(_TENANT, RateLimitTier.USER, actor_id="carol").allowed
+
+
+def test_write_bucket_applies_to_mutating_requests_only() -> None:
+    limiter = TenantRateLimiter(_config(write_rpm=1))
+
+    assert limiter.check_request(_TENANT, RateLimitTier.USER, route_class=RouteClass.WRITE).allowed
+    write = limiter.check_request(_TENANT, RateLimitTier.USER, route_class=RouteClass.WRITE)
+    read = limiter.check_request(_TENANT, RateLimitTier.USER, route_class=RouteClass.READ)
+
+    assert not write.allowed and write.scope == RateLimitScope.ROUTE
+    assert read.allowed
+    assert classify_route_class("patch") == RouteClass.WRITE
+    assert classify_route_class("GET") == RouteClass.READ
+
+
+def test_default_config_decision_matches_single_bucket_check() -> None:
+    config = _config(user_rpm=2)
+    multi = TenantRateLimiter(config)
+    single = TenantRateLimiter(config)
+
+    for _ in range(3):
+        a = multi.check_request(
+            _TENANT, RateLimitTier.USER, actor_id="x", route_class=RouteClass.WRITE
+        )
+        b = single.check(_TENANT, RateLimitTier.USER)
+        assert a == b
+
+
+def test_redis_store_checks_all_buckets_in_one_round_trip() -> None:
+    fake = _FakeRedis()
+    limiter = TenantRateLimiter(
+        _config(actor_rpm=50, write_rpm=50), store=RedisTokenBucketStore(fake)
+    )
+
+    for _ in range(10):
+        limiter.check_request(
+            _TENANT, RateLimitTier.USER, actor_id="a", route_class=RouteClass.WRITE
+        )
+
+    assert fake.eval_calls == 10
+    assert len(fake.state) == 3
+
+
+def test_lease_serves_most_requests_locally() -> None:
+    fake = _FakeRedis()
+    store = LeasedRateLimitStore(
+        RedisTokenBucketStore(fake), budget_pct=10, max_lease=20, executor=_InlineExecutor()
+    )
+    limiter = TenantRateLimiter(_config(user_rpm=600), store=store)  # capacity 600 -> lease 20
+
+    decisions = [limiter.check_request(_TENANT, RateLimitTier.USER) for _ in range(200)]
+
+    assert all(d.allowed for d in decisions)
+    stats = store.stats()
+    assert stats.remote_calls == 1
+    assert stats.local_hits == 199
+    assert fake.eval_calls < 30
+    assert stats.hit_ratio > 0.9
+
+
+def test_leased_replicas_never_admit_more_than_shared_capacity() -> None:
+    fake = _FakeRedis()
+    replicas = [
+        TenantRateLimiter(
+            _config(user_rpm=100),
+            store=LeasedRateLimitStore(
+                RedisTokenBucketStore(fake), budget_pct=10, executor=_InlineExecutor()
+            ),
+        )
+        for _ in range(2)
+    ]
+
+    admitted = sum(
+        replicas[i % 2].check_request(_TENANT, RateLimitTier.USER).allowed for i in range(300)
+    )
+
+    assert 80 <= admitted <= 100, "bounded under-admission (leases), never over-admission"
+
+
+def test_small_buckets_bypass_the_lease_and_stay_exact() -> None:
+    fake = _FakeRedis()
+    store = LeasedRateLimitStore(RedisTokenBucketStore(fake), executor=_InlineExecutor())
+    limiter = TenantRateLimiter(_config(user_rpm=2), store=store)  # 2% of 2 rounds to 0
+
+    allowed = [limiter.check_request(_TENANT, RateLimitTier.USER).allowed for _ in range(3)]
+
+    assert allowed == [True, True, False]
+    assert store.stats().local_hits == 0 and fake.eval_calls == 3
+
+
+def test_failed_top_up_never_fails_a_request() -> None:
+    fake = _FakeRedis()
+    store = LeasedRateLimitStore(
+        RedisTokenBucketStore(fake), budget_pct=10, max_lease=10, executor=_InlineExecutor()
+    )
+    limiter = TenantRateLimiter(_config(user_rpm=600), store=store)
+    assert limiter.check_request(_TENANT, RateLimitTier.USER).allowed  # leases 10 tokens
+
+    fake.fail = True
+    served = [limiter.check_request(_TENANT, RateLimitTier.USER).allowed for _ in range(10)]
+
+    assert served == [True] * 10
+    assert store.stats().top_up_failures >= 1
+
+
+def test_maybe_lease_respects_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    backing = RedisTokenBucketStore(_FakeRedis())
+
+    monkeypatch.setenv("IDIS_RATE_LIMIT_LEASE_PCT", "0")
+    assert maybe_lease(backing) is backing
+    monkeypatch.setenv("IDIS_RATE_LIMIT_LEASE_PCT", "5")
+    leased = maybe_lease(backing)
+    assert isinstance(leased, LeasedRateLimitStore) and leased.lease_size(1200) == 50
+
+
+def test_middleware_denies_writes_on_route_bucket(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from idis.api.main import create_app
+    from idis.audit.sink import JsonlFileAuditSink
+
+    tenant_id = str(uuid.uuid4())
+    api_key = f"key-{uuid.uuid4().hex[:16]}"
+    record = {
+        "tenant_id": tenant_id,
+        "actor_id": "actor-1",
+        "name": "T",
+        "timezone": "UTC",
+        "data_region": "us-east-1",
+        "roles": ["ANALYST"],
+    }
+    monkeypatch.setenv("IDIS_API_KEYS_JSON", json.dumps({api_key: record}))
+    limiter = TenantRateLimiter(_config(write_rpm=1))
+    app = create_app(
+        audit_sink=JsonlFileAuditSink(str(tmp_path / "audit.jsonl")),
+        rate_limiter=limiter,
+        service_region="us-east-1",
+    )
+    client = TestClient(app, raise_server_exceptions=False)
+    headers = {"X-IDIS-API-Key": api_key}
+
+    statuses = [
+        client.post(
+            "/v1/deals", json={"name": f"D{i}", "company_name": "C"}, headers=headers
+        ).status_code
+        for i in range(2)
+    ]
+    read = client.get("/v1/deals", headers=headers)
+
+    assert statuses[0] != 429 and statuses[1] == 429
+    assert read.status_code == 200
@@ -0,0 +1,139 @@
+"""Sort-and-sweep resolution engine behind Deduplicator and ConflictDetector.
+
+1. Near-matches from the sliding window equal a brute-force pairwise scan (mixed signs, zeros,
+   boundary values, unparseable values).
+2. Buckets are (claim_class, predicate, time_window): different predicates or periods are
+   never compared.
+3. Conflicts are one cluster per bucket with min/max spread and every member identity.
+"""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+from typing import Any
+
+from idis.services.extraction.resolution.conflict_detector import ConflictDetector
+from idis.services.extraction.resolution.deduplicator import DeduplicatedClaim, Deduplicator
+from idis.services.extraction.resolution.engine import (
+    NEAR_MATCH_THRESHOLD,
+    group_numeric_claims,
+    relative_difference,
+    sweep_near_matches,
+)
+
+DEAL_ID = "deal00001-0000-0000-0000-000000000001"
+
+
+def _claim(i: int, value: Any, predicate: str | None = "arr", tw: str | None = "FY2024") -> Any:
+    return DeduplicatedClaim(
+        claim_text=f"claim {i}",
+        claim_class="FINANCIAL",
+        extraction_confidence=Decimal("0.9"),
+        span_ids=[f"s{i}"],
+        identity_hash=f"id-{i:04d}",
+        predicate=predicate,
+        value={"value": value, "time_window": tw},
+    )
+
+
+def _pairwise_near_matches(claims: list[Any]) -> list[tuple[str, str]]:
+    near = []
+    for i, a in enumerate(claims):
+        for b in claims[i + 1 :]:
+            pct = relative_difference(
+                Decimal(str(a.value["value"])), Decimal(str(b.value["value"]))
+            )
+            if pct is not None and pct <= NEAR_MATCH_THRESHOLD:
+                near.append((a.identity_hash, b.identity_hash))
+    return near
+
+
+def test_sweep_matches_pairwise_scan() -> None:
+    rng = random.Random(7)
+    values: list[Any] = [0, 0, 100, 95, 94.99, 105, -100, -96, -104.9, 1e-9, 2e-9]
+    values += [rng.choice([-1, 1]) * round(rng.uniform(1, 200), 2) for _ in range(300)]
+    claims = [_claim(i, v) for i, v in enumerate(values)]
+
+    near = Deduplicator()._find_near_matches(claims)
+
+    assert near == _pairwise_near_matches(claims)
+    assert ("id-0002", "id-0003") in near, "a 5% difference is inclusive"
+    assert ("id-0002", "id-0004") not in near
+    assert ("id-0000", "id-0001") not in near, "zero pairs are never near-matches"
+    assert not any({a, b} == {"id-0002", "id-0006"} for a, b in near)
+
+
+def test_unparseable_values_are_skipped() -> None:
+    claims = [_claim(0, "n/a"), _claim(1, 100), _claim(2, None), _claim(3, 101)]
+
+    groups = group_numeric_claims(claims)
+
+    assert [[m.index for m in g] for g in groups.values()] == [[1, 3]]
+    assert [
+        (a.index, b.index) for a, b in sweep_near_matches(groups[("FINANCIAL", "arr", "FY2024")])
+    ] == [(1, 3)]
+
+
+def test_buckets_split_by_predicate_and_time_window() -> None:
+    claims = [
+        _claim(0, 100),
+        _claim(1, 101, predicate="revenue"),
+        _claim(2, 102, tw="FY2023"),
+        _claim(3, 500, tw="FY2023"),
+    ]
+
+    assert Deduplicator()._find_near_matches(claims) == []
+    conflicts = ConflictDetector().detect(claims)
+    assert conflicts.conflict_count == 1
+    assert conflicts.conflicts[0].member_identities == ("id-0002", "id-0003")
+
+
+def test_conflicts_are_reported_as_clusters() -> None:
+    claims = [_claim(i, v) for i, v in enumerate([100, 130, 104, 100, 90, 120])]
+    claims.append(_claim(6, 1000, predicate="headcount"))
+
+    result = ConflictDetector().detect(claims)
+
+    assert result.conflict_count == 1, "one record per bucket, not one per conflicting pair"
+    conflict = result.conflicts[0]
+    assert (conflict.claim_identity_a, conflict.claim_identity_b) == ("id-0004", "id-0001")
+    assert (conflict.min_value, conflict.max_value) == ("90", "130")
+    assert Decimal(conflict.pct_difference) == Decimal(40) / Decimal(130)
+    assert conflict.member_identities == (
+        "id-0004",
+        "id-0000",
+        "id-0003",
+        "id-0002",
+        "id-0005",
+        "id-0001",
+    )
+    assert conflict.details.startswith("FINANCIAL/arr/FY2024: 6 claims span")
+
+
+def test_deduplicate_end_to_end_uses_buckets() -> None:
+    raw = [
+        {
+            "claim_text": "ARR $5.0M",
+            "claim_class": "FINANCIAL",
+            "predicate": "arr",
+            "value": {"value": 5_000_000, "time_window": "FY2024"},
+        },
+        {
+            "claim_text": "ARR $5.04M",
+            "claim_class": "FINANCIAL",
+            "predicate": "arr",
+            "value": {"value": 5_040_000, "time_window": "FY2024"},
+        },
+        {
+            "claim_text": "ARR $5.02M last year",
+            "claim_class": "FINANCIAL",
+            "predicate": "arr",
+            "value": {"value": 5_020_000, "time_window": "FY2023"},
+        },
+    ]
+
+    result = Deduplicator().deduplicate(raw, deal_id=DEAL_ID)
+
+    assert len(result.near_matches) == 1
+    assert ConflictDetector().detect(result.unique_claims).conflict_count == 0
@@ -0,0 +1,348 @@
+"""Set-based (batched) Sanad auto-grading.
+
+1. Parity: the batched path produces the same per-claim status, grade, errors, persisted
+   defects and stored claim grades as the per-claim path (chain-built, prebuilt and failing
+   claims mixed in one run).
+2. Round-trips: evidence is loaded with one get_by_claims call and every audit event goes out
+   in a single emit_batch call. Every event in that batch carries the columns PostgresAuditSink
+   requires, and services with their own sinks keep their events.
+3. Fail closed: an integrity failure persists nothing.
+4. Postgres repositories write multi-row statements, chunked at MAX_ROWS_PER_STATEMENT.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from idis.audit.postgres_sink import _event_row
+from idis.audit.sink import InMemoryAuditSink, JsonlFileAuditSink
+from idis.persistence.repositories.claims import (
+    MAX_ROWS_PER_STATEMENT,
+    ClaimsRepository,
+    InMemoryClaimsRepository,
+    InMemoryDefectsRepository,
+    InMemoryEvidenceRepository,
+    InMemorySanadsRepository,
+    SanadsRepository,
+    clear_all_claims_stores,
+)
+from idis.services.defects.service import DefectService
+from idis.services.sanad.auto_grade import auto_grade_claims_for_run
+from idis.services.sanad.service import SanadIntegrityError, SanadService
+
+TENANT_ID = "a0000000-0000-0000-0000-000000000001"
+DEAL_ID = "b0000000-0000-0000-0000-000000000001"
+PREBUILT_EVIDENCE = ("e1000000-0000-0000-0000-000000000001", "e1000000-0000-0000-0000-000000000002")
+
+
+def _claim_id(i: int) -> str:
+    return f"d0000000-0000-0000-0000-{i:012d}"
+
+
+class _CountingEvidenceRepository(InMemoryEvidenceRepository):
+    def __init__(self, tenant_id: str) -> None:
+        super().__init__(tenant_id)
+        self.calls: Counter[str] = Counter()
+
+    def get_by_claim(self, claim_id: str) -> list[dict[str, Any]]:
+        self.calls["get_by_claim"] += 1
+        return super().get_by_claim(claim_id)
+
+    def get_by_claims(self, claim_ids: Any) -> dict[str, list[dict[str, Any]]]:
+        self.calls["get_by_claims"] += 1
+        return super().get_by_claims(claim_ids)
+
+
+class _BatchRecordingSink(InMemoryAuditSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.emit_calls = 0
+        self.batch_sizes: list[int] = []
+
+    def emit(self, event: dict[str, Any]) -> None:
+        self.emit_calls += 1
+        super().emit(event)
+
+    def emit_batch(self, events: Any) -> None:
+        self.batch_sizes.append(len(events))
+        super().emit_batch(events)
+
+
+class _PostgresRowSink(_BatchRecordingSink):
+    """Maps every event to an audit_events row first, as PostgresAuditSink does."""
+
+    def emit(self, event: dict[str, Any]) -> None:
+        _event_row(event)
+        super().emit(event)
+
+    def emit_batch(self, events: Any) -> None:
+        for event in events:
+            _event_row(event)  # AuditSinkError rejects the whole batch
+        super().emit_batch(events)
+
+
+def _seed_run() -> tuple[_CountingEvidenceRepository, list[str], dict[str, dict[str, Any]]]:
+    """Four chain-built claims (1-4 evidence items), two without evidence, one prebuilt."""
+    clear_all_claims_stores()
+    claims = InMemoryClaimsRepository(TENANT_ID)
+    ev_repo = _CountingEvidenceRepository(TENANT_ID)
+    claim_ids = [_claim_id(i) for i in range(7)]
+    for i, claim_id in enumerate(claim_ids):
+        claims.create(
+            claim_id=claim_id,
+            deal_id=DEAL_ID,
+            claim_class="FINANCIAL",
+            claim_text=f"claim {i}",
+            corroboration={"extraction_confidence": 0.8 + i / 100},
+        )
+    for i, grade in enumerate("ABCD"):
+        for j in range(i + 1):
+            ev_repo.create(
+                evidence_id=f"e0000000-0000-0000-0000-0000000000{i}{j}",
+                tenant_id=TENANT_ID,
+                deal_id=DEAL_ID,
+                claim_id=claim_ids[i],
+                source_span_id=f"span-{i}-{j}",
+                source_grade=grade,
+            )
+    primary, corroborating = PREBUILT_EVIDENCE
+    prebuilt = {
+        claim_ids[6]: {
+            "sanad": {
+                "primary_evidence_id": primary,
+                "corroborating_evidence_ids": [corroborating],
+                "sanad_grade": "B",
+                "transmission_chain": [
+                    {
+                        "node_id": "f0000000-0000-0000-0000-000000000001",
+                        "node_type": "SOURCE",
+                        "input_refs": [],
+                        "output_ref": primary,
+                    }
+                ],
+            },
+            "sources": [
+                {
+                    "evidence_id": primary,
+                    "source_system": "Deck",
+                    "source_grade": "C",
+                    "value": 100,
+                },
+                {
+                    "evidence_id": corroborating,
+                    "source_system": "Bank",
+                    "source_grade": "A",
+                    "value": 5,
+                },
+            ],
+            "claim": {"value": 100},
+        }
+    }
+    return ev_repo, claim_ids, prebuilt
+
+
+def _run(*, batched: bool) -> tuple[Any, _CountingEvidenceRepository, _BatchRecordingSink]:
+    ev_repo, claim_ids, prebuilt = _seed_run()
+    sink = _BatchRecordingSink()
+    result = auto_grade_claims_for_run(
+        run_id="run-1",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        created_claim_ids=claim_ids,
+        evidence_repo=ev_repo,
+        audit_sink=sink,
+        prebuilt_sanads=prebuilt,
+        batched=batched,
+    )
+    return result, ev_repo, sink
+
+
+def _snapshot(result: Any) -> list[tuple[Any, ...]]:
+    """Per-claim outcome with persisted state, independent of generated UUIDs."""
+    claims = InMemoryClaimsRepository(TENANT_ID)
+    sanads = InMemorySanadsRepository(TENANT_ID)
+    defects = InMemoryDefectsRepository(TENANT_ID)
+    rows = []
+    for r in result.results:
+        claim = claims.get(r.claim_id)
+        assert claim is not None
+        sanad = sanads.get(r.sanad_id) if r.sanad_id else None
+        persisted, _ = defects.list_by_claim(r.claim_id, limit=200)
+        assert sorted(r.defect_ids) == sorted(d["defect_id"] for d in persisted)
+        assert claim["sanad_id"] == r.sanad_id
+        rows.append(
+            (
+                r.claim_id,
+                r.status,
+                r.grade,
+                r.error,
+                claim["claim_grade"],
+                sanad["computed"]["grade"] if sanad else None,
+                sanad["computed"]["extraction_confidence"] if sanad else None,
+                sorted((d["defect_type"], d["severity"], d["description"]) for d in persisted),
+            )
+        )
+    return rows
+
+
+def test_batched_grading_matches_per_claim_grading() -> None:
+    per_claim, per_claim_repo, per_claim_sink = _run(batched=False)
+    expected = _snapshot(per_claim)
+    expected_events = Counter(e["event_type"] for e in per_claim_sink.events)
+
+    batched, batched_repo, batched_sink = _run(batched=True)
+
+    assert _snapshot(batched) == expected
+    assert (batched.graded_count, batched.failed_count, batched.total_defects) == (
+        per_claim.graded_count,
+        per_claim.failed_count,
+        per_claim.total_defects,
+    )
+    assert batched.graded_count == 5 and batched.failed_count == 2
+    assert batched.total_defects >= 1, "prebuilt outlier value yields a grader defect"
+    assert Counter(e["event_type"] for e in batched_sink.events) == expected_events
+
+    assert per_claim_repo.calls == {"get_by_claim": 6}
+    assert batched_repo.calls == {"get_by_claims": 1}
+    assert batched_sink.emit_calls == 0
+    assert batched_sink.batch_sizes == [len(per_claim_sink.events)]
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_run_audit_events_map_to_postgres_rows(batched: bool) -> None:
+    ev_repo, claim_ids, prebuilt = _seed_run()
+    sink = _PostgresRowSink()
+
+    auto_grade_claims_for_run(
+        run_id="run-1",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        created_claim_ids=claim_ids,
+        evidence_repo=ev_repo,
+        audit_sink=sink,
+        prebuilt_sanads=prebuilt,
+        batched=batched,
+    )
+
+    assert {e["event_type"] for e in sink.events} == {
+        "sanad.created",
+        "sanad.graded",
+        "defect.created",
+        "defect.detected",
+    }
+    graded = [e for e in sink.events if e["event_type"] == "sanad.graded"]
+    assert len(graded) == 5
+    assert all(_event_row(e)["deal_id"] == DEAL_ID for e in graded)
+
+
+def test_batched_run_leaves_service_events_on_their_own_sinks() -> None:
+    ev_repo, claim_ids, prebuilt = _seed_run()
+    sink, sanad_sink, defect_sink = _BatchRecordingSink(), InMemoryAuditSink(), InMemoryAuditSink()
+
+    auto_grade_claims_for_run(
+        run_id="run-1",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        created_claim_ids=claim_ids,
+        evidence_repo=ev_repo,
+        sanad_service=SanadService(tenant_id=TENANT_ID, audit_sink=sanad_sink),
+        defect_service=DefectService(tenant_id=TENANT_ID, audit_sink=defect_sink),
+        audit_sink=sink,
+        prebuilt_sanads=prebuilt,
+    )
+
+    assert {e["event_type"] for e in sanad_sink.events} == {"sanad.created"}
+    assert {e["event_type"] for e in defect_sink.events} == {"defect.created"}
+    assert {e["event_type"] for e in sink.events} == {
+        "sanad.created",
+        "sanad.graded",
+        "defect.detected",
+    }
+    assert sink.batch_sizes == [len(sink.events)]
+    assert len(sanad_sink.events) == 5
+
+
+def test_batched_integrity_failure_persists_nothing() -> None:
+    ev_repo, claim_ids, _ = _seed_run()
+    ev_repo.create(
+        evidence_id="e2000000-0000-0000-0000-000000000001",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        claim_id="not-a-uuid",
+        source_span_id="span-x",
+    )
+    sink = _BatchRecordingSink()
+
+    with pytest.raises(SanadIntegrityError):
+        auto_grade_claims_for_run(
+            run_id="run-1",
+            tenant_id=TENANT_ID,
+            deal_id=DEAL_ID,
+            created_claim_ids=[claim_ids[0], "not-a-uuid"],
+            evidence_repo=ev_repo,
+            audit_sink=sink,
+        )
+
+    assert InMemorySanadsRepository(TENANT_ID).list_by_deal(DEAL_ID)[0] == []
+    assert InMemoryClaimsRepository(TENANT_ID).get(claim_ids[0])["sanad_id"] is None  # type: ignore[index]
+    assert [e["event_type"] for e in sink.events] == ["sanad.integrity.failed"]
+
+
+class _RecordingConnection:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any] | None = None) -> Any:
+        self.statements.append((str(statement), params or {}))
+        return None
+
+
+def test_postgres_repositories_write_multi_row_statements() -> None:
+    conn = _RecordingConnection()
+    sanads = SanadsRepository(conn, TENANT_ID)  # type: ignore[arg-type]
+    claims = ClaimsRepository(conn, TENANT_ID)  # type: ignore[arg-type]
+    conn.statements.clear()
+    count = MAX_ROWS_PER_STATEMENT + 1
+
+    created = sanads.create_many(
+        [
+            {
+                "sanad_id": f"s-{i}",
+                "claim_id": f"c-{i}",
+                "deal_id": DEAL_ID,
+                "primary_evidence_id": f"e-{i}",
+                "computed": {"grade": "B"},
+            }
+            for i in range(count)
+        ]
+    )
+    claims.update_grades([("c-0", "B", "s-0"), ("c-1", None, None), ("c-2", "A", None)])
+
+    inserts, updates = conn.statements[:2], conn.statements[2:]
+    assert [sql.count(":sanad_id_") for sql, _ in inserts] == [MAX_ROWS_PER_STATEMENT, 1]
+    assert all(params["tenant_id"] == TENANT_ID for _, params in inserts)
+    assert json.loads(inserts[1][1]["computed_0"]) == {"grade": "B"}
+    assert [s["sanad_id"] for s in created] == [f"s-{i}" for i in range(count)]
+    assert len(updates) == 1, "one UPDATE for all claims; the no-op update is dropped"
+    assert {k: v for k, v in updates[0][1].items() if k.startswith("claim_id_")} == {
+        "claim_id_0": "c-0",
+        "claim_id_1": "c-2",
+    }
+
+
+def test_jsonl_sink_emit_batch_writes_every_event(tmp_path: Path) -> None:
+    sink = JsonlFileAuditSink(str(tmp_path / "audit.jsonl"))
+    events = [{"event_id": str(i), "tenant_id": TENANT_ID} for i in range(3)]
+
+    sink.emit_batch(events)
+    sink.emit({"event_id": "3", "tenant_id": TENANT_ID})
+
+    lines = (tmp_path / "audit.jsonl").read_text().splitlines()
+    assert [json.loads(line)["event_id"] for line in lines] == ["0", "1", "2", "3"]
+    stats = sink.stats()
+    assert stats is not None and stats.events == 4
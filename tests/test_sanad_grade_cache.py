@@ -0,0 +1,201 @@
+"""Memoized Sanad grading keyed by a content hash of the grading inputs.
+
+1. The cache key is stable for identical inputs and changes with the claim value, sources,
+   transmission chain, grading inputs and grader version.
+2. Rerunning auto-grade on unchanged claims reuses their latest sanads: the grader is not
+   called and no sanads or defects are persisted again, on both the batched and per-claim
+   paths. Stale claim rows still get the reused grade and sanad_id written back, and the
+   summary reports the same total_defects plus reused vs recomputed grades.
+3. Changed evidence or a grader code change recomputes only what is stale.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from idis.audit.sink import InMemoryAuditSink
+from idis.persistence.repositories.claims import (
+    InMemoryClaimsRepository,
+    InMemoryEvidenceRepository,
+    _defects_in_memory_store,
+    _sanad_in_memory_store,
+    clear_all_claims_stores,
+)
+from idis.services.sanad import auto_grade, grade_cache
+from idis.services.sanad.auto_grade import auto_grade_claims_for_run
+from idis.services.sanad.grade_cache import (
+    GRADE_CACHE_KEY_FIELD,
+    SANAD_GRADER_VERSION,
+    compute_grade_cache_key,
+    grader_code_version,
+)
+
+TENANT_ID = "a0000000-0000-0000-0000-000000000002"
+DEAL_ID = "b0000000-0000-0000-0000-000000000002"
+PREBUILT_CLAIM = "d0000000-0000-0000-0000-000000000099"
+
+
+def _claim_id(i: int) -> str:
+    return f"d0000000-0000-0000-0000-{i:012d}"
+
+
+@pytest.fixture(autouse=True)
+def _clean_stores() -> Any:
+    clear_all_claims_stores()
+    yield
+    clear_all_claims_stores()
+
+
+@pytest.fixture
+def grader_calls(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    calls: list[Any] = []
+    grade = auto_grade.grade_sanad_v2
+
+    def counting_grade(*args: Any, **kwargs: Any) -> Any:
+        calls.append(kwargs.get("sanad"))
+        return grade(*args, **kwargs)
+
+    monkeypatch.setattr(auto_grade, "grade_sanad_v2", counting_grade)
+    return calls
+
+
+def _seed(claims: int = 3) -> tuple[InMemoryEvidenceRepository, list[str]]:
+    claims_repo = InMemoryClaimsRepository(TENANT_ID)
+    ev_repo = InMemoryEvidenceRepository(TENANT_ID)
+    claim_ids = [_claim_id(i) for i in range(claims)]
+    for i, claim_id in enumerate(claim_ids):
+        claims_repo.create(
+            claim_id=claim_id,
+            deal_id=DEAL_ID,
+            claim_class="FINANCIAL",
+            claim_text=f"claim {i}",
+            value={"value": 100 + i, "unit": "USD"},
+        )
+        for j in range(i + 1):
+            ev_repo.create(
+                evidence_id=f"e0000000-0000-0000-0000-0000000000{i}{j}",
+                tenant_id=TENANT_ID,
+                deal_id=DEAL_ID,
+                claim_id=claim_id,
+                source_span_id=f"span-{i}-{j}",
+                source_grade="B",
+            )
+    return ev_repo, claim_ids
+
+
+def _prebuilt() -> dict[str, dict[str, Any]]:
+    return {
+        PREBUILT_CLAIM: {
+            "sanad": {
+                "primary_evidence_id": "ev-p",
+                "corroborating_evidence_ids": ["ev-c"],
+                "sanad_grade": "B",
+                "transmission_chain": [{"node_id": "n-1", "node_type": "SOURCE"}],
+            },
+            "sources": [  # the outlier value yields a grader defect
+                {"evidence_id": "ev-p", "source_system": "Deck", "source_grade": "C", "value": 100},
+                {"evidence_id": "ev-c", "source_system": "Bank", "source_grade": "A", "value": 5},
+            ],
+            "claim": {"value": 100},
+        }
+    }
+
+
+def _run(ev_repo: Any, claim_ids: list[str], **kwargs: Any) -> Any:
+    return auto_grade_claims_for_run(
+        run_id="run-1",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        created_claim_ids=claim_ids,
+        evidence_repo=ev_repo,
+        audit_sink=InMemoryAuditSink(),
+        **kwargs,
+    )
+
+
+def test_cache_key_covers_every_grading_input() -> None:
+    base: dict[str, Any] = {
+        "claim_value": {"value": 1},
+        "sources": [{"evidence_id": "e-1"}],
+        "transmission_chain": [{"node_id": "n-1"}],
+        "inputs": {"dhabt_score": 0.9},
+        "grader_version": "v-1",
+    }
+    key = compute_grade_cache_key(**base)
+
+    assert compute_grade_cache_key(**dict(base, sources=[{"evidence_id": "e-1"}])) == key
+    for field, changed in [
+        ("claim_value", {"value": 2}),
+        ("sources", [{"evidence_id": "e-2"}]),
+        ("transmission_chain", [{"node_id": "n-2"}]),
+        ("inputs", {"dhabt_score": 0.8}),
+        ("grader_version", "v-2"),
+    ]:
+        assert compute_grade_cache_key(**dict(base, **{field: changed})) != key, field
+    assert grader_code_version().startswith(f"{SANAD_GRADER_VERSION}+")
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_rerun_reuses_unchanged_grades(batched: bool, grader_calls: list[Any]) -> None:
+    ev_repo, claim_ids = _seed()
+    all_ids = [*claim_ids, PREBUILT_CLAIM]
+
+    first = _run(ev_repo, all_ids, prebuilt_sanads=_prebuilt(), batched=batched)
+    sanads, defects = len(_sanad_in_memory_store), len(_defects_in_memory_store)
+    grader_calls.clear()
+    second = _run(ev_repo, all_ids, prebuilt_sanads=_prebuilt(), batched=batched)
+
+    assert (first.reused_count, first.recomputed_count) == (0, 4)
+    assert (second.reused_count, second.recomputed_count) == (4, 0)
+    assert grader_calls == []
+    assert (len(_sanad_in_memory_store), len(_defects_in_memory_store)) == (sanads, defects)
+    assert [(r.claim_id, r.sanad_id, r.grade) for r in second.results] == [
+        (r.claim_id, r.sanad_id, r.grade) for r in first.results
+    ]
+    assert all(r.reused and r.defect_ids == [] for r in second.results)
+    assert second.total_defects == first.total_defects >= 1
+    assert all(GRADE_CACHE_KEY_FIELD in s["computed"] for s in _sanad_in_memory_store.values())
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_cache_hit_writes_back_stale_claim_grade(batched: bool) -> None:
+    ev_repo, claim_ids = _seed()
+    claims_repo = InMemoryClaimsRepository(TENANT_ID)
+    first = _run(ev_repo, claim_ids, batched=batched)
+    claims_repo.update_grade(claim_ids[0], claim_grade="D", sanad_id=None)  # reset row
+
+    second = _run(ev_repo, claim_ids, batched=batched)
+
+    assert second.reused_count == 3
+    for before, after in zip(first.results, second.results, strict=True):
+        claim = claims_repo.get(after.claim_id)
+        assert claim is not None
+        assert (claim["claim_grade"], claim["sanad_id"]) == (before.grade, before.sanad_id)
+
+
+def test_changed_evidence_and_grader_version_recompute(
+    monkeypatch: pytest.MonkeyPatch, grader_calls: list[Any]
+) -> None:
+    ev_repo, claim_ids = _seed()
+    _run(ev_repo, claim_ids)
+    ev_repo.create(
+        evidence_id="e0000000-0000-0000-0000-000000000999",
+        tenant_id=TENANT_ID,
+        deal_id=DEAL_ID,
+        claim_id=claim_ids[1],
+        source_span_id="span-new",
+        source_grade="A",
+    )
+
+    grader_calls.clear()
+    partial = _run(ev_repo, claim_ids)
+
+    assert [r.reused for r in partial.results] == [True, False, True]
+    assert len(grader_calls) == 1
+    assert partial.results[1].sanad_id != partial.results[0].sanad_id
+
+    monkeypatch.setattr(grade_cache, "grader_code_version", lambda: "sanad-v2+changed")
+    rerun = _run(ev_repo, claim_ids)
+    assert (rerun.reused_count, rerun.recomputed_count) == (0, 3)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import uuid
 from pathlib import Path
@@ -197,6 +198,39 @@ def test_download_completed_deliverable_streams_bytes(
     assert response.content.startswith(b"%PDF")
 
 
+def test_download_honors_etag_and_byte_ranges(
+    client: TestClient,
+    exported_bundle: tuple[RecordingDeliverablesRepository, dict[str, Any]],
+) -> None:
+    """Download serves a sha256 ETag, 304 on a current cache, and single byte ranges."""
+    repository, _summary = exported_bundle
+    url = f"/v1/deliverables/{_memo_pdf_row(repository)['deliverable_id']}/content"
+    auth = {"X-IDIS-API-Key": API_KEY}
+
+    full = client.get(url, headers=auth)
+    body = full.content
+    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+    assert (full.headers["etag"], full.headers["accept-ranges"]) == (etag, "bytes")
+    assert full.headers["content-length"] == str(len(body))
+
+    not_modified = client.get(url, headers={**auth, "If-None-Match": f'W/"stale", {etag}'})
+    assert (not_modified.status_code, not_modified.content) == (304, b"")
+
+    head = client.get(url, headers={**auth, "Range": "bytes=0-3"})
+    assert (head.status_code, head.content) == (206, b"%PDF")
+    assert head.headers["content-range"] == f"bytes 0-3/{len(body)}"
+
+    tail = client.get(url, headers={**auth, "Range": "bytes=-5", "If-Range": etag})
+    assert (tail.status_code, tail.content) == (206, body[-5:])
+
+    stale_if_range = client.get(url, headers={**auth, "Range": "bytes=0-3", "If-Range": '"x"'})
+    assert (stale_if_range.status_code, stale_if_range.content) == (200, body)
+
+    beyond = client.get(url, headers={**auth, "Range": f"bytes={len(body)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(body)}"
+
+
 def test_download_rejects_queued_or_cross_tenant(
     client: TestClient,
     exported_bundle: tuple[RecordingDeliverablesRepository, dict[str, Any]],
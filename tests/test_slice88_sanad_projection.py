@@ -137,13 +137,15 @@ def test_production_shaped_chain_produces_input_edges_end_to_end(
 ) -> None:
     """End-to-end: a production-shaped (entity-keyed) input_ref yields an INPUT edge.
 
-    Exercises the REAL GraphProjectionService + GraphRepository with `execute_write` recorded
-    (no real Neo4j), proving production-shaped refs route through to an INPUT-edge MERGE.
+    Exercises the REAL GraphProjectionService + GraphRepository with `execute_write_unwind`
+    recorded (no real Neo4j), proving production-shaped refs route through to an INPUT-edge MERGE.
     """
     recorded: list[tuple[str, dict[str, Any]]] = []
     monkeypatch.setattr(
-        "idis.persistence.graph_repo.execute_write",
-        lambda query, params: recorded.append((query, params)),
+        "idis.persistence.graph_repo.execute_write_unwind",
+        lambda statements, params, **_kw: recorded.extend(
+            (query, row) for query, rows in statements for row in rows
+        ),
     )
     monkeypatch.setattr("idis.persistence.graph_consistency.is_neo4j_configured", lambda: True)
 
@@ -171,8 +173,6 @@ def test_production_shaped_chain_produces_input_edges_end_to_end(
     )
 
     input_edge_writes = [
-        (query, params)
-        for query, params in recorded
-        if "INPUT" in query and params.get("ref_id") == "ev-1"
+        (query, row) for query, row in recorded if "INPUT" in query and row.get("ref_id") == "ev-1"
     ]
     assert input_edge_writes, "production-shaped input_ref produced no INPUT edge"
@@ -41,7 +41,8 @@ _MAPPING_DOC = _REPO_ROOT / "docs" / "architecture" / "slice99_metrics_mapping.m
 _MONITORING_DIR = _REPO_ROOT / "deploy" / "monitoring"
 
 _METRIC_LINE_PATTERN = re.compile(
-    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>[^}]*)\})?\s+(?P<value>-?\d+)$"
+    r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>[^}]*)\})?\s+"
+    r"(?P<value>-?\d+(?:\.\d+)?(?:e[+-]?\d+)?)$"
 )
 _EXPR_METRIC_PATTERN = re.compile(
     r"\b([a-z][a-z0-9_]*_(?:total|seconds|count|sum|ms|ratio|bytes|lag|failures))\b"
@@ -49,7 +50,8 @@ _EXPR_METRIC_PATTERN = re.compile(
 
 # Reviewer remediation: tenant_id is NOT an allowed scrape label - webhook counters are
 # global aggregates so the unauthenticated /metrics surface exposes no tenant identifiers.
-_ALLOWED_LABEL_KEYS = {"method", "status_class"}
+# Latency histograms add the route TEMPLATE (never the raw path) and the bucket bound.
+_ALLOWED_LABEL_KEYS = {"method", "status_class", "route", "le"}
 
 
 def _client() -> TestClient:
@@ -57,8 +59,8 @@ def _client() -> TestClient:
     return TestClient(create_app(service_region="us-east-1"), raise_server_exceptions=False)
 
 
-def _parse_exposition(body: str) -> list[tuple[str, dict[str, str], int]]:
-    parsed: list[tuple[str, dict[str, str], int]] = []
+def _parse_exposition(body: str) -> list[tuple[str, dict[str, str], float]]:
+    parsed: list[tuple[str, dict[str, str], float]] = []
     for line in body.splitlines():
         if not line.strip() or line.startswith("#"):
             continue
@@ -70,7 +72,7 @@ def _parse_exposition(body: str) -> list[tuple[str, dict[str, str], int]]:
             for pair in raw.split(","):
                 key, _, value = pair.partition("=")
                 labels[key.strip()] = value.strip().strip('"')
-        parsed.append((match.group("name"), labels, int(match.group("value"))))
+        parsed.append((match.group("name"), labels, float(match.group("value"))))
     return parsed
 
 
@@ -104,7 +106,7 @@ def test_http_counters_increment_from_real_requests() -> None:
 
     body = client.get("/metrics").text
     parsed = _parse_exposition(body)
-    by_name: dict[str, int] = {}
+    by_name: dict[str, float] = {}
     for name, labels, value in parsed:
         if name == "http_requests_total" and labels.get("method") == "GET":
             by_name[labels.get("status_class", "?")] = (
@@ -116,6 +118,12 @@ def test_http_counters_increment_from_real_requests() -> None:
     assert any(
         name == "http_request_duration_ms_total" and value >= 0 for name, _, value in parsed
     ), "request latency must be measured"
+    assert any(
+        name == "http_request_duration_seconds_count"
+        and labels == {"method": "GET", "route": "/health"}
+        and value >= 2
+        for name, labels, value in parsed
+    ), "request latency must be recorded per route template"
 
 
 def test_5xx_counter_increments_through_the_real_middleware() -> None:
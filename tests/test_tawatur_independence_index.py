@@ -0,0 +1,88 @@
+"""Interned chain index behind Tawatur chain-overlap / collusion scoring.
+
+1. Overlap fraction equals the pairwise node-set intersection scan on random source sets,
+   including malformed chains (non-list, non-dict nodes, missing node_id).
+2. Interning is deterministic and postings are the sources containing each node.
+3. assess_tawatur scores are unchanged for a large corroborated source set.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from idis.services.sanad.independence import build_chain_index, chain_node_ids
+from idis.services.sanad.tawatur import assess_tawatur, compute_collusion_risk
+
+
+def _pairwise_overlap(sources: list[dict[str, Any]]) -> float:
+    node_sets = [chain_node_ids(s) for s in sources]
+    if len(node_sets) < 2:
+        return 0.0
+    pairs = overlapping = 0
+    for i in range(len(node_sets)):
+        for j in range(i + 1, len(node_sets)):
+            pairs += 1
+            overlapping += bool(node_sets[i] & node_sets[j])
+    return overlapping / pairs
+
+
+def _sources(n: int, nodes: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    sources: list[dict[str, Any]] = []
+    for i in range(n):
+        chain: Any = [{"node_id": f"n-{rng.randrange(nodes)}"} for _ in range(rng.randrange(4))]
+        roll = rng.random()
+        if roll < 0.05:
+            chain = "not-a-list"
+        elif roll < 0.10:
+            chain.extend(["raw-node", {"node_id": ""}, {"label": "no id"}])
+        sources.append(
+            {
+                "evidence_id": f"ev-{i}",
+                "source_system": rng.choice(["crm", "erp", "bank"]),
+                "upstream_origin_id": f"origin-{rng.randrange(n)}",
+                "timestamp": f"2026-01-{rng.randrange(1, 28):02d}T{rng.randrange(24):02d}:00:00Z",
+                "transmission_chain": chain,
+            }
+        )
+    return sources
+
+
+def test_overlap_matches_pairwise_scan() -> None:
+    for n, nodes, seed in [(0, 5, 1), (1, 5, 1), (2, 1, 2), (60, 40, 3), (300, 2_000, 4)]:
+        sources = _sources(n, nodes, seed)
+        assert build_chain_index(sources).overlap_fraction() == _pairwise_overlap(sources)
+
+
+def test_index_interns_nodes_deterministically() -> None:
+    sources = [
+        {"transmission_chain": [{"node_id": "b"}, {"node_id": "a"}]},
+        {"transmission_chain": [{"node_id": "c"}]},
+        {"transmission_chain": [{"node_id": "a"}, {"node_id": "c"}, {"node_id": "a"}]},
+        {},
+    ]
+
+    index = build_chain_index(sources)
+
+    assert index.node_ids == ("a", "b", "c")
+    assert index.source_nodes == ((0, 1), (2,), (0, 2), ())
+    assert index.postings == (0b101, 0b001, 0b110)
+    assert index.overlapping_pairs() == 2
+    assert index.overlap_fraction() == 2 / 6
+
+
+def test_assess_tawatur_scores_unchanged_for_large_source_sets() -> None:
+    sources = _sources(1_000, 300, 5)
+
+    result = assess_tawatur(sources)
+
+    system_share = 0.0
+    for system in ("crm", "erp", "bank"):
+        share = sum(s["source_system"] == system for s in sources) / len(sources)
+        system_share = max(system_share, share)
+    expected = round(
+        min(1.0, 0.40 * system_share + 0.30 * 0.9 + 0.30 * _pairwise_overlap(sources)), 4
+    )
+    assert compute_collusion_risk(sources) == result.collusion_risk == expected
+    assert result.total_sources == 1_000
@@ -7,6 +7,7 @@ Tests cover:
 - Date handling (ISO-8601)
 - Fail-closed behavior for corrupted files
 - Size limit enforcement
+- Row/table compacted span modes and expansion back to cell spans
 """
 
 from __future__ import annotations
@@ -16,8 +17,8 @@ from datetime import date, datetime
 
 import pytest
 
-from idis.parsers.base import ParseErrorCode, ParseLimits
-from idis.parsers.xlsx import parse_xlsx
+from idis.parsers.base import ParseErrorCode, ParseLimits, XlsxSpanMode
+from idis.parsers.xlsx import expand_compacted_span, parse_xlsx
 
 try:
     from openpyxl import Workbook
@@ -411,3 +412,80 @@ class TestXLSXParserMetadata:
         assert result.success is True
         assert "span_count" in result.metadata
         assert result.metadata["span_count"] == 4
+
+
+PNL_SHEET: list[list[object]] = [
+    ["Metric", "FY2023", "FY2024"],
+    ["Revenue", 1200000, 1800000],
+    ["Gross Margin", 0.62, 0.66],
+    [],
+    ["Notes"],
+    ["Audited", True],
+]
+
+
+@pytest.mark.skipif(not OPENPYXL_AVAILABLE, reason="openpyxl not installed")
+class TestXLSXParserCompactedSpans:
+    """Test ROW and TABLE span modes."""
+
+    def test_row_mode_one_span_per_row_with_header_context(self) -> None:
+        """ROW mode emits one span per row and points at the block's header row."""
+        xlsx_bytes = create_test_xlsx({"P&L": PNL_SHEET})
+
+        result = parse_xlsx(xlsx_bytes, span_mode=XlsxSpanMode.ROW)
+
+        assert result.success is True
+        assert result.metadata["span_mode"] == "row"
+        assert len(result.spans) == 5
+        revenue = result.spans[1]
+        assert revenue.span_type == "CELL"
+        assert revenue.text_excerpt == "Revenue\t1200000\t1800000"
+        assert revenue.locator["sheet"] == "P&L"
+        assert revenue.locator["row"] == 2
+        assert revenue.locator["range"] == "A2:C2"
+        assert revenue.locator["header_row"] == 1
+        start, end = revenue.locator["cells"]["B2"]
+        assert revenue.text_excerpt[start:end] == "1200000"
+
+    def test_table_mode_splits_blocks_on_blank_rows(self) -> None:
+        """TABLE mode emits one span per contiguous block of rows."""
+        xlsx_bytes = create_test_xlsx({"P&L": PNL_SHEET})
+
+        result = parse_xlsx(xlsx_bytes, span_mode=XlsxSpanMode.TABLE)
+
+        assert result.success is True
+        assert [span.locator["range"] for span in result.spans] == ["A1:C3", "A5:B6"]
+        table = result.spans[0]
+        assert table.locator["row_range"] == [1, 3]
+        assert table.text_excerpt.splitlines() == [
+            "Metric\tFY2023\tFY2024",
+            "Revenue\t1200000\t1800000",
+            "Gross Margin\t0.62\t0.66",
+        ]
+        assert table.locator["header_row"] == 1
+
+    @pytest.mark.parametrize("mode", [XlsxSpanMode.ROW, XlsxSpanMode.TABLE])
+    def test_expansion_reproduces_cell_mode(self, mode: XlsxSpanMode) -> None:
+        """Expanding compacted spans yields exactly the CELL mode spans."""
+        xlsx_bytes = create_test_xlsx({"P&L": PNL_SHEET, "Other": [[1, "x"], [None, 2]]})
+
+        cell_spans = parse_xlsx(xlsx_bytes).spans
+        compacted = parse_xlsx(xlsx_bytes, span_mode=mode).spans
+        expanded = [cell for span in compacted for cell in expand_compacted_span(span)]
+
+        assert len(compacted) < len(cell_spans)
+        assert expanded == cell_spans
+        assert sum(len(span.text_excerpt.split()) for span in compacted) == sum(
+            len(span.text_excerpt.split()) for span in cell_spans
+        )  # compaction adds no words to the extraction prompt
+
+    def test_limits_apply_in_compacted_modes(self) -> None:
+        """Sheet limits fail closed regardless of span mode."""
+        xlsx_bytes = create_test_xlsx({"A": [[1]], "B": [[2]], "C": [[3]]})
+
+        result = parse_xlsx(
+            xlsx_bytes, limits=ParseLimits(max_sheets=2), span_mode=XlsxSpanMode.ROW
+        )
+
+        assert result.success is False
+        assert result.errors[0].code == ParseErrorCode.MAX_SHEETS_EXCEEDED